@@ -31,7 +31,7 @@ type CrawlProgress = {
   percent?: number;
   processed?: number;
   failed?: number;
-  consolidated_file?: string;
+  output_file?: string;
   out_dir?: string;
 };
 
@@ -279,7 +279,7 @@ export default function NewsScraper({ onOpenSettings }: { onOpenSettings?: () =>
       const blobUrl = URL.createObjectURL(blob);
       const a = document.createElement("a");
       a.href = blobUrl;
-      a.download = `articles_${crawlJobId.slice(0, 8)}.json`;
+      a.download = `articles_${crawlJobId.slice(0, 8)}.ndjson`;
       document.body.appendChild(a);
       a.click();
       document.body.removeChild(a);
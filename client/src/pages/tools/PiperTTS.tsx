@@ -22,14 +22,6 @@ type Voice = {
   demo_url: string | null;
 };
 
-type GenerateResponse = {
-  status: string;
-  file_id: string;
-  filename: string;
-  download_url: string;
-  normalized_text: string;
-};
-
 type PiperModelStatus = {
   installed: boolean;
   espeak_ng?: { exists: boolean; path: string };
@@ -37,6 +29,38 @@ type PiperModelStatus = {
   model_dir?: string;
 };
 
+const WAV_HEADER_BYTES = 44;
+
+function concatBytes(a: Uint8Array, b: Uint8Array): Uint8Array {
+  if (a.length === 0) return b;
+  const out = new Uint8Array(a.length + b.length);
+  out.set(a, 0);
+  out.set(b, a.length);
+  return out;
+}
+
+function pcm16ToWavBlob(parts: Int16Array[], sampleRate: number): Blob {
+  const dataBytes = parts.reduce((total, part) => total + part.byteLength, 0);
+  const header = new DataView(new ArrayBuffer(WAV_HEADER_BYTES));
+  const writeTag = (offset: number, tag: string) => {
+    for (let i = 0; i < 4; i++) header.setUint8(offset + i, tag.charCodeAt(i));
+  };
+  writeTag(0, "RIFF");
+  header.setUint32(4, 36 + dataBytes, true);
+  writeTag(8, "WAVE");
+  writeTag(12, "fmt ");
+  header.setUint32(16, 16, true);
+  header.setUint16(20, 1, true);
+  header.setUint16(22, 1, true);
+  header.setUint32(24, sampleRate, true);
+  header.setUint32(28, sampleRate * 2, true);
+  header.setUint16(32, 2, true);
+  header.setUint16(34, 16, true);
+  writeTag(36, "data");
+  header.setUint32(40, dataBytes, true);
+  return new Blob([header.buffer, ...parts.map((part) => part.buffer as ArrayBuffer)], { type: "audio/wav" });
+}
+
 export default function PiperTTS({ onOpenSettings }: { onOpenSettings?: () => void }) {
   const { t } = useI18n();
 
@@ -55,6 +79,7 @@ export default function PiperTTS({ onOpenSettings }: { onOpenSettings?: () => vo
   const [piperModelStatus, setPiperModelStatus] = useState<PiperModelStatus | null>(null);
   const [playingDemo, setPlayingDemo] = useState<string | null>(null);
   const demoAudioRef = useRef<HTMLAudioElement | null>(null);
+  const streamAudioRef = useRef<AudioContext | null>(null);
 
   const charCount = text.length;
 
@@ -151,21 +176,63 @@ export default function PiperTTS({ onOpenSettings }: { onOpenSettings?: () => vo
 
     try {
       setProgress({ status: "processing", percent: 50, message: t("tool.piper_tts.processing") });
-      const res = await fetch(`${APP_API_URL}/api/v1/piper-tts/generate`, {
+      const res = await fetch(`${APP_API_URL}/api/v1/piper-tts/generate/stream`, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ text, voice_id: selectedVoice, language, speed, normalize: true }),
+        body: JSON.stringify({ text, voice_id: selectedVoice, language, speed, format: "wav" }),
       });
-      if (!res.ok) {
+      if (!res.ok || !res.body) {
         const err = await res.json().catch(() => ({}));
         throw new Error(String(err.detail || "Generate failed"));
       }
-      const data = (await res.json()) as GenerateResponse;
-      const url = data.download_url.startsWith("http") ? data.download_url : `${APP_API_URL}${data.download_url}`;
-      setLogs((prev) => [...prev, `Generated: ${data.filename}`]);
+
+      // Play each sentence as it arrives; keep the PCM to offer the full file at the end.
+      streamAudioRef.current?.close().catch(() => {});
+      const ctx = new AudioContext();
+      streamAudioRef.current = ctx;
+      const reader = res.body.getReader();
+      const pcmParts: Int16Array[] = [];
+      let pending: Uint8Array = new Uint8Array(0);
+      let headerRead = false;
+      let sampleRate = 22050;
+      let nextStart = 0;
+
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        let bytes = concatBytes(pending, value);
+        if (!headerRead) {
+          if (bytes.length < WAV_HEADER_BYTES) {
+            pending = bytes;
+            continue;
+          }
+          sampleRate = new DataView(bytes.buffer, bytes.byteOffset, WAV_HEADER_BYTES).getUint32(24, true);
+          bytes = bytes.slice(WAV_HEADER_BYTES);
+          headerRead = true;
+        }
+        const usable = bytes.length - (bytes.length % 2);
+        pending = bytes.slice(usable);
+        if (usable === 0) continue;
+
+        const samples = new Int16Array(bytes.slice(0, usable).buffer);
+        pcmParts.push(samples);
+        const buffer = ctx.createBuffer(1, samples.length, sampleRate);
+        const channel = buffer.getChannelData(0);
+        for (let i = 0; i < samples.length; i++) channel[i] = samples[i] / 32768;
+        const source = ctx.createBufferSource();
+        source.buffer = buffer;
+        source.connect(ctx.destination);
+        nextStart = Math.max(nextStart, ctx.currentTime);
+        source.start(nextStart);
+        nextStart += buffer.duration;
+      }
+
+      if (pcmParts.length === 0) throw new Error("Generate failed");
+      const filename = "piper_tts.wav";
+      setLogs((prev) => [...prev, `Generated: ${filename}`]);
       setProgress({ status: "complete", percent: 100, message: t("tool.piper_tts.audio_ready") });
-      setAudioUrl(url);
-      setDownloadName(data.filename || "piper_tts.wav");
+      setAudioUrl(URL.createObjectURL(pcm16ToWavBlob(pcmParts, sampleRate)));
+      setDownloadName(filename);
     } catch (err) {
       const msg = err instanceof Error ? err.message : t("tool.piper_tts.server_not_reachable");
       setLogs((prev) => [...prev, msg]);
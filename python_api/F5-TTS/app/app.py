@@ -11,12 +11,14 @@ from .routers import env as env_router
 from .routers import files as files_router
 from .routers import system as system_router
 from .routers import tts as tts_router
+from .services.voice_clone import engine
 
 
 def _cleanup_loop() -> None:
     while True:
         time.sleep(60)
         job_store.cleanup()
+        engine.unload_idle()
 
 
 def create_app() -> FastAPI:
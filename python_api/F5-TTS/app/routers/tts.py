@@ -5,13 +5,16 @@ from fastapi.responses import StreamingResponse
 
 from ..deps import get_job_store
 from ..services.voice_clone import (
+    F5BusyError,
     download_model,
+    engine_status,
     generate,
     get_download_file_id,
     list_samples,
     list_voices,
     progress_store,
     register_voice,
+    unload_models,
 )
 from python_api.common.jobs import JobStore
 
@@ -28,6 +31,20 @@ def model_download(payload: dict | None = Body(default=None), job_store: JobStor
     return StreamingResponse(progress_store.sse_stream(task_id), media_type="text/event-stream")
 
 
+@router.post("/models/unload")
+def model_unload(payload: dict | None = Body(default=None)) -> dict:
+    language = (payload or {}).get("language")
+    try:
+        return unload_models(str(language) if language else None)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.get("/models/engine")
+def model_engine() -> dict:
+    return engine_status()
+
+
 @router.get("/voices")
 def voices(language: str = Query(default="vi"), custom_only: bool = Query(default=False)) -> dict:
     return list_voices(language, custom_only=custom_only)
@@ -70,9 +87,16 @@ def generate_voice(payload: dict = Body(...), job_store: JobStore = Depends(get_
     nfe_step = int(payload.get("nfe_step", 32))
     remove_silence = bool(payload.get("remove_silence", False))
     language = str(payload.get("language", "vi"))
+    stream_segments = bool(payload.get("stream_segments", False))
     if not voice_id or not text:
         raise HTTPException(status_code=400, detail="voice_id and text are required")
-    task_id = generate(job_store, voice_id, text, speed, cfg_strength, nfe_step, remove_silence, language)
+    try:
+        task_id = generate(
+            job_store, voice_id, text, speed, cfg_strength, nfe_step, remove_silence, language,
+            stream_segments=stream_segments,
+        )
+    except F5BusyError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
     return {"task_id": task_id}
 
 
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import queue
 import re
-import subprocess
-import sys
 import threading
 import time
 import unicodedata
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Iterator, List
+
+import numpy as np
 
 from python_api.common.logging import log
 from python_api.common.paths import MODEL_F5_VN_DIR, MODEL_F5_EN_DIR, TEMP_DIR
@@ -45,9 +49,382 @@ VOCAB_FILE = VOCAB_FILE_VN
 
 _SUPPORTED_LANGUAGES = {"vi", "en"}
 
+# Checkpoints are fine-tunes of F5TTS_Base and are decoded with vocos.
+F5_MODEL_CONFIG = "F5TTS_Base"
+F5_VOCODER = "vocos"
+# Generation jobs waiting behind the running one; further requests are rejected.
+# At least 1: values below that are raised to 1 (a queue.Queue of size 0 would
+# be unbounded, not "no waiting").
+F5_MAX_QUEUED = max(1, int(os.getenv("F5_MAX_QUEUED", "8")))
+# Unload models unused for this long; 0 keeps them resident until /models/unload.
+F5_IDLE_UNLOAD_SECONDS = int(os.getenv("F5_IDLE_UNLOAD_SECONDS", "0"))
+
+# Text chunks synthesized concurrently on the warm model, and the crossfade
+# applied where consecutive chunks meet.
+F5_PARALLEL_CHUNKS = max(1, int(os.getenv("F5_PARALLEL_CHUNKS", "2")))
+F5_CROSSFADE_SECONDS = 0.15
+# Processed references kept in memory, keyed by content hash.
+F5_REFERENCE_MEMO_SIZE = 32
+
 progress_store = ProgressStore()
 task_files: dict[str, str] = {}
 
+# voices.json path -> (mtime_ns, voices, voices by id)
+_voices_index: dict[Path, tuple[int, List[dict], dict[str, dict]]] = {}
+_voices_index_lock = threading.Lock()
+
+_reference_memo: "OrderedDict[str, dict]" = OrderedDict()
+_reference_lock = threading.Lock()
+
+
+class _Crossfader:
+    """
+    Join chunk waveforms with a linear crossfade, emitting audio incrementally.
+
+    The last `fade_samples` of each pushed chunk are held back until the next
+    chunk arrives and blended with its head, so the pieces returned by push()
+    and flush() concatenate to the fully crossfaded signal.
+    """
+
+    def __init__(self, fade_samples: int) -> None:
+        self.fade_samples = max(0, fade_samples)
+        self._tail: np.ndarray | None = None
+
+    def push(self, wave: np.ndarray) -> np.ndarray:
+        combined = np.asarray(wave, dtype=np.float32).reshape(-1)
+        if self._tail is not None:
+            tail = self._tail
+            overlap = min(len(tail), len(combined), self.fade_samples)
+            ramp = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+            blended = tail[len(tail) - overlap :] * (1.0 - ramp) + combined[:overlap] * ramp
+            combined = np.concatenate([tail[: len(tail) - overlap], blended, combined[overlap:]])
+        keep = min(self.fade_samples, len(combined))
+        self._tail = combined[len(combined) - keep :]
+        return combined[: len(combined) - keep]
+
+    def flush(self) -> np.ndarray:
+        tail = self._tail if self._tail is not None else np.zeros(0, dtype=np.float32)
+        self._tail = None
+        return tail
+
+
+class F5BusyError(RuntimeError):
+    """Raised when the generation queue is full."""
+
+
+class F5Engine:
+    """
+    In-process F5-TTS inference with the model and vocoder kept warm.
+
+    Each language's checkpoint is loaded on first use and stays resident; the
+    vocos vocoder is shared. Jobs run one at a time on a single worker thread
+    fed by a bounded queue, so concurrent requests never load a second copy of
+    the model or compete for the GPU.
+    """
+
+    def __init__(self, max_queued: int = F5_MAX_QUEUED) -> None:
+        if max_queued < 1:
+            raise ValueError("max_queued must be at least 1")
+        # Holds waiting jobs only; the running one has already been taken off.
+        self._jobs: queue.Queue = queue.Queue(maxsize=max_queued)
+        self._models: dict[str, Any] = {}
+        self._last_used: dict[str, float] = {}
+        self._vocoder: Any = None
+        self._device: str | None = None
+        # Guards the dicts above and is only held briefly; checkpoint loads run
+        # outside it, single-flight per language, so status() and submit()
+        # never wait behind a load.
+        self._lock = threading.RLock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._vocoder_load_lock = threading.Lock()
+        self._worker_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._running: str | None = None
+        self._chunk_executor: ThreadPoolExecutor | None = None
+
+    # -- model lifecycle ---------------------------------------------------
+
+    def _resolve_device(self) -> str:
+        if self._device is None:
+            import torch
+
+            if torch.cuda.is_available():
+                self._device = "cuda"
+            elif getattr(torch.backends, "mps", None) is not None and torch.backends.mps.is_available():
+                self._device = "mps"
+            else:
+                self._device = "cpu"
+        return self._device
+
+    def _resident(self, language: str) -> tuple[Any, Any] | None:
+        """Return (model, vocoder) if language is loaded, marking it used. Caller holds _lock."""
+        model = self._models.get(language)
+        if model is None or self._vocoder is None:
+            return None
+        self._last_used[language] = time.time()
+        return model, self._vocoder
+
+    def load(self, language: str) -> tuple[Any, Any]:
+        """Return (model, vocoder) for language, loading them on first use."""
+        with self._lock:
+            resident = self._resident(language)
+            if resident is not None:
+                return resident
+            load_lock = self._load_locks.setdefault(language, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                resident = self._resident(language)
+                if resident is not None:
+                    # Loaded by the thread we waited on.
+                    return resident
+            try:
+                model = self._load_model(language)
+                vocoder = self._load_vocoder()
+            except BaseException:
+                with self._lock:
+                    self._load_locks.pop(language, None)
+                raise
+
+            # Publish and retire the load lock together, so a thread arriving
+            # now either finds the model or waits on this lock.
+            with self._lock:
+                self._models[language] = model
+                if self._vocoder is None:
+                    self._vocoder = vocoder
+                self._last_used[language] = time.time()
+                self._load_locks.pop(language, None)
+                return model, self._vocoder
+
+    def _load_model(self, language: str) -> Any:
+        from importlib.resources import files
+
+        from f5_tts.infer.utils_infer import load_model
+        from hydra.utils import get_class
+        from omegaconf import OmegaConf
+
+        device = self._resolve_device()
+        model_file, vocab_file = _get_model_paths(language)
+        if not model_file.exists():
+            raise FileNotFoundError(f"Model not found: {model_file}")
+
+        started = time.time()
+        model_cfg = OmegaConf.load(str(files("f5_tts").joinpath(f"configs/{F5_MODEL_CONFIG}.yaml")))
+        model_cls = get_class(f"f5_tts.model.{model_cfg.model.backbone}")
+        model = load_model(
+            model_cls,
+            model_cfg.model.arch,
+            str(model_file),
+            mel_spec_type=F5_VOCODER,
+            vocab_file=str(vocab_file),
+            device=device,
+        )
+        log(
+            f"Loaded F5-TTS model for {language} on {device} in {time.time() - started:.1f}s",
+            log_name="f5-tts.log",
+        )
+        return model
+
+    def _load_vocoder(self) -> Any:
+        """Return the shared vocoder, loading it once even when two languages load together."""
+        with self._vocoder_load_lock:
+            with self._lock:
+                if self._vocoder is not None:
+                    return self._vocoder
+            from f5_tts.infer.utils_infer import load_vocoder
+
+            vocoder = load_vocoder(vocoder_name=F5_VOCODER, device=self._resolve_device())
+            with self._lock:
+                if self._vocoder is None:
+                    self._vocoder = vocoder
+                return self._vocoder
+
+    def unload(self, language: str | None = None) -> list[str]:
+        """Drop the model for language (all when None); the vocoder goes with the last model."""
+        with self._lock:
+            targets = [language] if language else list(self._models)
+            unloaded = [lang for lang in targets if self._models.pop(lang, None) is not None]
+            for lang in unloaded:
+                self._last_used.pop(lang, None)
+            if not self._models:
+                self._vocoder = None
+        if unloaded:
+            self._release_device_memory()
+            log(f"Unloaded F5-TTS model(s): {', '.join(unloaded)}", log_name="f5-tts.log")
+        return unloaded
+
+    def unload_idle(self, idle_seconds: int = F5_IDLE_UNLOAD_SECONDS) -> list[str]:
+        if idle_seconds <= 0:
+            return []
+        cutoff = time.time() - idle_seconds
+        with self._lock:
+            idle = [lang for lang, used in self._last_used.items() if used < cutoff and lang != self._running]
+        return [lang for lang in idle if self.unload(lang)]
+
+    def _release_device_memory(self) -> None:
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
+
+    # -- job queue ---------------------------------------------------------
+
+    def submit(self, language: str, job: Callable[[], None]) -> None:
+        """Queue job to run on the worker thread; raises F5BusyError when the queue is full."""
+        try:
+            self._jobs.put_nowait((language, job))
+        except queue.Full as exc:
+            raise F5BusyError("Voice generation queue is full; try again shortly") from exc
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._work, name="f5-tts-worker", daemon=True)
+                self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            language, job = self._jobs.get()
+            self._running = language
+            try:
+                job()
+            except Exception as exc:  # jobs report their own errors; keep the worker alive
+                log(f"F5-TTS job crashed: {exc}", "error", log_name="f5-tts.log")
+            finally:
+                self._running = None
+                self._jobs.task_done()
+
+    # -- inference ---------------------------------------------------------
+
+    def split_text(self, reference: dict, gen_text: str, speed: float = 1.0) -> list[str]:
+        """Split gen_text with f5-tts chunk_text, sized to the reference clip as infer_process does."""
+        from f5_tts.infer.utils_infer import chunk_text
+
+        ref_seconds = reference["audio"].shape[-1] / reference["sample_rate"]
+        max_chars = int(len(reference["ref_text"].encode("utf-8")) / ref_seconds * (22 - ref_seconds) * speed)
+        return [chunk for chunk in chunk_text(gen_text, max_chars=max(1, max_chars)) if chunk.strip()]
+
+    def iter_synthesize(
+        self,
+        language: str,
+        reference: dict,
+        chunks: list[str],
+        speed: float = 1.0,
+        cfg_strength: float = 2.0,
+        nfe_step: int = 32,
+    ) -> Iterator[tuple[int, np.ndarray, int]]:
+        """
+        Yield (index, wave, sample_rate) per chunk, in order.
+
+        Up to F5_PARALLEL_CHUNKS chunks are in flight at once on the resident
+        model; each is one infer_batch_process call with the cached reference.
+        """
+        from f5_tts.infer.utils_infer import infer_batch_process
+
+        model, vocoder = self.load(language)
+        device = self._resolve_device()
+        ref_audio = (reference["audio"], reference["sample_rate"])
+        ref_text = reference["ref_text"]
+
+        def _one(text: str) -> tuple[np.ndarray, int]:
+            wave, sample_rate, _ = next(
+                infer_batch_process(
+                    ref_audio,
+                    ref_text,
+                    [text],
+                    model,
+                    vocoder,
+                    mel_spec_type=F5_VOCODER,
+                    nfe_step=nfe_step,
+                    cfg_strength=cfg_strength,
+                    speed=speed,
+                    device=device,
+                )
+            )
+            return wave, sample_rate
+
+        with self._lock:
+            if self._chunk_executor is None:
+                self._chunk_executor = ThreadPoolExecutor(max_workers=F5_PARALLEL_CHUNKS, thread_name_prefix="f5-chunk")
+            executor = self._chunk_executor
+
+        pending: dict[int, Future] = {}
+        submitted = 0
+        try:
+            for index in range(len(chunks)):
+                while submitted < len(chunks) and submitted < index + F5_PARALLEL_CHUNKS:
+                    pending[submitted] = executor.submit(_one, chunks[submitted])
+                    submitted += 1
+                wave, sample_rate = pending.pop(index).result()
+                with self._lock:
+                    self._last_used[language] = time.time()
+                yield index, wave, sample_rate
+        finally:
+            for future in pending.values():
+                future.cancel()
+
+    def synthesize(
+        self,
+        language: str,
+        reference: dict,
+        gen_text: str,
+        output_path: Path,
+        speed: float = 1.0,
+        cfg_strength: float = 2.0,
+        nfe_step: int = 32,
+        remove_silence: bool = False,
+        on_segment: Callable[[int, int, np.ndarray, int], None] | None = None,
+    ) -> Path:
+        """
+        Run inference with the resident model and write a WAV to output_path.
+
+        `reference` comes from load_reference, so the sample is not reloaded or
+        re-trimmed. Long text is split into chunks that are synthesized in
+        parallel and crossfaded; `on_segment(index, total, audio, sample_rate)`
+        receives each finished piece as soon as it is final, and the pieces
+        concatenate to the written file (before optional silence removal).
+        """
+        import soundfile as sf
+        from f5_tts.infer.utils_infer import remove_silence_for_generated_wav
+
+        chunks = self.split_text(reference, gen_text, speed) or [gen_text]
+        total = len(chunks)
+        crossfader: _Crossfader | None = None
+        pieces: list[np.ndarray] = []
+        sample_rate = reference["sample_rate"]
+        for index, wave, sample_rate in self.iter_synthesize(
+            language, reference, chunks, speed=speed, cfg_strength=cfg_strength, nfe_step=nfe_step
+        ):
+            if crossfader is None:
+                crossfader = _Crossfader(int(F5_CROSSFADE_SECONDS * sample_rate))
+            piece = crossfader.push(wave)
+            if index == total - 1:
+                piece = np.concatenate([piece, crossfader.flush()])
+            pieces.append(piece)
+            if on_segment is not None:
+                on_segment(index, total, piece, sample_rate)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        sf.write(str(output_path), np.concatenate(pieces), sample_rate)
+        if remove_silence:
+            remove_silence_for_generated_wav(str(output_path))
+        return output_path
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "loaded": sorted(self._models),
+                "loading": sorted(self._load_locks),
+                "device": self._device,
+                "running": self._running,
+                "queued": self._jobs.qsize(),
+                "max_queued": self._jobs.maxsize,
+            }
+
+
+engine = F5Engine()
+
 
 def _ensure_dirs() -> None:
     MODEL_F5_VN_DIR.mkdir(parents=True, exist_ok=True)
@@ -92,20 +469,95 @@ def model_status_all() -> dict:
     }
 
 
-def _load_voices(language: str = "vi") -> List[dict]:
+def _voices_entry(language: str) -> tuple[List[dict], dict[str, dict]]:
+    """Parsed voices.json for language, re-read only when the file's mtime changes."""
     voices_json, _ = _get_voices_config(language)
-    if not voices_json.exists():
-        return []
+    try:
+        mtime_ns = voices_json.stat().st_mtime_ns
+    except OSError:
+        return [], {}
+    with _voices_index_lock:
+        cached = _voices_index.get(voices_json)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
     with voices_json.open("r", encoding="utf-8") as handle:
         data = json.load(handle)
-    return data.get("voices", [])
+    voices = data.get("voices", [])
+    by_id = {voice.get("id"): voice for voice in voices if voice.get("id")}
+    with _voices_index_lock:
+        _voices_index[voices_json] = (mtime_ns, voices, by_id)
+    return voices, by_id
+
+
+def _load_voices(language: str = "vi") -> List[dict]:
+    return list(_voices_entry(language)[0])
 
 
 def _get_voice(voice_id: str, language: str = "vi") -> dict | None:
-    for voice in _load_voices(language):
-        if voice.get("id") == voice_id:
-            return voice
-    return None
+    return _voices_entry(language)[1].get(voice_id)
+
+
+def _reference_hash(audio_bytes: bytes, ref_text: str) -> str:
+    return hashlib.sha256(audio_bytes + b"\0" + ref_text.encode("utf-8")).hexdigest()
+
+
+def _reference_cache_path(ref_audio: Path) -> Path:
+    return ref_audio.with_name(f"{ref_audio.stem}_ref.pt")
+
+
+def _compute_reference(ref_audio: Path, ref_text: str, content_hash: str) -> dict:
+    import torchaudio
+    from f5_tts.infer.utils_infer import preprocess_ref_audio_text, target_sample_rate
+
+    # Clip/trim the sample and fix up the transcript exactly as f5-tts does per request.
+    processed_path, processed_text = preprocess_ref_audio_text(str(ref_audio), ref_text)
+    audio, sample_rate = torchaudio.load(processed_path)
+    if audio.shape[0] > 1:
+        audio = audio.mean(dim=0, keepdim=True)
+    if sample_rate != target_sample_rate:
+        audio = torchaudio.transforms.Resample(sample_rate, target_sample_rate)(audio)
+        sample_rate = target_sample_rate
+    return {"hash": content_hash, "audio": audio, "sample_rate": sample_rate, "ref_text": processed_text}
+
+
+def load_reference(ref_audio: Path, ref_text: str) -> dict:
+    """
+    Return the processed reference for a voice sample.
+
+    The clipped, resampled waveform and normalized transcript are persisted
+    next to the sample as `<stem>_ref.pt` and reused while the content hash of
+    (sample bytes, transcript) still matches.
+    """
+    content_hash = _reference_hash(ref_audio.read_bytes(), ref_text)
+    with _reference_lock:
+        reference = _reference_memo.get(content_hash)
+        if reference is not None:
+            _reference_memo.move_to_end(content_hash)
+            return reference
+
+    import torch
+
+    cache_path = _reference_cache_path(ref_audio)
+    reference = None
+    if cache_path.exists():
+        try:
+            data = torch.load(str(cache_path), map_location="cpu", weights_only=True)
+            if data.get("hash") == content_hash:
+                reference = data
+        except Exception as exc:
+            log(f"Ignoring unreadable reference cache {cache_path}: {exc}", "warning", log_name="f5-tts.log")
+    if reference is None:
+        reference = _compute_reference(ref_audio, ref_text, content_hash)
+        try:
+            torch.save(reference, str(cache_path))
+        except OSError as exc:
+            log(f"Could not write reference cache {cache_path}: {exc}", "warning", log_name="f5-tts.log")
+
+    with _reference_lock:
+        _reference_memo[content_hash] = reference
+        while len(_reference_memo) > F5_REFERENCE_MEMO_SIZE:
+            _reference_memo.popitem(last=False)
+    return reference
 
 
 def _slugify(value: str) -> str:
@@ -175,6 +627,13 @@ def register_voice(
     audio_path = voice_dir / audio_filename
     audio_path.write_bytes(sample_bytes)
 
+    # Precompute the processed reference so the first generation doesn't pay for it.
+    ref_hash = None
+    try:
+        ref_hash = load_reference(audio_path, clean_transcript)["hash"]
+    except Exception as exc:
+        log(f"Reference preprocessing deferred for {voice_id}: {exc}", "warning", log_name="f5-tts.log")
+
     default_description = "Custom English voice" if selected_language == "en" else "Giọng tùy chỉnh tiếng Việt"
     voice_entry = {
         "id": voice_id,
@@ -186,12 +645,16 @@ def register_voice(
         "ref_audio": f"{voice_id}/{audio_filename}",
         "ref_text": clean_transcript,
     }
+    if ref_hash:
+        voice_entry["ref_hash"] = ref_hash
 
     existing_voices.append(voice_entry)
     payload["voices"] = existing_voices
     voices_json.parent.mkdir(parents=True, exist_ok=True)
     with voices_json.open("w", encoding="utf-8") as handle:
         json.dump(payload, handle, ensure_ascii=False, indent=2)
+    with _voices_index_lock:
+        _voices_index.pop(voices_json, None)
 
     return voice_entry
 
@@ -221,9 +684,17 @@ def generate(
     nfe_step: int,
     remove_silence: bool,
     language: str = "vi",
+    stream_segments: bool = False,
 ) -> str:
+    """
+    Queue a generation on the in-process engine; raises F5BusyError when the queue is full.
+
+    Progress advances per text chunk. With `stream_segments`, each finished
+    segment is also saved and announced in the task log as
+    {"segment", "total", "download_url"} so clients can start playback early.
+    """
     task_id = f"voice_tts_{uuid.uuid4().hex}"
-    progress_store.set_progress(task_id, "starting", 0, "Starting generation...")
+    progress_store.set_progress(task_id, "starting", 0, "Waiting for the voice engine...")
 
     def runner() -> None:
         try:
@@ -237,63 +708,49 @@ def generate(
                 return
 
             _, voice_ref_dir = _get_voices_config(language)
-            model_file, vocab_file = _get_model_paths(language)
-
             ref_audio = voice_ref_dir / voice["ref_audio"]
             ref_text = voice.get("ref_text", "")
             if not ref_audio.exists():
                 progress_store.set_progress(task_id, "error", 0, "Reference audio not found")
                 return
 
-            output_name = f"voice_clone_{int(time.time())}.wav"
+            output_name = f"voice_clone_{int(time.time())}_{uuid.uuid4().hex[:8]}.wav"
             output_path = TEMP_DIR / output_name
 
-            # Use full path to f5-tts_infer-cli from the venv Scripts/bin dir
-            # (when launched from Electron, venv isn't activated so bare name won't resolve)
-            venv_scripts_dir = Path(sys.executable).parent
-            cli_name = "f5-tts_infer-cli.exe" if sys.platform == "win32" else "f5-tts_infer-cli"
-            cli_path = str(venv_scripts_dir / cli_name)
-            cmd = [
-                cli_path,
-                "--model", "F5TTS_Base",
-                "--ref_audio", str(ref_audio),
-                "--ref_text", ref_text,
-                "--gen_text", text,
-                "--speed", str(speed),
-                "--vocoder_name", "vocos",
-                "--vocab_file", str(vocab_file),
-                "--ckpt_file", str(model_file),
-                "--output_dir", str(TEMP_DIR),
-                "--output_file", output_name,
-            ]
-            if remove_silence:
-                cmd.append("--remove_silence")
-
+            if language not in engine.status()["loaded"]:
+                progress_store.set_progress(task_id, "loading", 10, "Loading model...")
+                engine.load(language)
+            reference = load_reference(ref_audio, ref_text)
             progress_store.set_progress(task_id, "generating", 30, "Generating audio...")
-
-            env = os.environ.copy()
-            env["PYTHONIOENCODING"] = "utf-8"
-            env["PYTHONLEGACYWINDOWSSTDIO"] = "utf-8"
-
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                env=env
+            started = time.time()
+
+            def on_segment(index: int, total: int, audio: np.ndarray, sample_rate: int) -> None:
+                if stream_segments:
+                    import soundfile as sf
+
+                    segment_name = f"{output_path.stem}_part{index + 1:03d}.wav"
+                    sf.write(str(TEMP_DIR / segment_name), audio, sample_rate)
+                    segment_record = job_store.add_file(TEMP_DIR / segment_name, segment_name)
+                    progress_store.add_log(task_id, json.dumps({
+                        "segment": index,
+                        "total": total,
+                        "download_url": f"/api/v1/files/{segment_record.file_id}",
+                    }))
+                percent = 30 + int((index + 1) / total * 65)
+                progress_store.set_progress(task_id, "generating", percent, f"Generated chunk {index + 1}/{total}")
+
+            engine.synthesize(
+                language,
+                reference=reference,
+                gen_text=text,
+                output_path=output_path,
+                speed=speed,
+                cfg_strength=cfg_strength,
+                nfe_step=nfe_step,
+                remove_silence=remove_silence,
+                on_segment=on_segment,
             )
-
-            if result.stdout:
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        progress_store.add_log(task_id, line.strip())
-
-            code = result.returncode
-            if code != 0:
-                progress_store.set_progress(task_id, "error", 0, "TTS process failed")
-                return
+            progress_store.add_log(task_id, f"Generated in {time.time() - started:.1f}s")
 
             if not output_path.exists():
                 progress_store.set_progress(task_id, "error", 0, "Output file missing")
@@ -307,10 +764,23 @@ def generate(
             progress_store.set_progress(task_id, "error", 0, str(exc))
             log(f"Voice clone generation failed: {exc}", "error", log_name="f5-tts.log")
 
-    threading.Thread(target=runner, daemon=True).start()
+    try:
+        engine.submit(language, runner)
+    except F5BusyError as exc:
+        progress_store.set_progress(task_id, "error", 0, str(exc))
+        raise
     return task_id
 
 
+def unload_models(language: str | None = None) -> dict:
+    selected_language = _normalize_language(language) if language else None
+    return {"status": "success", "unloaded": engine.unload(selected_language)}
+
+
+def engine_status() -> dict:
+    return engine.status()
+
+
 def list_samples() -> dict:
     if not SAMPLES_DIR.exists():
         return {"samples": []}
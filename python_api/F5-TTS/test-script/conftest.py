@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Add F5-TTS to sys.path so `import app.services.*` resolves.
+# parents[0]=test-script, [1]=F5-TTS, [2]=python_api, [3]=repo root
+_F5_DIR = Path(__file__).resolve().parents[1]       # F5-TTS
+_REPO_ROOT = Path(__file__).resolve().parents[3]    # repo root
+
+for _p in (_F5_DIR, _REPO_ROOT):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import sys
+import threading
+import time
+from types import ModuleType
+
+import numpy as np
+import pytest
+
+import app.services.voice_clone as vc
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state(monkeypatch):
+    monkeypatch.setattr(vc, "log", lambda *args, **kwargs: None)
+    vc._voices_index.clear()
+    vc._reference_memo.clear()
+    yield
+    vc._voices_index.clear()
+    vc._reference_memo.clear()
+
+
+# ---------------------------------------------------------------------------
+# F5Engine
+# ---------------------------------------------------------------------------
+
+def test_engine_rejects_zero_queue():
+    with pytest.raises(ValueError):
+        vc.F5Engine(max_queued=0)
+
+
+def test_engine_submit_raises_busy_when_queue_full():
+    engine = vc.F5Engine(max_queued=1)
+    started = threading.Event()
+    release = threading.Event()
+    ran: list[str] = []
+
+    def _blocking():
+        started.set()
+        release.wait(5)
+        ran.append("first")
+
+    engine.submit("vi", _blocking)
+    assert started.wait(2)
+    engine.submit("vi", lambda: ran.append("second"))  # waits in the queue
+
+    with pytest.raises(vc.F5BusyError):
+        engine.submit("vi", lambda: ran.append("third"))
+    assert engine.status()["running"] == "vi" and engine.status()["queued"] == 1
+
+    release.set()
+    engine._jobs.join()
+    assert ran == ["first", "second"]
+
+
+def _returns_within(fn, seconds: float = 1.0):
+    result: list = []
+    thread = threading.Thread(target=lambda: result.append(fn()), daemon=True)
+    thread.start()
+    thread.join(seconds)
+    assert not thread.is_alive(), "blocked behind the model load"
+    return result[0]
+
+
+def test_engine_status_and_submit_do_not_wait_for_a_load(monkeypatch):
+    engine = vc.F5Engine(max_queued=2)
+    loading = threading.Event()
+    release = threading.Event()
+    loads: list[str] = []
+    model = object()
+
+    def _slow_load_model(language):
+        loads.append(language)
+        loading.set()
+        release.wait(5)
+        return model
+
+    monkeypatch.setattr(engine, "_load_model", _slow_load_model)
+    monkeypatch.setattr(engine, "_load_vocoder", lambda: "vocoder")
+
+    results: list = []
+    loaders = [threading.Thread(target=lambda: results.append(engine.load("vi"))) for _ in range(2)]
+    for loader in loaders:
+        loader.start()
+    assert loading.wait(2)
+    try:
+        status = _returns_within(engine.status)
+        assert status["loading"] == ["vi"] and status["loaded"] == []
+        ran = threading.Event()
+        _returns_within(lambda: engine.submit("en", ran.set))
+        assert ran.wait(2)
+    finally:
+        release.set()
+    for loader in loaders:
+        loader.join(5)
+
+    assert loads == ["vi"]  # the second caller waited for the first load
+    assert results == [(model, "vocoder"), (model, "vocoder")]
+    assert engine.status()["loading"] == [] and engine.status()["loaded"] == ["vi"]
+
+
+def test_engine_failed_load_can_be_retried(monkeypatch):
+    engine = vc.F5Engine(max_queued=1)
+    attempts: list[int] = []
+
+    def _flaky_load_model(language):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise FileNotFoundError("Model not found")
+        return "model"
+
+    monkeypatch.setattr(engine, "_load_model", _flaky_load_model)
+    monkeypatch.setattr(engine, "_load_vocoder", lambda: "vocoder")
+    with pytest.raises(FileNotFoundError):
+        engine.load("vi")
+    assert engine.status()["loading"] == []
+    assert engine.load("vi") == ("model", "vocoder")
+
+
+def test_engine_unload_idle_drops_only_idle_models():
+    engine = vc.F5Engine(max_queued=1)
+    engine._models = {"vi": object(), "en": object()}
+    engine._vocoder = object()
+    now = time.time()
+    engine._last_used = {"vi": now - 600, "en": now}
+
+    assert engine.unload_idle(idle_seconds=60) == ["vi"]
+    assert engine.status()["loaded"] == ["en"]
+    assert engine._vocoder is not None
+    assert engine.unload_idle(idle_seconds=0) == []
+
+
+def test_engine_unload_idle_skips_running_language():
+    engine = vc.F5Engine(max_queued=1)
+    engine._models = {"vi": object()}
+    engine._last_used = {"vi": time.time() - 600}
+    engine._running = "vi"
+    assert engine.unload_idle(idle_seconds=60) == []
+
+
+# ---------------------------------------------------------------------------
+# voices.json index
+# ---------------------------------------------------------------------------
+
+def _write_voices(path, voices, mtime_ns):
+    path.write_text(json.dumps({"voices": voices}), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_voices_entry_reloads_only_when_mtime_changes(monkeypatch, tmp_path):
+    voices_json = tmp_path / "voices.json"
+    monkeypatch.setattr(vc, "VOICES_JSON_VI", voices_json)
+    _write_voices(voices_json, [{"id": "a"}], 1_000_000_000_000)
+    assert [v["id"] for v in vc._load_voices("vi")] == ["a"]
+
+    # Same mtime: the cached index is served.
+    _write_voices(voices_json, [{"id": "b"}], 1_000_000_000_000)
+    assert vc._get_voice("a", "vi") == {"id": "a"}
+
+    _write_voices(voices_json, [{"id": "b"}], 2_000_000_000_000)
+    assert vc._get_voice("a", "vi") is None
+    assert vc._get_voice("b", "vi") == {"id": "b"}
+
+
+def test_voices_entry_missing_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(vc, "VOICES_JSON_VI", tmp_path / "missing.json")
+    assert vc._load_voices("vi") == []
+
+
+# ---------------------------------------------------------------------------
+# load_reference
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def fake_torch(monkeypatch):
+    module = ModuleType("torch")
+    module.save = lambda obj, path: open(path, "wb").write(pickle.dumps(obj))
+    module.load = lambda path, map_location=None, weights_only=False: pickle.loads(open(path, "rb").read())
+    monkeypatch.setitem(sys.modules, "torch", module)
+    return module
+
+
+def test_load_reference_reuses_cached_file_for_same_bytes_and_text(monkeypatch, tmp_path, fake_torch):
+    sample = tmp_path / "voice_sample.wav"
+    sample.write_bytes(b"RIFF-sample")
+    computed: list[str] = []
+
+    def _compute(ref_audio, ref_text, content_hash):
+        computed.append(ref_text)
+        return {"hash": content_hash, "audio": [0.0], "sample_rate": 24000, "ref_text": ref_text + "."}
+
+    monkeypatch.setattr(vc, "_compute_reference", _compute)
+
+    first = vc.load_reference(sample, "xin chào")
+    assert vc._reference_cache_path(sample).exists()
+
+    vc._reference_memo.clear()  # force the on-disk cache path
+    second = vc.load_reference(sample, "xin chào")
+    assert second == first
+    assert computed == ["xin chào"]
+
+    # A different transcript (or different bytes) is a different reference.
+    vc.load_reference(sample, "tạm biệt")
+    sample.write_bytes(b"RIFF-other")
+    vc.load_reference(sample, "tạm biệt")
+    assert computed == ["xin chào", "tạm biệt", "tạm biệt"]
+
+
+def test_load_reference_memo_skips_disk(monkeypatch, tmp_path, fake_torch):
+    sample = tmp_path / "voice_sample.wav"
+    sample.write_bytes(b"RIFF")
+    monkeypatch.setattr(vc, "_compute_reference", lambda a, t, h: {"hash": h, "ref_text": t})
+    first = vc.load_reference(sample, "x")
+    vc._reference_cache_path(sample).unlink()
+    assert vc.load_reference(sample, "x") is first
+
+
+# ---------------------------------------------------------------------------
+# _Crossfader
+# ---------------------------------------------------------------------------
+
+def test_crossfader_keeps_total_length_and_blends_overlap():
+    fader = vc._Crossfader(fade_samples=4)
+    first = fader.push(np.ones(10, dtype=np.float32))
+    second = fader.push(np.full(10, 3.0, dtype=np.float32))
+    tail = fader.flush()
+    out = np.concatenate([first, second, tail])
+
+    assert len(out) == 10 + 10 - 4
+    assert np.allclose(out[:6], 1.0) and np.allclose(out[10:], 3.0)
+    # The overlap ramps linearly from the first chunk into the second.
+    assert np.allclose(out[6:10], [1.0, 1 + 2 / 3, 1 + 4 / 3, 3.0])
+
+
+def test_crossfader_single_chunk_and_zero_fade():
+    fader = vc._Crossfader(fade_samples=4)
+    wave = np.arange(6, dtype=np.float32)
+    assert np.array_equal(np.concatenate([fader.push(wave), fader.flush()]), wave)
+
+    plain = vc._Crossfader(fade_samples=0)
+    out = np.concatenate([plain.push(np.ones(3)), plain.push(np.zeros(2)), plain.flush()])
+    assert np.array_equal(out, [1, 1, 1, 0, 0])
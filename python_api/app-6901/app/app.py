@@ -38,6 +38,7 @@ from .services.remove_overlay import (
     cleanup_video_overlay_results,
 )
 from .services.news_to_video import cleanup_news_to_video_state
+from .services.piper_tts_service import PIPER_PRELOAD_VOICES, preload_models
 
 
 def _cleanup_loop() -> None:
@@ -97,6 +98,8 @@ def create_app() -> FastAPI:
     app.mount("/user-assets", StaticFiles(directory=str(user_assets_dir)), name="user-assets")
 
     threading.Thread(target=_cleanup_loop, daemon=True).start()
+    if PIPER_PRELOAD_VOICES:
+        threading.Thread(target=preload_models, name="piper-preload", daemon=True).start()
     return app
 
 
@@ -18,6 +18,8 @@ class GenerateEdgeTtsRequest(BaseModel):
     voice: str
     rate: int = 0
     pitch: int = 0
+    # None: chunk automatically once text exceeds EDGE_TTS_LONG_TEXT_CHARS.
+    chunked: Optional[bool] = None
 
 
 @router.get("/languages")
@@ -38,6 +40,11 @@ async def get_voices(language: Optional[str] = Query(default=None, alias="langua
     return {"voices": voices}
 
 
+@router.get("/voices/catalog")
+def get_voice_catalog_status() -> dict:
+    return edge_tts_service.voice_catalog.status()
+
+
 @router.post("/generate")
 async def generate(
     payload: GenerateEdgeTtsRequest,
@@ -51,21 +58,32 @@ async def generate(
         raise HTTPException(status_code=400, detail="voice is required")
 
     try:
-        available_voices = await edge_tts_service.list_voices()
+        supported = await edge_tts_service.is_voice_supported(voice)
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
-
-    available_voice_ids = {item["id"] for item in available_voices}
-    if voice not in available_voice_ids:
+    if not supported:
         raise HTTPException(status_code=400, detail="voice is not supported")
 
+    chunked = payload.chunked
+    if chunked is None:
+        chunked = len(text) > edge_tts_service.EDGE_TTS_LONG_TEXT_CHARS
+
+    metadata: dict = {}
     try:
-        output_path, filename = await edge_tts_service.synthesize_to_mp3(
-            text=text,
-            voice=voice,
-            rate=payload.rate,
-            pitch=payload.pitch,
-        )
+        if chunked:
+            output_path, filename, metadata = await edge_tts_service.synthesize_long_to_mp3(
+                text=text,
+                voice=voice,
+                rate=payload.rate,
+                pitch=payload.pitch,
+            )
+        else:
+            output_path, filename = await edge_tts_service.synthesize_to_mp3(
+                text=text,
+                voice=voice,
+                rate=payload.rate,
+                pitch=payload.pitch,
+            )
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
     except ValueError as exc:
@@ -79,4 +97,6 @@ async def generate(
         "file_id": file_record.file_id,
         "filename": filename,
         "download_url": f"/api/v1/files/{file_record.file_id}",
+        "chunked": chunked,
+        **metadata,
     }
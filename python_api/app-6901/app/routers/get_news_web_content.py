@@ -15,6 +15,7 @@ POST /api/v1/news-scraper/scrape
 POST /api/v1/news-scraper/crawl/start
 GET  /api/v1/news-scraper/crawl/stream/{job_id}
 GET  /api/v1/news-scraper/crawl/result/{job_id}
+GET  /api/v1/news-scraper/crawl/download/{job_id}
 """
 
 from __future__ import annotations
@@ -22,25 +23,23 @@ from __future__ import annotations
 import json
 import os
 import queue
-import shutil
-import tempfile
 import threading
-import time
 import uuid
-from pathlib import Path
+from collections.abc import Iterator
 from typing import Any
 
 from fastapi import APIRouter, Body, HTTPException
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from python_api.common.paths import TEMP_DIR
+from ..services.get_news_web_content.crawl_engine import CRAWL_WORKERS, crawl
 from ..services.get_news_web_content.vnexpress import (
+    extract as _vne_extract,
     fetch_article_urls as _vne_fetch_urls,
-    scrape_article as _vne_scrape,
 )
 from ..services.get_news_web_content.cnn import (
+    extract as _cnn_extract,
     fetch_article_urls as _cnn_fetch_urls,
-    scrape_article as _cnn_scrape,
 )
 
 
@@ -51,11 +50,11 @@ def _fetch_urls_for(source: str, category_url: str, limit: int) -> list[str]:
     return _vne_fetch_urls(category_url=category_url, limit=limit)
 
 
-def _scrape_for(source: str, url: str, prefix: str, out_dir: str) -> tuple[str, str]:
-    """Dispatch scrape call to the correct scraper module."""
+def _extract_for(source: str, url: str) -> dict[str, Any]:
+    """Dispatch an in-memory article extraction to the correct scraper module."""
     if source == "cnn":
-        return _cnn_scrape(url=url, out_prefix=prefix, out_dir=out_dir)
-    return _vne_scrape(url=url, out_prefix=prefix, out_dir=out_dir)
+        return _cnn_extract(url)
+    return _vne_extract(url)
 
 router = APIRouter(prefix="/api/v1/news-scraper", tags=["news-scraper"])
 
@@ -189,19 +188,12 @@ def scrape_single_route(payload: dict = Body(...)) -> dict:
     if not source:
         source = "cnn" if "cnn.com" in url else "vnexpress"
 
-    tmp_dir = tempfile.mkdtemp(prefix="news_scrape_")
     try:
-        json_path, _ = _scrape_for(source, url=url, prefix="article", out_dir=tmp_dir)
-        with open(json_path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        return _extract_for(source, url)
     except RuntimeError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Scrape failed: {exc}") from exc
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
-
-    return data
 
 
 # ---------------------------------------------------------------------------
@@ -209,16 +201,26 @@ def scrape_single_route(payload: dict = Body(...)) -> dict:
 # ---------------------------------------------------------------------------
 
 
+def _output_path(job_id: str, out_dir: str) -> str:
+    return os.path.join(out_dir, f"articles_{job_id[:8]}.ndjson")
+
+
 def _run_crawl(
     job_id: str,
     source: str,
     category_url: str,
     limit: int,
     out_dir: str,
+    workers: int = CRAWL_WORKERS,
 ) -> None:
-    """Worker thread: fetch URLs, scrape each article, stream progress via SSE."""
+    """Worker thread: fetch URLs, scrape articles on a bounded pool, stream progress via SSE.
+
+    Each article is appended to an NDJSON file as soon as every article before
+    it in the listing has finished, so the file keeps listing order and only
+    out-of-order results are held in memory.
+    """
     try:
-        _set_job(job_id, {"status": "running", "processed": 0, "failed": 0, "saved_files": []})
+        _set_job(job_id, {"status": "running", "processed": 0, "failed": 0})
         _push_event(job_id, {"status": "started", "message": "Crawl started"})
 
         # Fetch candidate URLs
@@ -236,63 +238,59 @@ def _run_crawl(
         )
 
         os.makedirs(out_dir, exist_ok=True)
+        output_path = _output_path(job_id, out_dir)
 
         processed = 0
         failed = 0
-        articles: list[dict[str, Any]] = []
-
-        for idx, url in enumerate(to_scrape):
-            prefix = f"article_{idx + 1}"
-            _push_event(
-                job_id,
-                {
-                    "status": "scraping",
-                    "message": f"Scraping {idx + 1}/{len(to_scrape)}",
-                    "current": idx + 1,
-                    "total": len(to_scrape),
-                    "percent": int((idx / len(to_scrape)) * 100),
-                    "url": url,
-                },
-            )
-
-            try:
-                json_path, html_path = _scrape_for(source, url=url, prefix=prefix, out_dir=out_dir)
-                with open(json_path, "r", encoding="utf-8") as fh:
-                    article_data = json.load(fh)
-                articles.append(article_data)
-                # Remove individual files; only consolidated JSON will be kept
-                try:
-                    Path(json_path).unlink(missing_ok=True)
-                    if html_path:
-                        Path(html_path).unlink(missing_ok=True)
-                except Exception:
-                    pass
-                processed += 1
-            except Exception as exc:
-                failed += 1
-                _push_event(job_id, {"status": "article_failed", "url": url, "error": str(exc)})
-
-            _set_job(
-                job_id,
-                {"status": "running", "processed": processed, "failed": failed},
-            )
-
-            if idx < len(to_scrape) - 1:
-                time.sleep(0.5)
-
-        # Save one consolidated JSON file
-        consolidated_path = os.path.join(out_dir, "consolidated.json")
-        with open(consolidated_path, "w", encoding="utf-8") as fh:
-            json.dump(articles, fh, ensure_ascii=False, indent=2)
+        total = len(to_scrape)
+        # Finished articles waiting for an earlier one; None marks a failure.
+        pending: dict[int, dict[str, Any] | None] = {}
+        next_index = 0
+
+        with open(output_path, "w", encoding="utf-8") as out:
+            for idx, url, article_data, error in crawl(
+                to_scrape, lambda _idx, article_url: _extract_for(source, article_url), workers=workers
+            ):
+                if error is None:
+                    pending[idx] = article_data
+                    processed += 1
+                else:
+                    pending[idx] = None
+                    failed += 1
+                    _push_event(job_id, {"status": "article_failed", "url": url, "error": str(error)})
+
+                while next_index in pending:
+                    article = pending.pop(next_index)
+                    if article is not None:
+                        out.write(json.dumps(article, ensure_ascii=False) + "\n")
+                    next_index += 1
+                out.flush()
+
+                done = processed + failed
+                _push_event(
+                    job_id,
+                    {
+                        "status": "scraping",
+                        "message": f"Scraped {done}/{total}",
+                        "current": done,
+                        "total": total,
+                        "percent": int((done / total) * 100),
+                        "url": url,
+                    },
+                )
+                _set_job(
+                    job_id,
+                    {"status": "running", "processed": processed, "failed": failed},
+                )
 
         result: dict[str, Any] = {
             "status": "complete",
             "processed": processed,
             "failed": failed,
-            "consolidated_file": consolidated_path,
+            "output_file": output_path,
             "out_dir": os.path.abspath(out_dir),
         }
-        _set_job(job_id, {**result, "articles": articles})
+        _set_job(job_id, result)
         _push_event(job_id, {**result, "percent": 100, "message": f"Done — {processed} articles saved"})
 
     except Exception as exc:
@@ -311,7 +309,9 @@ def start_crawl(payload: dict = Body(...)) -> dict:
     - ``source``       : news source id (default: ``vnexpress``)
     - ``category_url`` : category listing page URL
     - ``limit``        : articles to scrape (1–50, default 10)
-    - ``out_dir``      : directory to write JSON output (default: ``articles``)
+    - ``out_dir``      : directory for the NDJSON output, one article per line
+    - ``workers``      : concurrent article scrapes (1–16, default ``NEWS_CRAWL_WORKERS``);
+      requests per host are still capped by the crawl engine's rate limiter
     """
     source = str(payload.get("source") or "vnexpress").strip().lower()
     _require_available_source(source)
@@ -324,17 +324,20 @@ def start_crawl(payload: dict = Body(...)) -> dict:
 
     out_dir = str(payload.get("out_dir") or "").strip() or str(_DEFAULT_OUT_DIR)
 
+    workers = int(payload.get("workers") or CRAWL_WORKERS)
+    workers = max(1, min(workers, 16))
+
     job_id = uuid.uuid4().hex
     _event_queues[job_id] = queue.Queue()
 
     thread = threading.Thread(
         target=_run_crawl,
-        args=(job_id, source, category_url, limit, out_dir),
+        args=(job_id, source, category_url, limit, out_dir, workers),
         daemon=True,
     )
     thread.start()
 
-    return {"job_id": job_id, "source": source, "category_url": category_url, "limit": limit}
+    return {"job_id": job_id, "source": source, "category_url": category_url, "limit": limit, "workers": workers}
 
 
 @router.get("/crawl/stream/{job_id}")
@@ -371,20 +374,47 @@ def crawl_result(job_id: str) -> dict:
     return job
 
 
+def _json_array_chunks(path: str) -> Iterator[str]:
+    """Re-emit an NDJSON file as a JSON array, one article at a time."""
+    yield "["
+    first = True
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            yield line if first else "," + line
+            first = False
+    yield "]"
+
+
 @router.get("/crawl/download/{job_id}")
-def crawl_download(job_id: str) -> Response:
-    """Download the consolidated JSON from a completed crawl job."""
+def crawl_download(job_id: str, format: str = "ndjson") -> Response:
+    """Stream the articles of a completed crawl job.
+
+    ``format=ndjson`` (default) sends the job's file as is, one article per
+    line; ``format=json`` wraps the same lines in a JSON array on the fly.
+    """
     with _jobs_lock:
         job = _jobs.get(job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     if job.get("status") != "complete":
         raise HTTPException(status_code=400, detail="Job not complete yet")
-    articles = job.get("articles", [])
-    content = json.dumps(articles, ensure_ascii=False, indent=2).encode("utf-8")
-    filename = f"articles_{job_id[:8]}.json"
-    return Response(
-        content=content,
-        media_type="application/json",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    output_file = job.get("output_file")
+    if not output_file or not os.path.isfile(output_file):
+        raise HTTPException(status_code=410, detail="Crawl output file no longer exists")
+    if format == "json":
+        filename = f"articles_{job_id[:8]}.json"
+        return StreamingResponse(
+            _json_array_chunks(output_file),
+            media_type="application/json",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+    if format != "ndjson":
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'json'")
+    return FileResponse(
+        output_file,
+        media_type="application/x-ndjson",
+        filename=os.path.basename(output_file),
     )
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import json
 import threading
 import uuid
 import urllib.request
+from collections.abc import Iterator
 from pathlib import Path
 
 from fastapi import APIRouter, Body, HTTPException
 from fastapi.responses import StreamingResponse
 
 from python_api.common.progress import ProgressStore
-from ..services.image_finder import ALL_SOURCE_IDS, ImageFinderError, find_images
+from ..services.image_finder import ALL_SOURCE_IDS, ImageFinderError, find_images, iter_find_images
 
 
 router = APIRouter(prefix="/image-finder", tags=["image-finder"])
@@ -90,8 +92,7 @@ def _download_images_worker(task_id: str, urls: list[str], save_dir: str) -> Non
     )
 
 
-@router.post("/search")
-def image_finder_search(payload: dict = Body(...)) -> dict:
+def _parse_search_payload(payload: dict) -> dict:
     text = str(payload.get("text") or "").strip()
     number_of_images = _parse_int(payload.get("number_of_images"), "number_of_images", 5)
     target_words = _parse_int(payload.get("target_words"), "target_words", 15)
@@ -104,15 +105,30 @@ def image_finder_search(payload: dict = Body(...)) -> dict:
     if number_of_images < 1:
         raise HTTPException(status_code=400, detail="number_of_images must be >= 1")
 
+    return {
+        "text": text,
+        "number_of_images": number_of_images,
+        "target_words": target_words,
+        "timeout_seconds": timeout_seconds,
+        "sources": sources,
+        "use_llm": use_llm,
+    }
+
+
+def _search_event_stream(params: dict) -> Iterator[str]:
     try:
-        result = find_images(
-            text=text,
-            number_of_images=number_of_images,
-            target_words=target_words,
-            timeout_seconds=timeout_seconds,
-            sources=sources,
-            use_llm=use_llm,
-        )
+        for event in iter_find_images(**params):
+            yield f"data: {json.dumps(event)}\n\n"
+    except Exception as exc:
+        yield f"data: {json.dumps({'event': 'error', 'detail': str(exc)})}\n\n"
+
+
+@router.post("/search")
+def image_finder_search(payload: dict = Body(...)) -> dict:
+    params = _parse_search_payload(payload)
+
+    try:
+        result = find_images(**params)
         return {"status": "ok", **result}
     except ImageFinderError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -120,6 +136,13 @@ def image_finder_search(payload: dict = Body(...)) -> dict:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@router.post("/search/stream")
+def image_finder_search_stream(payload: dict = Body(...)) -> StreamingResponse:
+    """Same as ``/search`` but streams images over SSE as they qualify."""
+    params = _parse_search_payload(payload)
+    return StreamingResponse(_search_event_stream(params), media_type="text/event-stream")
+
+
 @router.post("/download-all")
 def image_finder_download_all(payload: dict = Body(...)) -> dict:
     urls = [u for u in (payload.get("urls") or []) if isinstance(u, str) and u.strip()]
@@ -6,8 +6,18 @@ from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, Body, HTTPException
-
-from ..services.llm import generate, get_default_model, get_ollama_url, get_status, update_config
+from fastapi.responses import StreamingResponse
+
+from ..services.llm import (
+    agenerate,
+    build_prompt,
+    get_default_model,
+    get_ollama_url,
+    get_status,
+    response_cache,
+    stream_generate,
+    update_config,
+)
 
 router = APIRouter(prefix="/api/v1/llm", tags=["llm"])
 
@@ -39,6 +49,18 @@ def llm_update_config(payload: dict = Body(...)) -> dict:
     return {"status": "ok", "url": get_ollama_url(), "model": get_default_model()}
 
 
+@router.get("/cache")
+def llm_cache_status() -> dict:
+    """Return response cache size and hit counters."""
+    return response_cache.status()
+
+
+@router.delete("/cache")
+def llm_cache_clear() -> dict:
+    response_cache.clear()
+    return {"status": "cleared"}
+
+
 @router.get("/prompts")
 def llm_get_prompts() -> list:
     """Return the prompt templates from llm_prompt.json."""
@@ -74,21 +96,21 @@ def llm_batch_preview(payload: dict = Body(...)) -> dict:
     prompt: str = payload.get("prompt", "")
     result: dict[str, Any] = {}
     for key, input_text in data.items():
-        final_prompt = f"{prompt}\n\n{input_text}" if prompt else input_text
-        result[key] = final_prompt
+        result[key] = build_prompt(prompt, input_text)
     return result
 
 
 @router.post("/batch/generate")
-def llm_batch_generate(payload: dict = Body(...)) -> dict:
+async def llm_batch_generate(payload: dict = Body(...)) -> dict:
     """Run Ollama on each entry sequentially and return all outputs."""
     data: dict = payload.get("data", {})
     prompt: str = payload.get("prompt", "")
     model: str | None = payload.get("model") or None
+    use_cache = bool(payload.get("use_cache", False))
     result: dict[str, Any] = {}
     for key, input_text in data.items():
         try:
-            output = generate(prompt, str(input_text), model)
+            output = await agenerate(prompt, str(input_text), model, use_cache=use_cache)
             result[key] = output
         except Exception as exc:
             result[key] = f"[ERROR] {exc}"
@@ -104,17 +126,40 @@ def llm_batch_parse(payload: dict = Body(...)) -> dict:
     return {key: {"box1": value, "box2": box2} for key, value in data.items()}
 
 
-@router.post("/generate")
-def llm_generate(payload: dict = Body(...)) -> dict:
+def _parse_generate_request(payload: dict) -> tuple[str, str, str | None]:
     prompt = payload.get("prompt", "")
     input_text = payload.get("input_text", "")
     model = payload.get("model") or None
-
     if not input_text:
         raise HTTPException(status_code=400, detail="input_text is required")
+    return prompt, input_text, model
+
 
+@router.post("/generate")
+async def llm_generate(payload: dict = Body(...)) -> dict:
+    prompt, input_text, model = _parse_generate_request(payload)
+    use_cache = bool(payload.get("use_cache", False))
     try:
-        output = generate(prompt, input_text, model)
+        output = await agenerate(prompt, input_text, model, use_cache=use_cache)
         return {"status": "ok", "output": output}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
+
+
+@router.post("/generate/stream")
+async def llm_generate_stream(payload: dict = Body(...)) -> StreamingResponse:
+    """Stream tokens as SSE: `{"token"}` frames, then `{"status": "complete", "output"}` or an error."""
+    prompt, input_text, model = _parse_generate_request(payload)
+
+    async def _events():
+        parts: list[str] = []
+        try:
+            async for token in stream_generate(prompt, input_text, model):
+                parts.append(token)
+                yield f"data: {json.dumps({'token': token}, ensure_ascii=False)}\n\n"
+        except Exception as exc:
+            yield f"data: {json.dumps({'status': 'error', 'message': str(exc)})}\n\n"
+            return
+        yield f"data: {json.dumps({'status': 'complete', 'output': ''.join(parts)}, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(_events(), media_type="text/event-stream")
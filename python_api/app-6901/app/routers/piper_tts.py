@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Tuple
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from fastapi.responses import FileResponse, StreamingResponse
@@ -68,6 +70,12 @@ def download_models() -> StreamingResponse:
     return StreamingResponse(download_progress.sse_stream(task_id), media_type="text/event-stream")
 
 
+@router.get("/cache")
+def get_model_cache() -> dict:
+    """Resident voices, their estimated sizes and the cache budget, plus audio cache usage."""
+    return {**svc.model_cache_status(), "audio_cache": svc.audio_cache_status()}
+
+
 @router.get("/voices")
 def get_voices(language: str | None = Query(default=None)) -> dict:
     return {"voices": svc.list_voices(language=language)}
@@ -81,11 +89,7 @@ def get_demo(filename: str) -> FileResponse:
     return FileResponse(str(path), media_type="audio/wav")
 
 
-@router.post("/generate")
-def generate(
-    payload: dict = Body(...),
-    job_store: JobStore = Depends(get_job_store),
-) -> dict:
+def _parse_generate_request(payload: dict) -> Tuple[str, str, str, float]:
     text = str(payload.get("text") or "").strip()
     voice_id = str(payload.get("voice_id") or "").strip()
     language = str(payload.get("language") or "vi").strip().lower()
@@ -95,16 +99,41 @@ def generate(
         raise HTTPException(status_code=400, detail="text is required")
     if not voice_id:
         raise HTTPException(status_code=400, detail="voice_id is required")
+    return text, voice_id, language, speed
 
-    chunks = _normalize_and_chunk(text, language)
 
+def _require_chunks(text: str, language: str) -> List[str]:
+    chunks = _normalize_and_chunk(text, language)
     if not chunks:
         raise HTTPException(status_code=400, detail="text is empty after normalization")
+    return chunks
+
+
+def _run_generate(text: str, voice_id: str, language: str, speed: float) -> Tuple[Path, str, List[str]]:
+    chunks = _require_chunks(text, language)
+    output_path, filename = svc.generate_from_chunks(
+        chunks=chunks, voice_id=voice_id, speed=speed, language=language
+    )
+    return output_path, filename, chunks
+
+
+@router.post("/generate")
+async def generate(
+    payload: dict = Body(...),
+    job_store: JobStore = Depends(get_job_store),
+) -> dict:
+    """Synthesize on the Piper worker pool; the request waits without holding a threadpool slot."""
+    text, voice_id, language, speed = _parse_generate_request(payload)
 
     try:
-        output_path, filename = svc.generate_from_chunks(
-            chunks=chunks, voice_id=voice_id, speed=speed, language=language
-        )
+        future = svc.synthesis_pool.submit(_run_generate, text, voice_id, language, speed)
+    except svc.PiperBusyError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+    try:
+        output_path, filename, chunks = await asyncio.wrap_future(future)
+    except HTTPException:
+        raise
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except Exception as exc:
@@ -119,3 +148,146 @@ def generate(
         "normalized_text": " ".join(chunks),
         "chunks": chunks,
     }
+
+
+@router.post("/generate/async")
+def generate_async(
+    payload: dict = Body(...),
+    job_store: JobStore = Depends(get_job_store),
+) -> dict:
+    """Queue a generation job; follow it on /generate/progress/{job_id}."""
+    text, voice_id, language, speed = _parse_generate_request(payload)
+    try:
+        job_id = svc.start_generation(
+            job_store=job_store,
+            text=text,
+            voice_id=voice_id,
+            speed=speed,
+            language=language,
+            normalize=_normalize_and_chunk,
+        )
+    except svc.PiperBusyError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    return {"job_id": job_id}
+
+
+@router.get("/generate/progress/{job_id}")
+def generate_progress(job_id: str) -> StreamingResponse:
+    return StreamingResponse(svc.piper_progress.sse_stream(job_id), media_type="text/event-stream")
+
+
+@router.get("/generate/result/{job_id}")
+def generate_result(job_id: str, job_store: JobStore = Depends(get_job_store)) -> dict:
+    record = job_store.get_job(job_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="job not found")
+    return {
+        "job_id": job_id,
+        "status": record.status,
+        "result": record.result,
+        "error": record.error,
+        "progress": svc.piper_progress.get_payload(job_id, include_logs=False),
+    }
+
+
+@router.get("/queue")
+def get_queue() -> dict:
+    """Synthesis pool size and how many jobs are running or waiting."""
+    return svc.synthesis_pool.status()
+
+
+_STREAM_END = object()
+
+
+def _run_stream(
+    text: str,
+    voice_id: str,
+    language: str,
+    speed: float,
+    audio_format: str,
+    on_ready: Callable[[int], None],
+    emit: Callable[[object], None],
+    cancelled: threading.Event,
+) -> None:
+    """Pool job for /generate/stream: normalize, load the voice, then emit audio bytes until done."""
+    try:
+        chunks = _require_chunks(text, language)
+        engine = svc._load_model(voice_id)
+        on_ready(engine.sample_rate)
+        for part in svc.iter_audio_stream(chunks, voice_id, speed=speed, language=language, audio_format=audio_format):
+            if cancelled.is_set():
+                return
+            emit(part)
+    finally:
+        emit(_STREAM_END)
+
+
+@router.post("/generate/stream")
+async def generate_stream(payload: dict = Body(...)) -> StreamingResponse:
+    """
+    Stream audio while it is synthesized, one sentence chunk at a time.
+
+    `format` is "wav" (default; streaming WAV header + PCM16) or "pcm" (raw
+    PCM16 mono, sample rate in the X-Sample-Rate header).
+
+    The whole stream runs as one job on the Piper worker pool and holds its
+    slot until the last chunk is sent or the client disconnects.
+    """
+    text, voice_id, language, speed = _parse_generate_request(payload)
+    audio_format = str(payload.get("format") or "wav").strip().lower()
+    if audio_format not in svc.STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {list(svc.STREAM_FORMATS)}")
+
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Future = loop.create_future()
+    frames: asyncio.Queue = asyncio.Queue()
+    cancelled = threading.Event()
+
+    def _on_ready(sample_rate: int) -> None:
+        loop.call_soon_threadsafe(ready.set_result, sample_rate)
+
+    def _emit(item: object) -> None:
+        loop.call_soon_threadsafe(frames.put_nowait, item)
+
+    try:
+        future = svc.synthesis_pool.submit(
+            _run_stream, text, voice_id, language, speed, audio_format, _on_ready, _emit, cancelled
+        )
+    except svc.PiperBusyError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    job = asyncio.wrap_future(future)
+
+    # Normalize and load the voice before the response starts so bad input is
+    # still a 400/404 rather than a truncated stream.
+    await asyncio.wait([ready, job], return_when=asyncio.FIRST_COMPLETED)
+    if not ready.done():
+        cancelled.set()
+        try:
+            job.result()
+        except HTTPException:
+            raise
+        except (FileNotFoundError, ValueError) as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Piper TTS generation failed: {exc}") from exc
+        raise HTTPException(status_code=500, detail="Piper TTS generation produced no audio")
+    sample_rate = ready.result()
+
+    async def _body():
+        try:
+            while True:
+                item = await frames.get()
+                if item is _STREAM_END:
+                    break
+                yield item
+            await job  # re-raise a mid-stream synthesis error
+        finally:
+            # Client gone or stream finished: stop the worker between chunks.
+            cancelled.set()
+
+    media_type = "audio/wav" if audio_format == "wav" else f"audio/L16;rate={sample_rate};channels=1"
+    return StreamingResponse(
+        _body(),
+        media_type=media_type,
+        headers={"X-Sample-Rate": str(sample_rate), "Cache-Control": "no-cache"},
+    )
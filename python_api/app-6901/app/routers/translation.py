@@ -1,19 +1,24 @@
 from __future__ import annotations
 
+import sqlite3
 from typing import Any
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from python_api.common.jobs import JobStore
 
 from ..deps import get_job_store
 from ..services.translation import (
+    TRANSLATION_BACKENDS,
+    TRANSLATION_MEMORY_ENABLED,
     download_model,
     get_model_status,
+    get_translation_events,
     get_translation_status,
     load_model,
     start_translation,
+    translation_memory,
     translation_progress,
     unload_model,
 )
@@ -44,6 +49,15 @@ def _validate_segments(raw_segments: Any) -> list[dict] | None:
     return normalized
 
 
+def _validate_backend(raw_backend: Any) -> str | None:
+    if raw_backend is None or raw_backend == "":
+        return None
+    backend = str(raw_backend).strip().lower()
+    if backend not in TRANSLATION_BACKENDS:
+        raise HTTPException(status_code=400, detail=f"backend must be one of: {', '.join(TRANSLATION_BACKENDS)}")
+    return backend
+
+
 @router.post("/translate")
 def translate(payload: dict = Body(...), job_store: JobStore = Depends(get_job_store)) -> dict:
     source_lang = str(payload.get("source_lang") or "").strip()
@@ -51,6 +65,8 @@ def translate(payload: dict = Body(...), job_store: JobStore = Depends(get_job_s
     text = str(payload.get("text") or "").strip()
     preserve_emotion = bool(payload.get("preserve_emotion", True))
     segments = _validate_segments(payload.get("segments"))
+    backend = _validate_backend(payload.get("backend"))
+    use_memory = bool(payload.get("use_memory", True))
 
     if not source_lang or not target_lang:
         raise HTTPException(status_code=400, detail="source_lang and target_lang are required")
@@ -64,13 +80,40 @@ def translate(payload: dict = Body(...), job_store: JobStore = Depends(get_job_s
         target_lang=target_lang,
         segments=segments,
         preserve_emotion=preserve_emotion,
+        backend=backend,
+        use_memory=use_memory,
     )
     return {"job_id": job_id}
 
 
+def _resume_cursor(cursor: int | None, last_event_id: str | None) -> int:
+    if cursor is not None:
+        return cursor
+    if last_event_id is not None and last_event_id.strip().isdigit():
+        return int(last_event_id) + 1
+    return 0
+
+
 @router.get("/translate/stream/{job_id}")
-def translate_stream(job_id: str) -> StreamingResponse:
-    return StreamingResponse(translation_progress.sse_stream(job_id), media_type="text/event-stream")
+def translate_stream(
+    job_id: str,
+    cursor: int | None = Query(default=None, ge=0),
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    start = _resume_cursor(cursor, last_event_id)
+    return StreamingResponse(translation_progress.event_stream(job_id, cursor=start), media_type="text/event-stream")
+
+
+@router.get("/translate/segments/{job_id}")
+def translate_segments(
+    job_id: str,
+    cursor: int = Query(default=0, ge=0),
+    job_store: JobStore = Depends(get_job_store),
+) -> dict:
+    status_payload = get_translation_status(job_store, job_id)
+    if not status_payload:
+        raise HTTPException(status_code=404, detail="job not found")
+    return {**get_translation_events(job_id, cursor), "status": status_payload.get("status")}
 
 
 @router.get("/translate/result/{job_id}")
@@ -88,6 +131,25 @@ def translate_result(job_id: str, job_store: JobStore = Depends(get_job_store))
     }
 
 
+@router.get("/memory")
+def memory_stats() -> dict:
+    if not TRANSLATION_MEMORY_ENABLED:
+        return {"enabled": False, "path": str(translation_memory.path)}
+    try:
+        return {"enabled": True, **translation_memory.stats()}
+    except sqlite3.Error as exc:
+        raise HTTPException(status_code=500, detail=f"translation memory unavailable: {exc}") from exc
+
+
+@router.delete("/memory")
+def memory_clear() -> dict:
+    try:
+        translation_memory.clear()
+    except sqlite3.Error as exc:
+        raise HTTPException(status_code=500, detail=f"translation memory unavailable: {exc}") from exc
+    return {"status": "cleared"}
+
+
 @router.post("/download")
 def model_download(job_store: JobStore = Depends(get_job_store)) -> StreamingResponse:
     task_id = download_model(job_store)
@@ -95,8 +157,9 @@ def model_download(job_store: JobStore = Depends(get_job_store)) -> StreamingRes
 
 
 @router.post("/load")
-def model_load() -> StreamingResponse:
-    task_id = load_model()
+def model_load(payload: dict | None = Body(default=None)) -> StreamingResponse:
+    backend = _validate_backend((payload or {}).get("backend"))
+    task_id = load_model(backend)
     return StreamingResponse(translation_progress.sse_stream(task_id), media_type="text/event-stream")
 
 
@@ -1,11 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
+import json
+import logging
+import os
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from python_api.common.paths import TEMP_DIR
+from python_api.common.paths import CACHE_DIR, TEMP_DIR
+from .text_normalizer.text_processor import chunk_text_i18n
+
+
+LOGGER = logging.getLogger(__name__)
+
+EDGE_TTS_VOICES_TTL_SECONDS = float(os.getenv("EDGE_TTS_VOICES_TTL_SECONDS", "86400"))
+# An unknown voice id triggers a refresh only if the catalog is at least this old.
+EDGE_TTS_VOICES_MISS_REFRESH_SECONDS = float(os.getenv("EDGE_TTS_VOICES_MISS_REFRESH_SECONDS", "300"))
+EDGE_TTS_VOICES_PATH = CACHE_DIR / "edge-tts" / "voices.json"
+
+# Long-text mode: texts over EDGE_TTS_LONG_TEXT_CHARS are split and the chunks
+# synthesized concurrently, at most EDGE_TTS_MAX_CONCURRENCY at a time.
+EDGE_TTS_LONG_TEXT_CHARS = int(os.getenv("EDGE_TTS_LONG_TEXT_CHARS", "1000"))
+EDGE_TTS_MAX_CONCURRENCY = int(os.getenv("EDGE_TTS_MAX_CONCURRENCY", "4"))
+EDGE_TTS_CHUNK_RETRIES = int(os.getenv("EDGE_TTS_CHUNK_RETRIES", "2"))
+# edge-tts reports boundary offsets in 100 ns ticks.
+_TICKS_PER_SECOND = 10_000_000
 
 
 def _get_edge_tts_module() -> Any:
@@ -33,9 +55,125 @@ def _normalize_voice(voice: Dict[str, Any]) -> Dict[str, str]:
     }
 
 
+class VoiceCatalog:
+    """
+    Edge-TTS voice list, kept in memory and on disk.
+
+    Reads are served from memory; a cold start loads the last catalog written
+    to `path`, and only an empty cache waits for the network. Once the
+    catalog is older than `ttl_seconds` it is still returned, and a single
+    background refresh replaces it (stale-while-revalidate). Failed refreshes
+    keep the old catalog.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._voices: Optional[List[Dict[str, Any]]] = None
+        self._voice_ids: frozenset[str] = frozenset()
+        self._fetched_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.last_error: Optional[str] = None
+
+    def _set(self, voices: List[Dict[str, Any]], fetched_at: float) -> None:
+        self._voices = voices
+        self._voice_ids = frozenset(_normalize_voice(voice)["id"] for voice in voices) - {""}
+        self._fetched_at = fetched_at
+
+    def _load_from_disk(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            voices = payload["voices"]
+            if isinstance(voices, list) and voices:
+                self._set(voices, float(payload.get("fetched_at", 0)))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            LOGGER.warning("Ignoring unreadable Edge-TTS voice cache %s: %s", self.path, exc)
+
+    def _save_to_disk(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"fetched_at": self._fetched_at, "voices": self._voices}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            LOGGER.warning("Could not write Edge-TTS voice cache %s: %s", self.path, exc)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self._fetched_at
+
+    async def _fetch(self) -> None:
+        try:
+            voices = await _get_edge_tts_module().list_voices()
+        except Exception as exc:
+            self.last_error = str(exc)
+            raise
+        self._set(list(voices), time.time())
+        self.refreshes += 1
+        self.last_error = None
+        await asyncio.to_thread(self._save_to_disk)
+
+    def refresh(self) -> asyncio.Task:
+        """Start a refresh unless one is already running on this event loop."""
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._refresh_task = asyncio.ensure_future(self._fetch())
+            task.add_done_callback(_log_refresh_failure)
+        return task
+
+    async def get(self) -> List[Dict[str, Any]]:
+        if self._voices is None:
+            self._load_from_disk()
+        if self._voices is None:
+            await self.refresh()
+        elif self.age_seconds > self.ttl_seconds:
+            self.refresh()
+        return self._voices or []
+
+    async def has_voice(self, voice_id: str) -> bool:
+        await self.get()
+        if voice_id in self._voice_ids:
+            return True
+        if self.age_seconds > EDGE_TTS_VOICES_MISS_REFRESH_SECONDS:
+            # Possibly a voice added since the catalog was fetched.
+            try:
+                await self.refresh()
+            except Exception:
+                return False
+        return voice_id in self._voice_ids
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "voices": len(self._voice_ids),
+            "age_seconds": round(self.age_seconds, 1) if self._voices is not None else None,
+            "ttl_seconds": self.ttl_seconds,
+            "refreshing": self._refresh_task is not None and not self._refresh_task.done(),
+            "refreshes": self.refreshes,
+            "last_error": self.last_error,
+            "path": str(self.path),
+        }
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        LOGGER.warning("Edge-TTS voice catalog refresh failed: %s", task.exception())
+
+
+voice_catalog = VoiceCatalog(EDGE_TTS_VOICES_PATH, EDGE_TTS_VOICES_TTL_SECONDS)
+
+
+async def is_voice_supported(voice_id: str) -> bool:
+    return await voice_catalog.has_voice(voice_id)
+
+
 async def list_voices(language: str | None = None) -> List[Dict[str, str]]:
-    edge_tts = _get_edge_tts_module()
-    voices_raw = await edge_tts.list_voices()
+    voices_raw = await voice_catalog.get()
     language_prefix = (language or "").strip().lower()
 
     result: List[Dict[str, str]] = []
@@ -52,8 +190,7 @@ async def list_voices(language: str | None = None) -> List[Dict[str, str]]:
 
 
 async def list_languages() -> List[Dict[str, Any]]:
-    edge_tts = _get_edge_tts_module()
-    voices_raw = await edge_tts.list_voices()
+    voices_raw = await voice_catalog.get()
     by_code: Dict[str, Dict[str, Any]] = {}
 
     for voice in voices_raw:
@@ -91,3 +228,134 @@ async def synthesize_to_mp3(text: str, voice: str, rate: int = 0, pitch: int = 0
     communicator = edge_tts.Communicate(safe_text, safe_voice, rate=rate_str, pitch=pitch_str)
     await communicator.save(str(output_path))
     return output_path, filename
+
+
+# MPEG audio frame header tables, indexed by the header's version bits.
+_MP3_BITRATES_KBPS = {
+    "v1": (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    "v2": (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def mp3_duration_seconds(data: bytes) -> float:
+    """
+    Duration of a Layer III MP3 stream, by walking its frame headers.
+
+    Edge-TTS returns headerless CBR MP3, so counting frames is exact and needs
+    no decoder. Bytes that do not start a valid frame are skipped.
+    """
+    index, samples, size = 0, 0, len(data)
+    sample_rate = 0
+    if data[:3] == b"ID3" and size >= 10:
+        index = 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9])
+    while index + 4 <= size:
+        if data[index] != 0xFF or (data[index + 1] & 0xE0) != 0xE0:
+            index += 1
+            continue
+        version = (data[index + 1] >> 3) & 0x03
+        layer = (data[index + 1] >> 1) & 0x03
+        bitrate_index = data[index + 2] >> 4
+        rate_index = (data[index + 2] >> 2) & 0x03
+        if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+            index += 1
+            continue
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+        bitrate = _MP3_BITRATES_KBPS["v1" if version == 3 else "v2"][bitrate_index] * 1000
+        frame_samples = 1152 if version == 3 else 576
+        padding = (data[index + 2] >> 1) & 0x01
+        frame_length = frame_samples // 8 * bitrate // sample_rate + padding
+        samples += frame_samples
+        index += max(frame_length, 1)
+    return samples / sample_rate if sample_rate else 0.0
+
+
+async def _synthesize_chunk(
+    edge_tts: Any, text: str, voice: str, rate: str, pitch: str
+) -> Tuple[bytes, List[Dict[str, Any]]]:
+    """Synthesize one chunk to MP3 bytes plus its word boundaries (seconds, chunk-relative)."""
+    last_error: Optional[Exception] = None
+    for attempt in range(EDGE_TTS_CHUNK_RETRIES + 1):
+        audio = bytearray()
+        words: List[Dict[str, Any]] = []
+        try:
+            communicator = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch, boundary="WordBoundary")
+            async for chunk in communicator.stream():
+                if chunk["type"] == "audio":
+                    audio.extend(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    start = chunk["offset"] / _TICKS_PER_SECOND
+                    words.append({
+                        "word": chunk["text"],
+                        "start": start,
+                        "end": start + chunk["duration"] / _TICKS_PER_SECOND,
+                    })
+            if audio:
+                return bytes(audio), words
+            last_error = RuntimeError("edge-tts returned no audio")
+        except Exception as exc:
+            last_error = exc
+        if attempt < EDGE_TTS_CHUNK_RETRIES:
+            await asyncio.sleep(0.5 * (attempt + 1))
+    raise RuntimeError(f"edge-tts failed on chunk {text[:40]!r}: {last_error}")
+
+
+async def synthesize_long_to_mp3(
+    text: str,
+    voice: str,
+    rate: int = 0,
+    pitch: int = 0,
+    max_concurrency: int = EDGE_TTS_MAX_CONCURRENCY,
+) -> Tuple[Path, str, Dict[str, Any]]:
+    """
+    Synthesize article-length text chunk by chunk.
+
+    The text is split with chunk_text_i18n, chunks are synthesized
+    concurrently (bounded by `max_concurrency`, each retried on failure) and
+    their MP3 frames are concatenated without re-encoding. The returned
+    metadata has whisper-style `segments` (one per chunk, each with `words`)
+    and a flat `words` list, all with absolute start/end seconds.
+    """
+    edge_tts = _get_edge_tts_module()
+    safe_voice = voice.strip()
+    if not safe_voice:
+        raise ValueError("voice is required")
+    chunks = chunk_text_i18n(text.strip())
+    if not chunks:
+        raise ValueError("text is required")
+
+    rate_str = f"{int(rate):+d}%"
+    pitch_str = f"{int(pitch):+d}Hz"
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _bounded(chunk: str) -> Tuple[bytes, List[Dict[str, Any]]]:
+        async with semaphore:
+            return await _synthesize_chunk(edge_tts, chunk, safe_voice, rate_str, pitch_str)
+
+    results = await asyncio.gather(*(_bounded(chunk) for chunk in chunks))
+
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    filename = f"edge_tts_{uuid4().hex}.mp3"
+    output_path = TEMP_DIR / filename
+    segments: List[Dict[str, Any]] = []
+    words: List[Dict[str, Any]] = []
+    offset = 0.0
+    with output_path.open("wb") as handle:
+        for chunk, (audio, chunk_words) in zip(chunks, results):
+            handle.write(audio)
+            duration = mp3_duration_seconds(audio)
+            shifted = [
+                {"word": word["word"], "start": round(offset + word["start"], 3), "end": round(offset + word["end"], 3)}
+                for word in chunk_words
+            ]
+            segments.append({
+                "id": len(segments),
+                "text": chunk,
+                "start": round(offset, 3),
+                "end": round(offset + duration, 3),
+                "words": shifted,
+            })
+            words.extend(shifted)
+            offset += duration
+    metadata = {"duration": round(offset, 3), "chunks": len(chunks), "segments": segments, "words": words}
+    return output_path, filename, metadata
@@ -8,11 +8,10 @@ import os
 import re
 import time
 from typing import Any
-from urllib.parse import urljoin, urlparse
-import urllib.robotparser as robotparser
+from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup, Tag
+from .. import crawl_engine, extraction
+from ..extraction import HtmlElement
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -23,15 +22,11 @@ USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
 )
 
-REQUEST_TIMEOUT = 15
-SLEEP_BETWEEN_REQUESTS = 3.0
-_MAX_RETRIES = 3
 
 _FETCH_HEADERS = {
     "User-Agent": USER_AGENT,
     "Accept-Language": "en-US,en;q=0.9",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-    "Accept-Encoding": "gzip, deflate, br",
     "Connection": "keep-alive",
     "Upgrade-Insecure-Requests": "1",
 }
@@ -53,34 +48,13 @@ def _clean_text(text: str | None) -> str | None:
 
 
 def can_fetch(url: str, user_agent: str = USER_AGENT) -> bool:
-    """Check *robots.txt* permission for *url*."""
-    parsed = urlparse(url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-    rp = robotparser.RobotFileParser()
-    try:
-        rp.set_url(robots_url)
-        rp.read()
-        return rp.can_fetch(user_agent, url)
-    except Exception:
-        return False
+    """Check *robots.txt* permission for *url* (cached per host by the crawl engine)."""
+    return crawl_engine.can_fetch(url, user_agent)
 
 
 def _fetch_html(url: str) -> str:
-    """Download *url* with retries and progressive back-off."""
-    for attempt in range(_MAX_RETRIES):
-        try:
-            resp = requests.get(url, headers=_FETCH_HEADERS, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            if len(resp.text) < 100:
-                raise ValueError(f"Response too short ({len(resp.text)} chars)")
-            return resp.text
-        except (requests.RequestException, ValueError) as exc:
-            if attempt == _MAX_RETRIES - 1:
-                raise RuntimeError(
-                    f"Failed to fetch {url} after {_MAX_RETRIES} attempts"
-                ) from exc
-            time.sleep((attempt + 1) * 2)
-    raise RuntimeError("Unexpected fetch failure")
+    """Download *url* via the shared crawl engine (pooled, rate-limited, retried)."""
+    return crawl_engine.fetch_html(url, headers=_FETCH_HEADERS)
 
 
 # ---------------------------------------------------------------------------
@@ -88,11 +62,11 @@ def _fetch_html(url: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _extract_json_ld(soup: BeautifulSoup) -> dict[str, Any]:
+def _extract_json_ld(root: HtmlElement) -> dict[str, Any]:
     """Parse the first NewsArticle JSON-LD block on the page."""
-    for script in soup.find_all("script", type="application/ld+json"):
+    for script in root.xpath('//script[@type="application/ld+json"]'):
         try:
-            data = json.loads(script.string or "")
+            data = json.loads(script.text or "")
         except (json.JSONDecodeError, TypeError):
             continue
 
@@ -120,19 +94,13 @@ def _extract_json_ld(soup: BeautifulSoup) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-def _extract_metadata(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
+def _extract_metadata(root: HtmlElement, base_url: str) -> dict[str, Any]:
     """Pull metadata from JSON-LD (primary) and meta tags (fallback)."""
 
     def _meta(names: list[str]) -> str | None:
-        for name in names:
-            tag = soup.find("meta", attrs={"property": name}) or soup.find(
-                "meta", attrs={"name": name}
-            )
-            if tag and tag.get("content"):
-                return tag["content"].strip()
-        return None
+        return extraction.meta_content(root, names)
 
-    ld = _extract_json_ld(soup)
+    ld = _extract_json_ld(root)
 
     # --- Title ---
     title: str | None = None
@@ -140,8 +108,9 @@ def _extract_metadata(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
         title = _clean_text(ld["headline"])
     if not title:
         title = _clean_text(_meta(["og:title", "twitter:title"]))
-    if not title and soup.find("h1"):
-        title = _clean_text(soup.find("h1").get_text())  # type: ignore[union-attr]
+    h1 = extraction.first(root, "//h1")
+    if not title and h1 is not None:
+        title = _clean_text(h1.text_content())
 
     # --- Description ---
     description: str | None = ld.get("description") or _meta(
@@ -178,9 +147,9 @@ def _extract_metadata(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
     )
     # Fallback: data-first-publish attribute on timestamp span
     if not published_time:
-        ts_span = soup.find(attrs={"data-first-publish": True})
-        if ts_span:
-            published_time = ts_span.get("data-first-publish")  # type: ignore[assignment]
+        ts_span = extraction.first(root, "//*[@data-first-publish]")
+        if ts_span is not None:
+            published_time = ts_span.get("data-first-publish")
 
     # --- Author ---
     author: str | None = None
@@ -195,9 +164,9 @@ def _extract_metadata(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
             author = ld_author
     if not author:
         # CNN byline: span.byline__name
-        byline = soup.select_one("span.byline__name")
-        if byline:
-            author = _clean_text(byline.get_text())
+        byline = extraction.first(root, f"//span[{extraction.has_class('byline__name')}]")
+        if byline is not None:
+            author = _clean_text(byline.text_content())
     if not author:
         author = _meta(["author", "article:author"])
 
@@ -217,17 +186,17 @@ def _extract_metadata(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
     elif isinstance(ld_section, str):
         categories = [ld_section]
     if not categories:
-        kicker = soup.select_one(".headline__kicker")
-        if kicker:
-            text = _clean_text(kicker.get_text())
+        kicker = extraction.first(root, f"//*[{extraction.has_class('headline__kicker')}]")
+        if kicker is not None:
+            text = _clean_text(kicker.text_content())
             if text:
                 categories = [text]
 
     # --- Tags ---
     tags: list[str] = [
-        t["content"].strip()
-        for t in soup.find_all("meta", attrs={"property": "article:tag"})
-        if t.get("content")
+        content.strip()
+        for content in root.xpath('//meta[@property="article:tag"]/@content')
+        if content
     ]
 
     return {
@@ -244,70 +213,44 @@ def _extract_metadata(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
     }
 
 
-def _find_article_container(soup: BeautifulSoup) -> Tag:
-    """Locate the main article body element, preferring CNN-specific selectors."""
-
-    # 1. CNN primary: div.article__content (itemprop="articleBody")
-    container = soup.select_one("div.article__content")
-    if container and isinstance(container, Tag):
-        return container
-
-    # 2. article element
-    article = soup.find("article")
-    if article and isinstance(article, Tag):
-        return article
-
-    # 3. itemprop="articleBody"
-    itemprop = soup.find(attrs={"itemprop": "articleBody"})
-    if itemprop and isinstance(itemprop, Tag):
-        return itemprop
+# Fast paths for the article body, in order; the density heuristic is the fallback.
+_CONTAINER_SELECTORS = (
+    f"//div[{extraction.has_class('article__content')}]",  # itemprop="articleBody"
+    "//article",
+    "//*[@itemprop='articleBody']",
+)
+_PARAGRAPH_XPATH = f".//p[{extraction.has_class('paragraph-elevate')}]"
+_IMAGE_WRAPPER_XPATH = "//div[contains(@class, 'image_large')]"
+_CAPTION_XPATH = f".//div[@itemprop='caption' or {extraction.has_class('image_large__caption')}]"
+_CREDIT_XPATH = (
+    f".//*[(self::figcaption and {extraction.has_class('image_large__credit')})"
+    f" or {extraction.has_class('image__credit')}]"
+)
 
-    # 4. Largest div by paragraph count
-    best: Tag | None = None
-    best_count = 0
-    for div in soup.find_all("div"):
-        count = len(div.find_all("p"))
-        if count > best_count:
-            best = div
-            best_count = count
 
-    return best or soup.body or soup
+def _find_article_container(root: HtmlElement) -> HtmlElement:
+    """Locate the main article body element, preferring CNN-specific selectors."""
+    return extraction.find_container(root, _CONTAINER_SELECTORS)
 
 
 def _extract_body(
-    soup: BeautifulSoup, base_url: str
+    root: HtmlElement, base_url: str
 ) -> dict[str, list[str] | list[dict[str, str | None]]]:
     """Extract paragraphs and images from the CNN article body."""
-    container = _find_article_container(soup)
+    container = _find_article_container(root)
 
     # CNN paragraph class: "paragraph-elevate" (may also be plain <p>)
-    cnn_paras = container.select("p.paragraph-elevate")
-    if cnn_paras:
-        paragraphs = [
-            p.get_text(separator=" ", strip=True)
-            for p in cnn_paras
-            if len(p.get_text(strip=True)) > 30
-        ]
-    else:
-        paragraphs = [
-            p.get_text(separator=" ", strip=True)
-            for p in container.find_all("p")
-            if len(p.get_text(strip=True)) > 30
-        ]
+    paragraphs = extraction.extract_paragraphs(container.xpath(_PARAGRAPH_XPATH) or container.iter("p"))
 
     # Images — CNN wraps them in div with class containing "image_large"
     seen_srcs: set[str] = set()
     images: list[dict[str, str | None]] = []
 
-    for img_wrapper in soup.select("div[class*='image_large']"):
-        img_tag = img_wrapper.find("img")
-        if not img_tag:
+    for img_wrapper in root.xpath(_IMAGE_WRAPPER_XPATH):
+        img_tag = extraction.first(img_wrapper, ".//img")
+        if img_tag is None:
             continue
-        src = (
-            img_tag.get("data-src")
-            or img_tag.get("data-original")
-            or img_tag.get("src")
-        )
+        src = extraction.image_source(img_tag)
         if not src:
             continue
         src = urljoin(base_url, src)
@@ -317,21 +260,21 @@ def _extract_body(
 
         # Caption
         caption: str | None = None
-        cap_div = img_wrapper.select_one("div[itemprop='caption'], div.image_large__caption")
-        if cap_div:
-            caption = _clean_text(cap_div.get_text())
+        cap_div = extraction.first(img_wrapper, _CAPTION_XPATH)
+        if cap_div is not None:
+            caption = _clean_text(cap_div.text_content())
         # Credit/attribution
         credit: str | None = None
-        credit_tag = img_wrapper.select_one("figcaption.image_large__credit, .image__credit")
-        if credit_tag:
-            credit = _clean_text(credit_tag.get_text())
+        credit_tag = extraction.first(img_wrapper, _CREDIT_XPATH)
+        if credit_tag is not None:
+            credit = _clean_text(credit_tag.text_content())
 
         images.append({"src": src, "caption": caption, "credit": credit})
 
     # Fallback: collect all <img> in container if none found above
     if not images:
-        for img in container.find_all("img"):
-            src = img.get("data-src") or img.get("data-original") or img.get("src")
+        for img in container.iter("img"):
+            src = extraction.image_source(img)
             if not src:
                 continue
             src = urljoin(base_url, src)
@@ -340,11 +283,11 @@ def _extract_body(
             seen_srcs.add(src)
 
             caption = None
-            fig = img.find_parent("figure")
-            if fig:
-                cap_tag = fig.find("figcaption")
-                if cap_tag:
-                    caption = _clean_text(cap_tag.get_text())
+            fig = next(img.iterancestors("figure"), None)
+            if fig is not None:
+                cap_tag = extraction.first(fig, ".//figcaption")
+                if cap_tag is not None:
+                    caption = _clean_text(cap_tag.text_content())
 
             images.append({"src": src, "caption": caption, "credit": None})
 
@@ -395,38 +338,50 @@ def _save_html_preview(data: dict[str, Any], path: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def scrape_article(
-    url: str,
-    out_prefix: str = "article",
-    out_dir: str = "articles",
-) -> tuple[str, str]:
-    """Scrape *url*, save JSON + HTML preview, return their paths.
+def extract(url: str) -> dict[str, Any]:
+    """Fetch and parse *url* into the article payload, without touching disk.
 
     @param url: Full CNN article URL.
-    @param out_prefix: Filename prefix (e.g. ``article_1``).
-    @param out_dir: Directory to write output files into.
-    @return: ``(json_path, html_path)`` tuple.
+    @return: ``{"scraped_at", "source_url", "meta", "body"}`` dict.
     """
     raw_html = _fetch_html(url)
-    time.sleep(SLEEP_BETWEEN_REQUESTS)
-
-    soup = BeautifulSoup(raw_html, "html.parser")
-    metadata = _extract_metadata(soup, url)
-    body = _extract_body(soup, url)
 
-    payload: dict[str, Any] = {
+    root = extraction.parse_html(raw_html)
+    return {
         "scraped_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "source_url": url,
-        "meta": metadata,
-        "body": body,
+        "meta": _extract_metadata(root, url),
+        "body": _extract_body(root, url),
     }
 
+
+def save_article(
+    data: dict[str, Any],
+    out_prefix: str = "article",
+    out_dir: str = "articles",
+) -> tuple[str, str]:
+    """Write an {@link extract} payload as JSON + HTML preview, return their paths."""
     os.makedirs(out_dir, exist_ok=True)
     base = os.path.basename(out_prefix)
     json_path = os.path.join(out_dir, f"{base}.json")
     html_path = os.path.join(out_dir, f"{base}.html")
 
-    _save_json(payload, json_path)
-    _save_html_preview(payload, html_path)
+    _save_json(data, json_path)
+    _save_html_preview(data, html_path)
 
     return json_path, html_path
+
+
+def scrape_article(
+    url: str,
+    out_prefix: str = "article",
+    out_dir: str = "articles",
+) -> tuple[str, str]:
+    """Scrape *url*, save JSON + HTML preview, return their paths.
+
+    @param url: Full CNN article URL.
+    @param out_prefix: Filename prefix (e.g. ``article_1``).
+    @param out_dir: Directory to write output files into.
+    @return: ``(json_path, html_path)`` tuple.
+    """
+    return save_article(extract(url), out_prefix, out_dir)
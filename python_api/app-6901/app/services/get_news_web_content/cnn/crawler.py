@@ -5,9 +5,9 @@ from __future__ import annotations
 import logging
 import os
 import shutil
-import time
 from dataclasses import dataclass, field
 
+from .. import crawl_engine
 from .url_fetcher import fetch_article_urls
 from .content_scraper import scrape_article
 
@@ -33,6 +33,7 @@ class CrawlConfig:
     daily_limit: int = DEFAULT_DAILY_LIMIT
     clean_before_run: bool = False
     fetch_pool_size: int = 50
+    workers: int = crawl_engine.CRAWL_WORKERS
 
 
 # ---------------------------------------------------------------------------
@@ -87,7 +88,8 @@ def crawl_articles(config: CrawlConfig | None = None) -> CrawlResult:
       1. Optionally clean the output directory.
       2. Load previously-processed URLs.
       3. Fetch fresh article URLs from the category page.
-      4. Scrape up to ``daily_limit`` new articles and save JSON + HTML.
+      4. Scrape up to ``daily_limit`` new articles on ``workers`` threads and
+         save JSON + HTML.
 
     @param config: Crawl configuration. ``None`` uses defaults.
     @return: A {@link CrawlResult} summarising the run.
@@ -110,26 +112,25 @@ def crawl_articles(config: CrawlConfig | None = None) -> CrawlResult:
     new_urls = [u for u in urls if u not in processed]
     logger.info("Found %d new article URLs (of %d total)", len(new_urls), len(urls))
 
-    # Scrape
+    # Scrape concurrently; per-host politeness is enforced by the crawl engine.
     start_num = _next_article_number(cfg.out_dir)
-    for idx, url in enumerate(new_urls[: cfg.daily_limit]):
-        article_num = start_num + idx
-        prefix = f"article_{article_num}"
-        logger.info("Scraping article %d: %s", article_num, url)
-
-        try:
-            json_path, _ = scrape_article(url, prefix, cfg.out_dir)
-            _save_processed(cfg.processed_file, url)
-            result.processed += 1
-            result.saved_files.append(json_path)
-            logger.info("Saved %s", json_path)
-        except Exception:
-            logger.exception("Failed to process %s", url)
-            result.failed += 1
+    batch = new_urls[: cfg.daily_limit]
+
+    def _scrape(idx: int, url: str) -> str:
+        prefix = f"article_{start_num + idx}"
+        logger.info("Scraping article %d: %s", start_num + idx, url)
+        json_path, _ = scrape_article(url, prefix, cfg.out_dir)
+        return json_path
 
-        # Small delay between articles
-        if idx < len(new_urls[: cfg.daily_limit]) - 1:
-            time.sleep(1)
+    for _, url, json_path, error in crawl_engine.crawl(batch, _scrape, workers=cfg.workers):
+        if error is not None:
+            logger.error("Failed to process %s: %s", url, error)
+            result.failed += 1
+            continue
+        _save_processed(cfg.processed_file, url)
+        result.processed += 1
+        result.saved_files.append(json_path)
+        logger.info("Saved %s", json_path)
 
     result.skipped = len(processed)
     logger.info(
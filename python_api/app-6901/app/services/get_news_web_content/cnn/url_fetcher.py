@@ -2,9 +2,10 @@
 
 import re
 
-import requests
 from bs4 import BeautifulSoup
 
+from .. import crawl_engine
+
 BASE_URL = "https://edition.cnn.com"
 DEFAULT_CATEGORY_URL = f"{BASE_URL}/business"
 
@@ -36,8 +37,7 @@ def fetch_article_urls(
     @param limit: Maximum number of URLs to return.
     @return: Deduplicated list of absolute article URLs.
     """
-    resp = requests.get(category_url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-    resp.raise_for_status()
+    resp = crawl_engine.fetch(category_url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
 
     soup = BeautifulSoup(resp.text, "html.parser")
 
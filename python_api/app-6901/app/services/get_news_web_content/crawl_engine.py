@@ -0,0 +1,418 @@
+"""Shared crawl engine — pooled HTTP session, per-host politeness, worker pool.
+
+Every scraper module fetches through :func:`fetch_html`, so all requests share
+one keep-alive session and one rate limiter. Each host gets a token bucket
+(``NEWS_CRAWL_RATE_PER_HOST`` requests/second, bursts of ``NEWS_CRAWL_BURST``),
+which replaces the fixed sleeps between articles: crawl throughput is bounded
+by that politeness budget, not by serial latency. :func:`crawl` fans a list of
+URLs out over a bounded thread pool.
+
+Responses carrying an ETag or Last-Modified are kept in an on-disk cache and
+revalidated with a conditional GET, so re-fetching an unchanged page costs a
+304. robots.txt is parsed once per host and kept for ``NEWS_ROBOTS_TTL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+import urllib.robotparser as robotparser
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, TypeVar
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from python_api.common.paths import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+CRAWL_WORKERS = int(os.getenv("NEWS_CRAWL_WORKERS", "4"))
+RATE_PER_HOST = float(os.getenv("NEWS_CRAWL_RATE_PER_HOST", "1.0"))
+BURST_PER_HOST = int(os.getenv("NEWS_CRAWL_BURST", "2"))
+
+REQUEST_TIMEOUT = 15
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+ROBOTS_TTL_SECONDS = float(os.getenv("NEWS_ROBOTS_TTL_SECONDS", "3600"))
+# Unreachable robots.txt means "disallow"; retry that sooner than a real answer.
+ROBOTS_ERROR_TTL_SECONDS = 60.0
+HTTP_CACHE_MAX_BYTES = int(float(os.getenv("NEWS_HTTP_CACHE_MB", "200")) * 1024 * 1024)
+HTTP_CACHE_DIR = CACHE_DIR / "news-scraper" / "http"
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+class TokenBucket:
+    """Thread-safe token bucket; :meth:`acquire` blocks until a token is free.
+
+    Tokens are reserved under the lock (the balance may go negative) and the
+    caller sleeps outside it, so waiting threads are served in arrival order.
+    A ``rate`` of 0 or less disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if needed. Returns the seconds waited."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """One :class:`TokenBucket` per host name."""
+
+    def __init__(self, rate: float = RATE_PER_HOST, burst: int = BURST_PER_HOST) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return bucket.acquire()
+
+
+rate_limiter = HostRateLimiter()
+
+# ---------------------------------------------------------------------------
+# Shared session
+# ---------------------------------------------------------------------------
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide keep-alive session, sized for the worker pool."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            # Only advertise encodings urllib3 can decode (br needs the brotli package).
+            session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(CRAWL_WORKERS * 2, 10))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def _backoff_seconds(attempt: int, retry_after: str | None = None) -> float:
+    """Full-jitter exponential backoff; a numeric ``Retry-After`` takes precedence."""
+    if retry_after and retry_after.strip().isdigit():
+        return min(float(retry_after), BACKOFF_MAX_SECONDS)
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+
+
+class ResponseCache:
+    """On-disk store of response bodies plus their validators, keyed by URL.
+
+    Only responses with an ETag or Last-Modified are stored, since nothing
+    else can be revalidated. Files are ``<sha256>.json`` (metadata) and
+    ``<sha256>.body``; the least recently used are evicted past ``max_bytes``.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._used_bytes: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        folder = self.root / key[:2]
+        return folder / f"{key}.json", folder / f"{key}.body"
+
+    def get(self, url: str) -> tuple[dict[str, Any], bytes] | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return meta, body
+
+    def touch(self, url: str) -> None:
+        for path in self._paths(url):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    def put(self, url: str, resp: requests.Response) -> None:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not self.enabled or not (etag or last_modified):
+            return
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": resp.encoding,
+            "content_type": resp.headers.get("Content-Type"),
+            "stored_at": time.time(),
+        }
+        body = resp.content
+        with self._lock:
+            used = self._usage()
+            try:
+                previous = body_path.stat().st_size
+            except OSError:
+                previous = 0
+            try:
+                meta_path.parent.mkdir(parents=True, exist_ok=True)
+                body_path.write_bytes(body)
+                meta_path.write_text(json.dumps(meta), encoding="utf-8")
+            except OSError as exc:
+                logger.warning("Could not write HTTP cache entry for %s: %s", url, exc)
+                return
+            self._used_bytes = used - previous + len(body)
+            if self._used_bytes > self.max_bytes:
+                self._evict()
+
+    def _usage(self) -> int:
+        if self._used_bytes is None:
+            self._used_bytes = sum(path.stat().st_size for path in self.root.glob("*/*.body"))
+        return self._used_bytes
+
+    def _evict(self) -> None:
+        bodies = sorted(self.root.glob("*/*.body"), key=lambda path: path.stat().st_mtime)
+        target = int(self.max_bytes * 0.9)
+        for body_path in bodies:
+            if self._used_bytes <= target:
+                break
+            size = body_path.stat().st_size
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".json").unlink(missing_ok=True)
+            self._used_bytes -= size
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            used = self._usage() if self.root.exists() else 0
+        return {"used_bytes": used, "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses}
+
+
+response_cache = ResponseCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES)
+
+
+def _cached_response(url: str, meta: dict[str, Any], body: bytes, revalidated: requests.Response) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = url
+    resp._content = body
+    resp.encoding = meta.get("encoding")
+    resp.headers.update({key: value for key, value in revalidated.headers.items()})
+    if meta.get("content_type"):
+        resp.headers["Content-Type"] = meta["content_type"]
+    resp.from_cache = True  # type: ignore[attr-defined]
+    return resp
+
+
+def fetch(
+    url: str,
+    headers: dict[str, str] | None = None,
+    timeout: float = REQUEST_TIMEOUT,
+    retries: int = MAX_RETRIES,
+    use_cache: bool = True,
+) -> requests.Response:
+    """GET *url* through the shared session, rate limiter and retry policy.
+
+    Connection errors, timeouts, 429 and 5xx are retried with jittered
+    backoff; other HTTP errors are raised immediately. With *use_cache*, a
+    stored copy is revalidated (If-None-Match / If-Modified-Since) and served
+    on 304; the returned response then has ``from_cache = True``.
+
+    @raise RuntimeError: When every attempt failed.
+    """
+    session = get_session()
+    cached = response_cache.get(url) if use_cache and response_cache.enabled else None
+    request_headers = dict(headers or {})
+    if cached is not None:
+        meta = cached[0]
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+    # The session decides which encodings it can decode.
+    request_headers.pop("Accept-Encoding", None)
+
+    last_error: Exception | None = None
+    for attempt in range(retries):
+        rate_limiter.acquire(url)
+        retry_after: str | None = None
+        try:
+            resp = session.get(url, headers=request_headers, timeout=timeout)
+            if resp.status_code == 304 and cached is not None:
+                response_cache.hits += 1
+                response_cache.touch(url)
+                return _cached_response(url, cached[0], cached[1], resp)
+            if resp.status_code in _RETRY_STATUSES:
+                retry_after = resp.headers.get("Retry-After")
+                raise requests.HTTPError(f"{resp.status_code} for {url}", response=resp)
+            resp.raise_for_status()
+            if use_cache:
+                response_cache.misses += 1
+                response_cache.put(url, resp)
+            return resp
+        except requests.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else None
+            if status not in _RETRY_STATUSES:
+                raise RuntimeError(f"Failed to fetch {url}: {exc}") from exc
+            last_error = exc
+        except requests.RequestException as exc:
+            last_error = exc
+        if attempt < retries - 1:
+            delay = _backoff_seconds(attempt, retry_after)
+            logger.debug("Retrying %s in %.1fs (%s)", url, delay, last_error)
+            time.sleep(delay)
+    raise RuntimeError(f"Failed to fetch {url} after {retries} attempts") from last_error
+
+
+def fetch_html(url: str, headers: dict[str, str] | None = None, min_length: int = 100) -> str:
+    """Like :func:`fetch`, returning the body text; too-short bodies count as failures."""
+    for attempt in range(MAX_RETRIES):
+        text = fetch(url, headers=headers).text
+        if len(text) >= min_length:
+            return text
+        if attempt < MAX_RETRIES - 1:
+            time.sleep(_backoff_seconds(attempt))
+    raise RuntimeError(f"Failed to fetch {url}: response too short ({len(text)} chars)")
+
+
+# ---------------------------------------------------------------------------
+# robots.txt
+# ---------------------------------------------------------------------------
+
+
+class RobotsCache:
+    """Parsed robots.txt per host, refreshed after ``ttl_seconds``.
+
+    Mirrors ``RobotFileParser.read`` for 4xx: 401/403 disallow everything,
+    other 4xx allow everything. Network failures and 5xx responses disallow,
+    but are retried after ``ROBOTS_ERROR_TTL_SECONDS``.
+    """
+
+    def __init__(self, ttl_seconds: float = ROBOTS_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, robotparser.RobotFileParser | None]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, origin: str) -> tuple[float, robotparser.RobotFileParser | None]:
+        parser = robotparser.RobotFileParser(f"{origin}/robots.txt")
+        rate_limiter.acquire(origin)
+        try:
+            resp = get_session().get(f"{origin}/robots.txt", timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as exc:
+            logger.debug("robots.txt unreachable for %s: %s", origin, exc)
+            return time.monotonic() + ROBOTS_ERROR_TTL_SECONDS, None
+        if resp.status_code >= 500:
+            logger.debug("robots.txt unavailable for %s: HTTP %s", origin, resp.status_code)
+            return time.monotonic() + ROBOTS_ERROR_TTL_SECONDS, None
+        if resp.status_code in (401, 403):
+            parser.disallow_all = True
+        elif resp.status_code >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(resp.text.splitlines())
+        parser.modified()
+        return time.monotonic() + self.ttl_seconds, parser
+
+    def can_fetch(self, url: str, user_agent: str) -> bool:
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        with self._lock:
+            entry = self._entries.get(origin)
+        if entry is None or entry[0] <= time.monotonic():
+            entry = self._load(origin)
+            with self._lock:
+                self._entries[origin] = entry
+        parser = entry[1]
+        return parser is not None and parser.can_fetch(user_agent, url)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+robots_cache = RobotsCache()
+
+
+def can_fetch(url: str, user_agent: str) -> bool:
+    """Check robots.txt permission for *url* using the per-host cache."""
+    return robots_cache.can_fetch(url, user_agent)
+
+
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+
+def crawl(
+    items: list[T],
+    work: Callable[[int, T], Any],
+    workers: int = CRAWL_WORKERS,
+) -> Iterator[tuple[int, T, Any, Exception | None]]:
+    """Run ``work(index, item)`` over *items* on a bounded thread pool.
+
+    Yields ``(index, item, result, error)`` in completion order, so callers can
+    report progress as articles finish. Politeness comes from the per-host
+    limiter inside :func:`fetch`, not from this pool.
+    """
+    if not items:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items))), thread_name_prefix="news-crawl") as pool:
+        futures = {pool.submit(work, index, item): (index, item) for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            index, item = futures[future]
+            try:
+                yield index, item, future.result(), None
+            except Exception as exc:
+                yield index, item, None, exc
@@ -0,0 +1,162 @@
+"""lxml-based article extraction shared by the news scrapers.
+
+Pages are parsed once with lxml's HTML parser. :func:`find_container` tries
+the site's fast-path XPath selectors first and only falls back to the
+text-density heuristic when none of them holds a paragraph. The heuristic's
+per-node text length and paragraph count come from :func:`measure`, a single
+bottom-up pass, instead of calling ``get_text`` on every ``<div>``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+
+from lxml import etree, html
+
+HtmlElement = html.HtmlElement
+
+# Text inside these never counts as article text (BeautifulSoup's get_text skips them too).
+_SKIP_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+_PARSER = html.HTMLParser(encoding="utf-8", remove_comments=True, remove_pis=True)
+
+
+def parse_html(raw: str | bytes) -> HtmlElement:
+    """Parse a page into an lxml tree; never raises on empty or broken input."""
+    data = raw.encode("utf-8") if isinstance(raw, str) else raw
+    try:
+        return html.document_fromstring(data, parser=_PARSER)
+    except (etree.ParserError, ValueError):
+        return html.document_fromstring(b"<html><body></body></html>", parser=_PARSER)
+
+
+def has_class(name: str) -> str:
+    """XPath predicate body matching elements whose class list contains *name*."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def first(node: HtmlElement, xpath: str) -> HtmlElement | None:
+    found = node.xpath(xpath)
+    return found[0] if found else None
+
+
+def _strings(node: HtmlElement) -> Iterator[str]:
+    if node.text:
+        yield node.text
+    for child in node:
+        if child.tag not in _SKIP_TEXT_TAGS:
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def text_of(node: HtmlElement | None, separator: str = "") -> str:
+    """Stripped, non-empty text fragments of *node* joined by *separator*.
+
+    Same result as BeautifulSoup's ``get_text(separator, strip=True)``.
+    """
+    if node is None:
+        return ""
+    return separator.join(piece for piece in (s.strip() for s in _strings(node)) if piece)
+
+
+def meta_content(root: HtmlElement, names: Iterable[str]) -> str | None:
+    """First non-empty ``<meta property|name=...>`` content for *names*, in order."""
+    for name in names:
+        tag = first(root, f'//meta[@property="{name}"]')
+        if tag is None:
+            tag = first(root, f'//meta[@name="{name}"]')
+        if tag is not None and tag.get("content"):
+            return tag.get("content").strip()
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Container detection
+# ---------------------------------------------------------------------------
+
+
+def measure(root: HtmlElement) -> tuple[dict[HtmlElement, int], dict[HtmlElement, int]]:
+    """Text length and descendant ``<p>`` count for every element, in one pass.
+
+    Elements are visited in reverse document order, so every child is
+    finished before its parent and each node is summed from its children.
+    Text length matches ``len(get_text(strip=True))``.
+    """
+    text_len: dict[HtmlElement, int] = {}
+    p_count: dict[HtmlElement, int] = {}
+    for node in reversed(list(root.iter(etree.Element))):
+        if node.tag in _SKIP_TEXT_TAGS:
+            text_len[node] = 0
+            p_count[node] = 0
+            continue
+        length = len(node.text.strip()) if node.text else 0
+        paragraphs = 0
+        for child in node:
+            length += text_len.get(child, 0)
+            if child.tail:
+                length += len(child.tail.strip())
+            paragraphs += p_count.get(child, 0) + (child.tag == "p")
+        text_len[node] = length
+        p_count[node] = paragraphs
+    return text_len, p_count
+
+
+def _count_paragraphs(node: HtmlElement) -> int:
+    return int(node.xpath("count(.//p)"))
+
+
+def _density_container(root: HtmlElement, fallback_xpaths: Sequence[str]) -> HtmlElement | None:
+    text_len, p_count = measure(root)
+    candidates: list[HtmlElement] = []
+    for xpath in ("//article", "//*[@itemprop='articleBody']", *fallback_xpaths):
+        candidates.extend(root.xpath(xpath))
+    divs = [node for node in text_len if node.tag == "div"]
+    if divs:
+        # measure() walked in reverse document order; flip back so max() keeps
+        # the outermost of equally long divs.
+        candidates.append(max(reversed(divs), key=text_len.__getitem__))
+    best: HtmlElement | None = None
+    best_count = 0
+    for candidate in candidates:
+        if p_count.get(candidate, 0) > best_count:
+            best, best_count = candidate, p_count[candidate]
+    return best
+
+
+def find_container(
+    root: HtmlElement,
+    selectors: Sequence[str] = (),
+    fallback_xpaths: Sequence[str] = (),
+) -> HtmlElement:
+    """Locate the main article element.
+
+    @param selectors: Site fast-path XPaths, tried in order; the first match
+        holding at least one ``<p>`` wins.
+    @param fallback_xpaths: Extra candidates for the density heuristic, which
+        otherwise considers ``<article>``, ``itemprop=articleBody`` and the
+        ``<div>`` with the most text, and keeps the one with most paragraphs.
+    """
+    for xpath in selectors:
+        for node in root.xpath(xpath):
+            if _count_paragraphs(node):
+                return node
+    best = _density_container(root, fallback_xpaths)
+    if best is not None:
+        return best
+    body = root.find("body")
+    return body if body is not None else root
+
+
+def extract_paragraphs(nodes: Iterable[HtmlElement], min_length: int = 30) -> list[str]:
+    """Text of each paragraph node longer than *min_length* characters."""
+    paragraphs = []
+    for node in nodes:
+        if len(text_of(node)) > min_length:
+            paragraphs.append(text_of(node, " "))
+    return paragraphs
+
+
+def image_source(img: HtmlElement) -> str | None:
+    """Lazy-load aware ``src`` of an ``<img>``."""
+    return img.get("data-src") or img.get("data-original") or img.get("src")
@@ -8,11 +8,10 @@ import os
 import re
 import time
 from typing import Any
-from urllib.parse import urljoin, urlparse
-import urllib.robotparser as robotparser
+from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup, Tag
+from .. import crawl_engine, extraction
+from ..extraction import HtmlElement
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -23,15 +22,11 @@ USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
 )
 
-REQUEST_TIMEOUT = 15
-SLEEP_BETWEEN_REQUESTS = 3.0
-_MAX_RETRIES = 3
 
 _FETCH_HEADERS = {
     "User-Agent": USER_AGENT,
     "Accept-Language": "vi-VN,vi;q=0.9,en;q=0.8",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-    "Accept-Encoding": "gzip, deflate, br",
     "Connection": "keep-alive",
     "Upgrade-Insecure-Requests": "1",
 }
@@ -55,35 +50,13 @@ def _clean_title(text: str | None) -> str | None:
 
 
 def can_fetch(url: str, user_agent: str = USER_AGENT) -> bool:
-    """Check *robots.txt* permission for *url*."""
-    parsed = urlparse(url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-    rp = robotparser.RobotFileParser()
-    try:
-        rp.set_url(robots_url)
-        rp.read()
-        return rp.can_fetch(user_agent, url)
-    except Exception:
-        return False
+    """Check *robots.txt* permission for *url* (cached per host by the crawl engine)."""
+    return crawl_engine.can_fetch(url, user_agent)
 
 
 def _fetch_html(url: str) -> str:
-    """Download *url* with retries and progressive back-off."""
-    for attempt in range(_MAX_RETRIES):
-        try:
-            resp = requests.get(url, headers=_FETCH_HEADERS, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            if len(resp.text) < 100:
-                raise ValueError(f"Response too short ({len(resp.text)} chars)")
-            return resp.text
-        except (requests.RequestException, ValueError) as exc:
-            if attempt == _MAX_RETRIES - 1:
-                raise RuntimeError(
-                    f"Failed to fetch {url} after {_MAX_RETRIES} attempts"
-                ) from exc
-            time.sleep((attempt + 1) * 2)
-    # Unreachable, but keeps mypy happy.
-    raise RuntimeError("Unexpected fetch failure")
+    """Download *url* via the shared crawl engine (pooled, rate-limited, retried)."""
+    return crawl_engine.fetch_html(url, headers=_FETCH_HEADERS)
 
 
 # ---------------------------------------------------------------------------
@@ -91,20 +64,26 @@ def _fetch_html(url: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _extract_metadata(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
+# Fast paths for the article body; the density heuristic is the fallback.
+_CONTAINER_SELECTORS = (
+    f"//article[{extraction.has_class('fck_detail')}]",
+    "//*[contains(@class, 'fck_detail')]",
+)
+_FALLBACK_CANDIDATES = (
+    "(//div[contains(@class, 'container')])[1]",
+    "(//div[contains(@class, 'sidebar-1')])[1]",
+)
+
+
+def _extract_metadata(root: HtmlElement, base_url: str) -> dict[str, Any]:
     """Pull Open-Graph / meta-tag metadata from the page."""
 
     def _meta(names: list[str]) -> str | None:
-        for name in names:
-            tag = soup.find("meta", attrs={"property": name}) or soup.find(
-                "meta", attrs={"name": name}
-            )
-            if tag and tag.get("content"):
-                return tag["content"].strip()
-        return None
+        return extraction.meta_content(root, names)
 
+    title_tag = extraction.first(root, "//title")
     title_raw = _meta(["og:title", "twitter:title"]) or (
-        soup.title.string.strip() if soup.title and soup.title.string else None
+        title_tag.text.strip() if title_tag is not None and title_tag.text else None
     )
 
     meta: dict[str, Any] = {
@@ -120,15 +99,15 @@ def _extract_metadata(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
 
     # Tags
     meta["tags"] = [
-        t["content"].strip()
-        for t in soup.find_all("meta", attrs={"property": "article:tag"})
-        if t.get("content")
+        content.strip()
+        for content in root.xpath('//meta[@property="article:tag"]/@content')
+        if content
     ]
 
     # Categories (from tt_list_folder_name, 3rd element)
     categories: list[str] = []
-    for t in soup.find_all("meta", attrs={"name": "tt_list_folder_name"}):
-        parts = [p.strip() for p in (t.get("content") or "").split(",") if p.strip()]
+    for content in root.xpath('//meta[@name="tt_list_folder_name"]/@content'):
+        parts = [p.strip() for p in content.split(",") if p.strip()]
         if len(parts) >= 3:
             categories.append(parts[2])
     meta["categories"] = categories
@@ -139,54 +118,23 @@ def _extract_metadata(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
     return meta
 
 
-def _find_article_container(soup: BeautifulSoup) -> Tag:
-    """Heuristically locate the main article container element."""
-    candidates: list[Tag] = []
-
-    for art in soup.find_all("article"):
-        candidates.append(art)
-
-    itemprop = soup.find(attrs={"itemprop": "articleBody"})
-    if itemprop and isinstance(itemprop, Tag):
-        candidates.append(itemprop)
-
-    for cls in ("fck_detail", "fck_detail width_common", "container", "sidebar-1"):
-        found = soup.find("div", class_=lambda c: c and cls in c)
-        if found and isinstance(found, Tag):
-            candidates.append(found)
-
-    all_divs = soup.find_all("div")
-    if all_divs:
-        biggest = max(all_divs, key=lambda d: len(d.get_text(strip=True) or ""))
-        candidates.append(biggest)
-
-    best: Tag | None = None
-    best_p_count = 0
-    for cand in candidates:
-        p_count = len(cand.find_all("p"))
-        if p_count > best_p_count:
-            best = cand
-            best_p_count = p_count
-
-    return best or soup.body or soup
+def _find_article_container(root: HtmlElement) -> HtmlElement:
+    """Locate the main article container element."""
+    return extraction.find_container(root, _CONTAINER_SELECTORS, _FALLBACK_CANDIDATES)
 
 
 def _extract_body(
-    soup: BeautifulSoup, base_url: str
+    root: HtmlElement, base_url: str
 ) -> dict[str, list[str] | list[dict[str, str | None]]]:
     """Extract paragraphs and images from the article body."""
-    container = _find_article_container(soup)
+    container = _find_article_container(root)
 
-    paragraphs = [
-        p.get_text(separator=" ", strip=True)
-        for p in container.find_all("p")
-        if p.get_text(strip=True) and len(p.get_text(strip=True)) > 30
-    ]
+    paragraphs = extraction.extract_paragraphs(container.iter("p"))
 
     seen_srcs: set[str] = set()
     images: list[dict[str, str | None]] = []
-    for img in container.find_all("img"):
-        src = img.get("data-src") or img.get("data-original") or img.get("src")
+    for img in container.iter("img"):
+        src = extraction.image_source(img)
         if not src:
             continue
         src = urljoin(base_url, src)
@@ -195,15 +143,16 @@ def _extract_body(
         seen_srcs.add(src)
 
         caption: str | None = None
-        fig = img.find_parent("figure")
-        if fig:
-            cap_tag = fig.find("figcaption")
-            if cap_tag:
-                caption = cap_tag.get_text(strip=True)
-        if not caption and img.parent:
-            cap_span = img.parent.find("span", class_=lambda c: c and "caption" in c)
-            if cap_span:
-                caption = cap_span.get_text(strip=True)
+        fig = next(img.iterancestors("figure"), None)
+        if fig is not None:
+            cap_tag = extraction.first(fig, ".//figcaption")
+            if cap_tag is not None:
+                caption = extraction.text_of(cap_tag)
+        parent = img.getparent()
+        if not caption and parent is not None:
+            cap_span = extraction.first(parent, ".//span[contains(@class, 'caption')]")
+            if cap_span is not None:
+                caption = extraction.text_of(cap_span)
 
         images.append({"src": src, "caption": caption})
 
@@ -250,38 +199,50 @@ def _save_html_preview(data: dict[str, Any], path: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def scrape_article(
-    url: str,
-    out_prefix: str = "article",
-    out_dir: str = "articles",
-) -> tuple[str, str]:
-    """Scrape *url*, save JSON + HTML preview, return their paths.
+def extract(url: str) -> dict[str, Any]:
+    """Fetch and parse *url* into the article payload, without touching disk.
 
     @param url: Full article URL.
-    @param out_prefix: Filename prefix (e.g. ``article_1``).
-    @param out_dir: Directory to write output files into.
-    @return: ``(json_path, html_path)`` tuple.
+    @return: ``{"scraped_at", "source_url", "meta", "body"}`` dict.
     """
     raw_html = _fetch_html(url)
-    time.sleep(SLEEP_BETWEEN_REQUESTS)
-
-    soup = BeautifulSoup(raw_html, "html.parser")
-    metadata = _extract_metadata(soup, url)
-    body = _extract_body(soup, url)
 
-    payload: dict[str, Any] = {
+    root = extraction.parse_html(raw_html)
+    return {
         "scraped_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "source_url": url,
-        "meta": metadata,
-        "body": body,
+        "meta": _extract_metadata(root, url),
+        "body": _extract_body(root, url),
     }
 
+
+def save_article(
+    data: dict[str, Any],
+    out_prefix: str = "article",
+    out_dir: str = "articles",
+) -> tuple[str, str]:
+    """Write an {@link extract} payload as JSON + HTML preview, return their paths."""
     os.makedirs(out_dir, exist_ok=True)
     base = os.path.basename(out_prefix)
     json_path = os.path.join(out_dir, f"{base}.json")
     html_path = os.path.join(out_dir, f"{base}.html")
 
-    _save_json(payload, json_path)
-    _save_html_preview(payload, html_path)
+    _save_json(data, json_path)
+    _save_html_preview(data, html_path)
 
     return json_path, html_path
+
+
+def scrape_article(
+    url: str,
+    out_prefix: str = "article",
+    out_dir: str = "articles",
+) -> tuple[str, str]:
+    """Scrape *url*, save JSON + HTML preview, return their paths.
+
+    @param url: Full article URL.
+    @param out_prefix: Filename prefix (e.g. ``article_1``).
+    @param out_dir: Directory to write output files into.
+    @return: ``(json_path, html_path)`` tuple.
+    """
+    return save_article(extract(url), out_prefix, out_dir)
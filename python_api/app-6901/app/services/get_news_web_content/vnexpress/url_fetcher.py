@@ -1,8 +1,9 @@
 """Fetch article URLs from a VNExpress category page."""
 
-import requests
 from bs4 import BeautifulSoup
 
+from .. import crawl_engine
+
 DEFAULT_CATEGORY_URL = "https://vnexpress.net/kinh-doanh"
 
 HEADERS = {
@@ -27,8 +28,7 @@ def fetch_article_urls(
     @param limit: Maximum number of URLs to return.
     @return: Deduplicated list of article URLs.
     """
-    resp = requests.get(category_url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-    resp.raise_for_status()
+    resp = crawl_engine.fetch(category_url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
 
     soup = BeautifulSoup(resp.text, "html.parser")
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from .image_search.image_finder import ImageFinderError, find_images
+from .image_search.image_finder import ImageFinderError, find_images, iter_find_images
 from .image_search.image_pipeline.search import ALL_SOURCE_IDS
 
-__all__ = ["find_images", "ImageFinderError", "ALL_SOURCE_IDS"]
+__all__ = ["find_images", "iter_find_images", "ImageFinderError", "ALL_SOURCE_IDS"]
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import re
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Any
 
-from .image_pipeline.orchestrator import run_pipeline
+from .image_pipeline.orchestrator import iter_pipeline, run_pipeline
 from ...services.llm import generate
 
 
@@ -12,15 +11,6 @@ class ImageFinderError(Exception):
     """Raised when image search generation fails."""
 
 
-# Regex to strip <think>...</think> blocks produced by deepseek-r1 and similar.
-_THINK_TAG_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
-
-
-def _strip_think_tags(text: str) -> str:
-    """Remove ``<think>...</think>`` reasoning blocks from LLM output."""
-    return _THINK_TAG_RE.sub("", text).strip()
-
-
 def _extract_visual_keywords(text: str, target_words: int, model: str) -> str:
     """
     Uses an LLM to generate a concise, descriptive search phrase from input text.
@@ -49,8 +39,9 @@ def _extract_visual_keywords(text: str, target_words: int, model: str) -> str:
         "  Output: aerial view modern city skyline dense urban buildings\n\n"
         "Now generate a search phrase for this text:"
     )
-    raw_output = generate(prompt=prompt, input_text=text, model=model)
-    search_phrase = _strip_think_tags(raw_output).strip().strip('"\'')
+    # Think blocks are stripped before caching, so a re-run of the same article is free.
+    raw_output = generate(prompt=prompt, input_text=text, model=model, use_cache=True, strip_think=True)
+    search_phrase = raw_output.strip().strip('"\'')
 
     if not search_phrase:
         raise ImageFinderError("Empty search phrase returned from LLM service")
@@ -67,6 +58,52 @@ def _extract_visual_keywords(text: str, target_words: int, model: str) -> str:
 
 
 
+def _resolve_keywords(text: str, target_words: int, model: str, use_llm: bool) -> str:
+    word_count = len(text.split())
+    if not use_llm or word_count <= 30:
+        return text
+    return _extract_visual_keywords(text, target_words=target_words, model=model)
+
+
+def _normalize_image(image: object, search_query: str, keywords: str) -> dict[str, Any] | None:
+    if not isinstance(image, dict):
+        return None
+    image_url = image.get("url")
+    source = image.get("source")
+    if not isinstance(image_url, str) or not image_url:
+        return None
+    return {
+        "url": image_url,
+        "source": source if isinstance(source, str) else "unknown",
+        "description": search_query,
+        "tags": [keywords],
+        "file_path": image.get("file_path"),
+        "width": image.get("width"),
+        "height": image.get("height"),
+        "resolution": image.get("resolution"),
+    }
+
+
+def _build_result(pipeline_payload: dict[str, Any], search_query: str, keywords: str) -> dict[str, Any]:
+    images = pipeline_payload.get("images")
+    if not isinstance(images, list):
+        raise ImageFinderError("Invalid image pipeline payload")
+
+    normalized_images: list[dict[str, Any]] = []
+    for image in images:
+        normalized = _normalize_image(image, search_query, keywords)
+        if normalized is not None:
+            normalized_images.append(normalized)
+
+    return {
+        "keywords": keywords,
+        "search_query": search_query,
+        "count": len(normalized_images),
+        "images": normalized_images,
+        "summary": pipeline_payload.get("summary"),
+    }
+
+
 def find_images(
     text: str,
     number_of_images: int = 5,
@@ -84,11 +121,7 @@ def find_images(
     normalized_count = max(1, min(20, int(number_of_images)))
     normalized_words = max(5, min(30, int(target_words)))
 
-    word_count = len(cleaned_text.split())
-    if not use_llm or word_count <= 30:
-        keywords = cleaned_text
-    else:
-        keywords = _extract_visual_keywords(cleaned_text, target_words=normalized_words, model=model)
+    keywords = _resolve_keywords(cleaned_text, normalized_words, model, use_llm)
     search_query = keywords
 
     pipeline_payload = run_pipeline(
@@ -99,36 +132,49 @@ def find_images(
         timeout_seconds=timeout_seconds,
         enabled_sources=sources,
     )
-    images = pipeline_payload.get("images")
-    if not isinstance(images, list):
-        raise ImageFinderError("Invalid image pipeline payload")
+    return _build_result(pipeline_payload, search_query, keywords)
 
-    normalized_images: list[dict[str, Any]] = []
-    for image in images:
-        if not isinstance(image, dict):
-            continue
-        image_url = image.get("url")
-        source = image.get("source")
-        if not isinstance(image_url, str) or not image_url:
-            continue
-        normalized_images.append(
-            {
-                "url": image_url,
-                "source": source if isinstance(source, str) else "unknown",
-                "description": search_query,
-                "tags": [keywords],
-                "file_path": image.get("file_path"),
-                "width": image.get("width"),
-                "height": image.get("height"),
-                "resolution": image.get("resolution"),
-            }
-        )
 
-    return {
-        "keywords": keywords,
-        "search_query": search_query,
-        "count": len(normalized_images),
-        "images": normalized_images,
-        "summary": pipeline_payload.get("summary"),
-    }
+def iter_find_images(
+    text: str,
+    number_of_images: int = 5,
+    target_words: int = 15,
+    model: str = "deepseek-r1:8b",
+    timeout_seconds: int = 60,
+    sources: Sequence[str] | None = None,
+    use_llm: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """
+    Streaming variant of :func:`find_images`.
 
+    Yields ``keywords``, ``source`` and ``image`` events as the pipeline progresses,
+    then a final ``done`` event carrying the same payload ``find_images`` returns.
+    """
+    cleaned_text = text.strip()
+    if not cleaned_text:
+        raise ImageFinderError("text is required")
+
+    normalized_count = max(1, min(20, int(number_of_images)))
+    normalized_words = max(5, min(30, int(target_words)))
+
+    keywords = _resolve_keywords(cleaned_text, normalized_words, model, use_llm)
+    search_query = keywords
+    yield {"event": "keywords", "keywords": keywords, "search_query": search_query}
+
+    for event in iter_pipeline(
+        paragraph=cleaned_text,
+        query_generator=lambda _: search_query,
+        per_source_limit=max(normalized_count, 10),
+        top_k=normalized_count,
+        timeout_seconds=timeout_seconds,
+        enabled_sources=sources,
+    ):
+        kind = event.get("event")
+        if kind == "source":
+            yield event
+        elif kind == "image":
+            normalized = _normalize_image(event.get("image"), search_query, keywords)
+            if normalized is not None:
+                yield {"event": "image", "image": normalized}
+        elif kind == "done":
+            yield {"event": "done", **_build_result(event, search_query, keywords)}
@@ -1,2 +1,2 @@
-"""Image search/download/analyze pipeline modules."""
+"""Image search/probe/download pipeline modules."""
 
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import hashlib
 import imghdr
+import io
 import logging
 import ssl
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -185,68 +185,47 @@ def _download_single_image(
     if len(data) > MAX_DOWNLOAD_BYTES:
         return None, f"Image too large ({len(data)} bytes): {image.url}"
 
-    extension = _guess_ext(image.url, content_type, data)
-    digest = hashlib.sha256(image.url.encode("utf-8")).hexdigest()[:16]
-    output_path = source_root / f"{digest}{extension}"
-    output_path.write_bytes(data)
-
+    # Read dimensions from the in-memory header while verifying, so the
+    # file is never reopened from disk to measure it.
     try:
-        with Image.open(output_path) as loaded:
+        with Image.open(io.BytesIO(data)) as loaded:
+            width, height = loaded.size
             loaded.verify()
     except Exception as exc:
-        try:
-            output_path.unlink(missing_ok=True)
-        except Exception:
-            pass
         return None, f"Invalid downloaded image ({image.url}): {exc}"
 
-    return ImageResult(source=image.source, url=image.url, file_path=str(output_path)), None
+    extension = _guess_ext(image.url, content_type, data)
+    digest = hashlib.sha256(image.url.encode("utf-8")).hexdigest()[:16]
+    output_path = source_root / f"{digest}{extension}"
+    output_path.write_bytes(data)
+
+    return (
+        ImageResult(
+            source=image.source,
+            url=image.url,
+            file_path=str(output_path),
+            width=int(width),
+            height=int(height),
+            resolution=int(width) * int(height),
+        ),
+        None,
+    )
 
 
-def download_images(
-    images: list[ImageResult],
+def download_image(
+    image: ImageResult,
     download_root: Path | None = None,
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
-    max_workers: int = 8,
-) -> tuple[list[ImageResult], list[str]]:
+) -> tuple[ImageResult | None, str | None]:
     """
-    Download image URLs in parallel and return local file paths.
+    Download a single image URL, never raising.
 
-    @return Tuple of (downloaded_images, errors).
+    @return Tuple of (downloaded_image, error); exactly one of them is set.
     """
-    if not images:
-        return [], []
-
     output_root = _build_download_root(download_root)
-    deduplicated: list[ImageResult] = []
-    seen: set[str] = set()
-    for item in images:
-        normalized_url = item.url.strip()
-        if not normalized_url or normalized_url in seen:
-            continue
-        seen.add(normalized_url)
-        deduplicated.append(item)
-
-    downloaded: list[ImageResult] = []
-    errors: list[str] = []
-
-    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
-        futures = {
-            executor.submit(_download_single_image, image, output_root, timeout_seconds): image
-            for image in deduplicated
-        }
-        for future in as_completed(futures):
-            source_item = futures[future]
-            try:
-                result, error = future.result()
-                if result is not None:
-                    downloaded.append(result)
-                if error is not None:
-                    errors.append(error)
-            except Exception as exc:  # pragma: no cover - defensive integration guard
-                message = f"Download failed for {source_item.url}: {exc}"
-                LOGGER.warning(message)
-                errors.append(message)
-
-    return downloaded, errors
-
+    try:
+        return _download_single_image(image, output_root, timeout_seconds)
+    except Exception as exc:
+        message = f"Download failed for {image.url}: {exc}"
+        LOGGER.warning(message)
+        return None, message
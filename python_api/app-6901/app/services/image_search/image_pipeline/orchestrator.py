@@ -1,70 +1,236 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
-from typing import Callable
+import queue
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
 
-from .analyzer import analyze_images
-from .downloader import download_images
-from .models import SearchQuery
-from .search import run_all_sources
-from .selector import select_top_images
+from .downloader import download_image
+from .models import ImageResult, SearchQuery
+from .probe import probe_image
+from .search import iter_all_sources
+from .selector import TopKSelector
 
 
 LOGGER = logging.getLogger(__name__)
 
+MIN_SIDE = 369
+DOWNLOAD_WORKERS = 10
+PROBE_WORKERS = 16
 
-def run_pipeline(
+
+def iter_pipeline(
     paragraph: str,
     query_generator: Callable[[str], str],
     per_source_limit: int = 5,
     top_k: int = 5,
     timeout_seconds: int = 30,
     enabled_sources: Sequence[str] | None = None,
-) -> dict[str, object]:
+    min_side: int = MIN_SIDE,
+) -> Iterator[dict[str, Any]]:
     """
-    Run full image pipeline: query -> search -> download -> resolution analysis -> top-k selection.
+    Run the image pipeline as a stream of events.
+
+    Candidates are probed as soon as each source returns URLs: only the first few KB
+    are fetched to read width/height from the header. Ranking and ``min_side``
+    filtering happen on that probed metadata, and only images that make the cut are
+    fully downloaded. The stream stops once ``top_k`` images meeting ``min_side`` are
+    downloaded. Candidates whose header cannot be parsed fall back to a full download.
+
+    Events, in order of appearance:
+      - ``{"event": "query", "query": str}``
+      - ``{"event": "source", "source": str, "count": int, "error": str | None}``
+      - ``{"event": "image", "image": dict}`` for each downloaded image meeting ``min_side``
+      - ``{"event": "done", "query": str, "images": list, "summary": dict}`` (always last)
     """
     query = query_generator(paragraph).strip()
     if not query:
         raise RuntimeError("Query generator returned empty search query")
 
     search_query = SearchQuery(paragraph=paragraph, query=query)
+    yield {"event": "query", "query": search_query.query}
 
-    url_candidates, search_errors = run_all_sources(
-        query=search_query.query,
-        per_source_limit=per_source_limit,
-        timeout_seconds=timeout_seconds,
-        enabled_sources=enabled_sources,
-    )
+    # Non-qualifying candidates are only needed if nothing meets min_side.
+    fallback = TopKSelector(top_k=top_k, min_side=min_side)
+    events: queue.Queue[tuple[str, Any]] = queue.Queue()
+    stop = threading.Event()
 
-    downloaded_images, download_errors = download_images(
-        url_candidates,
-        timeout_seconds=timeout_seconds,
-        max_workers=10,
-    )
+    def _search() -> None:
+        try:
+            for source_event in iter_all_sources(
+                query=search_query.query,
+                per_source_limit=per_source_limit,
+                timeout_seconds=timeout_seconds,
+                enabled_sources=enabled_sources,
+            ):
+                events.put(("source", source_event))
+                if stop.is_set():
+                    break
+        except Exception as exc:  # pragma: no cover - defensive integration guard
+            LOGGER.warning("Image search fan-out failed: %s", exc)
+        finally:
+            events.put(("search_done", None))
+
+    search_thread = threading.Thread(target=_search, name="image-search", daemon=True)
+    search_thread.start()
+
+    probe_executor = ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix="image-probe")
+    download_executor = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="image-download")
+    seen_urls: set[str] = set()
+    search_errors: dict[str, str] = {}
+    download_errors: list[str] = []
+    delivered: list[ImageResult] = []
+    reserve: list[ImageResult] = []
+    candidates = 0
+    probed = 0
+    downloaded = 0
+    pending_probes = 0
+    pending_downloads = 0
+    pending_qualified = 0
+    search_done = False
+
+    def _submit_download(image: ImageResult, kind: str) -> None:
+        nonlocal pending_downloads
+        pending_downloads += 1
+        future = download_executor.submit(download_image, image, None, timeout_seconds)
+        future.add_done_callback(lambda done: events.put((kind, done)))
+
+    def _fill_download_slots() -> None:
+        # Keep at most top_k qualifying downloads delivered or in flight; the rest wait in reserve.
+        nonlocal pending_qualified
+        while reserve and len(delivered) + pending_qualified < top_k:
+            reserve.sort(key=lambda item: item.resolution or 0)
+            pending_qualified += 1
+            _submit_download(reserve.pop(), "qualified")
+
+    try:
+        while (not search_done or pending_probes or pending_downloads) and len(delivered) < top_k:
+            kind, payload = events.get()
+
+            if kind == "search_done":
+                search_done = True
+                continue
+
+            if kind == "source":
+                source_name, source_results, error = payload
+                if error is not None:
+                    search_errors[source_name] = error
+                yield {"event": "source", "source": source_name, "count": len(source_results), "error": error}
+                for item in source_results:
+                    normalized = item.url.strip()
+                    if not normalized or normalized in seen_urls:
+                        continue
+                    seen_urls.add(normalized)
+                    candidates += 1
+                    pending_probes += 1
+                    future = probe_executor.submit(probe_image, item, timeout_seconds)
+                    future.add_done_callback(lambda done: events.put(("probe", done)))
+                continue
+
+            if kind == "probe":
+                pending_probes -= 1
+                if payload.cancelled():
+                    continue
+                result, error = payload.result()
+                if error is not None:
+                    download_errors.append(error)
+                if result is None:
+                    continue
+                if result.resolution is None:
+                    # Header not understood; measure it the old way with a full download.
+                    _submit_download(result, "measured")
+                    continue
+                probed += 1
+                if fallback.offer(result):
+                    reserve.append(result)
+                    _fill_download_slots()
+                continue
 
-    analyzed_images, analysis_errors = analyze_images(downloaded_images, max_workers=10)
-    selected_images = select_top_images(analyzed_images, top_k=top_k, min_side=369)
+            # Full download finished ("qualified" or "measured").
+            pending_downloads -= 1
+            if kind == "qualified":
+                pending_qualified -= 1
+            if payload.cancelled():
+                continue
+            result, error = payload.result()
+            if error is not None:
+                download_errors.append(error)
+            if result is None:
+                _fill_download_slots()
+                continue
+            downloaded += 1
+            if kind == "measured" and not fallback.offer(result):
+                continue
+            if result.width >= min_side and result.height >= min_side:
+                delivered.append(result)
+                yield {"event": "image", "image": result.to_dict()}
+            _fill_download_slots()
+
+        if not delivered and top_k > 0:
+            # Nothing met min_side: download the best of the rest, as select_top_images would.
+            for image in fallback.result():
+                if image.file_path:
+                    delivered.append(image)
+                    continue
+                result, error = download_image(image, None, timeout_seconds)
+                if error is not None:
+                    download_errors.append(error)
+                if result is not None:
+                    downloaded += 1
+                    delivered.append(result)
+        elif len(delivered) >= top_k:
+            LOGGER.info("Image pipeline secured %d images; stopping early", top_k)
+    finally:
+        stop.set()
+        probe_executor.shutdown(wait=False, cancel_futures=True)
+        download_executor.shutdown(wait=False, cancel_futures=True)
 
     if search_errors:
         LOGGER.warning("Image pipeline source errors: %s", search_errors)
     if download_errors:
         LOGGER.warning("Image pipeline download errors: %s", download_errors[:5])
-    if analysis_errors:
-        LOGGER.warning("Image pipeline analysis errors: %s", analysis_errors[:5])
 
-    return {
+    selected_images = sorted(delivered, key=lambda item: item.resolution or 0, reverse=True)[:top_k]
+    yield {
+        "event": "done",
         "query": search_query.query,
         "images": [image.to_dict() for image in selected_images],
         "summary": {
-            "search_candidates": len(url_candidates),
-            "downloaded": len(downloaded_images),
-            "analyzed": len(analyzed_images),
+            "search_candidates": candidates,
+            "probed": probed,
+            "downloaded": downloaded,
+            "analyzed": probed,
             "selected": len(selected_images),
             "search_errors": search_errors,
             "download_errors": download_errors,
-            "analysis_errors": analysis_errors,
+            "analysis_errors": [],
         },
     }
 
+
+def run_pipeline(
+    paragraph: str,
+    query_generator: Callable[[str], str],
+    per_source_limit: int = 5,
+    top_k: int = 5,
+    timeout_seconds: int = 30,
+    enabled_sources: Sequence[str] | None = None,
+) -> dict[str, object]:
+    """
+    Run full image pipeline: query -> search -> header probe -> top-k selection -> download.
+
+    Stages overlap; see :func:`iter_pipeline` for the streaming form.
+    """
+    for event in iter_pipeline(
+        paragraph=paragraph,
+        query_generator=query_generator,
+        per_source_limit=per_source_limit,
+        top_k=top_k,
+        timeout_seconds=timeout_seconds,
+        enabled_sources=enabled_sources,
+    ):
+        if event["event"] == "done":
+            return {key: value for key, value in event.items() if key != "event"}
+    raise RuntimeError("Image pipeline ended without a result")  # pragma: no cover
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import logging
+import struct
+
+import requests
+
+from .downloader import _REFERER_CHAIN, _build_download_headers, _build_session
+from .models import ImageResult
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Bytes requested per probe. Enough for PNG/GIF/WebP/BMP headers and for JPEG
+# start-of-frame markers behind typical EXIF/ICC blocks.
+PROBE_BYTES = 64 * 1024
+PROBE_CHUNK_BYTES = 4096
+
+_JPEG_SOF_MARKERS = frozenset(
+    (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF)
+)
+_JPEG_STANDALONE_MARKERS = frozenset((0x01, 0xD8, *range(0xD0, 0xD8)))
+
+
+def _jpeg_dimensions(data: bytes) -> tuple[int, int] | None:
+    index = 2
+    size = len(data)
+    while index < size:
+        if data[index] != 0xFF:
+            return None
+        # Skip fill bytes between markers.
+        while index < size and data[index] == 0xFF:
+            index += 1
+        if index >= size:
+            return None
+        marker = data[index]
+        index += 1
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+        if index + 2 > size:
+            return None
+        (segment_length,) = struct.unpack(">H", data[index : index + 2])
+        if marker in _JPEG_SOF_MARKERS:
+            if index + 7 > size:
+                return None
+            height, width = struct.unpack(">HH", data[index + 3 : index + 7])
+            return width, height
+        index += segment_length
+    return None
+
+
+def _webp_dimensions(data: bytes) -> tuple[int, int] | None:
+    if len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 ":
+        if data[23:26] != b"\x9d\x01\x2a":
+            return None
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        if data[20] != 0x2F:
+            return None
+        (bits,) = struct.unpack("<I", data[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    return None
+
+
+def _bmp_dimensions(data: bytes) -> tuple[int, int] | None:
+    if len(data) < 26:
+        return None
+    (header_size,) = struct.unpack("<I", data[14:18])
+    if header_size == 12:
+        width, height = struct.unpack("<HH", data[18:22])
+        return width, height
+    width, height = struct.unpack("<ii", data[18:26])
+    return width, abs(height)
+
+
+def parse_image_dimensions(data: bytes) -> tuple[int, int] | None:
+    """
+    Parse (width, height) from the leading bytes of a JPEG/PNG/WebP/GIF/BMP file.
+
+    @return Dimensions, or None if the format is unknown or more bytes are needed.
+    """
+    if data.startswith(b"\xff\xd8"):
+        dimensions = _jpeg_dimensions(data)
+    elif data.startswith(b"\x89PNG\r\n\x1a\n"):
+        if len(data) < 24 or data[12:16] != b"IHDR":
+            return None
+        dimensions = struct.unpack(">II", data[16:24])
+    elif data[:6] in (b"GIF87a", b"GIF89a"):
+        if len(data) < 10:
+            return None
+        dimensions = struct.unpack("<HH", data[6:10])
+    elif data.startswith(b"RIFF") and data[8:12] == b"WEBP":
+        dimensions = _webp_dimensions(data)
+    elif data.startswith(b"BM"):
+        dimensions = _bmp_dimensions(data)
+    else:
+        return None
+
+    if dimensions is None:
+        return None
+    width, height = dimensions
+    if width <= 0 or height <= 0:
+        return None
+    return int(width), int(height)
+
+
+def _open_probe_stream(url: str, session: requests.Session, timeout_seconds: int) -> requests.Response:
+    last_error: Exception | None = None
+    for referer in _REFERER_CHAIN:
+        headers = _build_download_headers(url, referer=referer)
+        headers["Range"] = f"bytes=0-{PROBE_BYTES - 1}"
+        try:
+            response = session.get(
+                url,
+                stream=True,
+                allow_redirects=True,
+                timeout=timeout_seconds,
+                headers=headers,
+            )
+            response.raise_for_status()
+            return response
+        except requests.HTTPError as exc:
+            last_error = exc
+            status = exc.response.status_code if exc.response is not None else 0
+            if status == 403:
+                continue
+            raise
+    raise requests.HTTPError(str(last_error or "All referer attempts failed"))
+
+
+def probe_image(image: ImageResult, timeout_seconds: int) -> tuple[ImageResult | None, str | None]:
+    """
+    Fetch only the first few KB of an image and read its dimensions from the header.
+
+    Sends an HTTP Range request and stops reading as soon as the header parses, so
+    servers that ignore Range still only transfer a few chunks before the stream
+    is aborted. Never raises.
+
+    @return ``(measured, None)`` on success; ``(image, None)`` when the URL is reachable
+        but the format could not be parsed from the header (caller should fall back
+        to a full download); ``(None, error)`` on failure.
+    """
+    session = _build_session()
+    try:
+        response = _open_probe_stream(image.url, session, timeout_seconds)
+        try:
+            content_type = response.headers.get("Content-Type")
+            if content_type and not content_type.lower().startswith("image/"):
+                return None, f"Non-image content type for {image.url}: {content_type}"
+
+            buffer = bytearray()
+            dimensions: tuple[int, int] | None = None
+            for chunk in response.iter_content(chunk_size=PROBE_CHUNK_BYTES):
+                if not chunk:
+                    continue
+                buffer.extend(chunk)
+                dimensions = parse_image_dimensions(bytes(buffer))
+                if dimensions is not None or len(buffer) >= PROBE_BYTES:
+                    break
+        finally:
+            response.close()
+    except Exception as exc:
+        return None, f"Probe failed for {image.url}: {exc}"
+    finally:
+        session.close()
+
+    if dimensions is None:
+        LOGGER.debug("Could not parse image header for %s (%d bytes read)", image.url, len(buffer))
+        return image, None
+
+    width, height = dimensions
+    return ImageResult(
+        source=image.source,
+        url=image.url,
+        width=width,
+        height=height,
+        resolution=width * height,
+    ), None
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Sequence
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from ..models import ImageResult
 from .artvee import search_artvee_images
@@ -23,20 +26,98 @@ ALL_SOURCE_IDS: tuple[str, ...] = (
     "artvee",
 )
 
+# Extra time on top of the per-source timeout before the shared deadline expires.
+# Google needs a few seconds to boot ChromeDriver before its own timeout starts.
+DEADLINE_GRACE_SECONDS = 10
 
-def run_all_sources(
+# Google's worker is killed this long before the shared deadline, so it reports
+# back (empty) instead of being counted as a timeout and left running.
+GOOGLE_DEADLINE_MARGIN_SECONDS = 1.0
+
+# Consecutive timeouts/failures before a source is skipped, and for how long.
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 300
+
+
+class SourceCircuitBreaker:
+    """
+    Track consecutive failures per source and skip sources that keep failing.
+
+    Once the cooldown has passed, a single caller is let through as a probe
+    while everyone else keeps skipping the source; the probe's success closes
+    the breaker and its failure opens it for another cooldown. A probe that
+    never reports is replaced by a new one after a further cooldown.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown_seconds: float = BREAKER_COOLDOWN_SECONDS,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._failures: dict[str, int] = {}
+        self._open_until: dict[str, float] = {}
+        self._probing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def is_open(self, source: str) -> bool:
+        """Return True while *source* is cooling off and should be skipped."""
+        with self._lock:
+            open_until = self._open_until.get(source)
+            if open_until is None:
+                return False
+            now = time.monotonic()
+            if now < open_until:
+                return True
+            # Half-open: this caller is the probe; the source stays open for the rest.
+            self._open_until[source] = now + self.cooldown_seconds
+            self._probing.add(source)
+            return False
+
+    def record_success(self, source: str) -> None:
+        with self._lock:
+            self._failures.pop(source, None)
+            self._open_until.pop(source, None)
+            self._probing.discard(source)
+
+    def record_failure(self, source: str) -> None:
+        with self._lock:
+            failures = self._failures.get(source, 0) + 1
+            self._failures[source] = failures
+            if source in self._probing or failures >= self.failure_threshold:
+                self._probing.discard(source)
+                self._open_until[source] = time.monotonic() + self.cooldown_seconds
+                LOGGER.warning(
+                    "Image source %s failed %d times in a row; skipping for %ds",
+                    source, failures, int(self.cooldown_seconds),
+                )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._open_until.clear()
+            self._probing.clear()
+
+
+_breaker = SourceCircuitBreaker()
+
+
+def _build_sources(
     query: str,
-    per_source_limit: int = 5,
-    timeout_seconds: int = 30,
-    enabled_sources: Sequence[str] | None = None,
-) -> tuple[list[ImageResult], dict[str, str]]:
-    """Run all configured sources and merge unique URLs."""
-    results: list[ImageResult] = []
-    errors: dict[str, str] = {}
-    seen_urls: set[str] = set()
+    per_source_limit: int,
+    timeout_seconds: int,
+    enabled_sources: Sequence[str] | None,
+    deadline: float | None = None,
+) -> tuple[tuple[str, SourceRunner], ...]:
+    def _google() -> list[ImageResult]:
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic() - GOOGLE_DEADLINE_MARGIN_SECONDS
+        return search_google_images(query, per_source_limit, timeout_seconds, deadline_seconds=remaining)
 
     sources: tuple[tuple[str, SourceRunner], ...] = (
-        ("google", lambda: search_google_images(query, per_source_limit, timeout_seconds)),
+        ("google", _google),
         ("bing", lambda: search_bing_images(query, per_source_limit, timeout_seconds)),
         ("unsplash", lambda: search_unsplash_images(query, per_source_limit, timeout_seconds)),
         ("lexica", lambda: search_lexica_images(query, per_source_limit, timeout_seconds)),
@@ -46,13 +127,92 @@ def run_all_sources(
     if enabled_sources is not None:
         enabled_set = set(enabled_sources)
         sources = tuple(source for source in sources if source[0] in enabled_set)
+    return sources
+
+
+def iter_all_sources(
+    query: str,
+    per_source_limit: int = 5,
+    timeout_seconds: int = 30,
+    enabled_sources: Sequence[str] | None = None,
+    deadline_seconds: float | None = None,
+) -> Iterator[tuple[str, list[ImageResult], str | None]]:
+    """
+    Query all configured sources concurrently and yield results as each one finishes.
+
+    All sources share one overall deadline (``timeout_seconds`` plus a small grace
+    by default). Sources still running when it expires are reported as timed out
+    and left to finish in the background; their results are discarded.
+
+    @return Iterator of (source_name, results, error) in completion order.
+    """
+    if deadline_seconds is None:
+        deadline_seconds = timeout_seconds + DEADLINE_GRACE_SECONDS
+    deadline = time.monotonic() + max(0.0, deadline_seconds)
+    sources = _build_sources(query, per_source_limit, timeout_seconds, enabled_sources, deadline=deadline)
 
+    runnable: list[tuple[str, SourceRunner]] = []
     for source_name, run_source in sources:
-        try:
-            source_results = run_source()
-        except Exception as exc:  # pragma: no cover - integration behavior
-            LOGGER.warning("Image source failed (%s): %s", source_name, exc)
-            errors[source_name] = str(exc)
+        if _breaker.is_open(source_name):
+            yield source_name, [], "Skipped: source is cooling off after repeated failures"
+            continue
+        runnable.append((source_name, run_source))
+
+    if not runnable:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=len(runnable), thread_name_prefix="image-source")
+    pending: dict[Future[list[ImageResult]], str] = {
+        executor.submit(run_source): source_name for source_name, run_source in runnable
+    }
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                source_name = pending.pop(future)
+                try:
+                    source_results = future.result()
+                except Exception as exc:  # pragma: no cover - integration behavior
+                    LOGGER.warning("Image source failed (%s): %s", source_name, exc)
+                    _breaker.record_failure(source_name)
+                    yield source_name, [], str(exc)
+                    continue
+                _breaker.record_success(source_name)
+                yield source_name, source_results, None
+
+        for source_name in pending.values():
+            LOGGER.warning("Image source timed out (%s) after %.1fs", source_name, deadline_seconds)
+            _breaker.record_failure(source_name)
+            yield source_name, [], f"Timed out after {deadline_seconds:.0f}s"
+    finally:
+        # Do not block on stragglers; their threads exit once the request returns.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_all_sources(
+    query: str,
+    per_source_limit: int = 5,
+    timeout_seconds: int = 30,
+    enabled_sources: Sequence[str] | None = None,
+    deadline_seconds: float | None = None,
+) -> tuple[list[ImageResult], dict[str, str]]:
+    """Run all configured sources concurrently and merge unique URLs as they arrive."""
+    results: list[ImageResult] = []
+    errors: dict[str, str] = {}
+    seen_urls: set[str] = set()
+
+    for source_name, source_results, error in iter_all_sources(
+        query,
+        per_source_limit=per_source_limit,
+        timeout_seconds=timeout_seconds,
+        enabled_sources=enabled_sources,
+        deadline_seconds=deadline_seconds,
+    ):
+        if error is not None:
+            errors[source_name] = error
             continue
 
         for item in source_results:
@@ -63,4 +223,3 @@ def run_all_sources(
             results.append(item)
 
     return results, errors
-
@@ -23,12 +23,16 @@ def search_google_images(
     query: str,
     max_results: int = 10,
     timeout_seconds: int = 30,
+    deadline_seconds: float | None = None,
 ) -> list[ImageResult]:
     """Search Google Images via a detached subprocess running undetected_chromedriver.
 
     Chrome is launched in a separate process with CREATE_BREAKAWAY_FROM_JOB so it
     escapes Electron's Windows Job Object restrictions that cause the GPU/renderer
     child processes to crash when Chrome is spawned directly from the app server.
+
+    ``deadline_seconds`` caps the worker's total run time (the caller's remaining
+    shared deadline); the worker is killed when it expires.
     """
     LOGGER.warning(
         "[GoogleSearch] Starting: query=%r, max_results=%d, timeout=%ds",
@@ -44,7 +48,9 @@ def search_google_images(
     ]
 
     # Allow extra time for ChromeDriver startup on top of the search timeout.
-    proc_timeout = timeout_seconds + 30
+    proc_timeout: float = timeout_seconds + 30
+    if deadline_seconds is not None:
+        proc_timeout = max(0.1, min(proc_timeout, deadline_seconds))
 
     try:
         creation_flags = _CREATE_BREAKAWAY_FROM_JOB if sys.platform == "win32" else 0
@@ -56,7 +62,7 @@ def search_google_images(
             creationflags=creation_flags,
         )
     except subprocess.TimeoutExpired:
-        LOGGER.warning("[GoogleSearch] Worker timed out after %ds", proc_timeout)
+        LOGGER.warning("[GoogleSearch] Worker timed out after %.1fs", proc_timeout)
         return []
     except Exception as exc:
         LOGGER.warning("[GoogleSearch] Failed to launch worker: %s", exc)
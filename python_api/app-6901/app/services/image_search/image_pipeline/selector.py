@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import heapq
+
 from .models import ImageResult
 
 
@@ -22,3 +24,50 @@ def select_top_images(
     ranking_pool.sort(key=lambda item: item.resolution or 0, reverse=True)
     return ranking_pool[:top_k]
 
+
+
+class TopKSelector:
+    """
+    Incremental counterpart of :func:`select_top_images`.
+
+    Images are offered one at a time as they finish downloading. The selector keeps
+    the best ``top_k`` images meeting ``min_side`` plus the best ``top_k`` of any size
+    as a fallback, so :meth:`result` matches ``select_top_images`` over everything offered.
+    """
+
+    def __init__(self, top_k: int = 5, min_side: int = 600) -> None:
+        self.top_k = top_k
+        self.min_side = min_side
+        self._qualified: list[tuple[int, int, ImageResult]] = []
+        self._fallback: list[tuple[int, int, ImageResult]] = []
+        self._counter = 0
+
+    def _push(self, heap: list[tuple[int, int, ImageResult]], image: ImageResult) -> None:
+        # Negative counter keeps earlier images ahead on equal resolution, like a stable sort.
+        entry = (image.resolution or 0, -self._counter, image)
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def offer(self, image: ImageResult) -> bool:
+        """Add an analyzed image; return True if it meets ``min_side``."""
+        if self.top_k <= 0:
+            return False
+        if image.resolution is None or image.width is None or image.height is None:
+            return False
+        self._counter += 1
+        self._push(self._fallback, image)
+        if image.width >= self.min_side and image.height >= self.min_side:
+            self._push(self._qualified, image)
+            return True
+        return False
+
+    @property
+    def satisfied(self) -> bool:
+        """True once ``top_k`` images meeting ``min_side`` have been secured."""
+        return self.top_k > 0 and len(self._qualified) >= self.top_k
+
+    def result(self) -> list[ImageResult]:
+        pool = self._qualified if self._qualified else self._fallback
+        return [entry[2] for entry in sorted(pool, key=lambda entry: entry[:2], reverse=True)]
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Optional
 
 OLLAMA_API_URL = os.getenv("OLLAMA_API_URL", "http://localhost:11434")
 DEFAULT_MODEL = os.getenv("OLLAMA_MODEL", "deepseek-r1:8b")
+OLLAMA_TIMEOUT_SECONDS = float(os.getenv("OLLAMA_TIMEOUT_SECONDS", "300"))
+OLLAMA_MAX_CONNECTIONS = int(os.getenv("OLLAMA_MAX_CONNECTIONS", "8"))
+# Response cache bounds; 0 for either disables it.
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "256"))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
 
 # Runtime config — overrides env-based defaults when set via the API.
 _runtime_config: dict[str, str] = {}
@@ -24,6 +38,287 @@ def update_config(url: str | None = None, model: str | None = None) -> None:
         _runtime_config["model"] = model.strip()
 
 
+def build_prompt(prompt: str, input_text: str) -> str:
+    return f"{prompt}\n\n{input_text}" if prompt else input_text
+
+
+# Regex to strip <think>...</think> blocks produced by deepseek-r1 and similar.
+_THINK_TAG_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+
+def strip_think_tags(text: str) -> str:
+    """Remove ``<think>...</think>`` reasoning blocks from LLM output."""
+    return _THINK_TAG_RE.sub("", text).strip()
+
+
+def _options_json(options: Optional[dict]) -> str:
+    return json.dumps(options, sort_keys=True, separators=(",", ":")) if options else ""
+
+
+# (url, model, full prompt, options as canonical JSON)
+_RequestKey = tuple[str, str, str, str]
+
+
+class LLMResponseCache:
+    """
+    In-memory LRU of generated responses with a TTL.
+
+    Keyed by Ollama URL, model, a hash of the full prompt and the generation
+    options, so a re-run over the same article skips the model entirely.
+    Entries older than `ttl_seconds` are treated as misses and dropped on
+    access. Only callers that pass `use_cache=True` read or fill it.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(
+        url: str, model: str, full_prompt: str, options: Optional[dict] = None, strip_think: bool = False
+    ) -> str:
+        prompt_hash = hashlib.sha256(full_prompt.encode("utf-8")).hexdigest()
+        return "\x1f".join((url, model, prompt_hash, _options_json(options), "strip" if strip_think else "raw"))
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+response_cache = LLMResponseCache(LLM_CACHE_MAX_ENTRIES, LLM_CACHE_TTL_SECONDS)
+
+
+class _TokenFanout:
+    """Tokens of one upstream stream, replayable by every coalesced subscriber."""
+
+    def __init__(self) -> None:
+        self.tokens: list[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._changed = asyncio.Event()
+
+    def push(self, token: str) -> None:
+        self.tokens.append(token)
+        self._changed.set()
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.error = error
+        self.done = True
+        self._changed.set()
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        position = 0
+        while True:
+            while position < len(self.tokens):
+                yield self.tokens[position]
+                position += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            self._changed.clear()
+            if position == len(self.tokens) and not self.done:
+                await self._changed.wait()
+
+
+class OllamaClient:
+    """
+    Shared Ollama HTTP client.
+
+    One keep-alive connection pool serves the sync API (status, image-finder
+    keyword extraction) and another the async API used by the LLM routes; the
+    async pool is rebuilt if the running event loop changes. Identical
+    generations already in flight — same URL, model and full prompt — are
+    coalesced: later callers wait for the first request instead of sending
+    their own, and streaming callers replay the shared token stream.
+    """
+
+    def __init__(self, transport: Any = None, async_transport: Any = None) -> None:
+        self._transport = transport
+        self._async_transport = async_transport
+        self._client = None
+        self._async_client = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._inflight: dict[_RequestKey, Future] = {}
+        self._async_inflight: dict[_RequestKey, asyncio.Task] = {}
+        self._streams: dict[_RequestKey, _TokenFanout] = {}
+        self.coalesced = 0
+
+    @staticmethod
+    def _limits_and_timeout():
+        import httpx
+
+        limits = httpx.Limits(max_connections=OLLAMA_MAX_CONNECTIONS, max_keepalive_connections=OLLAMA_MAX_CONNECTIONS)
+        timeout = httpx.Timeout(OLLAMA_TIMEOUT_SECONDS, connect=10.0)
+        return limits, timeout
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                import httpx
+
+                limits, timeout = self._limits_and_timeout()
+                self._client = httpx.Client(limits=limits, timeout=timeout, transport=self._transport)
+            return self._client
+
+    def _get_async_client(self):
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            import httpx
+
+            limits, timeout = self._limits_and_timeout()
+            self._async_client = httpx.AsyncClient(limits=limits, timeout=timeout, transport=self._async_transport)
+            self._async_loop = loop
+            self._async_inflight.clear()
+            self._streams.clear()
+        return self._async_client
+
+    @staticmethod
+    def _request_key(model: Optional[str], full_prompt: str, options: Optional[dict] = None) -> _RequestKey:
+        return get_ollama_url(), model or get_default_model(), full_prompt, _options_json(options)
+
+    @staticmethod
+    def _generate_body(key: _RequestKey, stream: bool) -> dict:
+        body: dict[str, Any] = {"model": key[1], "prompt": key[2], "stream": stream}
+        if key[3]:
+            body["options"] = json.loads(key[3])
+        return body
+
+    def generate(self, full_prompt: str, model: Optional[str] = None, options: Optional[dict] = None) -> str:
+        key = self._request_key(model, full_prompt, options)
+        with self._lock:
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return pending.result()
+
+        try:
+            resp = self.client.post(f"{key[0]}/api/generate", json=self._generate_body(key, stream=False))
+            resp.raise_for_status()
+            output = resp.json().get("response", "")
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        pending.set_result(output)
+        return output
+
+    async def agenerate(self, full_prompt: str, model: Optional[str] = None, options: Optional[dict] = None) -> str:
+        client = self._get_async_client()
+        key = self._request_key(model, full_prompt, options)
+        task = self._async_inflight.get(key)
+        if task is None:
+            async def _request() -> str:
+                try:
+                    resp = await client.post(f"{key[0]}/api/generate", json=self._generate_body(key, stream=False))
+                    resp.raise_for_status()
+                    return resp.json().get("response", "")
+                finally:
+                    self._async_inflight.pop(key, None)
+
+            task = self._async_inflight[key] = asyncio.ensure_future(_request())
+        else:
+            self.coalesced += 1
+        # shield: one caller disconnecting must not cancel the others' request.
+        return await asyncio.shield(task)
+
+    async def astream(
+        self, full_prompt: str, model: Optional[str] = None, options: Optional[dict] = None
+    ) -> AsyncIterator[str]:
+        """Yield response tokens as Ollama produces them."""
+        client = self._get_async_client()
+        key = self._request_key(model, full_prompt, options)
+        fanout = self._streams.get(key)
+        if fanout is None:
+            fanout = self._streams[key] = _TokenFanout()
+
+            async def _pump() -> None:
+                try:
+                    async with client.stream(
+                        "POST", f"{key[0]}/api/generate", json=self._generate_body(key, stream=True)
+                    ) as resp:
+                        resp.raise_for_status()
+                        async for line in resp.aiter_lines():
+                            if not line.strip():
+                                continue
+                            chunk = json.loads(line)
+                            if chunk.get("error"):
+                                raise RuntimeError(chunk["error"])
+                            if chunk.get("response"):
+                                fanout.push(chunk["response"])
+                            if chunk.get("done"):
+                                break
+                    fanout.finish()
+                except Exception as exc:
+                    fanout.finish(exc)
+                finally:
+                    self._streams.pop(key, None)
+
+            asyncio.ensure_future(_pump())
+        else:
+            self.coalesced += 1
+        async for token in fanout.subscribe():
+            yield token
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "inflight": len(self._inflight) + len(self._async_inflight) + len(self._streams),
+                "coalesced": self.coalesced,
+                "max_connections": OLLAMA_MAX_CONNECTIONS,
+            }
+
+
+ollama_client = OllamaClient()
+
+
 def get_status() -> dict:
     """Check connectivity and retrieve available models from the Ollama server."""
     url = get_ollama_url()
@@ -38,23 +333,24 @@ def get_status() -> dict:
     }
 
     try:
-        import requests
+        import httpx
     except ModuleNotFoundError:
         base["status"] = "error"
-        base["detail"] = "requests package not installed — run Install Environment first"
+        base["detail"] = "httpx package not installed — run Install Environment first"
         return base
 
+    client = ollama_client.client
     try:
-        resp = requests.get(f"{url}/api/tags", timeout=10)
+        resp = client.get(f"{url}/api/tags", timeout=10)
         resp.raise_for_status()
         models = [m.get("name") for m in resp.json().get("models", [])]
         base["connected"] = True
         base["models"] = models
         base["status"] = "ok"
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         base["status"] = "unreachable"
         return base
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         base["status"] = "timeout"
         return base
     except Exception as exc:
@@ -63,27 +359,77 @@ def get_status() -> dict:
         return base
 
     try:
-        ver_resp = requests.get(f"{url}/api/version", timeout=5)
-        if ver_resp.ok:
+        ver_resp = client.get(f"{url}/api/version", timeout=5)
+        if ver_resp.is_success:
             base["version"] = ver_resp.json().get("version")
     except Exception:
         pass
 
+    base["client"] = ollama_client.status()
     return base
 
 
-def generate(prompt: str, input_text: str, model: str | None = None) -> str:
-    """Call Ollama API to generate text."""
-    import requests
+def _cached_key(full_prompt: str, model: str | None, options: dict | None, strip_think: bool, use_cache: bool):
+    if not use_cache or not response_cache.enabled:
+        return None
+    return LLMResponseCache.make_key(get_ollama_url(), model or get_default_model(), full_prompt, options, strip_think)
 
-    url = get_ollama_url()
-    resolved_model = model if model else get_default_model()
-    full_prompt = f"{prompt}\n\n{input_text}" if prompt else input_text
-
-    resp = requests.post(
-        f"{url}/api/generate",
-        json={"model": resolved_model, "prompt": full_prompt, "stream": False},
-        timeout=300,
-    )
-    resp.raise_for_status()
-    return resp.json().get("response", "")
+
+def generate(
+    prompt: str,
+    input_text: str,
+    model: str | None = None,
+    options: dict | None = None,
+    use_cache: bool = False,
+    strip_think: bool = False,
+) -> str:
+    """
+    Call Ollama API to generate text.
+
+    With `use_cache`, responses are served from and stored in
+    `response_cache`; callers opt in when a repeated prompt may reuse an
+    earlier answer. With `strip_think`, think blocks are removed once,
+    before the response is cached.
+    """
+    full_prompt = build_prompt(prompt, input_text)
+    cache_key = _cached_key(full_prompt, model, options, strip_think, use_cache)
+    if cache_key is not None:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    output = ollama_client.generate(full_prompt, model, options)
+    if strip_think:
+        output = strip_think_tags(output)
+    if cache_key is not None and output:
+        response_cache.put(cache_key, output)
+    return output
+
+
+async def agenerate(
+    prompt: str,
+    input_text: str,
+    model: str | None = None,
+    options: dict | None = None,
+    use_cache: bool = False,
+    strip_think: bool = False,
+) -> str:
+    """Async form of generate; does not hold a worker thread while Ollama runs."""
+    full_prompt = build_prompt(prompt, input_text)
+    cache_key = _cached_key(full_prompt, model, options, strip_think, use_cache)
+    if cache_key is not None:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    output = await ollama_client.agenerate(full_prompt, model, options)
+    if strip_think:
+        output = strip_think_tags(output)
+    if cache_key is not None and output:
+        response_cache.put(cache_key, output)
+    return output
+
+
+def stream_generate(
+    prompt: str, input_text: str, model: str | None = None, options: dict | None = None
+) -> AsyncIterator[str]:
+    """Stream generated tokens as they arrive. Streams bypass the response cache."""
+    return ollama_client.astream(build_prompt(prompt, input_text), model, options)
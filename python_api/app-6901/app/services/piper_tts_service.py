@@ -1,23 +1,36 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import logging
 import os
+import queue
 import re
+import threading
+import time
 import unicodedata
 import wave
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 import numpy as np
 
-from python_api.common.paths import MODEL_PIPER_TTS_DIR, TEMP_DIR
+from python_api.common.jobs import JobStore
+from python_api.common.paths import CACHE_DIR, MODEL_PIPER_TTS_DIR, TEMP_DIR
+from python_api.common.progress import ProgressStore
+
+LOGGER = logging.getLogger(__name__)
 
 _PIPER_DIR = Path(__file__).resolve().parent / "piper_tts"
 _FINETUNE_DIR = MODEL_PIPER_TTS_DIR
 _MODEL_DIR = _FINETUNE_DIR / "tts-model"
 _DEMO_DIR = _PIPER_DIR / "demo"
 _ESPEAK_DIR = _FINETUNE_DIR / "eSpeak NG"
+_AUDIO_CACHE_DIR = CACHE_DIR / "piper-tts"
 
 # Point phonemizer at the bundled eSpeak NG before it is imported
 if _ESPEAK_DIR.exists():
@@ -61,8 +74,214 @@ _VOICE_META: Dict[str, Dict[str, str]] = {
 
 _LANG_DISPLAY = {"vi": "Tiếng Việt", "en": "English", "id": "Indonesia"}
 
-# in-memory model cache:  voice_id -> (session, config)
-_model_cache: Dict[str, Tuple] = {}
+# ONNX Runtime tuning. 0 threads = derive from CPU count and pool size.
+PIPER_INTRA_OP_THREADS = int(os.getenv("PIPER_INTRA_OP_THREADS", "0"))
+PIPER_INTER_OP_THREADS = int(os.getenv("PIPER_INTER_OP_THREADS", "1"))
+# Sessions per voice; >1 lets independent requests run inference in parallel.
+PIPER_SESSION_POOL_SIZE = max(1, int(os.getenv("PIPER_SESSION_POOL_SIZE", "1")))
+# Max chunks per padded batch (1 disables batching) and the max ratio between the
+# longest and shortest phoneme sequence allowed in one batch.
+PIPER_BATCH_SIZE = max(1, int(os.getenv("PIPER_BATCH_SIZE", "8")))
+PIPER_BATCH_MAX_PAD_RATIO = 1.5
+# Sentence -> phoneme-ID results kept per voice.
+PIPER_PHONEME_CACHE_SIZE = int(os.getenv("PIPER_PHONEME_CACHE_SIZE", "4096"))
+
+# Memory budget for resident voices, estimated as .onnx size x sessions per voice.
+# Least recently used voices are unloaded past it; 0 disables the limit.
+PIPER_MODEL_CACHE_MB = int(os.getenv("PIPER_MODEL_CACHE_MB", "512"))
+# Comma-separated voice_ids to load in the background at startup.
+PIPER_PRELOAD_VOICES = [v.strip() for v in os.getenv("PIPER_PRELOAD_VOICES", "").split(",") if v.strip()]
+
+# On-disk cache of post-processed sentence audio; 0 disables it.
+PIPER_AUDIO_CACHE_MB = int(os.getenv("PIPER_AUDIO_CACHE_MB", "256"))
+
+# Synthesis jobs run on a dedicated pool: PIPER_WORKERS at once, up to
+# PIPER_MAX_QUEUED more waiting; further requests are rejected as busy.
+PIPER_WORKERS = max(1, int(os.getenv("PIPER_WORKERS", "2")))
+PIPER_MAX_QUEUED = max(0, int(os.getenv("PIPER_MAX_QUEUED", "8")))
+
+STREAM_FORMATS = ("wav", "pcm")
+
+piper_progress = ProgressStore()
+
+
+class PiperBusyError(RuntimeError):
+    """Raised when the synthesis pool is full."""
+
+
+class SynthesisPool:
+    """
+    Dedicated worker threads for Piper synthesis with admission control.
+
+    ONNX Runtime, the espeak-ng library calls and the numpy post-processing all
+    release the GIL, so threads run in parallel without a per-process copy of
+    every voice. Jobs are served first-come first-served.
+    """
+
+    def __init__(self, workers: int, max_queued: int) -> None:
+        self.workers = workers
+        self.max_queued = max_queued
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._running = 0
+        self._pending = 0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._pending >= self.workers + self.max_queued:
+                raise PiperBusyError(
+                    f"Piper TTS is busy ({self._pending} requests in progress or queued); try again shortly"
+                )
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="piper-synth")
+            executor = self._executor
+
+        def _run():
+            with self._lock:
+                self._running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._pending -= 1
+
+        try:
+            return executor.submit(_run)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queued": self.max_queued,
+                "running": self._running,
+                "queued": self._pending - self._running,
+            }
+
+
+synthesis_pool = SynthesisPool(PIPER_WORKERS, PIPER_MAX_QUEUED)
+
+
+class PiperModelCache:
+    """
+    LRU cache of loaded voices bounded by an estimated memory budget.
+
+    Loads are single-flight: concurrent first requests for the same voice wait
+    for one load instead of each building their own sessions. Requests already
+    holding an evicted engine keep using it until they finish.
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _touch(self, voice_id: str) -> Optional["PiperEngine"]:
+        entry = self._entries.get(voice_id)
+        if entry is None:
+            return None
+        self._entries.move_to_end(voice_id)
+        entry["last_used"] = time.time()
+        return entry["engine"]
+
+    def get(self, voice_id: str, loader: Callable[[str], Tuple["PiperEngine", int]]) -> "PiperEngine":
+        """Return the cached engine for voice_id, loading it with `loader` on a miss."""
+        with self._lock:
+            engine = self._touch(voice_id)
+            if engine is not None:
+                self.hits += 1
+                return engine
+            load_lock = self._load_locks.setdefault(voice_id, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                engine = self._touch(voice_id)
+                if engine is not None:
+                    # Loaded by the thread we waited on.
+                    self.hits += 1
+                    return engine
+            try:
+                engine, size_bytes = loader(voice_id)
+            except BaseException:
+                with self._lock:
+                    self._load_locks.pop(voice_id, None)
+                raise
+
+            # Publish the entry and retire the load lock together, so a thread
+            # arriving now either hits the entry or waits on this lock.
+            with self._lock:
+                self.misses += 1
+                now = time.time()
+                self._entries[voice_id] = {
+                    "engine": engine,
+                    "size_bytes": size_bytes,
+                    "loaded_at": now,
+                    "last_used": now,
+                }
+                self._load_locks.pop(voice_id, None)
+                self._evict_over_budget(keep=voice_id)
+            return engine
+
+    def _evict_over_budget(self, keep: str) -> None:
+        if self.budget_bytes <= 0:
+            return
+        while self.used_bytes() > self.budget_bytes:
+            victim = next((vid for vid in self._entries if vid != keep), None)
+            if victim is None:
+                LOGGER.warning(
+                    "Piper voice %s (%d MB) alone exceeds the model cache budget (%d MB)",
+                    keep, self._entries[keep]["size_bytes"] >> 20, self.budget_bytes >> 20,
+                )
+                return
+            del self._entries[victim]
+            self.evictions += 1
+            LOGGER.info("Unloaded Piper voice %s (model cache over budget)", victim)
+
+    def used_bytes(self) -> int:
+        return sum(entry["size_bytes"] for entry in self._entries.values())
+
+    def evict(self, voice_id: str) -> bool:
+        with self._lock:
+            return self._entries.pop(voice_id, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def status(self) -> Dict:
+        with self._lock:
+            voices = [
+                {
+                    "voice_id": voice_id,
+                    "size_bytes": entry["size_bytes"],
+                    "loaded_at": entry["loaded_at"],
+                    "last_used": entry["last_used"],
+                }
+                # Most recently used first.
+                for voice_id, entry in reversed(self._entries.items())
+            ]
+            return {
+                "budget_bytes": self.budget_bytes,
+                "used_bytes": self.used_bytes(),
+                "voices": voices,
+                "loading": sorted(self._load_locks),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# in-memory model cache:  voice_id -> PiperEngine
+_model_cache = PiperModelCache(PIPER_MODEL_CACHE_MB * 1024 * 1024)
 
 
 def _scan_voices() -> List[Dict]:
@@ -105,12 +324,155 @@ def get_demo_path(filename: str) -> Optional[Path]:
     return path if path.exists() and path.suffix == ".wav" else None
 
 
-def _load_model(voice_id: str) -> Tuple:
-    """Load and cache an ONNX model + config for the given voice_id."""
-    if voice_id in _model_cache:
-        return _model_cache[voice_id]
-
+def _build_session_options(pool_size: int):
     import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    intra_threads = PIPER_INTRA_OP_THREADS or max(1, (os.cpu_count() or 1) // pool_size)
+    options.intra_op_num_threads = intra_threads
+    options.inter_op_num_threads = max(1, PIPER_INTER_OP_THREADS)
+    return options
+
+
+class PiperAudioCache:
+    """
+    Persistent cache of post-processed chunk audio, one PCM16 file per chunk.
+
+    File mtimes double as the LRU order: a hit touches the file, and the
+    oldest files are deleted once the directory grows past `max_bytes`.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._used_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @staticmethod
+    def make_key(model_hash: str, voice_id: str, speed: float, language: str, text: str) -> str:
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        raw = "\0".join((model_hash, voice_id, f"{speed:.3f}", language, normalized))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pcm"
+
+    def _scan_used_bytes(self) -> int:
+        if self._used_bytes is None:
+            self._used_bytes = sum(f.stat().st_size for f in self.root.glob("*/*.pcm")) if self.root.exists() else 0
+        return self._used_bytes
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32767.0
+
+    def put(self, key: str, audio: np.ndarray) -> None:
+        if not self.enabled:
+            return
+        path = self._path(key)
+        data = _audio_to_pcm16(audio)
+        with self._lock:
+            used = self._scan_used_bytes()
+            try:
+                previous = path.stat().st_size if path.exists() else 0
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{uuid4().hex}.tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+            except OSError as exc:
+                LOGGER.warning("Could not write Piper audio cache entry: %s", exc)
+                return
+            self._used_bytes = used - previous + len(data)
+            if self._used_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = []
+        for f in self.root.glob("*/*.pcm"):
+            try:
+                stat = f.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, f))
+        files.sort()
+        used = sum(size for _, size, _ in files)
+        # Shrink to 90% of the limit so eviction doesn't run on every write.
+        target = self.max_bytes * 0.9
+        for _, size, f in files:
+            if used <= target:
+                break
+            try:
+                f.unlink()
+                used -= size
+            except OSError:
+                pass
+        self._used_bytes = used
+
+    def clear(self) -> None:
+        with self._lock:
+            for f in self.root.glob("*/*.pcm"):
+                try:
+                    f.unlink()
+                except OSError:
+                    pass
+            self._used_bytes = 0
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "max_bytes": self.max_bytes,
+                "used_bytes": self._scan_used_bytes(),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_audio_cache = PiperAudioCache(_AUDIO_CACHE_DIR, PIPER_AUDIO_CACHE_MB * 1024 * 1024)
+
+# (path, size, mtime) -> sha256, so reloading an evicted voice doesn't rehash it.
+_model_hashes: Dict[Tuple[str, int, float], str] = {}
+
+
+def _model_file_hash(onnx_path: Path) -> str:
+    stat = onnx_path.stat()
+    cache_key = (str(onnx_path), stat.st_size, stat.st_mtime)
+    cached = _model_hashes.get(cache_key)
+    if cached is None:
+        digest = hashlib.sha256()
+        with open(onnx_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        cached = _model_hashes[cache_key] = digest.hexdigest()
+    return cached
+
+
+def _load_model(voice_id: str) -> "PiperEngine":
+    """Load and cache a PiperEngine for the given voice_id."""
+    return _model_cache.get(voice_id, _create_engine)
+
+
+def _create_engine(voice_id: str) -> Tuple["PiperEngine", int]:
+    """Build a PiperEngine and estimate its resident size in bytes."""
     import json
 
     parts = voice_id.split("/", 1)
@@ -128,9 +490,29 @@ def _load_model(voice_id: str) -> Tuple:
     with open(config_path, "r", encoding="utf-8") as f:
         config = json.load(f)
 
-    session = ort.InferenceSession(str(onnx_path), providers=["CPUExecutionProvider"])
-    _model_cache[voice_id] = (session, config)
-    return session, config
+    engine = PiperEngine(onnx_path, config, pool_size=PIPER_SESSION_POOL_SIZE)
+    engine.model_hash = _model_file_hash(onnx_path)
+    # Each session keeps its own copy of the weights.
+    size_bytes = onnx_path.stat().st_size * PIPER_SESSION_POOL_SIZE
+    return engine, size_bytes
+
+
+def model_cache_status() -> Dict:
+    return _model_cache.status()
+
+
+def audio_cache_status() -> Dict:
+    return _audio_cache.status()
+
+
+def preload_models(voice_ids: Optional[List[str]] = None) -> None:
+    """Load voices ahead of the first request (PIPER_PRELOAD_VOICES by default)."""
+    for voice_id in PIPER_PRELOAD_VOICES if voice_ids is None else voice_ids:
+        try:
+            _load_model(voice_id)
+            LOGGER.info("Preloaded Piper voice %s", voice_id)
+        except Exception as exc:
+            LOGGER.warning("Could not preload Piper voice %s: %s", voice_id, exc)
 
 
 def _espeak_exe() -> str:
@@ -143,6 +525,7 @@ def _espeak_phonemize(text: str, voice: str) -> str:
     """
     Call espeak-ng directly as a subprocess to produce IPA phonemes.
     Equivalent to phonemizer with backend='espeak', with_stress=True.
+    Only used when EspeakPhonemizer cannot load libespeak-ng.
     """
     import subprocess
 
@@ -162,17 +545,115 @@ def _espeak_phonemize(text: str, voice: str) -> str:
     return proc.stdout
 
 
-_LANG_MARKER_RE = re.compile(r'\([a-z]{2}(?:-[a-z]+)?\)', re.IGNORECASE)
+def _espeak_library_path() -> Optional[str]:
+    """Locate libespeak-ng: bundled eSpeak NG folder first, then the system."""
+    import ctypes.util
 
+    for name in ("libespeak-ng.dll", "libespeak-ng.so.1", "libespeak-ng.so", "libespeak-ng.dylib"):
+        candidate = _ESPEAK_DIR / name
+        if candidate.exists():
+            return str(candidate)
+    return ctypes.util.find_library("espeak-ng")
 
-def _text_to_phonemes(text: str, config: dict) -> list:
-    phoneme_type = config.get("phoneme_type", "espeak")
-    if phoneme_type == "text":
-        normalized = unicodedata.normalize("NFD", text)
-        return list(normalized)
 
-    voice = config.get("espeak", {}).get("voice", "en-us")
-    phonemes = _espeak_phonemize(text, voice)
+def _espeak_data_root() -> Optional[str]:
+    """Folder containing espeak-ng-data, as espeak_Initialize expects it."""
+    if (_ESPEAK_DIR / "espeak-ng-data").exists():
+        return str(_ESPEAK_DIR)
+    env_path = os.environ.get("ESPEAK_DATA_PATH")
+    if env_path:
+        path = Path(env_path)
+        return str(path.parent if path.name == "espeak-ng-data" else path)
+    return None
+
+
+class EspeakPhonemizer:
+    """
+    Long-lived espeak-ng session for IPA phonemization.
+
+    Loads libespeak-ng through ctypes once and calls espeak_TextToPhonemes
+    in-process, so a long article no longer spawns one espeak-ng process per
+    sentence (each re-reading espeak-ng-data). The library keeps global state,
+    so calls are serialised by a lock. When no shared library can be found it
+    falls back to the espeak-ng executable, one subprocess per text.
+    """
+
+    _AUDIO_OUTPUT_SYNCHRONOUS = 0x02
+    _INITIALIZE_DONT_EXIT = 0x8000
+    _CHARS_UTF8 = 1
+    _PHONEMES_IPA = 0x02
+
+    def __init__(self, library_path: Optional[str] = None) -> None:
+        self._lock = threading.Lock()
+        self._lib = None
+        self._voice: Optional[str] = None
+        self._library_path = library_path
+        self._loaded = False
+
+    def _ensure_library(self):
+        if self._loaded:
+            return self._lib
+        self._loaded = True
+        path = self._library_path or _espeak_library_path()
+        if not path:
+            return None
+        try:
+            import ctypes
+
+            lib = ctypes.cdll.LoadLibrary(path)
+            lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+            lib.espeak_Initialize.restype = ctypes.c_int
+            lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+            lib.espeak_SetVoiceByName.restype = ctypes.c_int
+            lib.espeak_TextToPhonemes.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_int, ctypes.c_int]
+            lib.espeak_TextToPhonemes.restype = ctypes.c_char_p
+
+            data_root = _espeak_data_root()
+            encoded_root = data_root.encode("utf-8") if data_root else None
+            if lib.espeak_Initialize(self._AUDIO_OUTPUT_SYNCHRONOUS, 0, encoded_root, self._INITIALIZE_DONT_EXIT) < 0:
+                return None
+            self._lib = lib
+        except Exception:
+            self._lib = None
+        return self._lib
+
+    @property
+    def uses_library(self) -> bool:
+        with self._lock:
+            return self._ensure_library() is not None
+
+    def _phonemize_one(self, lib, text: str) -> str:
+        import ctypes
+
+        buffer = ctypes.create_string_buffer(text.encode("utf-8"))
+        pointer = ctypes.c_void_p(ctypes.addressof(buffer))
+        clauses: List[str] = []
+        # Each call consumes one clause and advances the pointer; NULL when done.
+        while pointer.value:
+            result = lib.espeak_TextToPhonemes(ctypes.byref(pointer), self._CHARS_UTF8, self._PHONEMES_IPA)
+            if result:
+                clauses.append(result.decode("utf-8", errors="replace"))
+        return " ".join(clauses)
+
+    def phonemize(self, texts: List[str], voice: str) -> List[str]:
+        """Return the IPA phoneme string for each text, in order."""
+        with self._lock:
+            lib = self._ensure_library()
+            if lib is None:
+                return [_espeak_phonemize(text, voice) for text in texts]
+            if voice != self._voice:
+                if lib.espeak_SetVoiceByName(voice.encode("utf-8")) != 0:
+                    raise ValueError(f"espeak-ng voice not available: {voice}")
+                self._voice = voice
+            return [self._phonemize_one(lib, text) for text in texts]
+
+
+_phonemizer = EspeakPhonemizer()
+
+_LANG_MARKER_RE = re.compile(r'\([a-z]{2}(?:-[a-z]+)?\)', re.IGNORECASE)
+
+
+def _clean_phonemes(phonemes: str) -> list:
     # Strip language-switch markers espeak inserts when it detects a language
     # change mid-text, e.g. "(en)", "(vi)". These have no phoneme ID in the
     # model's map and would be silently skipped — but any surrounding whitespace
@@ -182,6 +663,20 @@ def _text_to_phonemes(text: str, config: dict) -> list:
     return list(normalized)
 
 
+def _texts_to_phonemes(texts: List[str], config: dict) -> List[list]:
+    """Phonemize a batch of texts with a single espeak session call."""
+    phoneme_type = config.get("phoneme_type", "espeak")
+    if phoneme_type == "text":
+        return [list(unicodedata.normalize("NFD", text)) for text in texts]
+
+    voice = config.get("espeak", {}).get("voice", "en-us")
+    return [_clean_phonemes(phonemes) for phonemes in _phonemizer.phonemize(texts, voice)]
+
+
+def _text_to_phonemes(text: str, config: dict) -> list:
+    return _texts_to_phonemes([text], config)[0]
+
+
 def _phonemes_to_ids(phonemes: list, id_map: dict) -> list:
     BOS, EOS, PAD = "^", "$", "_"
     ids = []
@@ -195,23 +690,155 @@ def _phonemes_to_ids(phonemes: list, id_map: dict) -> list:
     return ids
 
 
-def _run_inference(session, config: dict, text: str, speaker_id: int = 0,
-                   length_scale: float = 1.0, noise_scale: float = 0.667,
-                   noise_w_scale: float = 0.8) -> np.ndarray:
-    id_map = config["phoneme_id_map"]
-    phonemes = _text_to_phonemes(text, config)
-    phoneme_ids = _phonemes_to_ids(phonemes, id_map)
+def _group_batches(lengths: List[int], batch_size: int,
+                   max_pad_ratio: float = PIPER_BATCH_MAX_PAD_RATIO) -> List[List[int]]:
+    """
+    Group item indices into batches of similar length.
+
+    Items are sorted by length and packed greedily; a batch is closed when it is
+    full or when the next item would be more than `max_pad_ratio` times longer
+    than the shortest item in it, which bounds the wasted padded compute.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for index in order:
+        if current and (
+            len(current) >= batch_size
+            or lengths[index] > max(1, lengths[current[0]]) * max_pad_ratio
+        ):
+            batches.append(current)
+            current = []
+        current.append(index)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _trailing_silence(audio: np.ndarray, thresh: float = 0.002) -> int:
+    above = np.where(np.abs(audio) > thresh)[0]
+    if len(above) == 0:
+        return len(audio)
+    return len(audio) - 1 - int(above[-1])
+
+
+def _strip_batch_padding(audio: np.ndarray, tail_samples: int, thresh: float = 0.002) -> np.ndarray:
+    """
+    Cut the decoder output produced for a batch item's padding and restore a
+    natural end pause of `tail_samples` (measured on the batch's unpadded item).
+    """
+    above = np.where(np.abs(audio) > thresh)[0]
+    if len(above) == 0:
+        return audio
+    end = min(len(audio), int(above[-1]) + 1 + tail_samples)
+    return audio[:end]
+
+
+class PiperEngine:
+    """
+    ONNX inference for one Piper voice.
+
+    Holds a pool of tuned InferenceSessions (thread counts and graph
+    optimisation from the PIPER_* settings) and synthesizes lists of chunks in
+    padded batches of similar phoneme length.
+    """
+
+    def __init__(self, onnx_path: Path, config: dict, pool_size: int = PIPER_SESSION_POOL_SIZE) -> None:
+        import onnxruntime as ort
+
+        self.config = config
+        self.sample_rate = config["audio"]["sample_rate"]
+        # Identifies the weights in audio cache keys; set by _create_engine.
+        self.model_hash = ""
+        self._multi_speaker = config.get("num_speakers", 1) > 1
+        self._sessions: "queue.Queue" = queue.Queue()
+        self._id_cache: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._id_cache_lock = threading.Lock()
+        options = _build_session_options(pool_size)
+        for _ in range(max(1, pool_size)):
+            self._sessions.put(
+                ort.InferenceSession(str(onnx_path), sess_options=options, providers=["CPUExecutionProvider"])
+            )
+
+    @contextmanager
+    def _session(self):
+        session = self._sessions.get()
+        try:
+            yield session
+        finally:
+            self._sessions.put(session)
+
+    def phoneme_ids(self, text: str) -> List[int]:
+        return self.phoneme_ids_batch([text])[0]
 
-    input_ids = np.array(phoneme_ids, dtype=np.int64)[np.newaxis, :]
-    input_lengths = np.array([len(phoneme_ids)], dtype=np.int64)
-    scales = np.array([noise_scale, length_scale, noise_w_scale], dtype=np.float32)
+    def phoneme_ids_batch(self, texts: List[str]) -> List[List[int]]:
+        """Phoneme IDs per text; cache misses are phonemized together in one call."""
+        results: Dict[str, List[int]] = {}
+        misses: List[str] = []
+        with self._id_cache_lock:
+            for text in texts:
+                cached = self._id_cache.get(text)
+                if cached is not None:
+                    self._id_cache.move_to_end(text)
+                    results[text] = cached
+                elif text not in results:
+                    misses.append(text)
+                    results[text] = []
 
-    feeds = {"input": input_ids, "input_lengths": input_lengths, "scales": scales}
-    if config.get("num_speakers", 1) > 1:
-        feeds["sid"] = np.array([speaker_id], dtype=np.int64)
+        if misses:
+            id_map = self.config["phoneme_id_map"]
+            computed = [_phonemes_to_ids(phonemes, id_map) for phonemes in _texts_to_phonemes(misses, self.config)]
+            with self._id_cache_lock:
+                for text, ids in zip(misses, computed):
+                    results[text] = ids
+                    self._id_cache[text] = ids
+                while len(self._id_cache) > PIPER_PHONEME_CACHE_SIZE:
+                    self._id_cache.popitem(last=False)
 
-    results = session.run(None, feeds)
-    return results[0].squeeze()
+        return [results[text] for text in texts]
+
+    def infer_batch(self, id_lists: List[List[int]], speaker_id: int = 0,
+                    length_scale: float = 1.0, noise_scale: float = 0.667,
+                    noise_w_scale: float = 0.8) -> List[np.ndarray]:
+        """Run one padded batch through the model and return one waveform per item."""
+        lengths = [len(ids) for ids in id_lists]
+        max_len = max(lengths)
+        pad_id = self.config["phoneme_id_map"]["_"][0]
+        input_ids = np.full((len(id_lists), max_len), pad_id, dtype=np.int64)
+        for row, ids in enumerate(id_lists):
+            input_ids[row, : len(ids)] = ids
+        input_lengths = np.array(lengths, dtype=np.int64)
+        scales = np.array([noise_scale, length_scale, noise_w_scale], dtype=np.float32)
+
+        feeds = {"input": input_ids, "input_lengths": input_lengths, "scales": scales}
+        if self._multi_speaker:
+            feeds["sid"] = np.full((len(id_lists),), speaker_id, dtype=np.int64)
+
+        with self._session() as session:
+            output = session.run(None, feeds)[0]
+
+        audios = [output[row].reshape(-1) for row in range(len(id_lists))]
+        if len(audios) == 1:
+            return audios
+
+        # Items shorter than the longest carry decoder output for their padding.
+        longest = int(np.argmax(lengths))
+        tail = _trailing_silence(audios[longest])
+        return [
+            audio if row == longest or lengths[row] == max_len else _strip_batch_padding(audio, tail)
+            for row, audio in enumerate(audios)
+        ]
+
+    def synthesize(self, texts: List[str], length_scale: float = 1.0,
+                   batch_size: int = PIPER_BATCH_SIZE) -> List[np.ndarray]:
+        """Synthesize each text, batching similar-length chunks; results keep input order."""
+        id_lists = self.phoneme_ids_batch(texts)
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        for batch in _group_batches([len(ids) for ids in id_lists], batch_size):
+            audios = self.infer_batch([id_lists[i] for i in batch], length_scale=length_scale)
+            for index, audio in zip(batch, audios):
+                results[index] = audio
+        return results  # type: ignore[return-value]
 
 
 def _normalize_peak(audio: np.ndarray, target: float = 0.9) -> np.ndarray:
@@ -241,6 +868,37 @@ def _trim_silence(audio: np.ndarray, thresh: float = 0.002, min_samples: int = 4
     return audio[start:end]
 
 
+def _postprocess_chunk(audio: np.ndarray, language: str) -> np.ndarray:
+    is_vi = language == "vi"
+    if not is_vi:
+        audio = _trim_silence(audio)
+    return _normalize_peak(audio, target=1.0 if is_vi else 0.9)
+
+
+def _audio_to_pcm16(audio: np.ndarray) -> bytes:
+    audio = np.clip(audio, -1.0, 1.0)
+    return (audio * 32767).astype(np.int16).tobytes()
+
+
+def _wav_stream_header(sample_rate: int) -> bytes:
+    """
+    44-byte PCM16 mono WAV header for a stream of unknown length.
+
+    RIFF and data sizes are set to 0xFFFFFFFF, which browsers and ffmpeg treat
+    as "read until end of stream".
+    """
+    unknown = 0xFFFFFFFF
+    byte_rate = sample_rate * 2
+    return (
+        b"RIFF" + unknown.to_bytes(4, "little") + b"WAVE"
+        + b"fmt " + (16).to_bytes(4, "little")
+        + (1).to_bytes(2, "little") + (1).to_bytes(2, "little")
+        + sample_rate.to_bytes(4, "little") + byte_rate.to_bytes(4, "little")
+        + (2).to_bytes(2, "little") + (16).to_bytes(2, "little")
+        + b"data" + unknown.to_bytes(4, "little")
+    )
+
+
 def _audio_to_wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
     audio = np.clip(audio, -1.0, 1.0)
     pcm = (audio * 32767).astype(np.int16)
@@ -253,14 +911,33 @@ def _audio_to_wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
     return buf.getvalue()
 
 
+def _synthesize_cached(
+    engine: "PiperEngine",
+    voice_id: str,
+    texts: List[str],
+    speed: float,
+    language: str,
+) -> List[np.ndarray]:
+    """Post-processed audio per text; only audio-cache misses reach the model."""
+    keys = [PiperAudioCache.make_key(engine.model_hash, voice_id, speed, language, text) for text in texts]
+    segments: List[Optional[np.ndarray]] = [_audio_cache.get(key) for key in keys]
+    missing = [i for i, segment in enumerate(segments) if segment is None]
+    if missing:
+        length_scale = 1.0 / max(speed, 0.1)
+        audios = engine.synthesize([texts[i] for i in missing], length_scale=length_scale)
+        for i, audio in zip(missing, audios):
+            segments[i] = _postprocess_chunk(audio, language)
+            _audio_cache.put(keys[i], segments[i])
+    return segments
+
+
 def generate(text: str, voice_id: str, speed: float = 1.0) -> Tuple[Path, str]:
     """Run Piper TTS and return (output_path, filename)."""
-    session, config = _load_model(voice_id)
-    sample_rate = config["audio"]["sample_rate"]
+    engine = _load_model(voice_id)
     length_scale = 1.0 / max(speed, 0.1)
 
-    audio = _run_inference(session, config, text, length_scale=length_scale)
-    wav_bytes = _audio_to_wav_bytes(audio, sample_rate)
+    audio = engine.synthesize([text], length_scale=length_scale)[0]
+    wav_bytes = _audio_to_wav_bytes(audio, engine.sample_rate)
 
     TEMP_DIR.mkdir(parents=True, exist_ok=True)
     filename = f"piper_tts_{uuid4().hex}.wav"
@@ -274,6 +951,7 @@ def generate_from_chunks(
     voice_id: str,
     speed: float = 1.0,
     language: str = "vi",
+    on_progress: Optional[Callable[[int, int], None]] = None,
 ) -> Tuple[Path, str]:
     """
     Run Piper TTS on each chunk independently and concatenate the audio.
@@ -282,26 +960,29 @@ def generate_from_chunks(
       - Peak normalisation  (VI target=1.0, EN/other target=0.9)
       - Silence trimming    (EN/other only — VI relies on the '.' pause ID)
 
-    Each chunk is inferred separately so the ONNX model processes one
-    sentence at a time — giving better prosody per sentence and ensuring
-    the trailing '.' is encoded as its phoneme ID before EOS.
+    Each chunk is still its own sequence to the ONNX model — giving better
+    prosody per sentence and ensuring the trailing '.' is encoded as its
+    phoneme ID before EOS — but chunks of similar phoneme length are run
+    together as one padded batch.
+
+    Chunks already in the audio cache (same voice, model file, speed and
+    normalized text) are reused, so an edited article only re-synthesizes the
+    sentences that changed.
+
+    `on_progress(done, total)` is called after each window of PIPER_BATCH_SIZE
+    chunks.
     """
-    session, config = _load_model(voice_id)
-    sample_rate = config["audio"]["sample_rate"]
-    length_scale = 1.0 / max(speed, 0.1)
-    is_vi = language == "vi"
-    peak_target = 1.0 if is_vi else 0.9
+    engine = _load_model(voice_id)
+    sample_rate = engine.sample_rate
 
-    segments = []
-    for chunk in chunks:
-        chunk = chunk.strip()
-        if not chunk:
-            continue
-        audio = _run_inference(session, config, chunk, length_scale=length_scale)
-        if not is_vi:
-            audio = _trim_silence(audio)
-        audio = _normalize_peak(audio, target=peak_target)
-        segments.append(audio)
+    texts = [chunk.strip() for chunk in chunks if chunk.strip()]
+    segments: List[np.ndarray] = []
+    for start in range(0, len(texts), PIPER_BATCH_SIZE):
+        segments.extend(
+            _synthesize_cached(engine, voice_id, texts[start : start + PIPER_BATCH_SIZE], speed, language)
+        )
+        if on_progress is not None:
+            on_progress(len(segments), len(texts))
 
     if not segments:
         raise ValueError("No audio generated — all chunks were empty")
@@ -314,3 +995,107 @@ def generate_from_chunks(
     output_path = TEMP_DIR / filename
     output_path.write_bytes(wav_bytes)
     return output_path, filename
+
+
+def start_generation(
+    job_store: JobStore,
+    text: str,
+    voice_id: str,
+    speed: float,
+    language: str,
+    normalize: Callable[[str, str], List[str]],
+) -> str:
+    """
+    Queue a generation job on the synthesis pool and return its job id.
+
+    `normalize(text, language)` turns the raw text into sentence chunks; it
+    runs on the worker too. Progress is published on `piper_progress`.
+    Raises PiperBusyError when the pool is full.
+    """
+    job = job_store.create_job()
+
+    def runner() -> None:
+        try:
+            piper_progress.set_progress(job.job_id, "processing", 0, "Normalizing text...")
+            chunks = normalize(text, language)
+            if not chunks:
+                raise ValueError("text is empty after normalization")
+            piper_progress.set_progress(job.job_id, "processing", 5, "Loading voice...")
+
+            def _report(done: int, total: int) -> None:
+                percent = 10 + int(done / max(total, 1) * 85)
+                piper_progress.set_progress(job.job_id, "processing", percent, f"Synthesized {done}/{total} chunks")
+
+            output_path, filename = generate_from_chunks(
+                chunks, voice_id, speed=speed, language=language, on_progress=_report
+            )
+            file_record = job_store.add_file(output_path, filename)
+            result = {
+                "file_id": file_record.file_id,
+                "filename": filename,
+                "download_url": f"/api/v1/files/{file_record.file_id}",
+                "normalized_text": " ".join(chunks),
+                "chunks": chunks,
+            }
+            job_store.update_job(job.job_id, "complete", result=result)
+            piper_progress.set_progress(job.job_id, "complete", 100, "Generation complete")
+        except Exception as exc:
+            job_store.update_job(job.job_id, "error", error=str(exc))
+            piper_progress.set_progress(job.job_id, "error", 0, str(exc))
+
+    piper_progress.set_progress(job.job_id, "queued", 0, "Waiting for a synthesis worker...")
+    try:
+        synthesis_pool.submit(runner)
+    except PiperBusyError as exc:
+        job_store.update_job(job.job_id, "error", error=str(exc))
+        piper_progress.set_progress(job.job_id, "error", 0, str(exc))
+        raise
+    return job.job_id
+
+
+def iter_chunk_audio(
+    chunks: List[str],
+    voice_id: str,
+    speed: float = 1.0,
+    language: str = "vi",
+) -> Iterator[np.ndarray]:
+    """
+    Yield post-processed audio for each chunk, in order, as soon as it is ready.
+
+    The first chunk is synthesized on its own so playback can start right away;
+    the rest run in consecutive windows of PIPER_BATCH_SIZE chunks. Trim and
+    normalisation are applied per chunk exactly as in generate_from_chunks, and
+    the same audio cache is consulted.
+    """
+    engine = _load_model(voice_id)
+    texts = [chunk.strip() for chunk in chunks if chunk.strip()]
+    if not texts:
+        raise ValueError("No audio generated — all chunks were empty")
+
+    start = 0
+    while start < len(texts):
+        window = 1 if start == 0 else PIPER_BATCH_SIZE
+        yield from _synthesize_cached(engine, voice_id, texts[start : start + window], speed, language)
+        start += window
+
+
+def iter_audio_stream(
+    chunks: List[str],
+    voice_id: str,
+    speed: float = 1.0,
+    language: str = "vi",
+    audio_format: str = "wav",
+) -> Iterator[bytes]:
+    """
+    Stream synthesized speech as bytes while later chunks are still being synthesized.
+
+    `audio_format` is "wav" (streaming WAV header, then PCM16 frames) or "pcm"
+    (raw PCM16 little-endian mono at the voice's sample rate).
+    """
+    if audio_format not in STREAM_FORMATS:
+        raise ValueError(f"Unsupported stream format: {audio_format}")
+    engine = _load_model(voice_id)
+    if audio_format == "wav":
+        yield _wav_stream_header(engine.sample_rate)
+    for audio in iter_chunk_audio(chunks, voice_id, speed=speed, language=language):
+        yield _audio_to_pcm16(audio)
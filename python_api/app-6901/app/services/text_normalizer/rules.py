@@ -0,0 +1,709 @@
+"""
+Compiled rule table for Vietnamese number, date, unit and symbol normalization.
+
+Both ``VietnameseTextProcessor`` (processor.py) and the functional pipeline in
+text_processor.py run their steps from this module: every regex is compiled
+once at import, replacement callbacks are module-level functions instead of
+closures rebuilt on each call, measurement-unit passes run only for the
+units a single scan finds in the text, and ``number_to_words`` is memoized
+with 0-9999 precomputed.
+
+The two pipelines are not identical (step order, address numbers, Roman
+numerals, unit ranges), so each is an ordered tuple of :class:`Rule` drawn
+from the shared table: ``PROCESSOR_RULES`` and ``vietnamese_rules()``.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache, partial
+from typing import Callable, Iterable, NamedTuple
+
+
+class Rule(NamedTuple):
+    """One normalization step: a name (for profiling) and a ``str -> str`` function."""
+
+    name: str
+    apply: Callable[[str], str]
+
+
+def apply_rules(text: str, rules: Iterable[Rule]) -> str:
+    """Run *text* through *rules* in order."""
+    for rule in rules:
+        text = rule.apply(text)
+    return text
+
+
+def _sub(name: str, pattern: str, repl, flags: int = 0) -> Rule:
+    return Rule(name, partial(re.compile(pattern, flags).sub, repl))
+
+
+# ---------------------------------------------------------------------------
+# Number words
+# ---------------------------------------------------------------------------
+
+DIGITS = {
+    '0': 'không', '1': 'một', '2': 'hai', '3': 'ba', '4': 'bốn',
+    '5': 'năm', '6': 'sáu', '7': 'bảy', '8': 'tám', '9': 'chín',
+}
+TEENS = {
+    '10': 'mười', '11': 'mười một', '12': 'mười hai', '13': 'mười ba',
+    '14': 'mười bốn', '15': 'mười lăm', '16': 'mười sáu', '17': 'mười bảy',
+    '18': 'mười tám', '19': 'mười chín',
+}
+TENS = {
+    '2': 'hai mươi', '3': 'ba mươi', '4': 'bốn mươi', '5': 'năm mươi',
+    '6': 'sáu mươi', '7': 'bảy mươi', '8': 'tám mươi', '9': 'chín mươi',
+}
+ORDINALS = {
+    '1': 'nhất', '2': 'hai', '3': 'ba', '4': 'tư', '5': 'năm',
+    '6': 'sáu', '7': 'bảy', '8': 'tám', '9': 'chín', '10': 'mười',
+}
+
+NUMBER_CACHE_SIZE = 4096
+
+# Filled for 0..9999 below; _spell() reads it for every smaller part.
+_SMALL_NUMBERS: list[str] = []
+
+
+def _spell_group(num: int, word: str, scale: int) -> str:
+    head, rem = divmod(num, scale)
+    result = _spell(head) + word
+    if rem == 0:
+        return result
+    if rem < 10:
+        return result + ' không trăm lẻ ' + DIGITS[str(rem)]
+    if rem < 100:
+        return result + ' không trăm ' + _spell(rem)
+    return result + ' ' + _spell(rem)
+
+
+def _spell(num: int) -> str:
+    if num < len(_SMALL_NUMBERS):
+        return _SMALL_NUMBERS[num]
+    if num == 0:
+        return 'không'
+    if num < 10:
+        return DIGITS[str(num)]
+    if num < 20:
+        return TEENS[str(num)]
+    if num < 100:
+        tens, units = divmod(num, 10)
+        if units == 0:
+            return TENS[str(tens)]
+        if units == 1:
+            return TENS[str(tens)] + ' mốt'
+        if units == 4:
+            return TENS[str(tens)] + ' tư'
+        if units == 5:
+            return TENS[str(tens)] + ' lăm'
+        return TENS[str(tens)] + ' ' + DIGITS[str(units)]
+    if num < 1000:
+        hundreds, rem = divmod(num, 100)
+        result = DIGITS[str(hundreds)] + ' trăm'
+        if rem == 0:
+            return result
+        if rem < 10:
+            return result + ' lẻ ' + DIGITS[str(rem)]
+        return result + ' ' + _spell(rem)
+    if num < 1_000_000:
+        return _spell_group(num, ' nghìn', 1000)
+    if num < 1_000_000_000:
+        return _spell_group(num, ' triệu', 1_000_000)
+    return _spell_group(num, ' tỷ', 1_000_000_000)
+
+
+for _n in range(10_000):
+    _SMALL_NUMBERS.append(_spell(_n))
+
+
+@lru_cache(maxsize=NUMBER_CACHE_SIZE)
+def number_to_words(num_str: str) -> str:
+    """Convert a number string to Vietnamese words (memoized)."""
+    num_str = num_str.lstrip('0') or '0'
+    if num_str.startswith('-'):
+        return 'âm ' + number_to_words(num_str[1:])
+    try:
+        num = int(num_str)
+    except ValueError:
+        return num_str
+    if 0 <= num < 10_000:
+        return _SMALL_NUMBERS[num]
+    if num < 1_000_000_000_000:
+        return _spell(num)
+    # Very large: digit by digit
+    return ' '.join(DIGITS.get(d, d) for d in num_str)
+
+
+def _digits_aloud(text: str) -> str:
+    return ' '.join(DIGITS.get(d, d) for d in text if d.isdecimal())
+
+
+# ---------------------------------------------------------------------------
+# Text cleanup
+# ---------------------------------------------------------------------------
+
+_SPECIAL_CHARS = str.maketrans({
+    '&': ' và ', '@': ' a còng ', '#': ' thăng ', '_': ' ',
+    '*': None, '~': None, '`': None, '^': None,
+})
+
+UNICODE_NFC = Rule('unicode_nfc', partial(unicodedata.normalize, 'NFC'))
+
+SPECIAL_CHARS = (
+    Rule('special_chars', lambda text: text.translate(_SPECIAL_CHARS)),
+    _sub('strip_url', r'https?://\S+', ''),
+    _sub('strip_www', r'www\.\S+', ''),
+    _sub('strip_email', r'\S+@\S+\.\S+', ''),
+)
+
+_PUNCTUATION_COMMON = (
+    _sub('double_quotes', r'[""„‟]', '"'),
+    _sub('single_quotes', r"[‚‛]", "'"),
+    _sub('dashes', r'[–—−]', '-'),
+    _sub('ellipsis_dots', r'\.{3,}', '...'),
+    Rule('ellipsis_char', lambda text: text.replace('…', '...')),
+)
+# The processor keeps the last mark of a run ("?!" -> "!"), the functional pipeline the first.
+PUNCTUATION_PROCESSOR = _PUNCTUATION_COMMON + (_sub('repeated_marks', r'([!?.]){2,}', r'\1'),)
+PUNCTUATION = _PUNCTUATION_COMMON + (_sub('repeated_marks', r'([!?.])[!?.]+', r'\1'),)
+
+_PROCESSOR_EMOJI = (
+    r'[\U0001F600-\U0001F64F]|[\U0001F300-\U0001F5FF]|[\U0001F680-\U0001F6FF]|'
+    r'[\U0001F1E0-\U0001F1FF]|[\u2600-\u26FF]|[\u2700-\u27BF]|'
+    r'[\U0001F900-\U0001F9FF]|[\U0001F018-\U0001F270]|[\u238C-\u2454]|'
+    r'[\u20D0-\u20FF]|[\uFE0F]|[\u200D]'
+)
+
+CLEAN_PROCESSOR = (
+    _sub('emoji', _PROCESSOR_EMOJI, ''),
+    _sub('brackets_quotes', r'[\\()¯"""]', ''),
+    _sub('spaced_em_dash', r'\s—', '.'),
+    _sub('lone_underscore', r'\b_\b', ' '),
+    # Remove dashes but preserve those between numbers
+    _sub('dashes_to_space', r'(?<!\d)-(?!\d)', ' '),
+    # Keep only Latin, Vietnamese, numbers, punctuation, whitespace
+    _sub('non_latin', r'[^\u0000-\u024F\u1E00-\u1EFF]', ''),
+    Rule('strip', str.strip),
+)
+
+WHITESPACE = (
+    _sub('whitespace', r'\s+', ' '),
+    Rule('strip', str.strip),
+)
+
+
+# ---------------------------------------------------------------------------
+# Numbers with separators, ranges and addresses
+# ---------------------------------------------------------------------------
+
+def _drop_dots(m: re.Match) -> str:
+    return m.group(0).replace('.', '')
+
+
+def _year_range(m: re.Match) -> str:
+    return number_to_words(m.group(1)) + ' đến ' + number_to_words(m.group(2))
+
+
+def _percentage_range(m: re.Match) -> str:
+    return f"{number_to_words(m.group(1))} đến {number_to_words(m.group(2))} phần trăm"
+
+
+def _address_parts(parts: str) -> str:
+    return ' trên '.join(number_to_words(p) for p in parts.split('/'))
+
+
+def _address_keyword(m: re.Match) -> str:
+    return m.group(1) + ' ' + _address_parts(m.group(2))
+
+
+def _address_numbers(m: re.Match) -> str:
+    return _address_parts(m.group(0))
+
+
+THOUSAND_SEPARATORS = _sub('thousand_separators', r'(\d{1,3}(?:\.\d{3})+)(?=\s|$|[^\d.,])', _drop_dots)
+YEAR_RANGE = _sub('year_range', r'(\d{4})\s*[-–—]\s*(\d{4})', _year_range)
+PERCENTAGE_RANGE = _sub('percentage_range', r'(\d+)\s*[-–—]\s*(\d+)\s*%', _percentage_range)
+
+# Must run BEFORE dates: 13/2/80 is an address, not a date.
+ADDRESS_NUMBERS = (
+    # keyword + number/number... → always address
+    _sub('address_keyword', r'(số|nhà|đường|hẻm|ngõ|ngách|kiệt|phố)\s+(\d+(?:/\d+)+)',
+         _address_keyword, re.IGNORECASE),
+    # X/Y/Z where Z is 1-3 digits → address (a date needs a 4-digit year)
+    _sub('address_3part', r'\b(\d+)/(\d+)/(\d{1,3})\b', _address_numbers),
+    # X/Y where X has 3+ digits → can't be a date
+    _sub('address_bignum', r'\b(\d{3,})/(\d+)\b', _address_numbers),
+)
+
+
+# ---------------------------------------------------------------------------
+# Dates
+# ---------------------------------------------------------------------------
+
+def _is_valid_date(day: str, month: str, year: str | None = None) -> bool:
+    d, m = int(day), int(month)
+    if year and not (1000 <= int(year) <= 9999):
+        return False
+    return 1 <= d <= 31 and 1 <= m <= 12
+
+
+def _spell_day_range(day1: str, day2: str, month: str, year: str | None) -> str:
+    result = f"{number_to_words(day1)} đến {number_to_words(day2)} tháng {number_to_words(month)}"
+    if year:
+        result += f" năm {number_to_words(year)}"
+    return result
+
+
+def _ngay_range(m: re.Match) -> str:
+    day1, day2, month, year = m.groups()
+    if _is_valid_date(day1, month, year) and _is_valid_date(day2, month, year):
+        return 'ngày ' + _spell_day_range(day1, day2, month, year)
+    return m.group(0)
+
+
+def _date_range(m: re.Match) -> str:
+    day1, day2, month, year = m.groups()
+    if _is_valid_date(day1, month, year) and _is_valid_date(day2, month, year):
+        return _spell_day_range(day1, day2, month, year)
+    return m.group(0)
+
+
+def _month_range(m: re.Match) -> str:
+    month1, month2, year = m.groups()
+    if 1 <= int(month1) <= 12 and 1 <= int(month2) <= 12 and 1000 <= int(year) <= 9999:
+        return (f"tháng {number_to_words(month1)} đến tháng {number_to_words(month2)} "
+                f"năm {number_to_words(year)}")
+    return m.group(0)
+
+
+def _sinh(m: re.Match) -> str:
+    prefix, day, month, year = m.groups()
+    if _is_valid_date(day, month, year):
+        return (f"{prefix} ngày {number_to_words(day)} tháng {number_to_words(month)} "
+                f"năm {number_to_words(year)}")
+    return m.group(0)
+
+
+def _full_date(m: re.Match) -> str:
+    day, month, year = m.groups()
+    if _is_valid_date(day, month, year):
+        return f"ngày {number_to_words(day)} tháng {number_to_words(month)} năm {number_to_words(year)}"
+    return m.group(0)
+
+
+def _month_year(m: re.Match) -> str:
+    month, year = m.groups()
+    if 1 <= int(month) <= 12 and 1000 <= int(year) <= 9999:
+        return f"tháng {number_to_words(month)} năm {number_to_words(year)}"
+    return m.group(0)
+
+
+def _day_month(m: re.Match) -> str:
+    day, month = m.groups()
+    if _is_valid_date(day, month):
+        return f"{number_to_words(day)} tháng {number_to_words(month)}"
+    return m.group(0)
+
+
+def _x_thang_y(m: re.Match) -> str:
+    day, month = m.groups()
+    if _is_valid_date(day, month):
+        return f"ngày {number_to_words(day)} tháng {number_to_words(month)}"
+    return m.group(0)
+
+
+def _thang_x(m: re.Match) -> str:
+    month = m.group(1)
+    return 'tháng ' + number_to_words(month) if 1 <= int(month) <= 12 else m.group(0)
+
+
+def _ngay_x(m: re.Match) -> str:
+    day = m.group(1)
+    return 'ngày ' + number_to_words(day) if 1 <= int(day) <= 31 else m.group(0)
+
+
+_DATE_RANGE = _sub('date_range', r'(\d{1,2})\s*[-–—]\s*(\d{1,2})\s*[/-]\s*(\d{1,2})(?:\s*[/-]\s*(\d{4}))?',
+                   _date_range)
+_FULL_DATE = _sub('full_date', r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', _full_date)
+_MONTH_YEAR = _sub('month_year', r'(?:tháng\s+)?(\d{1,2})\s*[/-]\s*(\d{4})(?![\/-]\d)', _month_year)
+_THANG_X = _sub('thang_x', r'tháng\s*(\d+)', _thang_x)
+_NGAY_X = _sub('ngay_x', r'ngày\s*(\d+)', _ngay_x)
+
+DATES_PROCESSOR = (
+    _sub('ngay_range', r'ngày\s+(\d{1,2})\s*[-–—]\s*(\d{1,2})\s*[/-]\s*(\d{1,2})(?:\s*[/-]\s*(\d{4}))?',
+         _ngay_range),
+    _DATE_RANGE,
+    _sub('month_range', r'(\d{1,2})\s*[-–—]\s*(\d{1,2})\s*[/-]\s*(\d{4})', _month_range),
+    _sub('sinh_ngay', r'(Sinh|sinh)\s+ngày\s+(\d{1,2})[/-](\d{1,2})[/-](\d{4})', _sinh),
+    _FULL_DATE,
+    _MONTH_YEAR,
+    _sub('day_month', r'(\d{1,2})\s*[/-]\s*(\d{1,2})(?![\/-]\d)(?!\d+\s*%)', _day_month),
+    _sub('x_thang_y', r'(\d+)\s*tháng\s*(\d+)', _x_thang_y),
+    _THANG_X,
+    _NGAY_X,
+)
+
+DATES = (
+    _DATE_RANGE,
+    _FULL_DATE,
+    _MONTH_YEAR,
+    _sub('day_month', r'(\d{1,2})\s*[/\-]\s*(\d{1,2})(?![/\-]\d)(?!\d*\s*%)', _day_month),
+    _THANG_X,
+    _NGAY_X,
+)
+
+
+# ---------------------------------------------------------------------------
+# Times
+# ---------------------------------------------------------------------------
+
+def _hms(m: re.Match) -> str:
+    hour, minute, second = m.groups()
+    result = number_to_words(hour) + ' giờ'
+    if minute:
+        result += ' ' + number_to_words(minute) + ' phút'
+    if second:
+        result += ' ' + number_to_words(second) + ' giây'
+    return result
+
+
+def _hhmm(m: re.Match) -> str:
+    hour, minute = m.groups()
+    if 0 <= int(hour) <= 23 and 0 <= int(minute) <= 59:
+        return number_to_words(hour) + ' giờ ' + number_to_words(minute)
+    return m.group(0)
+
+
+def _h(m: re.Match) -> str:
+    hour = m.group(1)
+    if 0 <= int(hour) <= 23:
+        return number_to_words(hour) + ' giờ'
+    return m.group(0)
+
+
+def _gio_phut(m: re.Match) -> str:
+    return number_to_words(m.group(1)) + ' giờ ' + number_to_words(m.group(2)) + ' phút'
+
+
+def _gio(m: re.Match) -> str:
+    return number_to_words(m.group(1)) + ' giờ'
+
+
+TIMES = (
+    _sub('time_hms', r'(\d{1,2}):(\d{2})(?::(\d{2}))?', _hms),
+    _sub('time_hhmm', r'(\d{1,2})h(\d{2})(?![a-zà-ỹ])', _hhmm, re.IGNORECASE),
+    _sub('time_h', r'(\d{1,2})h(?![a-zà-ỹ\d])', _h, re.IGNORECASE),
+    _sub('time_gio_phut', r'(\d+)\s*giờ\s*(\d+)\s*phút', _gio_phut),
+    _sub('time_gio', r'(\d+)\s*giờ(?!\s*\d)', _gio),
+)
+
+
+# ---------------------------------------------------------------------------
+# Ordinals, currency, percentages, phone numbers, decimals
+# ---------------------------------------------------------------------------
+
+def _ordinal(m: re.Match) -> str:
+    prefix, num = m.groups()
+    return prefix + ' ' + (ORDINALS.get(num) or number_to_words(num))
+
+
+def _vnd(m: re.Match) -> str:
+    return number_to_words(m.group(1).replace(',', '')) + ' đồng'
+
+
+def _usd(m: re.Match) -> str:
+    return number_to_words(m.group(1).replace(',', '')) + ' đô la'
+
+
+def _decimal_words(m: re.Match) -> str:
+    return f"{number_to_words(m.group(1))} phẩy {number_to_words(m.group(2).lstrip('0') or '0')}"
+
+
+def _percentage_decimal(m: re.Match) -> str:
+    return _decimal_words(m) + ' phần trăm'
+
+
+def _percentage(m: re.Match) -> str:
+    return number_to_words(m.group(1)) + ' phần trăm'
+
+
+def _phone(m: re.Match) -> str:
+    return _digits_aloud(m.group(0))
+
+
+def _standalone(m: re.Match) -> str:
+    return number_to_words(m.group(0))
+
+
+ORDINAL = _sub('ordinal', r'(thứ|lần|bước|phần|chương|tập|số)\s*(\d+)', _ordinal, re.IGNORECASE)
+
+CURRENCY = (
+    _sub('currency_vnd', r'(\d+(?:,\d+)?)\s*(?:đồng|VND|vnđ)\b', _vnd, re.IGNORECASE),
+    _sub('currency_d', r'(\d+(?:,\d+)?)đ(?![a-zà-ỹ])', _vnd, re.IGNORECASE),
+    _sub('currency_usd_prefix', r'\$\s*(\d+(?:,\d+)?)', _usd),
+    _sub('currency_usd', r'(\d+(?:,\d+)?)\s*(?:USD|\$)', _usd, re.IGNORECASE),
+)
+
+PERCENTAGE = (
+    PERCENTAGE_RANGE,
+    _sub('percentage_decimal', r'(\d+),(\d+)\s*%', _percentage_decimal),
+    _sub('percentage', r'(\d+)\s*%', _percentage),
+)
+
+PHONE = (
+    _sub('phone_vn', r'0\d{9,10}', _phone),
+    _sub('phone_intl', r'\+84\d{9,10}', _phone),
+)
+
+DECIMAL = _sub('decimal', r'(\d+),(\d+)(?=\s|$|[^\d,])', _decimal_words)
+STANDALONE_NUMBERS = _sub('standalone_numbers', r'\b\d+\b', _standalone)
+
+
+# ---------------------------------------------------------------------------
+# Measurement units: per-unit passes, run only for units present in the text
+# ---------------------------------------------------------------------------
+
+UNIT_MAP = {
+    # Length
+    'cm': 'xăng-ti-mét', 'mm': 'mi-li-mét', 'km': 'ki-lô-mét',
+    'dm': 'đề-xi-mét', 'hm': 'héc-tô-mét', 'dam': 'đề-ca-mét',
+    'm': 'mét', 'inch': 'in',
+    # Weight
+    'kg': 'ki-lô-gam', 'mg': 'mi-li-gam', 'g': 'gam',
+    't': 'tấn', 'tấn': 'tấn', 'yến': 'yến', 'lạng': 'lạng',
+    # Volume
+    'ml': 'mi-li-lít', 'l': 'lít', 'lít': 'lít',
+    # Area
+    'm²': 'mét vuông', 'm2': 'mét vuông',
+    'km²': 'ki-lô-mét vuông', 'km2': 'ki-lô-mét vuông',
+    'ha': 'héc-ta',
+    'cm²': 'xăng-ti-mét vuông', 'cm2': 'xăng-ti-mét vuông',
+    # Cubic
+    'm³': 'mét khối', 'm3': 'mét khối',
+    'cm³': 'xăng-ti-mét khối', 'cm3': 'xăng-ti-mét khối',
+    'km³': 'ki-lô-mét khối', 'km3': 'ki-lô-mét khối',
+    # Time
+    's': 'giây', 'sec': 'giây', 'min': 'phút',
+    'h': 'giờ', 'hr': 'giờ', 'hrs': 'giờ',
+    # Speed
+    'km/h': 'ki-lô-mét trên giờ', 'kmh': 'ki-lô-mét trên giờ',
+    'm/s': 'mét trên giây', 'ms': 'mét trên giây',
+    'mm/h': 'mi-li-mét trên giờ', 'cm/s': 'xăng-ti-mét trên giây',
+    # Temperature
+    '°C': 'độ C', '°F': 'độ F', '°K': 'độ K',
+    '°R': 'độ R', '°Re': 'độ Re', '°Ro': 'độ Ro',
+    '°N': 'độ N', '°D': 'độ D',
+}
+
+# The functional pipeline predates the extra temperature scales. Its passes
+# break length ties in this order, which differs from UNIT_MAP's.
+_BASIC_UNITS = {unit: UNIT_MAP[unit] for unit in (
+    'km/h', 'kmh', 'm/s', 'mm/h', 'cm/s', 'km²', 'km2', 'km³', 'km3',
+    'cm²', 'cm2', 'cm³', 'cm3', 'm²', 'm2', 'm³', 'm3',
+    'dam', 'hm', 'dm', 'km', 'cm', 'mm', 'mg', 'ml', 'sec', 'min', 'hrs', 'hr', 'ms',
+    'ha', 'inch', 'kg', 'lít', 'tấn', 'yến', 'lạng', '°C', '°F', '°K', '°R',
+    'm', 'g', 'l', 't', 'h', 's',
+)}
+
+_SHORT_UNIT_TAIL = r'(?!\s*[a-zA-Zà-ỹ])(?=\s*[^a-zA-Zà-ỹ]|$)'
+_LONG_UNIT_TAIL = r'(?=\s|[^\w]|$)'
+
+
+def _unit_words(words: str, m: re.Match) -> str:
+    return m.group(1) + words
+
+
+def unit_rule(unit_map: dict[str, str]) -> Rule:
+    """Build the measurement-unit rule for *unit_map*.
+
+    Units are converted one regex per unit, longest first, each pass reading
+    the previous one's output: glued units depend on that order ("0m3lít" only
+    becomes "0 mét khối lít" because the ``lít`` pass inserts the space ``m3``
+    needs). One overlapping scan finds the units that follow a digit anywhere
+    in the text, and only their passes run.
+    """
+    ordered = sorted(unit_map, key=len, reverse=True)
+    passes = []
+    for unit in ordered:
+        tail = _SHORT_UNIT_TAIL if len(unit) == 1 else _LONG_UNIT_TAIL
+        pattern = re.compile(rf'(\d+)\s*{re.escape(unit)}{tail}', re.IGNORECASE)
+        passes.append(partial(pattern.sub, partial(_unit_words, ' ' + unit_map[unit])))
+    heads = [re.compile(re.escape(unit), re.IGNORECASE) for unit in ordered]
+    # Matches the longest unit after each digit; every unit that could match
+    # there is a prefix of it.
+    scan = re.compile(rf'\d(?=\s*({"|".join(re.escape(unit) for unit in ordered)}))', re.IGNORECASE)
+
+    @lru_cache(maxsize=256)
+    def _units_at(found: str) -> tuple[int, ...]:
+        return tuple(index for index, head in enumerate(heads) if head.match(found))
+
+    def _apply(text: str) -> str:
+        present: set[int] = set()
+        for m in scan.finditer(text):
+            present.update(_units_at(m.group(1)))
+        for index in sorted(present):
+            text = passes[index](text)
+        return text
+
+    return Rule('measurement_units', _apply)
+
+
+MEASUREMENT_UNITS_PROCESSOR = unit_rule(UNIT_MAP)
+MEASUREMENT_UNITS = unit_rule(_BASIC_UNITS)
+
+_RANGE_UNITS = sorted(set(UNIT_MAP) | {'đồng', 'VND', 'vnđ', 'đ', 'USD', '$'}, key=len, reverse=True)
+_RANGE_UNIT_PATTERN = '|'.join(re.escape(u) for u in _RANGE_UNITS)
+
+
+def _unit_range(m: re.Match) -> str:
+    n1, n2, unit = m.groups()
+    return f"{n1} đến {n2}{'' if unit.lower() == 'đ' else ' '}{unit}"
+
+
+def _unit_fraction(m: re.Match) -> str:
+    n1, n2, unit = m.groups()
+    return f"{n1} phần {n2}{'' if unit.lower() == 'đ' else ' '}{unit}"
+
+
+RANGES_WITH_UNITS = (
+    # Ranges: 1-10kg
+    _sub('unit_range', rf'(\d+)\s*[-–—]\s*(\d+)\s*({_RANGE_UNIT_PATTERN})\b', _unit_range, re.IGNORECASE),
+    # Fractions: 1/10kg
+    _sub('unit_fraction', rf'(\d+)\s*[/:|]\s*(\d+)\s*({_RANGE_UNIT_PATTERN})\b', _unit_fraction, re.IGNORECASE),
+)
+
+
+# ---------------------------------------------------------------------------
+# Roman numerals
+# ---------------------------------------------------------------------------
+
+_ROMAN_VALUES = {'I': 1, 'V': 5, 'X': 10, 'L': 50, 'C': 100, 'D': 500, 'M': 1000}
+_ROMAN_SUBTRACTIVE = {'I': {'V', 'X'}, 'X': {'L', 'C'}, 'C': {'D', 'M'}}
+
+
+def roman_to_int(s: str) -> int:
+    """Additive/subtractive value of an I/V/X/L/C string; -1 if it has other characters."""
+    if not s or not all(c in 'IVXLC' for c in s):
+        return -1
+    total = prev = 0
+    for c in reversed(s):
+        val = _ROMAN_VALUES[c]
+        if val < prev:
+            total -= val
+        else:
+            total += val
+        prev = val
+    return total
+
+
+def _roman_below_100(m: re.Match) -> str:
+    value = roman_to_int(m.group(1))
+    if 1 <= value < 100:
+        return number_to_words(str(value))
+    return m.group(0)
+
+
+_ROMAN_CHARS_RE = re.compile(r'^[IVXLCDM]+$')
+_ROMAN_REPEAT_RE = re.compile(r'([IVXLCD])\1{3,}|VV|LL|DD')
+_WORD_CHAR_RE = re.compile(r'[\wà-ỹ]')
+
+
+@lru_cache(maxsize=1024)
+def strict_roman_to_int(s: str) -> int | None:
+    """Strict Roman numeral parser (I..M, valid subtractive pairs only); None if invalid."""
+    s = s.upper()
+    if not _ROMAN_CHARS_RE.match(s) or _ROMAN_REPEAT_RE.search(s):
+        return None
+    result, i = 0, 0
+    while i < len(s):
+        cur = _ROMAN_VALUES[s[i]]
+        nxt = _ROMAN_VALUES[s[i + 1]] if i + 1 < len(s) else 0
+        if cur < nxt:
+            if s[i] not in _ROMAN_SUBTRACTIVE or s[i + 1] not in _ROMAN_SUBTRACTIVE[s[i]]:
+                return None
+            result += nxt - cur
+            i += 2
+        else:
+            result += cur
+            i += 1
+    return result if result > 0 else None
+
+
+def _roman_to_digits(m: re.Match, unlimited: bool) -> str:
+    before, roman = m.groups()
+    if before and _WORD_CHAR_RE.search(before):
+        return m.group(0)
+    if roman != roman.upper():
+        return m.group(0)
+    arabic = strict_roman_to_int(roman)
+    if arabic is None:
+        return m.group(0)
+    if not unlimited and not (1 <= arabic <= 30):
+        return m.group(0)
+    return (before or '') + str(arabic)
+
+
+ROMAN_PROCESSOR = _sub('roman_numerals', r'\b([IVXLC]{2,})\b', _roman_below_100)
+_ROMAN_PATTERN = r'(^|[\s\W])([IVXLCDMivxlcdm]+)(?=[\s\W]|$)'
+ROMAN = _sub('roman_numerals', _ROMAN_PATTERN, partial(_roman_to_digits, unlimited=False))
+ROMAN_UNLIMITED = _sub('roman_numerals', _ROMAN_PATTERN, partial(_roman_to_digits, unlimited=True))
+
+
+# ---------------------------------------------------------------------------
+# Pipelines
+# ---------------------------------------------------------------------------
+
+PROCESSOR_RULES: tuple[Rule, ...] = (
+    UNICODE_NFC,
+    *SPECIAL_CHARS,
+    *PUNCTUATION_PROCESSOR,
+    *CLEAN_PROCESSOR,
+    *ADDRESS_NUMBERS,
+    YEAR_RANGE,
+    # Before dates, so "3-5%" is not read as a date
+    PERCENTAGE_RANGE,
+    *DATES_PROCESSOR,
+    *TIMES,
+    ORDINAL,
+    THOUSAND_SEPARATORS,
+    *CURRENCY,
+    *PERCENTAGE,
+    *PHONE,
+    DECIMAL,
+    MEASUREMENT_UNITS_PROCESSOR,
+    ROMAN_PROCESSOR,
+    STANDALONE_NUMBERS,
+    *WHITESPACE,
+)
+"""Step order of ``VietnameseTextProcessor.process_vietnamese_text``."""
+
+
+def _vietnamese_rules(roman: Rule) -> tuple[Rule, ...]:
+    return (
+        UNICODE_NFC,
+        *SPECIAL_CHARS,
+        *PUNCTUATION,
+        THOUSAND_SEPARATORS,
+        *RANGES_WITH_UNITS,
+        YEAR_RANGE,
+        *DATES,
+        *TIMES,
+        roman,
+        ORDINAL,
+        *CURRENCY,
+        *PERCENTAGE,
+        *PHONE,
+        DECIMAL,
+        MEASUREMENT_UNITS,
+        STANDALONE_NUMBERS,
+        *WHITESPACE,
+    )
+
+
+_VIETNAMESE_RULES = _vietnamese_rules(ROMAN)
+_VIETNAMESE_RULES_UNLIMITED_ROMAN = _vietnamese_rules(ROMAN_UNLIMITED)
+
+
+def vietnamese_rules(unlimited_roman: bool = False) -> tuple[Rule, ...]:
+    """Step order of text_processor.process_vietnamese_text()."""
+    return _VIETNAMESE_RULES_UNLIMITED_ROMAN if unlimited_roman else _VIETNAMESE_RULES
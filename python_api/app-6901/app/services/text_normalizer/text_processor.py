@@ -21,426 +21,25 @@ Usage:
 
 import csv
 import re
-import unicodedata
 from pathlib import Path
 
-
-# ---------------------------------------------------------------------------
-# Vietnamese number words
-# ---------------------------------------------------------------------------
-
-_DIGITS = {
-    '0': 'không', '1': 'một', '2': 'hai', '3': 'ba', '4': 'bốn',
-    '5': 'năm',   '6': 'sáu', '7': 'bảy', '8': 'tám', '9': 'chín',
-}
-_TEENS = {
-    10: 'mười', 11: 'mười một', 12: 'mười hai', 13: 'mười ba',
-    14: 'mười bốn', 15: 'mười lăm', 16: 'mười sáu', 17: 'mười bảy',
-    18: 'mười tám', 19: 'mười chín',
-}
-_TENS = {
-    2: 'hai mươi', 3: 'ba mươi', 4: 'bốn mươi', 5: 'năm mươi',
-    6: 'sáu mươi', 7: 'bảy mươi', 8: 'tám mươi', 9: 'chín mươi',
-}
-
-
-def number_to_words(num_str: str) -> str:
-    num_str = num_str.lstrip('0') or '0'
-    if num_str.startswith('-'):
-        return 'âm ' + number_to_words(num_str[1:])
-    try:
-        num = int(num_str)
-    except ValueError:
-        return num_str
-
-    if num == 0:
-        return 'không'
-    if num < 10:
-        return _DIGITS[str(num)]
-    if num < 20:
-        return _TEENS[num]
-    if num < 100:
-        tens, units = divmod(num, 10)
-        if units == 0:
-            return _TENS[tens]
-        if units == 1:
-            return _TENS[tens] + ' mốt'
-        if units == 4:
-            return _TENS[tens] + ' tư'
-        if units == 5:
-            return _TENS[tens] + ' lăm'
-        return _TENS[tens] + ' ' + _DIGITS[str(units)]
-    if num < 1000:
-        hundreds, rem = divmod(num, 100)
-        r = _DIGITS[str(hundreds)] + ' trăm'
-        if rem == 0:
-            return r
-        if rem < 10:
-            return r + ' lẻ ' + _DIGITS[str(rem)]
-        return r + ' ' + number_to_words(str(rem))
-    if num < 1_000_000:
-        thousands, rem = divmod(num, 1000)
-        r = number_to_words(str(thousands)) + ' nghìn'
-        if rem == 0:
-            return r
-        if rem < 100:
-            if rem < 10:
-                return r + ' không trăm lẻ ' + _DIGITS[str(rem)]
-            return r + ' không trăm ' + number_to_words(str(rem))
-        return r + ' ' + number_to_words(str(rem))
-    if num < 1_000_000_000:
-        millions, rem = divmod(num, 1_000_000)
-        r = number_to_words(str(millions)) + ' triệu'
-        if rem == 0:
-            return r
-        if rem < 100:
-            if rem < 10:
-                return r + ' không trăm lẻ ' + _DIGITS[str(rem)]
-            return r + ' không trăm ' + number_to_words(str(rem))
-        return r + ' ' + number_to_words(str(rem))
-    if num < 1_000_000_000_000:
-        billions, rem = divmod(num, 1_000_000_000)
-        r = number_to_words(str(billions)) + ' tỷ'
-        if rem == 0:
-            return r
-        if rem < 100:
-            if rem < 10:
-                return r + ' không trăm lẻ ' + _DIGITS[str(rem)]
-            return r + ' không trăm ' + number_to_words(str(rem))
-        return r + ' ' + number_to_words(str(rem))
-    # Very large: digit by digit
-    return ' '.join(_DIGITS.get(d, d) for d in num_str)
+from . import rules
 
 
 # ---------------------------------------------------------------------------
 # Vietnamese processor (mirrors vietnamese-processor.js)
 # ---------------------------------------------------------------------------
+# Number words, patterns and step order live in rules.py, shared with
+# processor.VietnameseTextProcessor.
 
-def _normalize_unicode(text: str) -> str:
-    return unicodedata.normalize('NFC', text)
-
-
-def _remove_special_chars(text: str) -> str:
-    text = text.replace('&', ' và ')
-    text = text.replace('@', ' a còng ')
-    text = text.replace('#', ' thăng ')
-    text = re.sub(r'\*', '', text)
-    text = text.replace('_', ' ')
-    text = re.sub(r'~|`|\^', '', text)
-    text = re.sub(r'https?://\S+', '', text)
-    text = re.sub(r'www\.\S+', '', text)
-    text = re.sub(r'\S+@\S+\.\S+', '', text)
-    return text
-
-
-def _normalize_punctuation(text: str) -> str:
-    text = re.sub(r'[""„‟]', '"', text)
-    text = re.sub(r"[''‚‛]", "'", text)
-    text = re.sub(r'[–—−]', '-', text)
-    text = re.sub(r'\.{3,}', '...', text)
-    text = text.replace('…', '...')
-    text = re.sub(r'([!?.]{2,})', lambda m: m.group(0)[0], text)
-    return text
-
-
-def _remove_thousand_separators(text: str) -> str:
-    def _remove(m):
-        return m.group(0).replace('.', '')
-    return re.sub(r'\d{1,3}(?:\.\d{3})+(?=\s|$|[^\d.,])', _remove, text)
-
-
-def _convert_ranges_with_units(text: str) -> str:
-    measurement_units = [
-        'm', 'cm', 'mm', 'km', 'dm', 'hm', 'dam', 'inch',
-        'kg', 'g', 'mg', 't', 'tấn', 'yến', 'lạng',
-        'ml', 'l', 'lít',
-        'm²', 'm2', 'km²', 'km2', 'ha', 'cm²', 'cm2',
-        'm³', 'm3', 'cm³', 'cm3', 'km³', 'km3',
-        's', 'sec', 'min', 'h', 'hr', 'hrs',
-        'km/h', 'kmh', 'm/s', 'ms', 'mm/h', 'cm/s',
-        '°C', '°F', '°K', '°R', '°Re', '°Ro', '°N', '°D',
-        'đồng', 'VND', 'vnđ', 'đ', 'USD', '$',
-    ]
-    all_units = sorted(set(measurement_units), key=len, reverse=True)
-    unit_pattern = '|'.join(re.escape(u) for u in all_units)
-
-    # Ranges: 1-10kg
-    def _range_repl(m):
-        n1, n2, unit = m.group(1), m.group(2), m.group(3)
-        sep = '' if unit.lower() == 'đ' else ' '
-        return f'{n1} đến {n2}{sep}{unit}'
-    text = re.sub(rf'(\d+)\s*[-–—]\s*(\d+)\s*({unit_pattern})\b', _range_repl, text, flags=re.IGNORECASE)
-
-    # Fractions: 1/10kg
-    def _frac_repl(m):
-        n1, n2, unit = m.group(1), m.group(2), m.group(3)
-        sep = '' if unit.lower() == 'đ' else ' '
-        return f'{n1} phần {n2}{sep}{unit}'
-    text = re.sub(rf'(\d+)\s*[/:|]\s*(\d+)\s*({unit_pattern})\b', _frac_repl, text, flags=re.IGNORECASE)
-
-    return text
-
-
-def _convert_year_range(text: str) -> str:
-    def _repl(m):
-        return number_to_words(m.group(1)) + ' đến ' + number_to_words(m.group(2))
-    return re.sub(r'(\d{4})\s*[-–—]\s*(\d{4})', _repl, text)
-
-
-def _is_valid_date(day, month, year=None):
-    d, mo = int(day), int(month)
-    if year and not (1000 <= int(year) <= 9999):
-        return False
-    return 1 <= d <= 31 and 1 <= mo <= 12
-
-
-def _convert_date(text: str) -> str:
-    # date ranges: dd-dd/mm or dd-dd/mm/yyyy
-    def _range_date(m):
-        d1, d2, mo, yr = m.group(1), m.group(2), m.group(3), m.group(4)
-        if _is_valid_date(d1, mo, yr) and _is_valid_date(d2, mo, yr):
-            r = f'{number_to_words(d1)} đến {number_to_words(d2)} tháng {number_to_words(mo)}'
-            if yr:
-                r += f' năm {number_to_words(yr)}'
-            return r
-        return m.group(0)
-    text = re.sub(r'(\d{1,2})\s*[-–—]\s*(\d{1,2})\s*[/\-]\s*(\d{1,2})(?:\s*[/\-]\s*(\d{4}))?', _range_date, text)
-
-    # DD/MM/YYYY
-    def _full_date(m):
-        d, mo, yr = m.group(1), m.group(2), m.group(3)
-        if _is_valid_date(d, mo, yr):
-            return f'ngày {number_to_words(d)} tháng {number_to_words(mo)} năm {number_to_words(yr)}'
-        return m.group(0)
-    text = re.sub(r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{4})', _full_date, text)
-
-    # MM/YYYY
-    def _month_year(m):
-        mo, yr = m.group(1), m.group(2)
-        if 1 <= int(mo) <= 12 and 1000 <= int(yr) <= 9999:
-            return f'tháng {number_to_words(mo)} năm {number_to_words(yr)}'
-        return m.group(0)
-    text = re.sub(r'(?:tháng\s+)?(\d{1,2})\s*[/\-]\s*(\d{4})(?![/\-]\d)', _month_year, text)
-
-    # DD/MM
-    def _day_month(m):
-        d, mo = m.group(1), m.group(2)
-        if _is_valid_date(d, mo):
-            return f'{number_to_words(d)} tháng {number_to_words(mo)}'
-        return m.group(0)
-    text = re.sub(r'(\d{1,2})\s*[/\-]\s*(\d{1,2})(?![/\-]\d)(?!\d*\s*%)', _day_month, text)
-
-    # tháng X
-    def _thang(m):
-        mo = m.group(1)
-        return 'tháng ' + number_to_words(mo) if 1 <= int(mo) <= 12 else m.group(0)
-    text = re.sub(r'tháng\s*(\d+)', _thang, text)
-
-    # ngày X
-    def _ngay(m):
-        d = m.group(1)
-        return 'ngày ' + number_to_words(d) if 1 <= int(d) <= 31 else m.group(0)
-    text = re.sub(r'ngày\s*(\d+)', _ngay, text)
-
-    return text
-
-
-def _convert_time(text: str) -> str:
-    # HH:MM:SS or HH:MM
-    def _hms(m):
-        h, mi, s = m.group(1), m.group(2), m.group(3)
-        r = number_to_words(h) + ' giờ'
-        if mi:
-            r += ' ' + number_to_words(mi) + ' phút'
-        if s:
-            r += ' ' + number_to_words(s) + ' giây'
-        return r
-    text = re.sub(r'(\d{1,2}):(\d{2})(?::(\d{2}))?', _hms, text)
-
-    # 15h30
-    def _hm(m):
-        h, mi = int(m.group(1)), int(m.group(2))
-        if 0 <= h <= 23 and 0 <= mi <= 59:
-            return number_to_words(str(h)) + ' giờ ' + number_to_words(str(mi))
-        return m.group(0)
-    text = re.sub(r'(\d{1,2})h(\d{2})(?![a-zà-ỹ])', _hm, text, flags=re.IGNORECASE)
-
-    # 15h
-    def _h(m):
-        h = int(m.group(1))
-        if 0 <= h <= 23:
-            return number_to_words(str(h)) + ' giờ'
-        return m.group(0)
-    text = re.sub(r'(\d{1,2})h(?![a-zà-ỹ\d])', _h, text, flags=re.IGNORECASE)
-
-    # X giờ Y phút
-    text = re.sub(r'(\d+)\s*giờ\s*(\d+)\s*phút',
-                  lambda m: number_to_words(m.group(1)) + ' giờ ' + number_to_words(m.group(2)) + ' phút', text)
-    # X giờ
-    text = re.sub(r'(\d+)\s*giờ(?!\s*\d)',
-                  lambda m: number_to_words(m.group(1)) + ' giờ', text)
-    return text
-
-
-def _convert_roman_numerals(text: str, unlimited: bool = False) -> str:
-    _MAP = {'I': 1, 'V': 5, 'X': 10, 'L': 50, 'C': 100, 'D': 500, 'M': 1000}
-    _VALID_PAIRS = {'I': {'V', 'X'}, 'X': {'L', 'C'}, 'C': {'D', 'M'}}
-
-    def _roman_to_arabic(s):
-        s = s.upper()
-        if not re.match(r'^[IVXLCDM]+$', s):
-            return None
-        if re.search(r'([IVXLCD])\1{3,}', s) or re.search(r'VV|LL|DD', s):
-            return None
-        result, i = 0, 0
-        while i < len(s):
-            cur = _MAP[s[i]]
-            nxt = _MAP[s[i + 1]] if i + 1 < len(s) else 0
-            if cur < nxt:
-                if s[i] not in _VALID_PAIRS or s[i + 1] not in _VALID_PAIRS[s[i]]:
-                    return None
-                result += nxt - cur
-                i += 2
-            else:
-                result += cur
-                i += 1
-        return result if result > 0 else None
-
-    def _repl(m):
-        before, roman = m.group(1), m.group(2)
-        if before and re.search(r'[\wà-ỹ]', before):
-            return m.group(0)
-        if roman != roman.upper():
-            return m.group(0)
-        arabic = _roman_to_arabic(roman)
-        if arabic is None:
-            return m.group(0)
-        if not unlimited and not (1 <= arabic <= 30):
-            return m.group(0)
-        return (before or '') + str(arabic)
-
-    return re.sub(r'(^|[\s\W])([IVXLCDMivxlcdm]+)(?=[\s\W]|$)', _repl, text)
-
-
-def _convert_ordinal(text: str) -> str:
-    _ORD = {'1':'nhất','2':'hai','3':'ba','4':'tư','5':'năm',
-            '6':'sáu','7':'bảy','8':'tám','9':'chín','10':'mười'}
-    def _repl(m):
-        prefix, num = m.group(1), m.group(2)
-        return prefix + ' ' + (_ORD.get(num) or number_to_words(num))
-    return re.sub(r'(thứ|lần|bước|phần|chương|tập|số)\s*(\d+)', _repl, text, flags=re.IGNORECASE)
-
-
-def _convert_currency(text: str) -> str:
-    def _vnd(m):
-        return number_to_words(m.group(1).replace(',', '')) + ' đồng'
-    def _usd(m):
-        return number_to_words(m.group(1).replace(',', '')) + ' đô la'
-
-    text = re.sub(r'(\d+(?:,\d+)?)\s*(?:đồng|VND|vnđ)\b', _vnd, text, flags=re.IGNORECASE)
-    text = re.sub(r'(\d+(?:,\d+)?)đ(?![a-zà-ỹ])', _vnd, text, flags=re.IGNORECASE)
-    text = re.sub(r'\$\s*(\d+(?:,\d+)?)', _usd, text)
-    text = re.sub(r'(\d+(?:,\d+)?)\s*(?:USD|\$)', _usd, text, flags=re.IGNORECASE)
-    return text
-
-
-def _convert_percentage(text: str) -> str:
-    # Ranges: 3-5%
-    text = re.sub(r'(\d+)\s*[-–—]\s*(\d+)\s*%',
-                  lambda m: f'{number_to_words(m.group(1))} đến {number_to_words(m.group(2))} phần trăm', text)
-    # Decimal: 3,2%
-    text = re.sub(r'(\d+),(\d+)\s*%',
-                  lambda m: f'{number_to_words(m.group(1))} phẩy {number_to_words(m.group(2).lstrip("0") or "0")} phần trăm', text)
-    # Whole: 50%
-    text = re.sub(r'(\d+)\s*%',
-                  lambda m: number_to_words(m.group(1)) + ' phần trăm', text)
-    return text
-
-
-def _convert_phone(text: str) -> str:
-    def _digits(m):
-        return ' '.join(_DIGITS.get(d, d) for d in re.findall(r'\d', m.group(0)))
-    text = re.sub(r'0\d{9,10}', _digits, text)
-    text = re.sub(r'\+84\d{9,10}', _digits, text)
-    return text
-
-
-def _convert_decimal(text: str) -> str:
-    def _repl(m):
-        int_part = number_to_words(m.group(1))
-        dec_part = number_to_words(m.group(2).lstrip('0') or '0')
-        return f'{int_part} phẩy {dec_part}'
-    return re.sub(r'(\d+),(\d+)(?=\s|$|[^\d,])', _repl, text)
-
-
-def _convert_measurement_units(text: str) -> str:
-    unit_map = {
-        'km/h': 'ki-lô-mét trên giờ', 'kmh': 'ki-lô-mét trên giờ',
-        'm/s': 'mét trên giây',        'mm/h': 'mi-li-mét trên giờ',
-        'cm/s': 'xăng-ti-mét trên giây',
-        'km²': 'ki-lô-mét vuông',      'km2': 'ki-lô-mét vuông',
-        'km³': 'ki-lô-mét khối',       'km3': 'ki-lô-mét khối',
-        'cm²': 'xăng-ti-mét vuông',    'cm2': 'xăng-ti-mét vuông',
-        'cm³': 'xăng-ti-mét khối',     'cm3': 'xăng-ti-mét khối',
-        'm²':  'mét vuông',            'm2':  'mét vuông',
-        'm³':  'mét khối',             'm3':  'mét khối',
-        'dam': 'đề-ca-mét',            'hm':  'héc-tô-mét',
-        'dm':  'đề-xi-mét',            'km':  'ki-lô-mét',
-        'cm':  'xăng-ti-mét',          'mm':  'mi-li-mét',
-        'mg':  'mi-li-gam',            'ml':  'mi-li-lít',
-        'sec': 'giây',                 'min': 'phút',
-        'hrs': 'giờ',                  'hr':  'giờ',
-        'ms':  'mét trên giây',
-        'ha':  'héc-ta',               'inch':'in',
-        'kg':  'ki-lô-gam',            'lít': 'lít',
-        'tấn': 'tấn',                  'yến': 'yến',
-        'lạng':'lạng',
-        '°C':  'độ C',                 '°F':  'độ F',
-        '°K':  'độ K',                 '°R':  'độ R',
-        'm':   'mét',                  'g':   'gam',
-        'l':   'lít',                  't':   'tấn',
-        'h':   'giờ',                  's':   'giây',
-    }
-    for unit in sorted(unit_map, key=len, reverse=True):
-        esc = re.escape(unit)
-        if len(unit) == 1:
-            pattern = rf'(\d+)\s*{esc}(?!\s*[a-zA-Zà-ỹ])(?=\s*[^a-zA-Zà-ỹ]|$)'
-        else:
-            pattern = rf'(\d+)\s*{esc}(?=\s|[^\w]|$)'
-        text = re.sub(pattern, lambda m, u=unit: m.group(1) + ' ' + unit_map[u], text, flags=re.IGNORECASE)
-    return text
-
-
-def _convert_standalone_numbers(text: str) -> str:
-    return re.sub(r'\b\d+\b', lambda m: number_to_words(m.group(0)), text)
-
-
-def _clean_whitespace(text: str) -> str:
-    return re.sub(r'\s+', ' ', text).strip()
+number_to_words = rules.number_to_words
 
 
 def process_vietnamese_text(text: str, unlimited_roman: bool = False) -> str:
     """Mirror of processVietnameseText() in vietnamese-processor.js"""
     if not text:
         return ''
-    text = _normalize_unicode(text)
-    text = _remove_special_chars(text)
-    text = _normalize_punctuation(text)
-    text = _remove_thousand_separators(text)
-    text = _convert_ranges_with_units(text)
-    text = _convert_year_range(text)
-    text = _convert_date(text)
-    text = _convert_time(text)
-    text = _convert_roman_numerals(text, unlimited=unlimited_roman)
-    text = _convert_ordinal(text)
-    text = _convert_currency(text)
-    text = _convert_percentage(text)
-    text = _convert_phone(text)
-    text = _convert_decimal(text)
-    text = _convert_measurement_units(text)
-    text = _convert_standalone_numbers(text)
-    text = _clean_whitespace(text)
-    return text
+    return rules.apply_rules(text, rules.vietnamese_rules(unlimited_roman))
 
 
 # ---------------------------------------------------------------------------
@@ -925,6 +524,7 @@ def chunk_text_i18n(text: str) -> list[str]:
 # ---------------------------------------------------------------------------
 
 if __name__ == '__main__':
+    # Run from python_api/app-6901: python -m app.services.text_normalizer.text_processor
     # Load CSVs (adjust paths as needed)
     base = Path(__file__).parent / 'public'
     acronym_map     = _load_csv_map(str(base / 'acronyms.csv'))
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import gc
+import hashlib
+import os
+import shutil
+import sqlite3
 import threading
+import time
+import unicodedata
 import uuid
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
 from python_api.common.jobs import JobStore
 from python_api.common.logging import log
 from python_api.common.progress import ProgressStore
-from python_api.common.paths import MODEL_TRANSLATION_DIR
+from python_api.common.paths import CACHE_DIR, MODEL_TRANSLATION_CT2_DIR, MODEL_TRANSLATION_DIR
 from python_api.common.model_download_service import (
     download_model as central_download_model,
     is_model_downloaded,
@@ -19,11 +26,34 @@ translation_progress = ProgressStore()
 
 _model = None
 _tokenizer = None
+_ct2_translator = None
 _current_device: Optional[str] = None
 _model_lock = threading.Lock()
 
 MODEL_ID = "psilab/nllb-200-1.3B"
 MODEL_DIR = MODEL_TRANSLATION_DIR
+# int8 CTranslate2 export of MODEL_DIR, converted locally on first use.
+CT2_MODEL_DIR = MODEL_TRANSLATION_CT2_DIR
+
+# "transformers" (PyTorch, float16 on CUDA / float32 on CPU) or "ctranslate2"
+# (int8, much smaller and faster on CPU). Requests may override it.
+TRANSLATION_BACKENDS = ("transformers", "ctranslate2")
+TRANSLATION_BACKEND = os.getenv("TRANSLATION_BACKEND", "transformers").strip().lower()
+# CTranslate2 compute threads; 0 lets it use all cores.
+CT2_INTRA_THREADS = int(os.getenv("TRANSLATION_CT2_THREADS", "0"))
+
+# Persistent translation memory: exact repeats are served without the model.
+TRANSLATION_MEMORY_ENABLED = os.getenv("TRANSLATION_MEMORY", "1").strip() != "0"
+TRANSLATION_MEMORY_PATH = Path(
+    os.getenv("TRANSLATION_MEMORY_PATH") or CACHE_DIR / "translation_memory.sqlite3"
+).expanduser()
+TRANSLATION_MEMORY_MAX_ENTRIES = int(os.getenv("TRANSLATION_MEMORY_MAX_ENTRIES", "200000"))
+
+# Segment lists are translated in length-sorted batches of at most
+# TRANSLATION_BATCH_TOKENS padded source tokens and TRANSLATION_MAX_BATCH_SIZE rows.
+TRANSLATION_BATCH_TOKENS = int(os.getenv("TRANSLATION_BATCH_TOKENS", "4096"))
+TRANSLATION_MAX_BATCH_SIZE = max(1, int(os.getenv("TRANSLATION_MAX_BATCH_SIZE", "32")))
+TRANSLATION_MAX_INPUT_TOKENS = 1024
 
 LANGUAGE_MAP: Dict[str, str] = {
     "vi": "Vietnamese",
@@ -48,6 +78,125 @@ LANGUAGE_CODE_MAP: Dict[str, str] = {
 }
 
 
+def _normalize_memory_text(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+class TranslationMemory:
+    """
+    SQLite store of past translations keyed by (source, target, normalized
+    text, context hash, model id). Least recently used rows are pruned past
+    `max_entries`.
+    """
+
+    def __init__(self, path: Path, max_entries: int = TRANSLATION_MEMORY_MAX_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(source_lang: str, target_lang: str, text: str, context: str, model_id: str) -> str:
+        normalized_context = _normalize_memory_text(context)
+        context_hash = hashlib.sha256(normalized_context.encode("utf-8")).hexdigest() if normalized_context else ""
+        raw = "\0".join(
+            (source_lang.lower(), target_lang.lower(), _normalize_memory_text(text), context_hash, model_id)
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS memory ("
+                " key TEXT PRIMARY KEY,"
+                " source_lang TEXT NOT NULL,"
+                " target_lang TEXT NOT NULL,"
+                " model_id TEXT NOT NULL,"
+                " source_text TEXT NOT NULL,"
+                " translation TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_used REAL NOT NULL,"
+                " hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS memory_last_used ON memory (last_used)")
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+        found: Dict[str, str] = {}
+        with self._lock:
+            conn = self._connection()
+            # Stay under SQLite's bound-parameter limit.
+            for start in range(0, len(unique), 500):
+                part = unique[start : start + 500]
+                placeholders = ",".join("?" * len(part))
+                rows = conn.execute(
+                    f"SELECT key, translation FROM memory WHERE key IN ({placeholders})", part
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE memory SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                conn.commit()
+        return found
+
+    def put_many(self, rows: List[tuple[str, str, str, str, str, str]]) -> None:
+        """Store (key, source_lang, target_lang, model_id, source_text, translation) rows."""
+        if not rows:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO memory"
+                " (key, source_lang, target_lang, model_id, source_text, translation, created_at, last_used, hits)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                [(*row, now, now) for row in rows],
+            )
+            if self.max_entries > 0:
+                (count,) = conn.execute("SELECT COUNT(*) FROM memory").fetchone()
+                if count > self.max_entries:
+                    conn.execute(
+                        "DELETE FROM memory WHERE key IN"
+                        " (SELECT key FROM memory ORDER BY last_used ASC LIMIT ?)",
+                        (count - self.max_entries,),
+                    )
+            conn.commit()
+
+    def _exists(self) -> bool:
+        return self._conn is not None or self.path.exists()
+
+    def stats(self) -> dict:
+        """Entry and hit counts; a store that was never written reads as empty without creating the file."""
+        count, hits = 0, 0
+        with self._lock:
+            if self._exists():
+                count, hits = self._connection().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM memory"
+                ).fetchone()
+        return {"path": str(self.path), "entries": count, "total_hits": hits, "max_entries": self.max_entries}
+
+    def clear(self) -> None:
+        with self._lock:
+            if not self._exists():
+                return
+            conn = self._connection()
+            conn.execute("DELETE FROM memory")
+            conn.commit()
+
+
+translation_memory = TranslationMemory(TRANSLATION_MEMORY_PATH)
+
+
 def _detect_runtime_device() -> tuple[str, str | None]:
     """Detect runtime compute device, preferring CUDA when available."""
     try:
@@ -61,10 +210,83 @@ def _detect_runtime_device() -> tuple[str, str | None]:
     return "cpu", None
 
 
-def _ensure_model_loaded(task_id: str, preferred_device: str) -> None:
+def _resolve_backend(backend: Optional[str] = None) -> str:
+    selected = (backend or TRANSLATION_BACKEND or "transformers").strip().lower()
+    if selected not in TRANSLATION_BACKENDS:
+        raise ValueError(f"Unsupported translation backend: {backend}. Use one of {list(TRANSLATION_BACKENDS)}")
+    return selected
+
+
+def _load_tokenizer():
+    global _tokenizer
+    if _tokenizer is None:
+        from transformers import AutoTokenizer
+
+        _tokenizer = AutoTokenizer.from_pretrained(str(MODEL_DIR))
+    return _tokenizer
+
+
+def _ct2_model_ready() -> bool:
+    return (CT2_MODEL_DIR / "model.bin").exists()
+
+
+def _convert_ct2_model(task_id: str) -> None:
+    """Export MODEL_DIR to an int8 CTranslate2 model in CT2_MODEL_DIR."""
+    from ctranslate2.converters import TransformersConverter
+
+    translation_progress.set_progress(
+        task_id, "converting_model", 5, "Converting NLLB-200 to int8 CTranslate2 (one-time)..."
+    )
+    tmp_dir = CT2_MODEL_DIR.with_name(CT2_MODEL_DIR.name + ".tmp")
+    # An interrupted earlier run can leave a partial export in either place;
+    # the final rename fails if CT2_MODEL_DIR already exists.
+    for stale in (tmp_dir, CT2_MODEL_DIR):
+        if stale.exists():
+            shutil.rmtree(stale, ignore_errors=True)
+    TransformersConverter(str(MODEL_DIR), low_cpu_mem_usage=True).convert(
+        str(tmp_dir), quantization="int8", force=True
+    )
+    tmp_dir.replace(CT2_MODEL_DIR)
+    translation_progress.add_log(task_id, f"Converted model saved to {CT2_MODEL_DIR}")
+
+
+def _ensure_ct2_loaded(task_id: str, preferred_device: str) -> None:
+    global _ct2_translator, _current_device
+
+    with _model_lock:
+        if _ct2_translator is not None and _tokenizer is not None:
+            return
+
+        import ctranslate2
+
+        if not _ct2_model_ready():
+            _convert_ct2_model(task_id)
+
+        device = "cuda" if preferred_device == "cuda" else "cpu"
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+        translation_progress.set_progress(
+            task_id, "loading_model", 8, f"Loading int8 NLLB-200 (CTranslate2) on {device.upper()}..."
+        )
+        _load_tokenizer()
+        _ct2_translator = ctranslate2.Translator(
+            str(CT2_MODEL_DIR),
+            device=device,
+            compute_type=compute_type,
+            intra_threads=CT2_INTRA_THREADS,
+        )
+        if _model is None:
+            _current_device = device
+        translation_progress.add_log(task_id, f"CTranslate2 model loaded on {device.upper()} ({compute_type})")
+
+
+def _ensure_model_loaded(task_id: str, preferred_device: str, backend: Optional[str] = None) -> None:
     """Lazy-load NLLB-200 model into module-level cache."""
     global _model, _tokenizer, _current_device
 
+    if _resolve_backend(backend) == "ctranslate2":
+        _ensure_ct2_loaded(task_id, preferred_device)
+        return
+
     with _model_lock:
         if _model is not None and _tokenizer is not None:
             return
@@ -79,9 +301,9 @@ def _ensure_model_loaded(task_id: str, preferred_device: str) -> None:
             f"Loading NLLB-200 model on {effective_device.upper()}...",
         )
 
-        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+        from transformers import AutoModelForSeq2SeqLM
 
-        _tokenizer = AutoTokenizer.from_pretrained(str(MODEL_DIR))
+        _load_tokenizer()
         _model = AutoModelForSeq2SeqLM.from_pretrained(
             str(MODEL_DIR),
             torch_dtype=torch.float16 if effective_device == "cuda" else torch.float32,
@@ -93,74 +315,291 @@ def _ensure_model_loaded(task_id: str, preferred_device: str) -> None:
         translation_progress.add_log(task_id, f"Model loaded on {_current_device.upper()}")
 
 
-def _translate_segment(
-    text: str,
-    source_lang: str,
-    target_lang: str,
-    context: str = "",
-    preserve_emotion: bool = True,
-    max_new_tokens: int = 512,
-) -> str:
-    """Translate one segment with optional context."""
-    global _model, _tokenizer
-    if _model is None or _tokenizer is None:
-        raise RuntimeError("Translation model is not loaded")
-
-    if source_lang.lower() == target_lang.lower():
-        return text.strip()
-
-    _ = preserve_emotion
-
+def _resolve_language_codes(source_lang: str, target_lang: str) -> tuple[str, str]:
     src_code = LANGUAGE_CODE_MAP.get(source_lang.lower())
     tgt_code = LANGUAGE_CODE_MAP.get(target_lang.lower())
     if not src_code or not tgt_code:
         raise RuntimeError(f"Unsupported translation language pair: {source_lang} -> {target_lang}")
+    return src_code, tgt_code
 
-    if hasattr(_tokenizer, "src_lang"):
-        _tokenizer.src_lang = src_code
-
-    text_for_model = text.strip()
-    if context.strip():
-        text_for_model = f"{context.strip()} {text_for_model}".strip()
-
-    encoded_inputs = _tokenizer(
-        text_for_model,
-        return_tensors="pt",
-        truncation=True,
-        max_length=1024,
-    )
-    device = next(_model.parameters()).device
-    inputs = {key: value.to(device) for key, value in encoded_inputs.items()}
 
+def _resolve_forced_bos(tokenizer, tgt_code: str, target_lang: str) -> int:
     forced_bos_token_id: int | None = None
-    language_to_id = getattr(_tokenizer, "lang_code_to_id", None)
+    language_to_id = getattr(tokenizer, "lang_code_to_id", None)
     if isinstance(language_to_id, dict):
         raw_id = language_to_id.get(tgt_code)
         if isinstance(raw_id, int):
             forced_bos_token_id = raw_id
     if forced_bos_token_id is None:
-        raw_id = _tokenizer.convert_tokens_to_ids(tgt_code)
+        raw_id = tokenizer.convert_tokens_to_ids(tgt_code)
         if isinstance(raw_id, int):
             forced_bos_token_id = raw_id
     if not isinstance(forced_bos_token_id, int) or forced_bos_token_id < 0:
         raise RuntimeError(f"Failed to resolve NLLB language token for target language: {target_lang}")
+    return forced_bos_token_id
+
+
+def _plan_batches(lengths: List[int], token_budget: int, max_batch_size: int) -> List[List[int]]:
+    """
+    Group item indices into batches of similar token length.
+
+    Items are sorted by length so padding stays small; a batch closes when the
+    next item would push (rows x longest row) past token_budget or the row
+    count past max_batch_size. An item longer than the budget gets a batch of
+    its own.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    batches: List[List[int]] = []
+    current: List[int] = []
+    longest = 0
+    for index in order:
+        length = max(1, lengths[index])
+        widest = max(longest, length)
+        if current and (widest * (len(current) + 1) > token_budget or len(current) >= max_batch_size):
+            batches.append(current)
+            current = []
+            widest = length
+        current.append(index)
+        longest = widest
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _translate_batch(
+    texts: List[str],
+    source_lang: str,
+    target_lang: str,
+    contexts: Optional[List[str]] = None,
+    max_new_tokens: int = 512,
+    on_batch: Optional[Callable[[int, int], None]] = None,
+    backend: Optional[str] = None,
+    on_results: Optional[Callable[[List[int], List[str]], None]] = None,
+) -> List[str]:
+    """
+    Translate many segments with one `generate` call per length-sorted batch.
+
+    `contexts[i]` is prepended to `texts[i]` exactly as in _translate_segment.
+    Results come back in input order. `on_batch(done, total)` is called with
+    the number of segments finished after each batch, and `on_results(indices,
+    translations)` with the batch's own output. `backend` selects the loaded
+    transformers model or the CTranslate2 int8 model.
+    """
+    global _model, _tokenizer
+    use_ct2 = _resolve_backend(backend) == "ctranslate2"
+    model, tokenizer = (_ct2_translator if use_ct2 else _model), _tokenizer
+    if model is None or tokenizer is None:
+        raise RuntimeError("Translation model is not loaded")
+
+    if source_lang.lower() == target_lang.lower():
+        results = [text.strip() for text in texts]
+        if on_results is not None:
+            on_results(list(range(len(texts))), results)
+        return results
+
+    src_code, tgt_code = _resolve_language_codes(source_lang, target_lang)
+    if hasattr(tokenizer, "src_lang"):
+        tokenizer.src_lang = src_code
+    forced_bos_token_id = _resolve_forced_bos(tokenizer, tgt_code, target_lang)
+
+    model_inputs: List[str] = []
+    for index, text in enumerate(texts):
+        text_for_model = text.strip()
+        context = (contexts[index] if contexts else "") or ""
+        if context.strip():
+            text_for_model = f"{context.strip()} {text_for_model}".strip()
+        model_inputs.append(text_for_model)
+
+    lengths = [
+        len(ids)
+        for ids in tokenizer(model_inputs, truncation=True, max_length=TRANSLATION_MAX_INPUT_TOKENS)["input_ids"]
+    ]
+    batches = _plan_batches(lengths, TRANSLATION_BATCH_TOKENS, TRANSLATION_MAX_BATCH_SIZE)
+
+    if use_ct2:
+        return _translate_batches_ct2(
+            model, tokenizer, model_inputs, batches, tgt_code, max_new_tokens, on_batch, on_results
+        )
 
     import torch
 
-    with torch.no_grad():
-        output_tokens = _model.generate(
-            **inputs,
-            forced_bos_token_id=forced_bos_token_id,
-            max_new_tokens=max_new_tokens,
-            num_beams=4,
+    device = next(model.parameters()).device
+    results: List[str] = [""] * len(texts)
+    done = 0
+    for batch in batches:
+        encoded_inputs = tokenizer(
+            [model_inputs[i] for i in batch],
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=TRANSLATION_MAX_INPUT_TOKENS,
+        )
+        inputs = {key: value.to(device) for key, value in encoded_inputs.items()}
+        with torch.no_grad():
+            output_tokens = model.generate(
+                **inputs,
+                forced_bos_token_id=forced_bos_token_id,
+                max_new_tokens=max_new_tokens,
+                num_beams=4,
+            )
+        decoded_items = tokenizer.batch_decode(output_tokens, skip_special_tokens=True)
+        for index, decoded in zip(batch, decoded_items):
+            results[index] = " ".join(decoded.strip().split())
+        done += len(batch)
+        if on_results is not None:
+            on_results(batch, [results[i] for i in batch])
+        if on_batch is not None:
+            on_batch(done, len(texts))
+    return results
+
+
+def _translate_batches_ct2(
+    translator,
+    tokenizer,
+    model_inputs: List[str],
+    batches: List[List[int]],
+    tgt_code: str,
+    max_new_tokens: int,
+    on_batch: Optional[Callable[[int, int], None]],
+    on_results: Optional[Callable[[List[int], List[str]], None]] = None,
+) -> List[str]:
+    """
+    CTranslate2 counterpart of the generate loop in _translate_batch.
+
+    The target language token is passed as the decoder prefix, which is how
+    CTranslate2 expresses NLLB's forced BOS; it is dropped before decoding.
+    """
+    results: List[str] = [""] * len(model_inputs)
+    done = 0
+    for batch in batches:
+        sources = [
+            tokenizer.convert_ids_to_tokens(
+                tokenizer.encode(model_inputs[i], truncation=True, max_length=TRANSLATION_MAX_INPUT_TOKENS)
+            )
+            for i in batch
+        ]
+        outputs = translator.translate_batch(
+            sources,
+            target_prefix=[[tgt_code]] * len(batch),
+            beam_size=4,
+            max_decoding_length=max_new_tokens,
         )
+        for index, output in zip(batch, outputs):
+            tokens = output.hypotheses[0]
+            if tokens and tokens[0] == tgt_code:
+                tokens = tokens[1:]
+            decoded = tokenizer.decode(tokenizer.convert_tokens_to_ids(tokens), skip_special_tokens=True)
+            results[index] = " ".join(decoded.strip().split())
+        done += len(batch)
+        if on_results is not None:
+            on_results(batch, [results[i] for i in batch])
+        if on_batch is not None:
+            on_batch(done, len(model_inputs))
+    return results
+
+
+def _memory_model_id(backend: Optional[str]) -> str:
+    # int8 output differs slightly from the full-precision model, so keep them apart.
+    return f"{MODEL_ID}:{_resolve_backend(backend)}"
+
+
+def _translate_with_memory(
+    texts: List[str],
+    source_lang: str,
+    target_lang: str,
+    contexts: Optional[List[str]] = None,
+    backend: Optional[str] = None,
+    use_memory: bool = True,
+    ensure_loaded: Optional[Callable[[], None]] = None,
+    on_batch: Optional[Callable[[int, int], None]] = None,
+    on_results: Optional[Callable[[List[int], List[str]], None]] = None,
+) -> tuple[List[str], int]:
+    """
+    Translate texts, serving exact repeats from the translation memory.
+
+    Only misses reach the model; `ensure_loaded` is called first, and only when
+    there is at least one miss. `on_results(indices, translations)` sees the
+    memory hits first, then each model batch, indexed into `texts`.
+    Returns (translations in input order, hits).
+    """
+    contexts = contexts or [""] * len(texts)
+    use_memory = use_memory and TRANSLATION_MEMORY_ENABLED and source_lang.lower() != target_lang.lower()
+    results: List[Optional[str]] = [None] * len(texts)
+    keys: List[str] = []
+    if use_memory:
+        model_id = _memory_model_id(backend)
+        keys = [
+            TranslationMemory.make_key(source_lang, target_lang, text, context, model_id)
+            for text, context in zip(texts, contexts)
+        ]
+        try:
+            cached = translation_memory.get_many(keys)
+        except sqlite3.Error as exc:
+            log(f"Translation memory lookup failed: {exc}", "warning", log_name="translation.log")
+            cached, use_memory = {}, False
+        for index, key in enumerate(keys):
+            if key in cached:
+                results[index] = cached[key]
+    hits = sum(result is not None for result in results)
+    if hits and on_results is not None:
+        hit_indices = [index for index, result in enumerate(results) if result is not None]
+        on_results(hit_indices, [results[i] for i in hit_indices])
+
+    missing = [index for index, result in enumerate(results) if result is None]
+    if missing:
+        if ensure_loaded is not None:
+            ensure_loaded()
+
+        def _batch_results(batch: List[int], translations: List[str]) -> None:
+            if on_results is not None:
+                on_results([missing[i] for i in batch], translations)
+
+        translated = _translate_batch(
+            [texts[i] for i in missing],
+            source_lang=source_lang,
+            target_lang=target_lang,
+            contexts=[contexts[i] for i in missing],
+            on_batch=on_batch,
+            backend=backend,
+            on_results=_batch_results,
+        )
+        for index, translation in zip(missing, translated):
+            results[index] = translation
+        if use_memory:
+            model_id = _memory_model_id(backend)
+            try:
+                translation_memory.put_many([
+                    (keys[i], source_lang.lower(), target_lang.lower(), model_id, _normalize_memory_text(texts[i]), results[i])
+                    for i in missing
+                    if results[i]
+                ])
+            except sqlite3.Error as exc:
+                log(f"Translation memory write failed: {exc}", "warning", log_name="translation.log")
+    return [result or "" for result in results], hits
 
-    decoded_items = _tokenizer.batch_decode(output_tokens, skip_special_tokens=True)
-    decoded = decoded_items[0].strip() if decoded_items else ""
-    return " ".join(decoded.split())
+
+def _translate_segment(
+    text: str,
+    source_lang: str,
+    target_lang: str,
+    context: str = "",
+    preserve_emotion: bool = True,
+    max_new_tokens: int = 512,
+    backend: Optional[str] = None,
+) -> str:
+    """Translate one segment with optional context."""
+    _ = preserve_emotion
+    return _translate_batch(
+        [text],
+        source_lang=source_lang,
+        target_lang=target_lang,
+        contexts=[context],
+        max_new_tokens=max_new_tokens,
+        backend=backend,
+    )[0]
 
 
-def load_model() -> str:
+def load_model(backend: Optional[str] = None) -> str:
     """Load the translation model into memory, streaming progress via SSE."""
     task_id = f"translation_load_{uuid.uuid4().hex}"
     translation_progress.set_progress(task_id, "starting", 0, "Loading model...")
@@ -171,7 +610,7 @@ def load_model() -> str:
                 translation_progress.set_progress(task_id, "error", 0, "Model not downloaded. Please download it first.")
                 return
             preferred_device, _ = _detect_runtime_device()
-            _ensure_model_loaded(task_id, preferred_device)
+            _ensure_model_loaded(task_id, preferred_device, backend=backend)
             translation_progress.set_progress(task_id, "complete", 100, "Model loaded successfully.")
         except Exception as exc:
             translation_progress.set_progress(task_id, "error", 0, str(exc))
@@ -200,8 +639,20 @@ def start_translation(
     target_lang: str,
     segments: Optional[list[dict]] = None,
     preserve_emotion: bool = True,
+    backend: Optional[str] = None,
+    use_memory: bool = True,
 ) -> str:
-    """Start translation task in background thread and return job id."""
+    """
+    Start translation task in background thread and return job id.
+
+    Segments already in the translation memory are reused (unless
+    `use_memory` is False); the result's "memory" entry reports the hit ratio.
+    The model is only loaded when something is left to translate.
+
+    Each translated segment is also published as a `segment` event on
+    translation_progress as soon as its batch finishes (memory hits first),
+    so clients can consume the job incrementally; see get_translation_events.
+    """
     job = job_store.create_job()
 
     def runner() -> None:
@@ -213,52 +664,57 @@ def start_translation(
             else:
                 translation_progress.add_log(job.job_id, "CUDA not detected. Falling back to CPU.")
 
-            _ensure_model_loaded(job.job_id, preferred_device=preferred_device)
+            def ensure_loaded() -> None:
+                _ensure_model_loaded(job.job_id, preferred_device=preferred_device, backend=backend)
 
             if segments:
                 normalized_segments = [seg for seg in segments if isinstance(seg, dict) and str(seg.get("text", "")).strip()]
                 if not normalized_segments:
                     raise RuntimeError("segments contains no translatable text")
 
-                translated_segments: list[dict] = []
                 total = len(normalized_segments)
+                originals = [str(segment.get("text", "")).strip() for segment in normalized_segments]
+                contexts: list[str] = []
+                for idx in range(total):
+                    context_parts: list[str] = []
+                    if idx > 0 and originals[idx - 1]:
+                        context_parts.append(originals[idx - 1])
+                    if idx < total - 1 and originals[idx + 1]:
+                        context_parts.append(originals[idx + 1])
+                    contexts.append(" ".join(context_parts))
 
-                for idx, segment in enumerate(normalized_segments):
-                    percent = 10 + int((idx / max(total, 1)) * 85)
+                def _report(done: int, count: int) -> None:
                     translation_progress.set_progress(
                         job.job_id,
                         "translating",
-                        percent,
-                        f"Translating segment {idx + 1}/{total}...",
+                        10 + int((done / max(count, 1)) * 85),
+                        f"Translated {done}/{count} segments...",
                     )
 
-                    context_parts: list[str] = []
-                    if idx > 0:
-                        prev_text = str(normalized_segments[idx - 1].get("text", "")).strip()
-                        if prev_text:
-                            context_parts.append(prev_text)
-                    if idx < total - 1:
-                        next_text = str(normalized_segments[idx + 1].get("text", "")).strip()
-                        if next_text:
-                            context_parts.append(next_text)
-                    context = " ".join(context_parts)
-
-                    original_text = str(segment.get("text", "")).strip()
-                    translated_text = _translate_segment(
-                        original_text,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        context=context,
-                        preserve_emotion=preserve_emotion,
-                    )
-                    translated_segments.append(
-                        {
-                            "text": translated_text,
-                            "start": segment.get("start", segment.get("start_time")),
-                            "end": segment.get("end", segment.get("end_time")),
-                            "original_text": original_text,
-                        }
-                    )
+                def _publish(indices: list[int], translations: list[str]) -> None:
+                    for index, translated_text in zip(indices, translations):
+                        event = _segment_payload(normalized_segments[index], originals[index], translated_text)
+                        event.update(type="segment", index=index, total=total)
+                        translation_progress.add_event(job.job_id, event)
+
+                translation_progress.set_progress(job.job_id, "translating", 10, f"Translating {total} segments...")
+                translated_texts, hits = _translate_with_memory(
+                    originals,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    contexts=contexts,
+                    backend=backend,
+                    use_memory=use_memory,
+                    ensure_loaded=ensure_loaded,
+                    on_batch=_report,
+                    on_results=_publish,
+                )
+                if hits:
+                    translation_progress.add_log(job.job_id, f"Translation memory: {hits}/{total} segments reused")
+                translated_segments: list[dict] = [
+                    _segment_payload(segment, original_text, translated_text)
+                    for segment, original_text, translated_text in zip(normalized_segments, originals, translated_texts)
+                ]
 
                 translated_text = " ".join(seg["text"] for seg in translated_segments).strip()
                 result = {
@@ -267,22 +723,26 @@ def start_translation(
                     "target_language": target_lang,
                     "segments": translated_segments,
                     "segments_count": len(translated_segments),
+                    "memory": {"hits": hits, "misses": total - hits, "hit_ratio": round(hits / total, 4)},
                 }
             else:
                 clean_text = text.strip()
                 if not clean_text:
                     raise RuntimeError("text is required when segments is not provided")
                 translation_progress.set_progress(job.job_id, "translating", 30, "Translating text...")
-                translated_text = _translate_segment(
-                    clean_text,
+                translated_items, hits = _translate_with_memory(
+                    [clean_text],
                     source_lang=source_lang,
                     target_lang=target_lang,
-                    preserve_emotion=preserve_emotion,
+                    backend=backend,
+                    use_memory=use_memory,
+                    ensure_loaded=ensure_loaded,
                 )
                 result = {
-                    "translated_text": translated_text,
+                    "translated_text": translated_items[0],
                     "source_language": source_lang,
                     "target_language": target_lang,
+                    "memory": {"hits": hits, "misses": 1 - hits, "hit_ratio": float(hits)},
                 }
 
             job_store.update_job(job.job_id, "complete", result=result)
@@ -295,6 +755,27 @@ def start_translation(
     return job.job_id
 
 
+def _segment_payload(segment: dict, original_text: str, translated_text: str) -> dict:
+    return {
+        "text": translated_text,
+        "start": segment.get("start", segment.get("start_time")),
+        "end": segment.get("end", segment.get("end_time")),
+        "original_text": original_text,
+    }
+
+
+def get_translation_events(job_id: str, cursor: int = 0) -> dict:
+    """
+    Return the segment events published since `cursor`.
+
+    Events arrive in completion order, not segment order; each carries its
+    segment `index`. Pass the returned `cursor` back to continue. Events are
+    dropped a while after the job finishes; the job result keeps every segment.
+    """
+    events = translation_progress.get_events(job_id, cursor)
+    return {"job_id": job_id, "events": events, "cursor": max(cursor, 0) + len(events)}
+
+
 def get_translation_status(job_store: JobStore, job_id: str) -> Optional[dict]:
     """Return translation task status payload."""
     record = job_store.get_job(job_id)
@@ -311,25 +792,36 @@ def get_translation_status(job_store: JobStore, job_id: str) -> Optional[dict]:
 def get_model_status() -> dict:
     """Return current translation model state."""
     return {
-        "loaded": _model is not None and _tokenizer is not None,
+        "loaded": (_model is not None or _ct2_translator is not None) and _tokenizer is not None,
         "downloaded": is_model_downloaded("translation"),
         "model_id": MODEL_ID,
         "model_dir": str(MODEL_DIR),
         "device": _current_device,
+        "backend": TRANSLATION_BACKEND,
+        "backends": {
+            "transformers": {"loaded": _model is not None},
+            "ctranslate2": {
+                "loaded": _ct2_translator is not None,
+                "converted": _ct2_model_ready(),
+                "model_dir": str(CT2_MODEL_DIR),
+            },
+        },
         "supported_languages": LANGUAGE_MAP,
+        "memory_enabled": TRANSLATION_MEMORY_ENABLED,
     }
 
 
 def unload_model() -> dict:
     """Unload model and clear CUDA cache when available."""
-    global _model, _tokenizer, _current_device
+    global _model, _tokenizer, _ct2_translator, _current_device
 
     with _model_lock:
-        if _model is None and _tokenizer is None:
+        if _model is None and _tokenizer is None and _ct2_translator is None:
             return {"status": "not_loaded"}
 
         _model = None
         _tokenizer = None
+        _ct2_translator = None
         _current_device = None
         gc.collect()
 
@@ -0,0 +1,152 @@
+"""
+Compare article extraction: BeautifulSoup html.parser (the old path) vs lxml.
+
+Not a pytest module: it reads a corpus of saved pages. Run from python_api/app-6901:
+
+    python test-script/bench_news_extraction.py pages/
+    python test-script/bench_news_extraction.py pages/ --fetch urls.txt
+
+Every *.html file in the corpus directory is one article; files whose name
+contains "cnn" go through the CNN scraper, the rest through VnExpress.
+--fetch downloads the listed URLs (one per line) into the corpus first.
+For each page it times parsing and extraction separately for both paths,
+repeated --repeat times, and reports totals, the per-page p50 and the
+number of pages where both paths returned the same paragraphs.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+_APP6901_DIR = Path(__file__).resolve().parents[1]
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+for _p in (_APP6901_DIR, _REPO_ROOT):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+from bs4 import BeautifulSoup, Tag  # noqa: E402
+
+from app.services.get_news_web_content import crawl_engine, extraction  # noqa: E402
+from app.services.get_news_web_content.cnn import content_scraper as cnn  # noqa: E402
+from app.services.get_news_web_content.vnexpress import content_scraper as vnexpress  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Old path: html.parser + get_text() on every <div>
+# ---------------------------------------------------------------------------
+
+def legacy_container(soup: BeautifulSoup) -> Tag:
+    candidates: list[Tag] = list(soup.find_all("article"))
+    itemprop = soup.find(attrs={"itemprop": "articleBody"})
+    if isinstance(itemprop, Tag):
+        candidates.append(itemprop)
+    for cls in ("fck_detail", "container", "sidebar-1", "article__content"):
+        found = soup.find("div", class_=lambda c: c and cls in c)
+        if isinstance(found, Tag):
+            candidates.append(found)
+    all_divs = soup.find_all("div")
+    if all_divs:
+        candidates.append(max(all_divs, key=lambda d: len(d.get_text(strip=True) or "")))
+    best, best_count = None, 0
+    for cand in candidates:
+        count = len(cand.find_all("p"))
+        if count > best_count:
+            best, best_count = cand, count
+    return best or soup.body or soup
+
+
+def legacy_paragraphs(soup: BeautifulSoup) -> list[str]:
+    container = legacy_container(soup)
+    return [
+        p.get_text(separator=" ", strip=True)
+        for p in container.find_all("p")
+        if len(p.get_text(strip=True)) > 30
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+def _timed(fn: Callable[[], Any]) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def bench_page(raw: str, scraper: Any, url: str, repeat: int) -> dict[str, Any]:
+    times: dict[str, list[float]] = {"bs4_parse": [], "bs4_extract": [], "lxml_parse": [], "lxml_extract": []}
+    old_paragraphs: list[str] = []
+    new_paragraphs: list[str] = []
+    for _ in range(repeat):
+        soup, seconds = _timed(lambda: BeautifulSoup(raw, "html.parser"))
+        times["bs4_parse"].append(seconds)
+        old_paragraphs, seconds = _timed(lambda: legacy_paragraphs(soup))
+        times["bs4_extract"].append(seconds)
+
+        root, seconds = _timed(lambda: extraction.parse_html(raw))
+        times["lxml_parse"].append(seconds)
+        body, seconds = _timed(lambda: (scraper._extract_metadata(root, url), scraper._extract_body(root, url)))
+        times["lxml_extract"].append(seconds)
+        new_paragraphs = body[1]["paragraphs"]
+    result = {name: min(values) for name, values in times.items()}
+    result["same"] = old_paragraphs == new_paragraphs
+    return result
+
+
+def fetch_corpus(url_file: Path, corpus: Path) -> None:
+    corpus.mkdir(parents=True, exist_ok=True)
+    for url in url_file.read_text(encoding="utf-8").split():
+        name = re.sub(r"[^\w.-]+", "_", url.split("://", 1)[-1])[:120]
+        if not name.endswith(".html"):
+            name += ".html"
+        path = corpus / name
+        if path.exists():
+            continue
+        try:
+            path.write_text(crawl_engine.fetch_html(url), encoding="utf-8")
+            print(f"saved {path.name}")
+        except RuntimeError as exc:
+            print(f"skip {url}: {exc}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", type=Path, help="directory of saved article pages (*.html)")
+    parser.add_argument("--fetch", type=Path, help="file of article URLs to download into the corpus first")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per page; the fastest is kept")
+    args = parser.parse_args(argv)
+
+    if args.fetch:
+        fetch_corpus(args.fetch, args.corpus)
+    pages = sorted(args.corpus.glob("*.html"))
+    if not pages:
+        parser.error(f"no *.html pages in {args.corpus}")
+
+    results = []
+    for page in pages:
+        scraper = cnn if "cnn" in page.name.lower() else vnexpress
+        raw = page.read_text(encoding="utf-8", errors="replace")
+        results.append(bench_page(raw, scraper, f"https://example.invalid/{page.name}", max(1, args.repeat)))
+
+    header = f"{'path':<7}{'parse ms':>10}{'extract ms':>12}{'total ms':>10}{'p50/page':>10}"
+    print(f"{len(pages)} pages")
+    print(header)
+    print("-" * len(header))
+    for label, parse_key, extract_key in (("bs4", "bs4_parse", "bs4_extract"), ("lxml", "lxml_parse", "lxml_extract")):
+        parse = sum(r[parse_key] for r in results) * 1000
+        extract = sum(r[extract_key] for r in results) * 1000
+        per_page = statistics.median(r[parse_key] + r[extract_key] for r in results) * 1000
+        print(f"{label:<7}{parse:>10.1f}{extract:>12.1f}{parse + extract:>10.1f}{per_page:>10.2f}")
+    same = sum(r["same"] for r in results)
+    print(f"same paragraphs on {same}/{len(results)} pages (fast-path selectors may differ by design)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,187 @@
+"""
+Compare the Vietnamese number/date normalizers against an earlier revision.
+
+Not a pytest module: it reads a corpus of article text. Run from python_api/app-6901:
+
+    python test-script/bench_text_normalizer.py
+    python test-script/bench_text_normalizer.py articles_1a2b3c4d.ndjson notes/ --repeat 5
+
+Corpus arguments may be news-scraper output (*.ndjson crawl downloads or
+*.json single articles; body.paragraphs are used), *.txt files (one
+paragraph per blank-line separated block) or directories of those. With no
+arguments a small built-in set of news-style paragraphs is used.
+
+The baseline is loaded from git (--baseline, default: the revision before
+rules.py was added). Both VietnameseTextProcessor.process_vietnamese_text and
+text_processor.process_vietnamese_text are timed over the whole corpus,
+repeated --repeat times (fastest kept), and every paragraph's output is
+compared with the baseline's.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+_APP6901_DIR = Path(__file__).resolve().parents[1]
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+for _p in (_APP6901_DIR, _REPO_ROOT):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+from app.services.text_normalizer import processor, rules, text_processor  # noqa: E402
+
+_PACKAGE_DIR = Path(processor.__file__).resolve().parent
+_BASELINE_FILES = ("processor.py", "text_processor.py", "rules.py")
+
+_DEFAULT_CORPUS = [
+    "Theo Tổng cục Thống kê, GDP quý III/2024 tăng 7,4% so với cùng kỳ, cao hơn mức 6,9% của quý II. "
+    "Lũy kế 9 tháng, kinh tế tăng trưởng 6,82%, xuất khẩu đạt 299,63 tỷ USD.",
+    "Khoảng 14h30 ngày 12/9, xe tải chở 15 tấn hàng lưu thông trên quốc lộ 1A hướng Hà Nội - Lạng Sơn "
+    "với tốc độ 60km/h thì va chạm với ôtô con tại km 23.",
+    "Giá vàng miếng SJC sáng 5/10 niêm yết ở 82.500.000 đồng/lượng mua vào, bán ra 84.500.000đ, "
+    "giảm 500.000 đồng so với cuối tuần trước.",
+    "Nhiệt độ cao nhất tại Hà Nội dao động 35-37°C, có nơi trên 38°C. Độ ẩm thấp nhất 50-55%, "
+    "lượng mưa phổ biến 20-40mm, cục bộ trên 100mm.",
+    "Đội tuyển Việt Nam xếp thứ 3 bảng C, kém đội đầu bảng 4 điểm. Trận lượt về diễn ra lúc 19h ngày 21/11 "
+    "trên sân Mỹ Đình, sức chứa khoảng 40.000 chỗ.",
+    "Ông Nguyễn Văn A, sinh ngày 15/3/1975, trú tại số 128/7/2 đường Trần Hưng Đạo, quận 1, TP HCM, "
+    "bị tuyên phạt 7 năm tù. Liên hệ đường dây nóng 0912345678 để phản ánh.",
+    "Dự án có tổng diện tích 1.250 ha, vốn đầu tư 2,5 tỷ USD, giai đoạn 2025-2030 sẽ xây dựng 3.000 căn hộ "
+    "và 12 tòa văn phòng, mỗi căn rộng 75m2.",
+    "Đại hội Đảng lần thứ XIII đã thông qua nghị quyết, hội nghị Trung ương 10 khóa XIII diễn ra từ 18-20/9. "
+    "Kỳ họp thứ 8 Quốc hội khóa XV khai mạc ngày 21/10/2024.",
+    "Bão số 3 (Yagi) đổ bộ với sức gió mạnh cấp 12, giật cấp 15, tương đương 133-166 km/h. "
+    "Hơn 1,2 triệu hộ dân bị mất điện, thiệt hại ước tính 81.500 tỷ đồng.",
+    "Tháng 8/2024, giá xăng RON 95 giảm 320 đồng một lít, về mức 22.840 đồng. "
+    "Giá dầu Brent giao dịch quanh 78,5 USD/thùng, thấp nhất từ đầu năm.",
+]
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def _article_paragraphs(article: dict) -> list[str]:
+    body = article.get("body") or {}
+    return [p for p in body.get("paragraphs") or [] if p]
+
+
+def load_corpus(paths: list[Path]) -> list[str]:
+    paragraphs: list[str] = []
+    files: list[Path] = []
+    for path in paths:
+        files.extend(sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path])
+    for path in files:
+        if path.suffix == ".ndjson":
+            for line in path.read_text(encoding="utf-8").splitlines():
+                if line.strip():
+                    paragraphs.extend(_article_paragraphs(json.loads(line)))
+        elif path.suffix == ".json":
+            data = json.loads(path.read_text(encoding="utf-8"))
+            for article in data if isinstance(data, list) else [data]:
+                paragraphs.extend(_article_paragraphs(article))
+        elif path.suffix == ".txt":
+            blocks = path.read_text(encoding="utf-8").split("\n\n")
+            paragraphs.extend(b.strip() for b in blocks if b.strip())
+    return paragraphs
+
+
+# ---------------------------------------------------------------------------
+# Baseline from git
+# ---------------------------------------------------------------------------
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=_PACKAGE_DIR, check=True, capture_output=True, text=True, encoding="utf-8",
+    ).stdout
+
+
+def default_baseline() -> str:
+    added = _git("log", "--diff-filter=A", "--format=%H", "--", "rules.py").split()
+    return f"{added[-1]}~1" if added else "HEAD"
+
+
+def load_baseline(rev: str, workdir: Path) -> tuple[ModuleType, ModuleType]:
+    """Import processor.py / text_processor.py as of *rev* from a throwaway package."""
+    prefix = _git("rev-parse", "--show-prefix").strip()
+    package = workdir / "baseline_text_normalizer"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    for name in _BASELINE_FILES:
+        try:
+            source = _git("show", f"{rev}:{prefix}{name}")
+        except subprocess.CalledProcessError:
+            continue
+        (package / name).write_text(source, encoding="utf-8")
+    sys.path.insert(0, str(workdir))
+    return (
+        importlib.import_module("baseline_text_normalizer.processor"),
+        importlib.import_module("baseline_text_normalizer.text_processor"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+def bench(fn: Callable[[str], str], corpus: list[str], repeat: int) -> tuple[float, list[str]]:
+    best = float("inf")
+    outputs: list[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        outputs = [fn(text) for text in corpus]
+        best = min(best, time.perf_counter() - started)
+    return best, outputs
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", type=Path, nargs="*", help="*.ndjson / *.json / *.txt files or directories")
+    parser.add_argument("--baseline", help="git revision to compare against (default: before rules.py)")
+    parser.add_argument("--repeat", type=int, default=5, help="passes over the corpus; the fastest is kept")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus(args.corpus) if args.corpus else list(_DEFAULT_CORPUS)
+    if not corpus:
+        parser.error("no paragraphs found in the corpus")
+    rev = args.baseline or default_baseline()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        old_processor, old_text_processor = load_baseline(rev, Path(workdir))
+        pipelines = (
+            ("VietnameseTextProcessor",
+             old_processor.VietnameseTextProcessor().process_vietnamese_text,
+             processor.VietnameseTextProcessor().process_vietnamese_text),
+            ("text_processor",
+             old_text_processor.process_vietnamese_text,
+             text_processor.process_vietnamese_text),
+        )
+        chars = sum(len(text) for text in corpus)
+        print(f"{len(corpus)} paragraphs, {chars} chars; baseline {rev}")
+        header = f"{'pipeline':<26}{'baseline ms':>13}{'current ms':>12}{'speedup':>9}{'identical':>12}"
+        print(header)
+        print("-" * len(header))
+        for label, old_fn, new_fn in pipelines:
+            old_seconds, old_out = bench(old_fn, corpus, max(1, args.repeat))
+            new_seconds, new_out = bench(new_fn, corpus, max(1, args.repeat))
+            same = sum(a == b for a, b in zip(old_out, new_out))
+            print(f"{label:<26}{old_seconds * 1000:>13.1f}{new_seconds * 1000:>12.1f}"
+                  f"{old_seconds / new_seconds:>8.1f}x{f'{same}/{len(corpus)}':>12}")
+            for text, a, b in zip(corpus, old_out, new_out):
+                if a != b:
+                    print(f"  differs: {text[:70]!r}\n    baseline {a[:90]!r}\n    current  {b[:90]!r}")
+    info = rules.number_to_words.cache_info()
+    print(f"number_to_words cache: {info.hits} hits, {info.misses} misses")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+"""
+Compare the NLLB translation backends (transformers vs CTranslate2 int8).
+
+Not a pytest module: it loads the real models. Run from python_api/app-6901:
+
+    python test-script/bench_translation_backends.py input.srt --source en --target vi
+    python test-script/bench_translation_backends.py input.txt --source en --target vi --reference ref.txt
+
+Input is one sentence per line, or an .srt file (cue numbers and timings are
+skipped). For each backend it reports load time, resident memory after load,
+batched throughput over the whole input and one-at-a-time latency (p50/p95)
+over the first --single lines. Quality is corpus chrF against --reference when
+given, otherwise the agreement of each backend with the transformers output.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+_APP6901_DIR = Path(__file__).resolve().parents[1]
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+for _p in (_APP6901_DIR, _REPO_ROOT):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+from app.services import translation as tr  # noqa: E402
+
+_SRT_TIMING_RE = re.compile(r"^\d{2}:\d{2}:\d{2}[,.]\d{3}\s+-->\s+")
+
+
+def read_lines(path: Path) -> list[str]:
+    lines = []
+    for raw in path.read_text(encoding="utf-8-sig").splitlines():
+        line = raw.strip()
+        if not line or line.isdigit() or _SRT_TIMING_RE.match(line):
+            continue
+        lines.append(line)
+    return lines
+
+
+def _char_ngrams(text: str, n: int) -> Counter:
+    chars = "".join(text.split())
+    return Counter(chars[i : i + n] for i in range(len(chars) - n + 1))
+
+
+def chrf(hypotheses: list[str], references: list[str], max_n: int = 6, beta: float = 2.0) -> float:
+    """Corpus-level chrF (character n-gram F-score, 0-100)."""
+    precisions, recalls = [], []
+    for n in range(1, max_n + 1):
+        matches = hyp_total = ref_total = 0
+        for hypothesis, reference in zip(hypotheses, references):
+            hyp_counts, ref_counts = _char_ngrams(hypothesis, n), _char_ngrams(reference, n)
+            matches += sum((hyp_counts & ref_counts).values())
+            hyp_total += sum(hyp_counts.values())
+            ref_total += sum(ref_counts.values())
+        if hyp_total:
+            precisions.append(matches / hyp_total)
+        if ref_total:
+            recalls.append(matches / ref_total)
+    precision = statistics.mean(precisions) if precisions else 0.0
+    recall = statistics.mean(recalls) if recalls else 0.0
+    if precision + recall == 0:
+        return 0.0
+    return 100 * (1 + beta**2) * precision * recall / (beta**2 * precision + recall)
+
+
+def rss_mb() -> float | None:
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / 1024**2
+    except ImportError:
+        pass
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def run_backend(backend: str, lines: list[str], source: str, target: str, single: int, device: str) -> dict:
+    tr.unload_model()
+    started = time.perf_counter()
+    tr._ensure_model_loaded(f"bench_{backend}", device, backend=backend)
+    load_seconds = time.perf_counter() - started
+    memory = rss_mb()
+
+    started = time.perf_counter()
+    outputs = tr._translate_batch(lines, source, target, backend=backend)
+    batch_seconds = time.perf_counter() - started
+
+    latencies = []
+    for line in lines[:single]:
+        started = time.perf_counter()
+        tr._translate_segment(line, source, target, backend=backend)
+        latencies.append(time.perf_counter() - started)
+
+    return {
+        "backend": backend,
+        "outputs": outputs,
+        "load_s": load_seconds,
+        "rss_mb": memory,
+        "batch_s": batch_seconds,
+        "lines_per_s": len(lines) / batch_seconds if batch_seconds else float("inf"),
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else None,
+        "p95_ms": sorted(latencies)[max(0, int(len(latencies) * 0.95) - 1)] * 1000 if latencies else None,
+    }
+
+
+def _fmt(value: float | None, pattern: str) -> str:
+    return "-" if value is None else pattern.format(value)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", type=Path)
+    parser.add_argument("--source", required=True, choices=sorted(tr.LANGUAGE_CODE_MAP))
+    parser.add_argument("--target", required=True, choices=sorted(tr.LANGUAGE_CODE_MAP))
+    parser.add_argument("--reference", type=Path, help="reference translations, aligned line by line")
+    parser.add_argument("--backends", nargs="+", default=list(tr.TRANSLATION_BACKENDS), choices=tr.TRANSLATION_BACKENDS)
+    parser.add_argument("--limit", type=int, default=0, help="only use the first N lines")
+    parser.add_argument("--single", type=int, default=20, help="lines timed one at a time")
+    parser.add_argument("--device", default=None, choices=("cpu", "cuda"))
+    parser.add_argument("--dump", type=Path, help="write each backend's output to <dump>.<backend>.txt")
+    args = parser.parse_args(argv)
+
+    lines = read_lines(args.input)
+    if args.limit:
+        lines = lines[: args.limit]
+    references = read_lines(args.reference)[: len(lines)] if args.reference else None
+    if references is not None and len(references) != len(lines):
+        parser.error("reference must have as many lines as the input")
+    device = args.device or tr._detect_runtime_device()[0]
+
+    print(f"{len(lines)} lines, {args.source} -> {args.target}, device={device}")
+    results = [run_backend(b, lines, args.source, args.target, args.single, device) for b in args.backends]
+    tr.unload_model()
+
+    baseline = next((r["outputs"] for r in results if r["backend"] == "transformers"), None)
+    header = f"{'backend':<13}{'load s':>8}{'RSS MB':>9}{'batch s':>9}{'lines/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'chrF':>8}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        compare_to = references or baseline
+        score = chrf(result["outputs"], compare_to) if compare_to is not None else None
+        print(
+            f"{result['backend']:<13}{result['load_s']:>8.1f}{_fmt(result['rss_mb'], '{:.0f}'):>9}"
+            f"{result['batch_s']:>9.1f}{result['lines_per_s']:>9.2f}{_fmt(result['p50_ms'], '{:.0f}'):>9}"
+            f"{_fmt(result['p95_ms'], '{:.0f}'):>9}{_fmt(score, '{:.1f}'):>8}"
+        )
+        if args.dump:
+            Path(f"{args.dump}.{result['backend']}.txt").write_text("\n".join(result["outputs"]) + "\n", encoding="utf-8")
+    print("chrF is against --reference" if references else "chrF is agreement with the transformers output")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
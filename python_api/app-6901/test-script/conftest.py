@@ -24,10 +24,11 @@ def job_store():
 
 @pytest.fixture(autouse=True)
 def reset_llm_runtime_config():
-    """Clear llm._runtime_config between tests to avoid state leakage."""
+    """Clear llm._runtime_config and the response cache between tests to avoid state leakage."""
     yield
     try:
         from app.services import llm
         llm._runtime_config.clear()
+        llm.response_cache.clear()
     except Exception:
         pass
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+import app.services.edge_tts as edge_tts_module
 from app.services.edge_tts import (
+    VoiceCatalog,
     _get_edge_tts_module,
     _normalize_voice,
     list_voices,
@@ -13,6 +17,15 @@ from app.services.edge_tts import (
     synthesize_to_mp3,
 )
 
+
+@pytest.fixture(autouse=True)
+def _isolated_voice_catalog(tmp_path):
+    """Give every test an empty catalog that persists under tmp_path."""
+    catalog = VoiceCatalog(tmp_path / "voices.json", ttl_seconds=3600)
+    with patch.object(edge_tts_module, "voice_catalog", catalog):
+        yield catalog
+
+
 # ---------------------------------------------------------------------------
 # _get_edge_tts_module
 # ---------------------------------------------------------------------------
@@ -273,3 +286,140 @@ async def test_synthesize_calls_communicate_save(tmp_path):
             path, filename = await synthesize_to_mp3(text="Test text", voice="en-US-GuyNeural")
 
     communicator.save.assert_called_once_with(str(tmp_path / filename))
+
+
+# ---------------------------------------------------------------------------
+# VoiceCatalog — cached voice list
+# ---------------------------------------------------------------------------
+
+async def test_catalog_fetches_once_and_validates_from_memory(_isolated_voice_catalog):
+    mod = _make_edge_tts_mock()
+    with patch("app.services.edge_tts._get_edge_tts_module", return_value=mod):
+        await list_voices()
+        await list_languages()
+        assert await edge_tts_module.is_voice_supported("vi-VN-HoaiMyNeural")
+    assert mod.list_voices.await_count == 1
+
+
+async def test_catalog_cold_start_reads_disk(tmp_path):
+    with patch("app.services.edge_tts._get_edge_tts_module", return_value=_make_edge_tts_mock()):
+        await VoiceCatalog(tmp_path / "voices.json", ttl_seconds=3600).get()
+
+    offline = MagicMock()
+    offline.list_voices = AsyncMock(side_effect=OSError("offline"))
+    restarted = VoiceCatalog(tmp_path / "voices.json", ttl_seconds=3600)
+    with patch("app.services.edge_tts._get_edge_tts_module", return_value=offline):
+        voices = await restarted.get()
+    assert len(voices) == len(_SAMPLE_VOICES)
+    offline.list_voices.assert_not_awaited()
+
+
+async def test_catalog_serves_stale_while_refreshing(tmp_path):
+    catalog = VoiceCatalog(tmp_path / "voices.json", ttl_seconds=60)
+    catalog._set(_SAMPLE_VOICES[:1], fetched_at=0.0)  # long expired
+    mod = _make_edge_tts_mock()
+    with patch("app.services.edge_tts._get_edge_tts_module", return_value=mod):
+        stale = await catalog.get()
+        assert stale == _SAMPLE_VOICES[:1]
+        await catalog._refresh_task
+        fresh = await catalog.get()
+    assert fresh == _SAMPLE_VOICES
+    assert mod.list_voices.await_count == 1
+    assert catalog.status()["refreshes"] == 1
+
+
+async def test_catalog_keeps_old_voices_when_refresh_fails(tmp_path):
+    catalog = VoiceCatalog(tmp_path / "voices.json", ttl_seconds=60)
+    catalog._set(_SAMPLE_VOICES, fetched_at=0.0)
+    failing = MagicMock()
+    failing.list_voices = AsyncMock(side_effect=OSError("offline"))
+    with patch("app.services.edge_tts._get_edge_tts_module", return_value=failing):
+        await catalog.get()
+        with pytest.raises(OSError):
+            await catalog._refresh_task
+        assert await catalog.get() == _SAMPLE_VOICES
+    assert catalog.status()["last_error"] == "offline"
+
+
+async def test_unknown_voice_refreshes_old_catalog_once(tmp_path):
+    catalog = VoiceCatalog(tmp_path / "voices.json", ttl_seconds=10**9)
+    catalog._set(_SAMPLE_VOICES[:1], fetched_at=time.time() - 3600)
+    mod = _make_edge_tts_mock()
+    with patch("app.services.edge_tts._get_edge_tts_module", return_value=mod):
+        assert await catalog.has_voice("en-US-AriaNeural")
+        assert not await catalog.has_voice("xx-XX-Nobody")
+    assert mod.list_voices.await_count == 1
+
+
+# ---------------------------------------------------------------------------
+# synthesize_long_to_mp3 — chunked, concurrent
+# ---------------------------------------------------------------------------
+
+# MPEG-2 Layer III, 48 kbps, 24 kHz mono (Edge-TTS output): 144-byte frames of 24 ms.
+_MP3_FRAME = b"\xff\xf3\x64\xc4" + b"\x00" * 140
+
+
+def test_mp3_duration_counts_frames():
+    assert edge_tts_module.mp3_duration_seconds(_MP3_FRAME * 50) == pytest.approx(1.2)
+    assert edge_tts_module.mp3_duration_seconds(b"junk" + _MP3_FRAME * 10) == pytest.approx(0.24)
+    assert edge_tts_module.mp3_duration_seconds(b"") == 0.0
+
+
+def _make_streaming_edge_tts(frames_per_chunk: int = 25, delay: float = 0.0, failures: int = 0):
+    state = {"active": 0, "peak": 0, "calls": 0, "failures": failures}
+
+    def _communicate(text, voice, rate, pitch, boundary):
+        async def _stream():
+            state["calls"] += 1
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            try:
+                await asyncio.sleep(delay)
+                if state["failures"]:
+                    state["failures"] -= 1
+                    raise ConnectionError("socket closed")
+                yield {"type": "WordBoundary", "offset": 1_000_000, "duration": 2_000_000, "text": text.split()[0]}
+                yield {"type": "audio", "data": _MP3_FRAME * frames_per_chunk}
+            finally:
+                state["active"] -= 1
+
+        communicator = MagicMock()
+        communicator.stream = _stream
+        return communicator
+
+    mod = MagicMock()
+    mod.Communicate.side_effect = _communicate
+    return mod, state
+
+
+async def test_long_synthesis_concatenates_and_offsets_words(tmp_path):
+    mod, state = _make_streaming_edge_tts(frames_per_chunk=25, delay=0.01)
+    text = "\n".join(f"Sentence number {i} is here." for i in range(6))
+    with patch("app.services.edge_tts._get_edge_tts_module", return_value=mod), \
+            patch("app.services.edge_tts.chunk_text_i18n", side_effect=lambda t: t.split("\n")), \
+            patch("app.services.edge_tts.TEMP_DIR", tmp_path):
+        path, filename, meta = await edge_tts_module.synthesize_long_to_mp3(text, "en-US-GuyNeural", max_concurrency=2)
+
+    assert path.read_bytes() == _MP3_FRAME * 25 * 6
+    assert state["peak"] == 2
+    assert meta["chunks"] == 6
+    assert meta["duration"] == pytest.approx(3.6)
+    assert [segment["start"] for segment in meta["segments"]] == pytest.approx([0, 0.6, 1.2, 1.8, 2.4, 3.0])
+    assert meta["words"][1] == {"word": "Sentence", "start": pytest.approx(0.7), "end": pytest.approx(0.9)}
+    assert mod.Communicate.call_args.kwargs["boundary"] == "WordBoundary"
+
+
+async def test_long_synthesis_retries_failed_chunk(tmp_path):
+    mod, state = _make_streaming_edge_tts(failures=1)
+    with patch("app.services.edge_tts._get_edge_tts_module", return_value=mod), \
+            patch("app.services.edge_tts.TEMP_DIR", tmp_path), \
+            patch("app.services.edge_tts.asyncio.sleep", AsyncMock()):
+        _, _, meta = await edge_tts_module.synthesize_long_to_mp3("Only one chunk.", "en-US-GuyNeural")
+    assert state["calls"] == 2
+    assert meta["chunks"] == 1
+
+
+async def test_long_synthesis_empty_text_raises():
+    with patch("app.services.edge_tts._get_edge_tts_module", return_value=MagicMock()):
+        with pytest.raises(ValueError, match="text is required"):
+            await edge_tts_module.synthesize_long_to_mp3("   ", "en-US-GuyNeural")
@@ -0,0 +1,496 @@
+from __future__ import annotations
+
+import io
+import subprocess
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import app.services.image_search.image_pipeline.orchestrator as orchestrator_module
+import app.services.image_search.image_pipeline.search as search_module
+import app.services.image_search.image_pipeline.search.google as google_module
+from app.services.image_search.image_pipeline.models import ImageResult
+from app.services.image_search.image_pipeline.orchestrator import iter_pipeline, run_pipeline
+import app.services.image_search.image_pipeline.probe as probe_module
+from app.services.image_search.image_pipeline.probe import parse_image_dimensions, probe_image
+from app.services.image_search.image_pipeline.search import (
+    SourceCircuitBreaker,
+    iter_all_sources,
+    run_all_sources,
+)
+from app.services.image_search.image_pipeline.selector import TopKSelector, select_top_images
+
+
+@pytest.fixture(autouse=True)
+def reset_breaker():
+    search_module._breaker.reset()
+    yield
+    search_module._breaker.reset()
+
+
+def _fake_sources(runners: dict[str, object]):
+    def _build(query, per_source_limit, timeout_seconds, enabled_sources, deadline=None):
+        return tuple((name, runner) for name, runner in runners.items())
+    return _build
+
+
+# ---------------------------------------------------------------------------
+# run_all_sources / iter_all_sources
+# ---------------------------------------------------------------------------
+
+def test_run_all_sources_runs_sources_concurrently():
+    barrier = threading.Barrier(3, timeout=2)
+
+    def _runner(name):
+        def _run():
+            barrier.wait()  # deadlocks unless all three run at the same time
+            return [ImageResult(source=name, url=f"http://{name}/1.jpg")]
+        return _run
+
+    runners = {name: _runner(name) for name in ("a", "b", "c")}
+    with patch.object(search_module, "_build_sources", _fake_sources(runners)):
+        results, errors = run_all_sources("cats", timeout_seconds=5)
+
+    assert errors == {}
+    assert {r.source for r in results} == {"a", "b", "c"}
+
+
+def test_run_all_sources_deduplicates_urls():
+    runners = {
+        "a": lambda: [ImageResult(source="a", url="http://x/1.jpg")],
+        "b": lambda: [ImageResult(source="b", url=" http://x/1.jpg "), ImageResult(source="b", url="http://x/2.jpg")],
+    }
+    with patch.object(search_module, "_build_sources", _fake_sources(runners)):
+        results, _ = run_all_sources("cats")
+    assert sorted(r.url.strip() for r in results) == ["http://x/1.jpg", "http://x/2.jpg"]
+
+
+def test_run_all_sources_records_source_errors():
+    def _fail():
+        raise RuntimeError("boom")
+
+    runners = {"a": _fail, "b": lambda: [ImageResult(source="b", url="http://x/1.jpg")]}
+    with patch.object(search_module, "_build_sources", _fake_sources(runners)):
+        results, errors = run_all_sources("cats")
+    assert errors == {"a": "boom"}
+    assert len(results) == 1
+
+
+def test_run_all_sources_shared_deadline_does_not_wait_for_slow_source():
+    release = threading.Event()
+
+    def _slow():
+        release.wait(5)
+        return [ImageResult(source="slow", url="http://slow/1.jpg")]
+
+    runners = {"slow": _slow, "fast": lambda: [ImageResult(source="fast", url="http://fast/1.jpg")]}
+    started = time.monotonic()
+    with patch.object(search_module, "_build_sources", _fake_sources(runners)):
+        results, errors = run_all_sources("cats", deadline_seconds=0.2)
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert elapsed < 2
+    assert [r.source for r in results] == ["fast"]
+    assert "Timed out" in errors["slow"]
+
+
+def test_iter_all_sources_yields_in_completion_order():
+    def _slow():
+        time.sleep(0.2)
+        return []
+
+    runners = {"slow": _slow, "fast": lambda: []}
+    with patch.object(search_module, "_build_sources", _fake_sources(runners)):
+        names = [name for name, _, _ in iter_all_sources("cats")]
+    assert names == ["fast", "slow"]
+
+
+def test_open_breaker_skips_source():
+    calls: list[str] = []
+
+    def _runner():
+        calls.append("a")
+        return []
+
+    for _ in range(search_module.BREAKER_FAILURE_THRESHOLD):
+        search_module._breaker.record_failure("a")
+
+    with patch.object(search_module, "_build_sources", _fake_sources({"a": _runner})):
+        _, errors = run_all_sources("cats")
+    assert calls == []
+    assert "cooling off" in errors["a"]
+
+
+def test_google_worker_is_capped_by_remaining_shared_deadline():
+    seen: dict[str, float] = {}
+
+    def _google(query, max_results, timeout_seconds, deadline_seconds=None):
+        seen["deadline"] = deadline_seconds
+        return []
+
+    with patch.object(search_module, "search_google_images", _google):
+        _, errors = run_all_sources("cats", timeout_seconds=30, enabled_sources=["google"], deadline_seconds=5)
+    assert errors == {}
+    assert 0 < seen["deadline"] <= 5 - search_module.GOOGLE_DEADLINE_MARGIN_SECONDS
+
+
+def test_google_search_kills_worker_at_deadline():
+    with patch.object(google_module.subprocess, "run", side_effect=subprocess.TimeoutExpired("w", 3)) as run:
+        assert google_module.search_google_images("cats", 5, timeout_seconds=30, deadline_seconds=3) == []
+    assert run.call_args.kwargs["timeout"] == 3
+
+
+# ---------------------------------------------------------------------------
+# SourceCircuitBreaker
+# ---------------------------------------------------------------------------
+
+def test_breaker_opens_after_threshold():
+    breaker = SourceCircuitBreaker(failure_threshold=2, cooldown_seconds=60)
+    breaker.record_failure("bing")
+    assert breaker.is_open("bing") is False
+    breaker.record_failure("bing")
+    assert breaker.is_open("bing") is True
+
+
+def test_breaker_success_resets_failures():
+    breaker = SourceCircuitBreaker(failure_threshold=2, cooldown_seconds=60)
+    breaker.record_failure("bing")
+    breaker.record_success("bing")
+    breaker.record_failure("bing")
+    assert breaker.is_open("bing") is False
+
+
+def test_breaker_half_opens_after_cooldown():
+    breaker = SourceCircuitBreaker(failure_threshold=2, cooldown_seconds=0)
+    breaker.record_failure("bing")
+    breaker.record_failure("bing")
+    assert breaker.is_open("bing") is False
+    # One more failure after the cool-off re-opens immediately.
+    breaker.cooldown_seconds = 60
+    breaker.record_failure("bing")
+    assert breaker.is_open("bing") is True
+
+
+def _tripped_breaker(clock: list[float]) -> SourceCircuitBreaker:
+    breaker = SourceCircuitBreaker(failure_threshold=2, cooldown_seconds=60)
+    breaker.record_failure("bing")
+    breaker.record_failure("bing")
+    clock[0] += 61
+    return breaker
+
+
+def test_breaker_half_open_admits_one_probe():
+    clock = [1000.0]
+    with patch.object(search_module.time, "monotonic", lambda: clock[0]):
+        breaker = _tripped_breaker(clock)
+        assert breaker.is_open("bing") is False  # the probe
+        assert breaker.is_open("bing") is True  # a second caller arriving meanwhile
+        breaker.record_success("bing")
+        assert breaker.is_open("bing") is False
+        assert breaker.is_open("bing") is False
+
+
+def test_breaker_failed_probe_reopens_for_a_full_cooldown():
+    clock = [1000.0]
+    with patch.object(search_module.time, "monotonic", lambda: clock[0]):
+        breaker = _tripped_breaker(clock)
+        assert breaker.is_open("bing") is False
+        clock[0] += 30
+        breaker.record_failure("bing")
+        clock[0] += 59
+        assert breaker.is_open("bing") is True
+        clock[0] += 1
+        assert breaker.is_open("bing") is False
+
+
+def test_breaker_replaces_a_probe_that_never_reports():
+    clock = [1000.0]
+    with patch.object(search_module.time, "monotonic", lambda: clock[0]):
+        breaker = _tripped_breaker(clock)
+        assert breaker.is_open("bing") is False
+        clock[0] += 59
+        assert breaker.is_open("bing") is True
+        clock[0] += 1
+        assert breaker.is_open("bing") is False
+
+
+# ---------------------------------------------------------------------------
+# TopKSelector
+# ---------------------------------------------------------------------------
+
+def _img(name: str, width: int, height: int) -> ImageResult:
+    return ImageResult(source="s", url=f"http://x/{name}.jpg", width=width, height=height, resolution=width * height)
+
+
+def test_topk_selector_matches_select_top_images():
+    images = [_img("a", 800, 800), _img("b", 100, 100), _img("c", 1200, 900), _img("d", 700, 700), _img("e", 50, 900)]
+    selector = TopKSelector(top_k=2, min_side=600)
+    for image in images:
+        selector.offer(image)
+    assert selector.result() == select_top_images(list(images), top_k=2, min_side=600)
+
+
+def test_topk_selector_falls_back_to_small_images():
+    selector = TopKSelector(top_k=2, min_side=600)
+    assert selector.offer(_img("a", 100, 100)) is False
+    assert selector.offer(_img("b", 200, 200)) is False
+    assert [image.url for image in selector.result()] == ["http://x/b.jpg", "http://x/a.jpg"]
+
+
+def test_topk_selector_satisfied_after_top_k_qualified():
+    selector = TopKSelector(top_k=2, min_side=600)
+    selector.offer(_img("a", 800, 800))
+    assert selector.satisfied is False
+    selector.offer(_img("b", 100, 100))
+    assert selector.satisfied is False
+    selector.offer(_img("c", 900, 900))
+    assert selector.satisfied is True
+
+
+def test_topk_selector_ignores_unmeasured_images():
+    selector = TopKSelector(top_k=2, min_side=10)
+    assert selector.offer(ImageResult(source="s", url="http://x/a.jpg")) is False
+    assert selector.result() == []
+
+
+# ---------------------------------------------------------------------------
+# iter_pipeline / run_pipeline
+# ---------------------------------------------------------------------------
+
+def _fake_download(sizes: dict[str, tuple[int, int]]):
+    def _download(image, download_root=None, timeout_seconds=20):
+        if image.url not in sizes:
+            return None, f"Download failed for {image.url}"
+        width, height = sizes[image.url]
+        return ImageResult(
+            source=image.source, url=image.url, file_path="/tmp/x.jpg",
+            width=width, height=height, resolution=width * height,
+        ), None
+    return _download
+
+
+def _fake_probe(sizes: dict[str, tuple[int, int]], unparsed: tuple[str, ...] = ()):
+    def _probe(image, timeout_seconds=20):
+        if image.url in unparsed:
+            return image, None
+        if image.url not in sizes:
+            return None, f"Probe failed for {image.url}"
+        width, height = sizes[image.url]
+        return ImageResult(source=image.source, url=image.url, width=width, height=height, resolution=width * height), None
+    return _probe
+
+
+def _patched(source_events, sizes, unparsed=()):
+    def _iter(**kwargs):
+        yield from source_events
+    downloads: list[str] = []
+    fake_download = _fake_download(sizes)
+
+    def _download(image, download_root=None, timeout_seconds=20):
+        downloads.append(image.url)
+        return fake_download(image, download_root, timeout_seconds)
+
+    stack = [
+        patch.object(orchestrator_module, "iter_all_sources", _iter),
+        patch.object(orchestrator_module, "probe_image", _fake_probe(sizes, unparsed)),
+        patch.object(orchestrator_module, "download_image", _download),
+    ]
+    return stack, downloads
+
+
+def _run(source_events, sizes, unparsed=(), **kwargs):
+    stack, downloads = _patched(source_events, sizes, unparsed)
+    for patcher in stack:
+        patcher.start()
+    try:
+        events = list(iter_pipeline("p", lambda _: "cats", **kwargs))
+    finally:
+        for patcher in stack:
+            patcher.stop()
+    return events, downloads
+
+
+def test_iter_pipeline_streams_qualifying_images_and_finishes_with_done():
+    source_events = [
+        ("bing", [ImageResult(source="bing", url="http://x/big.jpg"), ImageResult(source="bing", url="http://x/small.jpg")], None),
+        ("lexica", [], "Timed out after 40s"),
+    ]
+    sizes = {"http://x/big.jpg": (1000, 800), "http://x/small.jpg": (100, 100)}
+    events, downloads = _run(source_events, sizes, top_k=5)
+
+    kinds = [event["event"] for event in events]
+    assert kinds[0] == "query"
+    assert kinds[-1] == "done"
+    assert [event["image"]["url"] for event in events if event["event"] == "image"] == ["http://x/big.jpg"]
+    assert downloads == ["http://x/big.jpg"]  # the small image is only probed
+    done = events[-1]
+    assert done["summary"]["search_candidates"] == 2
+    assert done["summary"]["probed"] == 2
+    assert done["summary"]["downloaded"] == 1
+    assert done["summary"]["search_errors"] == {"lexica": "Timed out after 40s"}
+
+
+def test_iter_pipeline_stops_early_once_top_k_secured():
+    urls = [f"http://x/{i}.jpg" for i in range(6)]
+    source_events = [("bing", [ImageResult(source="bing", url=url) for url in urls], None)]
+    sizes = {url: (1000, 1000) for url in urls}
+    events, downloads = _run(source_events, sizes, top_k=2)
+
+    assert len([event for event in events if event["event"] == "image"]) == 2
+    assert len(events[-1]["images"]) == 2
+    assert len(downloads) == 2
+
+
+def test_iter_pipeline_falls_back_to_best_small_images():
+    urls = ["http://x/a.jpg", "http://x/b.jpg", "http://x/c.jpg"]
+    source_events = [("bing", [ImageResult(source="bing", url=url) for url in urls], None)]
+    sizes = {"http://x/a.jpg": (100, 100), "http://x/b.jpg": (300, 300), "http://x/c.jpg": (200, 200)}
+    events, downloads = _run(source_events, sizes, top_k=2)
+
+    assert [image["url"] for image in events[-1]["images"]] == ["http://x/b.jpg", "http://x/c.jpg"]
+    assert sorted(downloads) == ["http://x/b.jpg", "http://x/c.jpg"]
+
+
+def test_iter_pipeline_downloads_unparsed_headers_in_full():
+    source_events = [("bing", [ImageResult(source="bing", url="http://x/odd.avif")], None)]
+    sizes = {"http://x/odd.avif": (1000, 1000)}
+    events, downloads = _run(source_events, sizes, unparsed=("http://x/odd.avif",), top_k=1)
+
+    assert downloads == ["http://x/odd.avif"]
+    assert [image["url"] for image in events[-1]["images"]] == ["http://x/odd.avif"]
+
+
+def test_run_pipeline_records_probe_errors():
+    source_events = [("bing", [ImageResult(source="bing", url="http://x/missing.jpg")], None)]
+    stack, _ = _patched(source_events, {})
+    for patcher in stack:
+        patcher.start()
+    try:
+        result = run_pipeline("p", lambda _: "cats")
+    finally:
+        for patcher in stack:
+            patcher.stop()
+
+    assert result["images"] == []
+    assert result["summary"]["download_errors"] == ["Probe failed for http://x/missing.jpg"]
+
+
+def test_run_pipeline_empty_query_raises():
+    with pytest.raises(RuntimeError, match="empty search query"):
+        run_pipeline("p", lambda _: "  ")
+
+
+# ---------------------------------------------------------------------------
+# parse_image_dimensions
+# ---------------------------------------------------------------------------
+
+def _encode(fmt: str, size: tuple[int, int], **params) -> bytes:
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (10, 20, 30)).save(buffer, format=fmt, **params)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "fmt, params",
+    [
+        ("JPEG", {}),
+        ("JPEG", {"progressive": True}),
+        ("PNG", {}),
+        ("GIF", {}),
+        ("BMP", {}),
+        ("WEBP", {"lossless": False}),
+        ("WEBP", {"lossless": True}),
+    ],
+)
+def test_parse_image_dimensions_formats(fmt, params):
+    data = _encode(fmt, (321, 123), **params)
+    assert parse_image_dimensions(data[:4096]) == (321, 123)
+
+
+def test_parse_image_dimensions_jpeg_behind_exif_block():
+    from PIL import Image
+
+    exif = Image.Exif()
+    exif[0x010E] = "x" * 20000  # ImageDescription pushes SOF past the first chunk
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480)).save(buffer, format="JPEG", exif=exif.tobytes())
+    data = buffer.getvalue()
+    assert parse_image_dimensions(data[:4096]) is None
+    assert parse_image_dimensions(data[:32768]) == (640, 480)
+
+
+def test_parse_image_dimensions_unknown_format():
+    assert parse_image_dimensions(b"<html><body>nope</body></html>") is None
+    assert parse_image_dimensions(b"") is None
+
+
+# ---------------------------------------------------------------------------
+# probe_image
+# ---------------------------------------------------------------------------
+
+class _FakeResponse:
+    def __init__(self, data: bytes, content_type: str = "image/png") -> None:
+        self.data = data
+        self.headers = {"Content-Type": content_type}
+        self.read_bytes = 0
+        self.closed = False
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size: int):
+        for offset in range(0, len(self.data), chunk_size):
+            chunk = self.data[offset : offset + chunk_size]
+            self.read_bytes += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _fake_session(response: _FakeResponse, seen_headers: list[dict]):
+    session = MagicMock()
+
+    def _get(url, **kwargs):
+        seen_headers.append(kwargs["headers"])
+        return response
+
+    session.get.side_effect = _get
+    return session
+
+
+def test_probe_image_reads_header_only_and_sends_range():
+    data = _encode("PNG", (2000, 1500)) + b"\0" * 1_000_000  # server ignores Range
+    response = _FakeResponse(data)
+    headers: list[dict] = []
+    with patch.object(probe_module, "_build_session", return_value=_fake_session(response, headers)):
+        result, error = probe_image(ImageResult(source="bing", url="http://x/a.png"), timeout_seconds=5)
+
+    assert error is None
+    assert (result.width, result.height, result.resolution) == (2000, 1500, 3_000_000)
+    assert result.file_path is None
+    assert headers[0]["Range"] == f"bytes=0-{probe_module.PROBE_BYTES - 1}"
+    assert response.read_bytes <= probe_module.PROBE_CHUNK_BYTES
+    assert response.closed is True
+
+
+def test_probe_image_unparsed_returns_original_image():
+    response = _FakeResponse(b"\0" * 100, content_type="image/avif")
+    image = ImageResult(source="bing", url="http://x/a.avif")
+    with patch.object(probe_module, "_build_session", return_value=_fake_session(response, [])):
+        result, error = probe_image(image, timeout_seconds=5)
+    assert result == image
+    assert error is None
+
+
+def test_probe_image_rejects_non_image_content():
+    response = _FakeResponse(b"<html></html>", content_type="text/html")
+    with patch.object(probe_module, "_build_session", return_value=_fake_session(response, [])):
+        result, error = probe_image(ImageResult(source="bing", url="http://x/a"), timeout_seconds=5)
+    assert result is None
+    assert "Non-image content type" in error
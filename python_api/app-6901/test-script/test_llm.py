@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import sys
+import threading
+import time
 from types import ModuleType
 from unittest.mock import MagicMock, patch
 
@@ -76,98 +80,83 @@ def test_update_config_none_values_no_change():
 
 
 # ---------------------------------------------------------------------------
-# get_status — requests not installed
+# get_status — httpx not installed
 # ---------------------------------------------------------------------------
 
-def test_get_status_requests_not_installed():
-    original = sys.modules.get("requests")
-    try:
-        sys.modules["requests"] = None  # type: ignore[assignment]
+def test_get_status_httpx_not_installed():
+    with patch.dict(sys.modules, {"httpx": None}):
         result = get_status()
-    finally:
-        if original is None:
-            sys.modules.pop("requests", None)
-        else:
-            sys.modules["requests"] = original
     assert result.get("status") == "error"
 
 
+# ---------------------------------------------------------------------------
+# Pooled client fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def use_client(monkeypatch):
+    """Route llm_module through a client whose pools are backed by mock transports."""
+    import httpx
+
+    def _install(handler, async_handler=None) -> llm_module.OllamaClient:
+        client = llm_module.OllamaClient(
+            transport=httpx.MockTransport(handler),
+            async_transport=httpx.MockTransport(async_handler or handler),
+        )
+        monkeypatch.setattr(llm_module, "ollama_client", client)
+        return client
+
+    return _install
+
+
+def _raise(exc):
+    def handler(request):
+        raise exc
+    return handler
+
+
 # ---------------------------------------------------------------------------
 # get_status — network errors
 # ---------------------------------------------------------------------------
 
-def _make_requests_mock(side_effect=None, json_data=None):
-    mock_req = MagicMock()
-    if side_effect:
-        mock_req.get.side_effect = side_effect
-    else:
-        resp = MagicMock()
-        resp.raise_for_status.return_value = None
-        resp.ok = True
-        resp.json.return_value = json_data or {}
-        mock_req.get.return_value = resp
-        mock_req.exceptions.ConnectionError = ConnectionError
-        mock_req.exceptions.Timeout = TimeoutError
-    # Set exception classes on mock
-    mock_req.exceptions = MagicMock()
-    mock_req.exceptions.ConnectionError = ConnectionError
-    mock_req.exceptions.Timeout = TimeoutError
-    return mock_req
-
-
-def test_get_status_connection_error():
-    mock_req = MagicMock()
-    mock_req.exceptions.ConnectionError = ConnectionError
-    mock_req.exceptions.Timeout = TimeoutError
-    mock_req.get.side_effect = ConnectionError("refused")
-
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        result = get_status()
+def test_get_status_connection_error(use_client):
+    import httpx
+
+    use_client(_raise(httpx.ConnectError("refused")))
+    result = get_status()
     assert result["status"] == "unreachable"
 
 
-def test_get_status_timeout():
-    mock_req = MagicMock()
-    mock_req.exceptions.ConnectionError = ConnectionError
-    mock_req.exceptions.Timeout = TimeoutError
-    mock_req.get.side_effect = TimeoutError("timed out")
+def test_get_status_timeout(use_client):
+    import httpx
 
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        result = get_status()
+    use_client(_raise(httpx.ReadTimeout("timed out")))
+    result = get_status()
     assert result["status"] == "timeout"
 
 
-def test_get_status_success():
-    mock_req = MagicMock()
-    mock_req.exceptions.ConnectionError = ConnectionError
-    mock_req.exceptions.Timeout = TimeoutError
-
-    tags_resp = MagicMock()
-    tags_resp.raise_for_status.return_value = None
-    tags_resp.json.return_value = {"models": [{"name": "llama3"}, {"name": "mistral"}]}
-
-    version_resp = MagicMock()
-    version_resp.ok = True
-    version_resp.json.return_value = {"version": "0.3.0"}
+def test_get_status_success(use_client):
+    import httpx
 
-    mock_req.get.side_effect = [tags_resp, version_resp]
+    def handler(request):
+        if request.url.path == "/api/tags":
+            return httpx.Response(200, json={"models": [{"name": "llama3"}, {"name": "mistral"}]})
+        return httpx.Response(200, json={"version": "0.3.0"})
 
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        result = get_status()
+    use_client(handler)
+    result = get_status()
 
     assert result["connected"] is True
     assert "llama3" in result["models"]
+    assert result["version"] == "0.3.0"
     assert result["status"] == "ok"
 
 
-def test_get_status_has_required_keys():
-    mock_req = MagicMock()
-    mock_req.exceptions.ConnectionError = ConnectionError
-    mock_req.exceptions.Timeout = TimeoutError
-    mock_req.get.side_effect = ConnectionError()
+def test_get_status_has_required_keys(use_client):
+    import httpx
 
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        result = get_status()
+    use_client(_raise(httpx.ConnectError("refused")))
+    result = get_status()
 
     for key in ("engine", "url", "default_model", "connected", "models"):
         assert key in result
@@ -177,63 +166,256 @@ def test_get_status_has_required_keys():
 # generate
 # ---------------------------------------------------------------------------
 
-def _mock_requests_post(response_json: dict):
-    mock_req = MagicMock()
-    resp = MagicMock()
-    resp.raise_for_status.return_value = None
-    resp.json.return_value = response_json
-    mock_req.post.return_value = resp
-    mock_req.exceptions.HTTPError = Exception
-    return mock_req
+def _capture_generate(use_client, response_json: dict, status_code: int = 200) -> list[dict]:
+    import httpx
+
+    bodies: list[dict] = []
 
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(status_code, json=response_json)
 
-def test_generate_uses_default_model():
+    use_client(handler)
+    return bodies
+
+
+def test_generate_uses_default_model(use_client):
     llm_module._runtime_config.clear()
-    mock_req = _mock_requests_post({"response": "ok"})
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        generate(prompt="", input_text="hello")
-    call_kwargs = mock_req.post.call_args
-    json_body = call_kwargs[1]["json"]
-    assert json_body["model"] == llm_module.DEFAULT_MODEL
-
-
-def test_generate_custom_model_used():
-    mock_req = _mock_requests_post({"response": "ok"})
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        generate(prompt="", input_text="hello", model="gemma2")
-    json_body = mock_req.post.call_args[1]["json"]
-    assert json_body["model"] == "gemma2"
-
-
-def test_generate_combined_prompt():
-    mock_req = _mock_requests_post({"response": "result"})
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        generate(prompt="System prompt", input_text="User input")
-    json_body = mock_req.post.call_args[1]["json"]
-    assert json_body["prompt"] == "System prompt\n\nUser input"
-
-
-def test_generate_empty_prompt_no_newlines():
-    mock_req = _mock_requests_post({"response": "result"})
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        generate(prompt="", input_text="User input")
-    json_body = mock_req.post.call_args[1]["json"]
-    assert json_body["prompt"] == "User input"
-
-
-def test_generate_returns_response_field():
-    mock_req = _mock_requests_post({"response": "Hello, world!"})
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        result = generate(prompt="", input_text="hi")
+    bodies = _capture_generate(use_client, {"response": "ok"})
+    generate(prompt="", input_text="hello")
+    assert bodies[0]["model"] == llm_module.DEFAULT_MODEL
+    assert bodies[0]["stream"] is False
+
+
+def test_generate_custom_model_used(use_client):
+    bodies = _capture_generate(use_client, {"response": "ok"})
+    generate(prompt="", input_text="hello", model="gemma2")
+    assert bodies[0]["model"] == "gemma2"
+
+
+def test_generate_combined_prompt(use_client):
+    bodies = _capture_generate(use_client, {"response": "result"})
+    generate(prompt="System prompt", input_text="User input")
+    assert bodies[0]["prompt"] == "System prompt\n\nUser input"
+
+
+def test_generate_empty_prompt_no_newlines(use_client):
+    bodies = _capture_generate(use_client, {"response": "result"})
+    generate(prompt="", input_text="User input")
+    assert bodies[0]["prompt"] == "User input"
+
+
+def test_generate_returns_response_field(use_client):
+    _capture_generate(use_client, {"response": "Hello, world!"})
+    result = generate(prompt="", input_text="hi")
     assert result == "Hello, world!"
 
 
-def test_generate_raises_on_http_error():
-    mock_req = MagicMock()
-    mock_req.exceptions.HTTPError = RuntimeError
-    resp = MagicMock()
-    resp.raise_for_status.side_effect = RuntimeError("400 Bad Request")
-    mock_req.post.return_value = resp
-    with patch.dict(sys.modules, {"requests": mock_req}):
-        with pytest.raises(RuntimeError):
-            generate(prompt="", input_text="test")
+def test_generate_raises_on_http_error(use_client):
+    import httpx
+
+    _capture_generate(use_client, {"error": "bad request"}, status_code=400)
+    with pytest.raises(httpx.HTTPStatusError):
+        generate(prompt="", input_text="test")
+
+
+def test_generate_reuses_one_pooled_client(use_client):
+    _capture_generate(use_client, {"response": "ok"})
+    client = llm_module.ollama_client
+    generate(prompt="", input_text="a")
+    first = client.client
+    generate(prompt="", input_text="b")
+    assert client.client is first
+
+
+def test_generate_coalesces_identical_inflight_prompts(use_client):
+    import httpx
+
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def handler(request):
+        calls.append(json.loads(request.content)["prompt"])
+        started.set()
+        release.wait(2)
+        return httpx.Response(200, json={"response": "shared"})
+
+    client = use_client(handler)
+    results: list[str] = []
+    leader = threading.Thread(target=lambda: results.append(generate("", "same")))
+    leader.start()
+    assert started.wait(2)
+    follower = threading.Thread(target=lambda: results.append(generate("", "same")))
+    follower.start()
+    deadline = time.time() + 2
+    while client.coalesced == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    release.set()
+    leader.join(2)
+    follower.join(2)
+
+    assert results == ["shared", "shared"]
+    assert calls == ["same"]
+    assert client.coalesced == 1
+
+
+# ---------------------------------------------------------------------------
+# agenerate / stream_generate
+# ---------------------------------------------------------------------------
+
+def test_agenerate_coalesces_concurrent_calls(use_client):
+    import httpx
+
+    calls: list[str] = []
+
+    async def handler(request):
+        calls.append(json.loads(request.content)["prompt"])
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"response": "async ok"})
+
+    client = use_client(lambda request: None, async_handler=handler)
+
+    async def _run():
+        return await asyncio.gather(
+            llm_module.agenerate("", "q"), llm_module.agenerate("", "q"), llm_module.agenerate("", "other")
+        )
+
+    assert asyncio.run(_run()) == ["async ok", "async ok", "async ok"]
+    assert sorted(calls) == ["other", "q"]
+    assert client.coalesced == 1
+
+
+def test_stream_generate_yields_tokens_and_shares_upstream(use_client):
+    import httpx
+
+    calls: list[dict] = []
+    lines = [{"response": "Hel"}, {"response": "lo"}, {"response": "", "done": True}]
+
+    async def handler(request):
+        calls.append(json.loads(request.content))
+        body = "".join(json.dumps(line) + "\n" for line in lines)
+        return httpx.Response(200, content=body.encode())
+
+    client = use_client(lambda request: None, async_handler=handler)
+
+    async def _collect():
+        return [token async for token in llm_module.stream_generate("", "hi")]
+
+    async def _run():
+        return await asyncio.gather(_collect(), _collect())
+
+    assert asyncio.run(_run()) == [["Hel", "lo"], ["Hel", "lo"]]
+    assert len(calls) == 1 and calls[0]["stream"] is True
+    assert client.coalesced == 1
+
+
+def test_stream_generate_raises_ollama_error(use_client):
+    import httpx
+
+    async def handler(request):
+        return httpx.Response(200, content=b'{"error": "model not found"}\n')
+
+    use_client(lambda request: None, async_handler=handler)
+
+    async def _run():
+        return [token async for token in llm_module.stream_generate("", "hi")]
+
+    with pytest.raises(RuntimeError, match="model not found"):
+        asyncio.run(_run())
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+def test_generate_serves_repeats_from_cache(use_client):
+    bodies = _capture_generate(use_client, {"response": "<think>hmm</think> red car"})
+    hits_before = llm_module.response_cache.status()["hits"]
+    first = generate("Describe", "article", model="m", use_cache=True, strip_think=True)
+    second = generate("Describe", "article", model="m", use_cache=True, strip_think=True)
+
+    assert first == second == "red car"
+    assert len(bodies) == 1
+    assert llm_module.response_cache.status()["hits"] - hits_before == 1
+
+
+def test_generate_cache_key_covers_url_model_options_and_opt_in(use_client):
+    bodies = _capture_generate(use_client, {"response": "ok"})
+    hits_before = llm_module.response_cache.status()["hits"]
+    generate("", "same", model="a", use_cache=True)
+    generate("", "same", model="b", use_cache=True)
+    generate("", "same", model="a", options={"temperature": 0}, use_cache=True)
+    generate("", "same", model="a")  # the cache is opt-in
+    generate("", "same", model="a", use_cache=True)
+    llm_module.update_config(url="http://other-host:11434")
+    generate("", "same", model="a", use_cache=True)
+
+    assert len(bodies) == 5
+    assert bodies[2]["options"] == {"temperature": 0}
+    assert llm_module.response_cache.status()["hits"] - hits_before == 1
+
+
+def test_response_cache_expires_and_evicts():
+    cache = llm_module.LLMResponseCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"
+    cache.put("c", "3")  # evicts b, the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+    with patch.object(llm_module.time, "monotonic", return_value=time.monotonic() + 61):
+        assert cache.get("c") is None
+    assert cache.status()["entries"] == 1
+
+
+def test_agenerate_uses_cache(use_client):
+    import httpx
+
+    calls: list[str] = []
+
+    async def handler(request):
+        calls.append(json.loads(request.content)["prompt"])
+        return httpx.Response(200, json={"response": "cached"})
+
+    use_client(lambda request: None, async_handler=handler)
+
+    async def _run():
+        return [
+            await llm_module.agenerate("", "q", use_cache=True),
+            await llm_module.agenerate("", "q", use_cache=True),
+        ]
+
+    assert asyncio.run(_run()) == ["cached", "cached"]
+    assert calls == ["q"]
+
+
+def test_generate_routes_cache_only_when_requested(use_client):
+    import httpx
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.routers import llm as router_module
+
+    calls: list[str] = []
+
+    async def handler(request):
+        calls.append(json.loads(request.content)["prompt"])
+        return httpx.Response(200, json={"response": f"answer {len(calls)}"})
+
+    use_client(lambda request: None, async_handler=handler)
+    app = FastAPI()
+    app.include_router(router_module.router)
+    client = TestClient(app)
+
+    body = {"prompt": "", "input_text": "q", "model": "m"}
+    assert client.post("/api/v1/llm/generate", json=body).json()["output"] == "answer 1"
+    assert client.post("/api/v1/llm/generate", json=body).json()["output"] == "answer 2"
+    batch = {"prompt": "", "data": {"k": "q"}, "model": "m"}
+    assert client.post("/api/v1/llm/batch/generate", json=batch).json() == {"k": "answer 3"}
+
+    cached = {**body, "use_cache": True}
+    assert client.post("/api/v1/llm/generate", json=cached).json()["output"] == "answer 4"
+    assert client.post("/api/v1/llm/generate", json=cached).json()["output"] == "answer 4"
+    assert len(calls) == 4
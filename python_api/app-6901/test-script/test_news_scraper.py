@@ -0,0 +1,462 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+import app.services.get_news_web_content.crawl_engine as engine
+
+
+# ---------------------------------------------------------------------------
+# TokenBucket / HostRateLimiter
+# ---------------------------------------------------------------------------
+
+class _Clock:
+    """Fake monotonic clock advanced by the patched time.sleep."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = _Clock()
+    with patch.object(engine.time, "monotonic", fake.monotonic), patch.object(engine.time, "sleep", fake.sleep):
+        yield fake
+
+
+def test_token_bucket_allows_burst_then_paces(clock):
+    bucket = engine.TokenBucket(rate=2.0, capacity=2)
+    waits = [bucket.acquire() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.5, 0.5])
+
+
+def test_token_bucket_refills_over_time(clock):
+    bucket = engine.TokenBucket(rate=1.0, capacity=1)
+    bucket.acquire()
+    clock.now += 5  # idle time never banks more than capacity
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(1.0)
+
+
+def test_token_bucket_zero_rate_disables_limit(clock):
+    bucket = engine.TokenBucket(rate=0, capacity=1)
+    assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+
+
+def test_host_rate_limiter_keeps_hosts_independent(clock):
+    limiter = engine.HostRateLimiter(rate=1.0, burst=1)
+    assert limiter.acquire("https://vnexpress.net/a.html") == 0.0
+    assert limiter.acquire("https://edition.cnn.com/b") == 0.0
+    assert limiter.acquire("https://VNExpress.net/c.html") == pytest.approx(1.0)
+
+
+# ---------------------------------------------------------------------------
+# fetch / fetch_html
+# ---------------------------------------------------------------------------
+
+def _response(status: int, text: str = "x" * 200, headers: dict | None = None) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status
+    resp.text = text
+    resp.headers = headers or {}
+    if status >= 400:
+        resp.raise_for_status.side_effect = requests.HTTPError(f"{status}", response=resp)
+    return resp
+
+
+@pytest.fixture
+def session():
+    fake = MagicMock()
+    with patch.object(engine, "get_session", return_value=fake), \
+            patch.object(engine, "rate_limiter", engine.HostRateLimiter(rate=0)), \
+            patch.object(engine.time, "sleep") as sleep:
+        fake.sleep = sleep
+        yield fake
+
+
+def test_fetch_retries_server_errors_with_backoff(session):
+    session.get.side_effect = [_response(503), requests.ConnectionError("reset"), _response(200)]
+    resp = engine.fetch("https://vnexpress.net/a.html")
+    assert resp.status_code == 200
+    assert session.get.call_count == 3
+    assert session.sleep.call_count == 2
+
+
+def test_fetch_honours_retry_after(session):
+    session.get.side_effect = [_response(429, headers={"Retry-After": "7"}), _response(200)]
+    engine.fetch("https://vnexpress.net/a.html")
+    session.sleep.assert_called_once_with(7.0)
+
+
+def test_fetch_does_not_retry_client_errors(session):
+    session.get.return_value = _response(404)
+    with pytest.raises(RuntimeError, match="Failed to fetch"):
+        engine.fetch("https://vnexpress.net/missing.html")
+    assert session.get.call_count == 1
+
+
+def test_fetch_gives_up_after_max_retries(session):
+    session.get.return_value = _response(502)
+    with pytest.raises(RuntimeError, match=f"after {engine.MAX_RETRIES} attempts"):
+        engine.fetch("https://vnexpress.net/a.html")
+    assert session.get.call_count == engine.MAX_RETRIES
+
+
+def test_fetch_html_rejects_short_bodies(session):
+    session.get.side_effect = [_response(200, text="tiny"), _response(200, text="<html>" + "x" * 200)]
+    assert engine.fetch_html("https://vnexpress.net/a.html").startswith("<html>")
+
+
+def test_backoff_is_jittered_and_capped():
+    delays = {engine._backoff_seconds(10) for _ in range(20)}
+    assert all(0 <= delay <= engine.BACKOFF_MAX_SECONDS for delay in delays)
+    assert len(delays) > 1
+
+
+# ---------------------------------------------------------------------------
+# Response cache / conditional GET
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(autouse=True)
+def _isolated_http_cache(tmp_path, monkeypatch):
+    cache = engine.ResponseCache(tmp_path / "http-cache", max_bytes=1024 * 1024)
+    monkeypatch.setattr(engine, "response_cache", cache)
+    return cache
+
+
+def _real_response(status: int, body: bytes = b"", headers: dict | None = None) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp.headers.update(headers or {})
+    resp.encoding = "utf-8"
+    return resp
+
+
+def test_fetch_revalidates_cached_response(session, _isolated_http_cache):
+    url = "https://vnexpress.net/a.html"
+    body = "<html>tin tức</html>".encode("utf-8")
+    session.get.side_effect = [
+        _real_response(200, body, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jun 2026 00:00:00 GMT"}),
+        _real_response(304),
+    ]
+
+    first = engine.fetch(url, headers={"Accept-Encoding": "br"})
+    second = engine.fetch(url)
+
+    assert not getattr(first, "from_cache", False)
+    assert second.from_cache is True
+    assert second.status_code == 200
+    assert second.text == "<html>tin tức</html>"
+    conditional = session.get.call_args_list[1].kwargs["headers"]
+    assert conditional["If-None-Match"] == '"v1"'
+    assert conditional["If-Modified-Since"] == "Mon, 01 Jun 2026 00:00:00 GMT"
+    assert "Accept-Encoding" not in session.get.call_args_list[0].kwargs["headers"]
+    assert _isolated_http_cache.hits == 1
+
+
+def test_fetch_replaces_cache_entry_when_page_changed(session, _isolated_http_cache):
+    url = "https://vnexpress.net/a.html"
+    session.get.side_effect = [
+        _real_response(200, b"old", {"ETag": '"v1"'}),
+        _real_response(200, b"new", {"ETag": '"v2"'}),
+    ]
+    engine.fetch(url)
+    assert engine.fetch(url).content == b"new"
+    assert _isolated_http_cache.get(url)[0]["etag"] == '"v2"'
+
+
+def test_fetch_skips_cache_without_validators(session, _isolated_http_cache):
+    session.get.return_value = _real_response(200, b"dynamic")
+    engine.fetch("https://vnexpress.net/kinh-doanh")
+    engine.fetch("https://vnexpress.net/kinh-doanh")
+    assert "If-None-Match" not in session.get.call_args.kwargs["headers"]
+    assert _isolated_http_cache.get("https://vnexpress.net/kinh-doanh") is None
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    cache = engine.ResponseCache(tmp_path, max_bytes=250)
+    for n in range(3):
+        cache.put(f"https://x.test/{n}", _real_response(200, b"x" * 100, {"ETag": str(n)}))
+        stamp = time.time() - 100 + n
+        for path in cache._paths(f"https://x.test/{n}"):
+            os.utime(path, (stamp, stamp))
+    assert cache.get("https://x.test/0") is None
+    assert cache.get("https://x.test/2") is not None
+
+
+def test_session_advertises_only_decodable_encodings():
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    assert engine.get_session().headers["Accept-Encoding"] == ACCEPT_ENCODING
+    has_brotli = any(importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+    assert ("br" in ACCEPT_ENCODING) == has_brotli
+
+
+# ---------------------------------------------------------------------------
+# robots.txt cache
+# ---------------------------------------------------------------------------
+
+def test_robots_cache_fetches_once_per_host(session, clock):
+    session.get.return_value = _real_response(200, b"User-agent: *\nDisallow: /private/\n")
+    robots = engine.RobotsCache(ttl_seconds=60)
+
+    assert robots.can_fetch("https://vnexpress.net/a.html", "bot")
+    assert not robots.can_fetch("https://vnexpress.net/private/b.html", "bot")
+    assert session.get.call_count == 1
+
+    clock.now += 61
+    robots.can_fetch("https://vnexpress.net/a.html", "bot")
+    assert session.get.call_count == 2
+
+
+@pytest.mark.parametrize("status, allowed", [(401, False), (403, False), (404, True), (500, False), (503, False)])
+def test_robots_cache_status_semantics(session, status, allowed):
+    session.get.return_value = _real_response(status)
+    assert engine.RobotsCache().can_fetch("https://edition.cnn.com/x", "bot") is allowed
+
+
+@pytest.mark.parametrize("failure", [requests.ConnectionError("down"), _real_response(503)])
+def test_robots_cache_retries_errors_sooner(session, clock, failure):
+    session.get.side_effect = [failure, _real_response(200, b"")]
+    robots = engine.RobotsCache(ttl_seconds=3600)
+    assert not robots.can_fetch("https://edition.cnn.com/x", "bot")
+    clock.now += engine.ROBOTS_ERROR_TTL_SECONDS + 1
+    assert robots.can_fetch("https://edition.cnn.com/x", "bot")
+
+
+# ---------------------------------------------------------------------------
+# lxml extraction
+# ---------------------------------------------------------------------------
+
+_VNEXPRESS_PAGE = """<html><head>
+<title>Giá vàng tăng - VnExpress</title>
+<meta property="og:title" content="Giá vàng &amp; tăng">
+<meta name="tt_list_folder_name" content="Kinh doanh, Kinh doanh, Tiền của tôi">
+<meta property="article:tag" content="vàng"><meta property="article:tag" content="SJC">
+<script>var x = "<p>script text that should never be counted as body</p>";</script>
+</head><body><div class="container">
+<p class="description">Mô tả ngắn của bài viết, nằm ngoài thân bài chính.</p>
+<article class="fck_detail ">
+<p>Sáng nay, giá vàng miếng SJC được niêm yết ở mức 120 triệu đồng mỗi lượng.</p>
+<figure><img data-src="/gold1.jpg" src="data:,"><figcaption>Giao dịch <em>vàng</em></figcaption></figure>
+<p>Ngắn.</p>
+<p>Giá vàng thế giới cũng tăng <strong>1,5%</strong> lên 2.400 USD một ounce.</p>
+</article></div></body></html>"""
+
+_CNN_PAGE = """<html><head>
+<script type="application/ld+json">{"@graph": [{"@type": "NewsArticle", "headline": "Markets rally",
+ "author": [{"name": "Jane Doe"}, {"name": "John Roe"}], "articleSection": "business"}]}</script>
+</head><body>
+<div class="image_large"><img src="https://media.cnn.com/hero.jpg">
+<div itemprop="caption">Traders on the floor.</div><figcaption class="image_large__credit">Getty</figcaption></div>
+<div class="article__content">
+<p class="paragraph-elevate">Stocks rallied on Wednesday after a report showed inflation cooled.</p>
+<div class="ad"><p>Advertisement text that is long enough to be a paragraph.</p></div>
+<p class="paragraph-elevate">The Dow rose 400 points while the S&amp;P 500 hit a record.</p>
+</div></body></html>"""
+
+
+def test_measure_matches_get_text_lengths():
+    from bs4 import BeautifulSoup
+
+    from app.services.get_news_web_content import extraction
+
+    root = extraction.parse_html(_VNEXPRESS_PAGE)
+    text_len, p_count = extraction.measure(root)
+    soup = BeautifulSoup(_VNEXPRESS_PAGE, "html.parser")
+    for tag in ("body", "article", "div"):
+        node = root.find(f".//{tag}")
+        assert text_len[node] == len(soup.find(tag).get_text(strip=True))
+        assert p_count[node] == len(soup.find(tag).find_all("p"))
+
+
+def test_find_container_prefers_fast_path_then_density():
+    from app.services.get_news_web_content import extraction
+
+    root = extraction.parse_html(_VNEXPRESS_PAGE)
+    assert extraction.find_container(root, ("//article",)).tag == "article"
+    # A selector without paragraphs falls through to the density heuristic,
+    # which keeps the candidate holding the most paragraphs.
+    assert extraction.find_container(root, ("//title",)).get("class") == "container"
+
+
+def test_parse_html_tolerates_empty_and_declared_encodings():
+    from app.services.get_news_web_content import extraction
+
+    assert extraction.parse_html("").find("body") is not None
+    root = extraction.parse_html('<?xml version="1.0" encoding="utf-8"?><html><body><p>Xin chào</p></body></html>')
+    assert extraction.text_of(root) == "Xin chào"
+
+
+def test_vnexpress_extracts_article_with_lxml():
+    from app.services.get_news_web_content import extraction
+    from app.services.get_news_web_content.vnexpress import content_scraper
+
+    root = extraction.parse_html(_VNEXPRESS_PAGE)
+    meta = content_scraper._extract_metadata(root, "https://vnexpress.net/a.html")
+    body = content_scraper._extract_body(root, "https://vnexpress.net/a.html")
+
+    assert meta["title"] == "Giá vàng tăng"
+    assert meta["tags"] == ["vàng", "SJC"]
+    assert meta["categories"] == ["Tiền của tôi"]
+    assert body["paragraphs"] == [
+        "Sáng nay, giá vàng miếng SJC được niêm yết ở mức 120 triệu đồng mỗi lượng.",
+        "Giá vàng thế giới cũng tăng 1,5% lên 2.400 USD một ounce.",
+    ]
+    assert body["images"] == [{"src": "https://vnexpress.net/gold1.jpg", "caption": "Giao dịchvàng"}]
+
+
+def test_cnn_extracts_article_with_lxml():
+    from app.services.get_news_web_content import extraction
+    from app.services.get_news_web_content.cnn import content_scraper
+
+    root = extraction.parse_html(_CNN_PAGE)
+    meta = content_scraper._extract_metadata(root, "https://edition.cnn.com/a")
+    body = content_scraper._extract_body(root, "https://edition.cnn.com/a")
+
+    assert meta["title"] == "Markets rally"
+    assert meta["author"] == "Jane Doe, John Roe"
+    assert meta["categories"] == ["business"]
+    assert body["paragraphs"] == [
+        "Stocks rallied on Wednesday after a report showed inflation cooled.",
+        "The Dow rose 400 points while the S&P 500 hit a record.",
+    ]
+    assert body["images"] == [
+        {"src": "https://media.cnn.com/hero.jpg", "caption": "Traders on the floor.", "credit": "Getty"}
+    ]
+
+
+# ---------------------------------------------------------------------------
+# crawl worker pool
+# ---------------------------------------------------------------------------
+
+def test_crawl_runs_concurrently_and_reports_errors():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _work(index: int, item: str) -> str:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        if item == "bad":
+            raise ValueError("broken page")
+        return item.upper()
+
+    results = list(engine.crawl(["a", "bad", "c", "d"], _work, workers=2))
+
+    assert peak == 2
+    assert sorted((index, result) for index, _, result, error in results if error is None) == [
+        (0, "A"), (2, "C"), (3, "D")
+    ]
+    assert [str(error) for _, _, _, error in results if error is not None] == ["broken page"]
+
+
+def test_crawl_empty_input_yields_nothing():
+    assert list(engine.crawl([], lambda index, item: item)) == []
+
+
+# ---------------------------------------------------------------------------
+# Router _run_crawl
+# ---------------------------------------------------------------------------
+
+def test_run_crawl_streams_ndjson_in_listing_order(tmp_path):
+    from app.routers import get_news_web_content as router_module
+
+    urls = [f"https://vnexpress.net/{n}.html" for n in range(5)]
+
+    def _fake_extract(source, url):
+        # Later URLs finish first; the third one fails.
+        time.sleep(0.01 * (len(urls) - urls.index(url)))
+        if url == urls[2]:
+            raise RuntimeError("boom")
+        return {"source_url": url}
+
+    job_id = "job-order"
+    with patch.object(router_module, "_fetch_urls_for", return_value=urls), \
+            patch.object(router_module, "_extract_for", side_effect=_fake_extract):
+        router_module._run_crawl(job_id, "vnexpress", "https://vnexpress.net/kinh-doanh", 5, str(tmp_path), workers=4)
+
+    job = router_module._jobs[job_id]
+    assert job["status"] == "complete"
+    assert (job["processed"], job["failed"]) == (4, 1)
+    assert "articles" not in job
+    assert os.listdir(tmp_path) == ["articles_job-orde.ndjson"]
+    with open(job["output_file"], encoding="utf-8") as fh:
+        assert [json.loads(line)["source_url"] for line in fh] == urls[:2] + urls[3:]
+
+
+def _router_client():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.routers import get_news_web_content as router_module
+
+    app = FastAPI()
+    app.include_router(router_module.router)
+    return TestClient(app)
+
+
+def test_crawl_download_streams_ndjson_and_json(tmp_path):
+    from app.routers import get_news_web_content as router_module
+
+    output = tmp_path / "articles_abc.ndjson"
+    output.write_text('{"n": 1}\n{"n": 2}\n', encoding="utf-8")
+    router_module._set_job("abc", {"status": "complete", "output_file": str(output)})
+    client = _router_client()
+
+    resp = client.get("/api/v1/news-scraper/crawl/download/abc")
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert resp.text.splitlines() == ['{"n": 1}', '{"n": 2}']
+    assert client.get("/api/v1/news-scraper/crawl/download/abc?format=json").json() == [{"n": 1}, {"n": 2}]
+
+    router_module._set_job("gone", {"status": "complete", "output_file": str(tmp_path / "missing.ndjson")})
+    assert client.get("/api/v1/news-scraper/crawl/download/gone").status_code == 410
+
+
+def test_scrape_route_returns_extract_without_temp_files(monkeypatch):
+    from app.services.get_news_web_content.cnn import content_scraper
+
+    monkeypatch.setattr(content_scraper, "_fetch_html", lambda url: _CNN_PAGE)
+    with patch("tempfile.mkdtemp") as mkdtemp:
+        resp = _router_client().post("/api/v1/news-scraper/scrape", json={"url": "https://edition.cnn.com/a"})
+
+    mkdtemp.assert_not_called()
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["source_url"] == "https://edition.cnn.com/a"
+    assert data["meta"]["title"] == "Markets rally"
+    assert len(data["body"]["paragraphs"]) == 2
+
+
+def test_scrape_article_is_an_optional_file_sink(tmp_path, monkeypatch):
+    from app.services.get_news_web_content.vnexpress import content_scraper
+
+    monkeypatch.setattr(content_scraper, "_fetch_html", lambda url: _VNEXPRESS_PAGE)
+    json_path, html_path = content_scraper.scrape_article("https://vnexpress.net/a.html", "article_1", str(tmp_path))
+
+    with open(json_path, encoding="utf-8") as fh:
+        saved = json.load(fh)
+    assert saved["meta"] == content_scraper.extract("https://vnexpress.net/a.html")["meta"]
+    assert os.path.basename(html_path) == "article_1.html"
@@ -0,0 +1,539 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from types import ModuleType, SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import app.services.piper_tts_service as svc
+from app.services.piper_tts_service import PiperEngine, _group_batches
+
+
+_CONFIG = {
+    "audio": {"sample_rate": 22050},
+    "phoneme_type": "text",
+    "phoneme_id_map": {"^": [1], "$": [2], "_": [0], "a": [3], "b": [4], ".": [5]},
+}
+_SAMPLES_PER_ID = 10
+
+
+class _FakeSession:
+    """Returns, per batch row, `input_length * 10` samples of 0.5 then 0.0 padding."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def run(self, _outputs, feeds):
+        self.calls.append(feeds)
+        batch, max_len = feeds["input"].shape
+        output = np.zeros((batch, 1, max_len * _SAMPLES_PER_ID), dtype=np.float32)
+        for row, length in enumerate(feeds["input_lengths"]):
+            output[row, 0, : length * _SAMPLES_PER_ID] = 0.5
+        return [output]
+
+
+@pytest.fixture(autouse=True)
+def _isolated_audio_cache(monkeypatch, tmp_path):
+    # Disabled by default so tests never touch the user's cache directory.
+    cache = svc.PiperAudioCache(tmp_path / "audio-cache", max_bytes=0)
+    monkeypatch.setattr(svc, "_audio_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def fake_ort(monkeypatch):
+    sessions: list[_FakeSession] = []
+
+    def _make_session(path, sess_options=None, providers=None):
+        session = _FakeSession()
+        session.options = sess_options
+        sessions.append(session)
+        return session
+
+    module = ModuleType("onnxruntime")
+    module.SessionOptions = SimpleNamespace
+    module.GraphOptimizationLevel = SimpleNamespace(ORT_ENABLE_ALL="all")
+    module.ExecutionMode = SimpleNamespace(ORT_SEQUENTIAL="sequential")
+    module.InferenceSession = _make_session
+    monkeypatch.setitem(sys.modules, "onnxruntime", module)
+    return sessions
+
+
+# ---------------------------------------------------------------------------
+# _group_batches
+# ---------------------------------------------------------------------------
+
+def test_group_batches_sorts_by_length_and_respects_batch_size():
+    batches = _group_batches([30, 10, 12, 11, 31], batch_size=2, max_pad_ratio=10)
+    assert batches == [[1, 3], [2, 0], [4]]
+
+
+def test_group_batches_splits_on_pad_ratio():
+    batches = _group_batches([10, 11, 40, 42], batch_size=8, max_pad_ratio=1.5)
+    assert batches == [[0, 1], [2, 3]]
+
+
+def test_group_batches_batch_size_one_is_one_per_item():
+    assert _group_batches([5, 3, 4], batch_size=1) == [[1], [2], [0]]
+
+
+def test_group_batches_covers_every_index_once():
+    lengths = [7, 3, 50, 9, 9, 12, 48, 1]
+    batches = _group_batches(lengths, batch_size=3)
+    assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+
+
+# ---------------------------------------------------------------------------
+# PiperEngine
+# ---------------------------------------------------------------------------
+
+def test_engine_configures_session_options(fake_ort, tmp_path):
+    with patch.object(svc, "PIPER_INTRA_OP_THREADS", 3), patch.object(svc, "PIPER_INTER_OP_THREADS", 2):
+        PiperEngine(tmp_path / "m.onnx", _CONFIG, pool_size=2)
+    assert len(fake_ort) == 2
+    options = fake_ort[0].options
+    assert options.intra_op_num_threads == 3
+    assert options.inter_op_num_threads == 2
+    assert options.graph_optimization_level == "all"
+
+
+def test_engine_synthesize_batches_and_keeps_order(fake_ort, tmp_path):
+    engine = PiperEngine(tmp_path / "m.onnx", _CONFIG, pool_size=1)
+    texts = ["ab.", "a.", "ba."]
+    audios = engine.synthesize(texts, batch_size=8)
+
+    assert len(fake_ort[0].calls) == 1
+    feeds = fake_ort[0].calls[0]
+    assert feeds["input"].shape[0] == 3
+    expected_ids = [len(engine.phoneme_ids(text)) for text in texts]
+    assert list(feeds["input_lengths"]) == sorted(expected_ids)
+    # Padding output is stripped: each item keeps only its own voiced samples.
+    assert [len(audio) for audio in audios] == [n * _SAMPLES_PER_ID for n in expected_ids]
+
+
+def test_engine_synthesize_batch_size_one_runs_per_chunk(fake_ort, tmp_path):
+    engine = PiperEngine(tmp_path / "m.onnx", _CONFIG, pool_size=1)
+    engine.synthesize(["a.", "b.", "ab."], batch_size=1)
+    assert len(fake_ort[0].calls) == 3
+    assert all(call["input"].shape[0] == 1 for call in fake_ort[0].calls)
+
+
+def test_engine_passes_speaker_ids_for_multi_speaker(fake_ort, tmp_path):
+    engine = PiperEngine(tmp_path / "m.onnx", {**_CONFIG, "num_speakers": 4}, pool_size=1)
+    engine.synthesize(["a.", "b."], batch_size=8)
+    assert list(fake_ort[0].calls[0]["sid"]) == [0, 0]
+
+
+def test_engine_phoneme_id_cache_only_phonemizes_misses(fake_ort, tmp_path):
+    engine = PiperEngine(tmp_path / "m.onnx", _CONFIG, pool_size=1)
+    calls: list[list[str]] = []
+    real = svc._texts_to_phonemes
+
+    def _counting(texts, config):
+        calls.append(list(texts))
+        return real(texts, config)
+
+    with patch.object(svc, "_texts_to_phonemes", _counting):
+        first = engine.phoneme_ids_batch(["a.", "b.", "a."])
+        second = engine.phoneme_ids_batch(["b.", "ab."])
+
+    assert calls == [["a.", "b."], ["ab."]]
+    assert first[0] == first[2]
+    assert second[0] == first[1]
+
+
+def test_engine_phoneme_id_cache_is_bounded(fake_ort, tmp_path):
+    engine = PiperEngine(tmp_path / "m.onnx", _CONFIG, pool_size=1)
+    with patch.object(svc, "PIPER_PHONEME_CACHE_SIZE", 2):
+        engine.phoneme_ids_batch(["a.", "b.", "ab."])
+    assert list(engine._id_cache) == ["b.", "ab."]
+
+
+# ---------------------------------------------------------------------------
+# PiperModelCache
+# ---------------------------------------------------------------------------
+
+def _sized_loader(sizes: dict, calls: list):
+    def _load(voice_id):
+        calls.append(voice_id)
+        return SimpleNamespace(voice_id=voice_id), sizes[voice_id]
+    return _load
+
+
+def test_model_cache_single_flight_for_concurrent_first_requests():
+    cache = svc.PiperModelCache(budget_bytes=0)
+    calls: list[str] = []
+    started = threading.Event()
+
+    def _slow_load(voice_id):
+        calls.append(voice_id)
+        started.set()
+        time.sleep(0.05)
+        return SimpleNamespace(voice_id=voice_id), 10
+
+    results: list = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("vi/a", _slow_load))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["vi/a"]
+    assert len({id(engine) for engine in results}) == 1
+    assert cache.status()["misses"] == 1
+    assert cache.status()["hits"] == 3
+
+
+def test_model_cache_never_drops_load_lock_before_entry_is_visible():
+    cache = svc.PiperModelCache(budget_bytes=0)
+    gaps: list[str] = []
+
+    class _CheckingLock:
+        """Asserts on every release that a started load is either cached or still locked."""
+
+        def __init__(self) -> None:
+            self._inner = threading.Lock()
+
+        def __enter__(self):
+            self._inner.__enter__()
+            return self
+
+        def __exit__(self, *exc):
+            if loading.is_set() and "vi/a" not in cache._entries and "vi/a" not in cache._load_locks:
+                gaps.append("vi/a")
+            return self._inner.__exit__(*exc)
+
+    loading = threading.Event()
+    cache._lock = _CheckingLock()
+
+    def _load(voice_id):
+        loading.set()
+        return SimpleNamespace(voice_id=voice_id), 1
+
+    cache.get("vi/a", _load)
+    assert gaps == []
+    assert cache._load_locks == {}
+
+
+def test_model_cache_evicts_least_recently_used_over_budget():
+    cache = svc.PiperModelCache(budget_bytes=25)
+    calls: list[str] = []
+    loader = _sized_loader({"vi/a": 10, "vi/b": 10, "vi/c": 10}, calls)
+
+    cache.get("vi/a", loader)
+    cache.get("vi/b", loader)
+    cache.get("vi/a", loader)  # b is now least recently used
+    cache.get("vi/c", loader)
+
+    status = cache.status()
+    assert [voice["voice_id"] for voice in status["voices"]] == ["vi/c", "vi/a"]
+    assert status["used_bytes"] == 20
+    assert status["evictions"] == 1
+    cache.get("vi/b", loader)
+    assert calls == ["vi/a", "vi/b", "vi/c", "vi/b"]
+
+
+def test_model_cache_keeps_single_voice_larger_than_budget():
+    cache = svc.PiperModelCache(budget_bytes=5)
+    cache.get("vi/a", _sized_loader({"vi/a": 10}, []))
+    assert [voice["voice_id"] for voice in cache.status()["voices"]] == ["vi/a"]
+
+
+def test_model_cache_failed_load_is_not_cached():
+    cache = svc.PiperModelCache(budget_bytes=0)
+
+    def _broken(voice_id):
+        raise FileNotFoundError(voice_id)
+
+    with pytest.raises(FileNotFoundError):
+        cache.get("vi/a", _broken)
+    assert cache.status()["voices"] == [] and cache.status()["loading"] == []
+    assert cache.get("vi/a", _sized_loader({"vi/a": 1}, [])).voice_id == "vi/a"
+
+
+def test_preload_models_skips_failures():
+    loaded: list[str] = []
+
+    def _fake_load(voice_id):
+        if voice_id == "vi/missing":
+            raise FileNotFoundError(voice_id)
+        loaded.append(voice_id)
+
+    with patch.object(svc, "_load_model", side_effect=_fake_load):
+        svc.preload_models(["vi/missing", "en/b"])
+    assert loaded == ["en/b"]
+
+
+# ---------------------------------------------------------------------------
+# EspeakPhonemizer
+# ---------------------------------------------------------------------------
+
+def test_phonemizer_falls_back_to_subprocess_without_library():
+    phonemizer = svc.EspeakPhonemizer()
+    with patch.object(svc, "_espeak_library_path", return_value=None), \
+            patch.object(svc, "_espeak_phonemize", side_effect=lambda text, voice: f"<{text}:{voice}>") as mock_run:
+        result = phonemizer.phonemize(["a", "b"], "vi")
+    assert result == ["<a:vi>", "<b:vi>"]
+    assert mock_run.call_count == 2
+    assert phonemizer.uses_library is False
+
+
+def test_phonemizer_library_sets_voice_once_per_change():
+    phonemizer = svc.EspeakPhonemizer()
+    fake_lib = SimpleNamespace(voices=[])
+    fake_lib.espeak_SetVoiceByName = lambda name: fake_lib.voices.append(name) or 0
+    phonemizer._lib = fake_lib
+    phonemizer._loaded = True
+
+    with patch.object(svc.EspeakPhonemizer, "_phonemize_one", lambda self, lib, text: text.upper()):
+        assert phonemizer.phonemize(["a", "b"], "vi") == ["A", "B"]
+        phonemizer.phonemize(["c"], "vi")
+        phonemizer.phonemize(["d"], "en-us")
+
+    assert fake_lib.voices == [b"vi", b"en-us"]
+
+
+def test_phonemizer_unknown_voice_raises():
+    phonemizer = svc.EspeakPhonemizer()
+    phonemizer._lib = SimpleNamespace(espeak_SetVoiceByName=lambda name: 1)
+    phonemizer._loaded = True
+    with pytest.raises(ValueError, match="voice not available"):
+        phonemizer.phonemize(["a"], "xx")
+
+
+def test_text_to_phonemes_strips_language_markers():
+    config = {"phoneme_type": "espeak", "espeak": {"voice": "vi"}}
+    with patch.object(svc._phonemizer, "phonemize", return_value=["(en)hˈɛ(vi) lo"]):
+        assert svc._text_to_phonemes("x", config) == list("hˈɛ lo")
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+class _FakeEngine:
+    sample_rate = 16000
+    model_hash = "fake"
+
+    def __init__(self) -> None:
+        self.windows: list[list[str]] = []
+
+    def synthesize(self, texts, length_scale=1.0, batch_size=None):
+        self.windows.append(list(texts))
+        return [np.full(len(text) * 100, 0.5, dtype=np.float32) for text in texts]
+
+
+def test_iter_chunk_audio_first_chunk_alone_then_windows():
+    engine = _FakeEngine()
+    chunks = ["a.", "bb.", " ", "ccc.", "dddd.", "eeeee."]
+    with patch.object(svc, "_load_model", return_value=engine), patch.object(svc, "PIPER_BATCH_SIZE", 2):
+        audios = list(svc.iter_chunk_audio(chunks, "vi/x", language="vi"))
+
+    assert engine.windows == [["a."], ["bb.", "ccc."], ["dddd.", "eeeee."]]
+    assert [len(audio) for audio in audios] == [200, 300, 400, 500, 600]
+
+
+def test_iter_chunk_audio_all_empty_raises():
+    with patch.object(svc, "_load_model", return_value=_FakeEngine()):
+        with pytest.raises(ValueError, match="all chunks were empty"):
+            list(svc.iter_chunk_audio([" ", ""], "vi/x"))
+
+
+def test_iter_audio_stream_wav_header_then_pcm():
+    with patch.object(svc, "_load_model", return_value=_FakeEngine()):
+        parts = list(svc.iter_audio_stream(["a.", "bb."], "vi/x", audio_format="wav"))
+
+    header = parts[0]
+    assert len(header) == 44
+    assert header[:4] == b"RIFF" and header[8:12] == b"WAVE" and header[36:40] == b"data"
+    assert int.from_bytes(header[24:28], "little") == 16000
+    assert [len(part) for part in parts[1:]] == [200 * 2, 300 * 2]
+
+
+def test_iter_audio_stream_pcm_has_no_header():
+    with patch.object(svc, "_load_model", return_value=_FakeEngine()):
+        parts = list(svc.iter_audio_stream(["a."], "vi/x", audio_format="pcm"))
+    assert [len(part) for part in parts] == [400]
+
+
+def test_iter_audio_stream_rejects_unknown_format():
+    with pytest.raises(ValueError, match="Unsupported stream format"):
+        list(svc.iter_audio_stream(["a."], "vi/x", audio_format="opus"))
+
+
+# ---------------------------------------------------------------------------
+# PiperAudioCache
+# ---------------------------------------------------------------------------
+
+def test_audio_cache_key_normalizes_text_and_separates_settings():
+    key = svc.PiperAudioCache.make_key
+    assert key("h", "vi/a", 1.0, "vi", " Xin  chào. ") == key("h", "vi/a", 1.0, "vi", "Xin chào.")
+    base = key("h", "vi/a", 1.0, "vi", "Xin chào.")
+    assert base != key("h2", "vi/a", 1.0, "vi", "Xin chào.")
+    assert base != key("h", "vi/a", 1.1, "vi", "Xin chào.")
+    assert base != key("h", "vi/b", 1.0, "vi", "Xin chào.")
+
+
+def test_audio_cache_round_trips_pcm16(tmp_path):
+    cache = svc.PiperAudioCache(tmp_path, max_bytes=1 << 20)
+    audio = np.linspace(-0.5, 0.5, 100, dtype=np.float32)
+    cache.put("ab" * 32, audio)
+    restored = cache.get("ab" * 32)
+    assert restored is not None and np.allclose(restored, audio, atol=1e-4)
+    assert cache.get("cd" * 32) is None
+    assert cache.status()["used_bytes"] == 200
+
+
+def test_audio_cache_evicts_least_recently_used(tmp_path):
+    cache = svc.PiperAudioCache(tmp_path, max_bytes=450)
+    audio = np.zeros(100, dtype=np.float32)  # 200 bytes on disk
+    cache.put("aa" * 32, audio)
+    cache.put("bb" * 32, audio)
+    old = cache._path("aa" * 32)
+    os.utime(old, (1, 1))
+    cache.put("cc" * 32, audio)
+
+    assert not old.exists()
+    assert cache.get("bb" * 32) is not None and cache.get("cc" * 32) is not None
+    assert cache.status()["used_bytes"] == 400
+
+
+def test_generate_from_chunks_synthesizes_only_cache_misses(_isolated_audio_cache, tmp_path):
+    _isolated_audio_cache.max_bytes = 1 << 20
+    engine = _FakeEngine()
+    with patch.object(svc, "_load_model", return_value=engine), patch.object(svc, "TEMP_DIR", tmp_path):
+        svc.generate_from_chunks(["a.", "bb.", "ccc."], "vi/x")
+        path, _ = svc.generate_from_chunks(["a.", "bbbb.", "ccc."], "vi/x")
+
+    assert engine.windows == [["a.", "bb.", "ccc."], ["bbbb."]]
+    assert path.exists()
+    assert _isolated_audio_cache.status()["hits"] == 2
+
+
+# ---------------------------------------------------------------------------
+# SynthesisPool / background jobs
+# ---------------------------------------------------------------------------
+
+def test_synthesis_pool_rejects_when_full():
+    pool = svc.SynthesisPool(workers=1, max_queued=1)
+    release = threading.Event()
+    running = pool.submit(release.wait, 5)
+    queued = pool.submit(lambda: "second")
+
+    with pytest.raises(svc.PiperBusyError):
+        pool.submit(lambda: "third")
+    deadline = time.time() + 2
+    while pool.status()["running"] != 1 and time.time() < deadline:
+        time.sleep(0.01)
+    assert pool.status() == {"workers": 1, "max_queued": 1, "running": 1, "queued": 1}
+
+    release.set()
+    assert running.result(timeout=2) is True
+    assert queued.result(timeout=2) == "second"
+    assert pool.submit(lambda: "again").result(timeout=2) == "again"
+
+
+def test_generate_from_chunks_reports_progress_per_window(tmp_path):
+    reports: list[tuple[int, int]] = []
+    with patch.object(svc, "_load_model", return_value=_FakeEngine()), \
+            patch.object(svc, "TEMP_DIR", tmp_path), patch.object(svc, "PIPER_BATCH_SIZE", 2):
+        svc.generate_from_chunks(["a.", "b.", "c."], "vi/x", on_progress=lambda *args: reports.append(args))
+    assert reports == [(2, 3), (3, 3)]
+
+
+def test_start_generation_runs_on_pool_and_records_result(tmp_path):
+    from python_api.common.jobs import JobStore
+
+    job_store = JobStore()
+    with patch.object(svc, "_load_model", return_value=_FakeEngine()), patch.object(svc, "TEMP_DIR", tmp_path), \
+            patch.object(svc, "synthesis_pool", svc.SynthesisPool(workers=1, max_queued=0)):
+        job_id = svc.start_generation(job_store, "ignored", "vi/x", 1.0, "vi", normalize=lambda text, lang: ["a.", "b."])
+        deadline = time.time() + 2
+        while job_store.get_job(job_id).status not in ("complete", "error") and time.time() < deadline:
+            time.sleep(0.01)
+
+    record = job_store.get_job(job_id)
+    assert record.status == "complete", record.error
+    assert record.result["chunks"] == ["a.", "b."]
+    assert svc.piper_progress.get_payload(job_id)["percent"] == 100
+
+
+def test_start_generation_busy_marks_job_failed():
+    from python_api.common.jobs import JobStore
+
+    job_store = JobStore()
+    pool = svc.SynthesisPool(workers=1, max_queued=0)
+    release = threading.Event()
+    pool.submit(release.wait, 5)
+    try:
+        with patch.object(svc, "synthesis_pool", pool):
+            with pytest.raises(svc.PiperBusyError):
+                svc.start_generation(job_store, "x", "vi/x", 1.0, "vi", normalize=lambda text, lang: ["a."])
+    finally:
+        release.set()
+
+
+# ---------------------------------------------------------------------------
+# /generate/stream
+# ---------------------------------------------------------------------------
+
+def _stream_client():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.routers import piper_tts as router_module
+
+    app = FastAPI()
+    app.include_router(router_module.router)
+    return TestClient(app)
+
+
+def test_generate_stream_refused_when_pool_full():
+    pool = svc.SynthesisPool(workers=1, max_queued=0)
+    release = threading.Event()
+    pool.submit(release.wait, 5)
+    try:
+        with patch.object(svc, "synthesis_pool", pool), patch.object(svc, "_load_model") as load:
+            response = _stream_client().post(
+                "/api/v1/piper-tts/generate/stream", json={"text": "Xin chào.", "voice_id": "vi/x"}
+            )
+    finally:
+        release.set()
+    assert response.status_code == 503
+    assert "busy" in response.json()["detail"]
+    load.assert_not_called()
+
+
+def test_generate_stream_synthesizes_on_pool():
+    pool = svc.SynthesisPool(workers=1, max_queued=0)
+    threads: list[str] = []
+    engine = _FakeEngine()
+    original = engine.synthesize
+
+    def _synthesize(texts, **kwargs):
+        threads.append(threading.current_thread().name)
+        return original(texts, **kwargs)
+
+    engine.synthesize = _synthesize
+    with patch.object(svc, "synthesis_pool", pool), patch.object(svc, "_load_model", return_value=engine):
+        response = _stream_client().post(
+            "/api/v1/piper-tts/generate/stream",
+            json={"text": "Xin chào. Tạm biệt.", "voice_id": "vi/x", "language": "en"},
+        )
+    assert response.status_code == 200
+    assert response.headers["x-sample-rate"] == "16000"
+    assert response.content[:4] == b"RIFF"
+    assert threads and all(name.startswith("piper-synth") for name in threads)
+    assert pool.status()["running"] == 0 and pool.status()["queued"] == 0
+
+
+def test_generate_stream_unknown_voice_is_404():
+    with patch.object(svc, "synthesis_pool", svc.SynthesisPool(workers=1, max_queued=0)), \
+            patch.object(svc, "_load_model", side_effect=FileNotFoundError("no voice")):
+        response = _stream_client().post("/api/v1/piper-tts/generate/stream", json={"text": "Hi.", "voice_id": "vi/x"})
+    assert response.status_code == 404
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+from app.services.text_normalizer import rules
+from app.services.text_normalizer.processor import VietnameseTextProcessor
+from app.services.text_normalizer.text_processor import number_to_words, process_vietnamese_text
+
+
+# (input, VietnameseTextProcessor output, text_processor output)
+_CASES = [
+    (
+        "Ngày 25/12/2023 lúc 15h30, giá 1.500.000đ tăng 3-5%.",
+        "Ngày ngày hai mươi lăm tháng mười hai năm hai nghìn không trăm hai mươi ba lúc mười lăm giờ ba mươi, "
+        "giá một triệu năm trăm nghìn đồng tăng ba đến năm phần trăm.",
+        "Ngày ngày hai mươi lăm tháng mười hai năm hai nghìn không trăm hai mươi ba lúc mười lăm giờ ba mươi, "
+        "giá một triệu năm trăm nghìn đồng tăng ba đến năm phần trăm.",
+    ),
+    (
+        "Nhà 13/2/80, gọi 0912345678.",
+        "Nhà mười ba trên hai trên tám mươi, gọi không chín một hai ba bốn năm sáu bảy tám.",
+        "Nhà mười ba/hai/tám mươi, gọi không chín một hai ba bốn năm sáu bảy tám.",
+    ),
+    (
+        "Thế kỷ XXI, nhiệt độ 30°C, 5°Re, xe chạy 60km/h trên 2,5km.",
+        "Thế kỷ hai mươi mốt, nhiệt độ ba mươi độ C, năm độ Re, "
+        "xe chạy sáu mươi ki-lô-mét trên giờ trên hai phẩy nămkm.",
+        "Thế kỷ hai mươi mốt, nhiệt độ ba mươi độ C, năm°Re, "
+        "xe chạy sáu mươi ki-lô-mét trên giờ trên hai phẩy nămkm.",
+    ),
+    ("Wow!?! Thật sao?..", "Wow! Thật sao.", "Wow! Thật sao?"),
+]
+
+
+@pytest.mark.parametrize("text, expected, _functional", _CASES)
+def test_processor_pipeline(text, expected, _functional):
+    assert VietnameseTextProcessor().process_vietnamese_text(text) == expected
+
+
+@pytest.mark.parametrize("text, _processor, expected", _CASES)
+def test_functional_pipeline(text, _processor, expected):
+    assert process_vietnamese_text(text) == expected
+
+
+def test_functional_pipeline_unlimited_roman():
+    assert process_vietnamese_text("Năm MMXXIV") == "Năm MMXXIV"
+    assert process_vietnamese_text("Năm MMXXIV", unlimited_roman=True) == "Năm hai nghìn không trăm hai mươi tư"
+
+
+@pytest.mark.parametrize("num, words", [
+    ("0", "không"),
+    ("007", "bảy"),
+    ("21", "hai mươi mốt"),
+    ("105", "một trăm lẻ năm"),
+    ("1005", "một nghìn không trăm lẻ năm"),
+    ("10010", "mười nghìn không trăm mười"),
+    ("1000005", "một triệu không trăm lẻ năm"),
+    ("-7", "âm bảy"),
+    ("1234567890123", "một hai ba bốn năm sáu bảy tám chín không một hai ba"),
+    ("abc", "abc"),
+])
+def test_number_to_words(num, words):
+    assert number_to_words(num) == words
+    assert VietnameseTextProcessor().number_to_words(num) == words
+
+
+def test_number_to_words_is_memoized():
+    rules.number_to_words.cache_clear()
+    number_to_words("123456")
+    number_to_words("123456")
+    info = rules.number_to_words.cache_info()
+    assert info.hits == 1 and info.misses == 1
+    assert info.maxsize == rules.NUMBER_CACHE_SIZE
+
+
+def test_unit_rule_prefers_longest_unit():
+    rule = rules.unit_rule({"m": "mét", "m2": "mét vuông", "km/h": "ki-lô-mét trên giờ", "km": "ki-lô-mét"})
+    assert rule.apply("5m2, 3 m, 40km/h, 2km") == "5 mét vuông, 3 mét, 40 ki-lô-mét trên giờ, 2 ki-lô-mét"
+    # single-letter units never eat the start of a word
+    assert rule.apply("5 mèo") == "5 mèo"
+
+
+# Glued units: each unit is its own pass over the previous pass's output, so
+# a later pass can unlock an earlier-skipped unit. (input, processor, functional)
+@pytest.mark.parametrize("text, expected, functional", [
+    ("0m3lít", "không mét khối lít", "không mét khối lít"),
+    ("10km2lít", "mười ki-lô-mét vuông lít", "10km2 lít"),
+    ("10cm3tấn", "mười xăng-ti-mét khối tấn", "10cm3 tấn"),
+    ("5m2l", "năm mét2 lít", "năm mét2 lít"),
+])
+def test_unit_passes_keep_sequential_order(text, expected, functional):
+    assert VietnameseTextProcessor().process_vietnamese_text(text) == expected
+    assert process_vietnamese_text(text) == functional
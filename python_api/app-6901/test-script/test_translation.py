@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import gc
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,7 +10,6 @@ import pytest
 import app.services.translation as tr_module
 from app.services.translation import (
     _detect_runtime_device,
-    _model_downloaded,
     get_model_status,
     unload_model,
 )
@@ -28,7 +28,7 @@ def test_detect_runtime_device_returns_tuple():
 
 def test_detect_runtime_device_cpu_when_no_cuda():
     """On machines without GPU (typical CI), should return cpu."""
-    import torch
+    torch = pytest.importorskip("torch")
     if not torch.cuda.is_available():
         device, gpu_name = _detect_runtime_device()
         assert device == "cpu"
@@ -48,52 +48,15 @@ def test_detect_runtime_device_exception_returns_cpu():
 
 
 # ---------------------------------------------------------------------------
-# _model_downloaded
+# downloaded flag (shared model_download_service check)
 # ---------------------------------------------------------------------------
 
-def test_model_downloaded_no_dir(tmp_path):
-    nonexistent = tmp_path / "no_dir"
-    with patch.object(tr_module, "MODEL_DIR", nonexistent):
-        assert _model_downloaded() is False
-
-
-def test_model_downloaded_empty_dir(tmp_path):
-    empty_dir = tmp_path / "model"
-    empty_dir.mkdir()
-    with patch.object(tr_module, "MODEL_DIR", empty_dir):
-        assert _model_downloaded() is False
-
-
-def test_model_downloaded_with_config_json(tmp_path):
-    model_dir = tmp_path / "model"
-    model_dir.mkdir()
-    (model_dir / "config.json").write_text("{}")
-    with patch.object(tr_module, "MODEL_DIR", model_dir):
-        assert _model_downloaded() is True
-
-
-def test_model_downloaded_with_safetensors_file(tmp_path):
-    model_dir = tmp_path / "model"
-    model_dir.mkdir()
-    (model_dir / "model.safetensors").write_bytes(b"weights")
-    with patch.object(tr_module, "MODEL_DIR", model_dir):
-        assert _model_downloaded() is True
-
-
-def test_model_downloaded_with_bin_file(tmp_path):
-    model_dir = tmp_path / "model"
-    model_dir.mkdir()
-    (model_dir / "pytorch_model.bin").write_bytes(b"weights")
-    with patch.object(tr_module, "MODEL_DIR", model_dir):
-        assert _model_downloaded() is True
-
-
-def test_model_downloaded_with_unrelated_file(tmp_path):
-    model_dir = tmp_path / "model"
-    model_dir.mkdir()
-    (model_dir / "readme.txt").write_text("readme")
-    with patch.object(tr_module, "MODEL_DIR", model_dir):
-        assert _model_downloaded() is False
+@pytest.mark.parametrize("downloaded", [True, False])
+def test_get_model_status_downloaded_uses_shared_check(downloaded):
+    with patch.object(tr_module, "is_model_downloaded", return_value=downloaded) as check:
+        result = get_model_status()
+    check.assert_called_once_with("translation")
+    assert result["downloaded"] is downloaded
 
 
 # ---------------------------------------------------------------------------
@@ -199,3 +162,370 @@ def test_unload_model_clears_current_device():
         tr_module._model = original_model
         tr_module._tokenizer = original_tokenizer
         tr_module._current_device = original_device
+
+
+# ---------------------------------------------------------------------------
+# Batched translation
+# ---------------------------------------------------------------------------
+
+def test_plan_batches_sorts_by_length_and_respects_budget():
+    lengths = [30, 5, 6, 29, 7]
+    batches = tr_module._plan_batches(lengths, token_budget=60, max_batch_size=8)
+    assert batches == [[1, 2, 4], [3, 0]]
+
+
+def test_plan_batches_respects_max_batch_size():
+    batches = tr_module._plan_batches([3, 3, 3, 3, 3], token_budget=1000, max_batch_size=2)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+def test_plan_batches_oversized_item_gets_own_batch():
+    assert tr_module._plan_batches([500, 4], token_budget=100, max_batch_size=8) == [[1], [0]]
+
+
+class _FakeEncoded(dict):
+    pass
+
+
+class _FakeIds(list):
+    def to(self, _device):
+        return self
+
+
+class _FakeTokenizer:
+    """Whitespace tokenizer; "decoding" upper-cases the input text."""
+
+    src_lang = None
+    lang_code_to_id = {"vie_Latn": 7}
+
+    def __call__(self, texts, return_tensors=None, padding=False, truncation=False, max_length=None):
+        ids = [text.split() for text in texts]
+        if return_tensors is None:
+            return {"input_ids": ids}
+        return _FakeEncoded(input_ids=_FakeIds(texts))
+
+    def batch_decode(self, outputs, skip_special_tokens=True):
+        return [text.upper() for text in outputs]
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def parameters(self):
+        return iter([MagicMock(device="cpu")])
+
+    def generate(self, input_ids, forced_bos_token_id, max_new_tokens, num_beams):
+        assert forced_bos_token_id == 7
+        self.calls.append(list(input_ids))
+        return list(input_ids)
+
+
+def test_translate_batch_one_generate_per_batch_in_input_order():
+    import sys
+
+    model = _FakeModel()
+    progress: list[tuple[int, int]] = []
+    texts = ["a b c d e f", "x", "p q", "m n o p q r s"]
+    with patch.object(tr_module, "_model", model), patch.object(tr_module, "_tokenizer", _FakeTokenizer()), \
+            patch.object(tr_module, "TRANSLATION_BATCH_TOKENS", 8), \
+            patch.dict(sys.modules, {"torch": MagicMock()}):
+        result = tr_module._translate_batch(texts, "en", "vi", on_batch=lambda *args: progress.append(args))
+
+    assert result == ["A B C D E F", "X", "P Q", "M N O P Q R S"]
+    assert model.calls == [["x", "p q"], ["a b c d e f"], ["m n o p q r s"]]
+    assert progress == [(2, 4), (3, 4), (4, 4)]
+
+
+def test_translate_batch_prepends_context():
+    import sys
+
+    model = _FakeModel()
+    with patch.object(tr_module, "_model", model), patch.object(tr_module, "_tokenizer", _FakeTokenizer()), \
+            patch.dict(sys.modules, {"torch": MagicMock()}):
+        result = tr_module._translate_batch(["b"], "en", "vi", contexts=["a"])
+    assert result == ["A B"]
+
+
+def test_translate_batch_same_language_is_passthrough():
+    with patch.object(tr_module, "_model", MagicMock()), patch.object(tr_module, "_tokenizer", MagicMock()):
+        assert tr_module._translate_batch([" hi "], "en", "EN") == ["hi"]
+
+
+class _FakeCt2Tokenizer(_FakeTokenizer):
+    def encode(self, text, truncation=True, max_length=None):
+        return text.split()
+
+    def convert_ids_to_tokens(self, ids):
+        return list(ids)
+
+    def convert_tokens_to_ids(self, tokens):
+        return list(tokens)
+
+    def decode(self, ids, skip_special_tokens=True):
+        return " ".join(ids).upper()
+
+
+class _FakeCt2Translator:
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def translate_batch(self, sources, target_prefix, beam_size, max_decoding_length):
+        self.calls.append({"sources": sources, "target_prefix": target_prefix})
+        return [MagicMock(hypotheses=[prefix + tokens]) for prefix, tokens in zip(target_prefix, sources)]
+
+
+def test_translate_batch_ctranslate2_uses_target_prefix_and_strips_it():
+    translator = _FakeCt2Translator()
+    with patch.object(tr_module, "_ct2_translator", translator), \
+            patch.object(tr_module, "_tokenizer", _FakeCt2Tokenizer()):
+        result = tr_module._translate_batch(["b c", "a"], "en", "vi", backend="ctranslate2")
+
+    assert result == ["B C", "A"]
+    assert translator.calls[0]["target_prefix"] == [["vie_Latn"], ["vie_Latn"]]
+    assert translator.calls[0]["sources"] == [["a"], ["b", "c"]]
+
+
+def test_translate_batch_ctranslate2_requires_loaded_translator():
+    with patch.object(tr_module, "_ct2_translator", None), patch.object(tr_module, "_tokenizer", MagicMock()):
+        with pytest.raises(RuntimeError, match="not loaded"):
+            tr_module._translate_batch(["a"], "en", "vi", backend="ctranslate2")
+
+
+def _fake_ct2_converters(converted: list) -> dict:
+    class _Converter:
+        def __init__(self, model_dir, low_cpu_mem_usage=False):
+            pass
+
+        def convert(self, output_dir, quantization=None, force=False):
+            out = Path(output_dir)
+            if out.exists() and not force:
+                raise RuntimeError(f"{out} exists")
+            out.mkdir(parents=True, exist_ok=True)
+            (out / "model.bin").write_bytes(b"int8")
+            converted.append(out)
+
+    converters = MagicMock(TransformersConverter=_Converter)
+    return {"ctranslate2": MagicMock(converters=converters), "ctranslate2.converters": converters}
+
+
+@pytest.mark.parametrize("stale", ["target", "tmp", "both"])
+def test_convert_ct2_model_replaces_stale_partial_exports(tmp_path, stale):
+    import sys
+    ct2_dir = tmp_path / "nllb-ct2"
+    tmp_dir = tmp_path / "nllb-ct2.tmp"
+    if stale in ("target", "both"):
+        ct2_dir.mkdir()
+        (ct2_dir / "config.json").write_text("{}")  # interrupted: no model.bin
+    if stale in ("tmp", "both"):
+        tmp_dir.mkdir()
+        (tmp_dir / "partial").write_bytes(b"x")
+
+    converted: list = []
+    with patch.dict(sys.modules, _fake_ct2_converters(converted)), \
+            patch.object(tr_module, "CT2_MODEL_DIR", ct2_dir):
+        tr_module._convert_ct2_model("task")
+        assert tr_module._ct2_model_ready()
+
+    assert converted == [tmp_dir]
+    assert sorted(p.name for p in ct2_dir.iterdir()) == ["model.bin"]
+    assert not tmp_dir.exists()
+
+
+def test_resolve_backend_rejects_unknown():
+    with pytest.raises(ValueError, match="Unsupported translation backend"):
+        tr_module._resolve_backend("onnx")
+    assert tr_module._resolve_backend("CTranslate2") == "ctranslate2"
+
+
+# ---------------------------------------------------------------------------
+# Translation memory
+# ---------------------------------------------------------------------------
+
+def test_memory_key_normalizes_text_and_separates_context_and_model():
+    key = tr_module.TranslationMemory.make_key
+    base = key("en", "vi", "Hello  world", "", "m:transformers")
+    assert base == key("EN", "vi", " Hello world ", "", "m:transformers")
+    assert base != key("en", "vi", "Hello world", "Previous line.", "m:transformers")
+    assert base != key("en", "vi", "Hello world", "", "m:ctranslate2")
+
+
+def test_memory_round_trip_and_prune(tmp_path):
+    memory = tr_module.TranslationMemory(tmp_path / "tm.sqlite3", max_entries=2)
+    memory.put_many([("k1", "en", "vi", "m", "a", "A"), ("k2", "en", "vi", "m", "b", "B")])
+    assert memory.get_many(["k1", "missing"]) == {"k1": "A"}
+    memory.put_many([("k3", "en", "vi", "m", "c", "C")])
+
+    # k2 was least recently used
+    assert memory.get_many(["k1", "k2", "k3"]) == {"k1": "A", "k3": "C"}
+    assert memory.stats()["entries"] == 2
+
+
+def test_memory_path_from_env(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    target = tmp_path / "tm" / "memory.sqlite3"
+    env = {**os.environ, "TRANSLATION_MEMORY_PATH": str(target), "PYTHONPATH": os.pathsep.join(sys.path)}
+    out = subprocess.run(
+        [sys.executable, "-c", "import app.services.translation as t; print(t.translation_memory.path)"],
+        env=env, capture_output=True, text=True, check=True, cwd=Path(tr_module.__file__).parents[2],
+    ).stdout.strip()
+    assert out == str(target)
+
+
+def test_memory_stats_and_clear_do_not_create_the_store(tmp_path):
+    memory = tr_module.TranslationMemory(tmp_path / "tm.sqlite3")
+    assert memory.stats()["entries"] == 0
+    memory.clear()
+    assert not memory.path.exists()
+
+
+def test_translate_with_memory_only_translates_misses(tmp_path):
+    memory = tr_module.TranslationMemory(tmp_path / "tm.sqlite3")
+    loads: list[int] = []
+    calls: list[list[str]] = []
+
+    def _fake_batch(texts, **kwargs):
+        calls.append(list(texts))
+        return [text.upper() for text in texts]
+
+    with patch.object(tr_module, "translation_memory", memory), \
+            patch.object(tr_module, "_translate_batch", side_effect=_fake_batch):
+        first, hits_first = tr_module._translate_with_memory(
+            ["a", "b"], "en", "vi", ensure_loaded=lambda: loads.append(1)
+        )
+        second, hits_second = tr_module._translate_with_memory(
+            ["b", "c", "a"], "en", "vi", ensure_loaded=lambda: loads.append(1)
+        )
+        third, hits_third = tr_module._translate_with_memory(
+            ["c"], "en", "vi", ensure_loaded=lambda: loads.append(1)
+        )
+
+    assert (first, hits_first) == (["A", "B"], 0)
+    assert (second, hits_second) == (["B", "C", "A"], 2)
+    assert (third, hits_third) == (["C"], 1)
+    assert calls == [["a", "b"], ["c"]]
+    assert loads == [1, 1]  # the all-hit call never loads the model
+
+
+def test_translate_with_memory_opt_out_skips_store(tmp_path):
+    memory = tr_module.TranslationMemory(tmp_path / "tm.sqlite3")
+    with patch.object(tr_module, "translation_memory", memory), \
+            patch.object(tr_module, "_translate_batch", side_effect=lambda texts, **kw: list(texts)):
+        tr_module._translate_with_memory(["a"], "en", "vi", use_memory=False)
+    assert memory.stats()["entries"] == 0
+
+
+def _memory_client():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.routers import translation as router_module
+
+    app = FastAPI()
+    app.include_router(router_module.router)
+    return TestClient(app)
+
+
+def test_memory_route_disabled_does_not_open_store(tmp_path):
+    from app.routers import translation as router_module
+
+    memory = tr_module.TranslationMemory(tmp_path / "tm.sqlite3")
+    with patch.object(router_module, "TRANSLATION_MEMORY_ENABLED", False), \
+            patch.object(router_module, "translation_memory", memory):
+        response = _memory_client().get("/memory")
+    assert response.status_code == 200
+    assert response.json()["enabled"] is False
+    assert not memory.path.exists()
+
+
+def test_memory_routes_report_sqlite_errors(tmp_path):
+    import sqlite3
+
+    from app.routers import translation as router_module
+
+    broken = MagicMock()
+    broken.stats.side_effect = sqlite3.OperationalError("database is locked")
+    broken.clear.side_effect = sqlite3.OperationalError("database is locked")
+    with patch.object(router_module, "TRANSLATION_MEMORY_ENABLED", True), \
+            patch.object(router_module, "translation_memory", broken):
+        client = _memory_client()
+        stats = client.get("/memory")
+        cleared = client.delete("/memory")
+    assert stats.status_code == 500 and "database is locked" in stats.json()["detail"]
+    assert cleared.status_code == 500
+
+
+# ---------------------------------------------------------------------------
+# Streamed segment events
+# ---------------------------------------------------------------------------
+
+def test_event_stream_resumes_from_cursor():
+    from python_api.common.progress import ProgressStore
+
+    store = ProgressStore()
+    for index in range(3):
+        store.add_event("job", {"type": "segment", "index": index})
+    store.set_progress("job", "complete", 100, "done")
+
+    frames = list(store.event_stream("job", cursor=1, interval=0))
+    event_frames = [frame for frame in frames if frame.startswith("id: ")]
+    assert [frame.splitlines()[0] for frame in event_frames] == ["id: 1", "id: 2"]
+    assert event_frames[0].splitlines()[1] == "event: segment"
+    assert frames[-1].startswith("data: ") and '"complete"' in frames[-1]
+    assert store.get_events("job", 2) == [{"type": "segment", "index": 2}]
+
+
+def test_progress_events_dropped_after_finish_grace_period():
+    from python_api.common import progress as progress_module
+
+    clock = [1000.0]
+    store = progress_module.ProgressStore(events_ttl_seconds=60)
+    with patch.object(progress_module.time, "monotonic", lambda: clock[0]):
+        store.add_event("done", {"type": "segment", "index": 0})
+        store.add_event("running", {"type": "segment", "index": 0})
+        store.set_progress("done", "complete", 100, "done")
+        store.set_progress("running", "translating", 50, "")
+
+        clock[0] += 59
+        assert len(store.get_events("done")) == 1  # still resumable during the grace period
+
+        clock[0] += 1
+        assert store.get_events("done") == []
+        assert store.get_events("running") == [{"type": "segment", "index": 0}]
+        assert set(store._events) == {"running"}
+        assert store._events_finished == {}
+
+
+def test_start_translation_publishes_segments_as_they_finish(job_store, tmp_path):
+    memory = tr_module.TranslationMemory(tmp_path / "tm.sqlite3")
+    memory.put_many([(
+        tr_module.TranslationMemory.make_key("en", "vi", "b", "a c", tr_module._memory_model_id(None)),
+        "en", "vi", tr_module._memory_model_id(None), "b", "B (memory)",
+    )])
+
+    def _fake_batch(texts, on_results=None, **kwargs):
+        translations = [text.upper() for text in texts]
+        if on_results is not None:
+            for index, translation in enumerate(translations):
+                on_results([index], [translation])
+        return translations
+
+    segments = [{"text": "a", "start": 0.0, "end": 1.0}, {"text": "b"}, {"text": "c"}]
+    with patch.object(tr_module, "translation_memory", memory), \
+            patch.object(tr_module, "_translate_batch", side_effect=_fake_batch), \
+            patch.object(tr_module, "_ensure_model_loaded"), \
+            patch.object(tr_module, "_detect_runtime_device", return_value=("cpu", None)):
+        job_id = tr_module.start_translation(job_store, "", "en", "vi", segments=segments)
+        deadline = time.time() + 2
+        while job_store.get_job(job_id).status not in ("complete", "error") and time.time() < deadline:
+            time.sleep(0.01)
+
+    assert job_store.get_job(job_id).status == "complete", job_store.get_job(job_id).error
+    first = tr_module.get_translation_events(job_id)
+    assert [(event["index"], event["text"]) for event in first["events"]] == [(1, "B (memory)"), (0, "A"), (2, "C")]
+    assert first["events"][1]["start"] == 0.0 and first["events"][1]["total"] == 3
+    assert first["cursor"] == 3
+    assert tr_module.get_translation_events(job_id, cursor=2)["events"][0]["index"] == 2
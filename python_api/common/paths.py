@@ -14,6 +14,9 @@ LOG_MAX_BYTES = 10 * 1024 * 1024
 TEMP_DIR = Path(tempfile.gettempdir()) / "psi_ai_content_hub"
 TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
+# Persistent caches; unlike TEMP_DIR these survive "clear temp cache".
+CACHE_DIR = BASE_APP_DIR / "cache"
+
 MODEL_ROOT = BASE_APP_DIR / "models"
 
 MODEL_F5_DIR = MODEL_ROOT / "f5-tts"
@@ -22,5 +25,6 @@ MODEL_F5_EN_DIR = MODEL_ROOT / "f5-tts-en"
 MODEL_VIENEU_DIR = MODEL_ROOT / "vieneu-tts"
 MODEL_WHISPER_DIR = MODEL_ROOT / "whisper"
 MODEL_TRANSLATION_DIR = MODEL_ROOT / "nllb-200-1.3B"
+MODEL_TRANSLATION_CT2_DIR = MODEL_ROOT / "nllb-200-1.3B-ct2-int8"
 MODEL_BIREFNET_DIR = MODEL_ROOT / "birefnet"
 MODEL_PIPER_TTS_DIR = MODEL_ROOT / "piper-tts-finetune"
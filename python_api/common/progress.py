@@ -4,14 +4,25 @@ import json
 import time
 from dataclasses import dataclass, field
 from threading import Lock
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
+
+
+_TERMINAL_STATUSES = ("complete", "error", "failed", "completed")
+
+
+def _event_frame(cursor: int, event: Dict) -> str:
+    return f"id: {cursor}\nevent: {event.get('type', 'event')}\ndata: {json.dumps(event)}\n\n"
 
 
 @dataclass
 class ProgressStore:
     max_logs: int = 200
+    # A finished task's events are dropped this long after its terminal status.
+    events_ttl_seconds: float = 600.0
     _progress: Dict[str, Dict] = field(default_factory=dict)
     _logs: Dict[str, List[str]] = field(default_factory=dict)
+    _events: Dict[str, List[Dict]] = field(default_factory=dict)
+    _events_finished: Dict[str, float] = field(default_factory=dict)
     _lock: Lock = field(default_factory=Lock)
 
     def set_progress(self, task_id: str, status: str, percent: int, message: str = "") -> None:
@@ -22,6 +33,21 @@ class ProgressStore:
                 "message": message,
                 "updated": time.time(),
             }
+            now = time.monotonic()
+            if status in _TERMINAL_STATUSES:
+                self._events_finished.setdefault(task_id, now)
+            else:
+                self._events_finished.pop(task_id, None)
+            self._expire_events(now)
+
+    def _expire_events(self, now: float) -> None:
+        expired = [
+            task_id for task_id, finished in self._events_finished.items()
+            if now - finished >= self.events_ttl_seconds
+        ]
+        for task_id in expired:
+            del self._events_finished[task_id]
+            self._events.pop(task_id, None)
 
     def add_log(self, task_id: str, line: str) -> None:
         with self._lock:
@@ -29,6 +55,25 @@ class ProgressStore:
             if len(self._logs[task_id]) > self.max_logs:
                 self._logs[task_id] = self._logs[task_id][-self.max_logs :]
 
+    def add_event(self, task_id: str, event: Dict) -> int:
+        """Append a result event for the task and return its cursor (0-based)."""
+        with self._lock:
+            self._expire_events(time.monotonic())
+            events = self._events.setdefault(task_id, [])
+            events.append(event)
+            return len(events) - 1
+
+    def get_events(self, task_id: str, cursor: int = 0) -> List[Dict]:
+        """
+        Return the events at and after `cursor`.
+
+        Events are kept whole while the task runs and for `events_ttl_seconds`
+        after it reaches a terminal status; after that they read as empty.
+        """
+        with self._lock:
+            self._expire_events(time.monotonic())
+            return list(self._events.get(task_id, [])[max(cursor, 0) :])
+
     def get_payload(self, task_id: str, include_logs: bool = True) -> Dict | None:
         with self._lock:
             data = self._progress.get(task_id)
@@ -44,8 +89,35 @@ class ProgressStore:
             payload = self.get_payload(task_id, include_logs=True)
             if payload:
                 yield f"data: {json.dumps(payload)}\n\n"
-                if payload.get("status") in ("complete", "error", "failed", "completed"):
+                if payload.get("status") in _TERMINAL_STATUSES:
                     break
             else:
                 yield f"data: {json.dumps({'status': 'waiting', 'percent': 0, 'message': 'Waiting...'})}\n\n"
             time.sleep(interval)
+
+    def event_stream(self, task_id: str, cursor: int = 0, interval: float = 0.3) -> Iterable[str]:
+        """
+        Like sse_stream, plus every event from `cursor` on as `event: <type>`.
+
+        Each event frame carries `id: <cursor>`, so a client that reconnects
+        with Last-Event-ID (or ?cursor=) resumes after the last event it saw.
+        Progress frames stay unnamed and are only sent when they change.
+        """
+        last_progress: Optional[Dict] = None
+        while True:
+            events = self.get_events(task_id, cursor)
+            for offset, event in enumerate(events):
+                yield _event_frame(cursor + offset, event)
+            cursor += len(events)
+            payload = self.get_payload(task_id, include_logs=True)
+            if payload is None:
+                yield f"data: {json.dumps({'status': 'waiting', 'percent': 0, 'message': 'Waiting...'})}\n\n"
+            elif payload != last_progress:
+                last_progress = payload
+                yield f"data: {json.dumps(payload)}\n\n"
+            if payload and payload.get("status") in _TERMINAL_STATUSES:
+                # Events added between the read above and the final status.
+                for offset, event in enumerate(self.get_events(task_id, cursor)):
+                    yield _event_frame(cursor + offset, event)
+                break
+            time.sleep(interval)